@@ -0,0 +1,11 @@
+"""
+네트워크 없이 google_maps_agents 파이프라인의 처리량과 지연 시간을 측정하는 벤치마크 모음입니다.
+
+- stub_servers: v4beta geocode HTTP 대역 서버, places_v1 SearchText gRPC 대역 서버
+- fake_llm: 미리 정의된 선택자 출력을 반환하는 결정적(deterministic) BaseLlm
+- harness: 대역 서버와 가짜 LLM을 root_agent에 연결하고 턴 단위 지연 시간을 측정
+- bench_pipeline: 엔드투엔드 및 단계별 처리량/지연 시간 벤치마크 실행기
+- import_time: python -X importtime 기반 임포트/콜드 스타트 시간 측정 및 기준값 비교
+- loadtest: JSONL 턴 코퍼스를 open/closed 루프 부하로 재생하는 부하 발생기 (대역 또는 실제 백엔드)
+- query_canonical_eval: 레이블된 쿼리 쌍으로 쿼리 정규화/근사 중복 병합의 재현율과 잘못된 병합 평가
+"""
@@ -0,0 +1,95 @@
+"""
+root_agent 파이프라인의 엔드투엔드 및 단계별 처리량/지연 시간 벤치마크입니다.
+
+로컬 대역 서버와 가짜 LLM을 사용하므로 네트워크나 API 키 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_pipeline --turns 200 --concurrency 8 \\
+        --places-latency-ms 30 --llm-latency-ms 0 --json bench_output.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import List
+
+from .fake_llm import CannedTurn, load_turns
+from .harness import OfflineEnvironment, TurnResult, format_summary, run_turn, summarize
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "data", "turns.jsonl")
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    """설정에 따라 턴들을 동시에 실행하고 집계 결과를 반환합니다."""
+    corpus: List[CannedTurn] = load_turns(args.corpus)
+    turns = [corpus[i % len(corpus)] for i in range(args.turns)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async with OfflineEnvironment(
+        places_latency=args.places_latency_ms / 1000,
+        geocode_latency=args.geocode_latency_ms / 1000,
+        llm_latency={"*": args.llm_latency_ms / 1000},
+        places_kwargs={
+            "num_places": args.places,
+            "reviews_per_place": args.reviews,
+            "photos_per_place": args.photos,
+        },
+    ) as env:
+        assert env.runner is not None
+        runner = env.runner
+        # 워밍업: 클라이언트 채널 연결 및 지연 임포트 비용을 측정에서 제외
+        for turn in corpus[: args.warmup]:
+            await run_turn(runner, "bench", await env.new_session(), turn)
+
+        async def one(turn: CannedTurn) -> TurnResult:
+            async with semaphore:
+                return await run_turn(runner, "bench", await env.new_session(), turn)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one(turn) for turn in turns))
+        elapsed = time.perf_counter() - started
+
+        summary = summarize(list(results), elapsed)
+        summary["upstream_requests"] = {
+            "places": env.places_server.requests,
+            "geocode": env.geocode_server.requests,
+        }
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument(
+        "--corpus", default=DEFAULT_CORPUS, help="CannedTurn JSONL 파일"
+    )
+    parser.add_argument("--turns", type=int, default=200, help="실행할 턴 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 실행 턴 수")
+    parser.add_argument("--warmup", type=int, default=2, help="측정 전 워밍업 턴 수")
+    parser.add_argument("--places-latency-ms", type=float, default=0.0)
+    parser.add_argument("--geocode-latency-ms", type=float, default=0.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--places", type=int, default=20, help="SearchText 응답 장소 수"
+    )
+    parser.add_argument("--reviews", type=int, default=5, help="장소당 리뷰 수")
+    parser.add_argument("--photos", type=int, default=10, help="장소당 사진 수")
+    parser.add_argument("--json", help="집계 결과를 저장할 JSON 파일 경로")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    summary = asyncio.run(run_benchmark(args))
+    print(format_summary(summary))
+    print(f"upstream requests: {summary['upstream_requests']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+"""
+고정된 평가 코퍼스로 턴당 토큰 수, 단계별 지연 시간, 선택자 정확도의 회귀를 검사하는 하네스입니다.
+
+코퍼스(data/eval_corpus.jsonl)의 각 레코드는 사용자 발화, 기록된 모델 출력(CannedTurn 필드),
+정답 레이블("expected": route, field_tier, included_type, language_code)로 구성됩니다.
+기본 모드는 대역 서버와 가짜 LLM으로 기록된 출력을 재현하므로 네트워크나 API 키 없이 실행되며,
+가짜 LLM의 토큰 수는 시스템 지시문과 대화 내용 길이로 계산되므로 prompts.py 변경이 그대로 반영됩니다.
+--live는 실제 모델을 호출하여 정확도와 토큰 수를 측정하고, --record는 관측된 모델 출력을
+코퍼스 형식으로 저장하여 이후 오프라인 재현에 사용할 수 있게 합니다.
+
+오프라인 모드의 레이블 비교는 같은 레코드의 기록된 출력이 도구 인자와 세션 상태까지 그대로
+전달되는지 확인하는 배선(plumbing) 검사이며 모델 정확도가 아닙니다. 불일치가 하나라도 있으면 회귀로
+보고, 정확도 하한은 --live 실행에서만 검사합니다.
+
+지연 시간 예산은 절대 시간이 아니라 같은 실행에서 측정한 기준 작업(calibrate()) 시간의 배수로
+저장하므로, 예산을 만든 머신과 속도가 다른 CI 머신에서도 같은 예산을 사용할 수 있습니다.
+
+측정 결과는 예산 파일(data/eval_budgets.json)과 비교하며, --check를 지정하면 예산을 넘는
+회귀(토큰/지연 시간 초과, 정확도 하락, 배선 불일치, 턴 오류)가 있을 때 종료 코드 1을 반환합니다.
+
+사용법:
+    python -m benchmarks.eval_gate --check
+    python -m benchmarks.eval_gate --update-budgets
+    python -m benchmarks.eval_gate --live --budgets live_budgets.json --record recorded.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from google_maps_agents.models.schemas import (
+    selected_fields,
+    selected_language,
+    selected_type,
+)
+from google_maps_agents.telemetry.cost import COST_HISTORY_KEY
+from google_maps_agents.tools.field_mask import compute_sku_tier
+
+from .fake_llm import CannedTurn, load_turns
+from .harness import (
+    APP_NAME,
+    OfflineEnvironment,
+    TurnResult,
+    format_summary,
+    run_turn,
+    summarize,
+)
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "data", "eval_corpus.jsonl")
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(__file__), "data", "eval_budgets.json")
+USER_ID = "eval"
+
+# 정답 레이블 (레코드의 expected에 있는 레이블만 비교합니다)
+LABELS = ("route", "field_tier", "included_type", "language_code")
+TOKEN_KEYS = ("prompt_tokens", "completion_tokens", "llm_calls")
+MODE_OFFLINE = "offline"
+MODE_LIVE = "live"
+
+# 기준 작업: 장소 검색 응답 크기의 JSON 왕복과 이벤트 루프 전환
+_CALIBRATION_PAYLOAD = {
+    "places": [
+        {
+            "id": f"place-{index}",
+            "displayName": {"text": "강남역 근처 카페", "languageCode": "ko"},
+            "formattedAddress": "대한민국 서울특별시 강남구 테헤란로 152",
+            "location": {"latitude": 37.4979, "longitude": 127.0276},
+            "types": ["cafe", "food", "point_of_interest", "establishment"],
+        }
+        for index in range(20)
+    ]
+}
+
+
+@dataclass
+class Observation:
+    """
+    평가 턴 하나의 관측 결과입니다.
+
+    Attributes:
+        turn (CannedTurn): 실행한 코퍼스 레코드
+        result (TurnResult): 지연 시간 측정 결과
+        observed (Dict[str, Optional[str]]): 레이블별 관측 값
+        outputs (Dict[str, Any]): 관측된 모델 출력 (--record 시 CannedTurn 필드로 저장)
+        tokens (Dict[str, int]): 턴 전체 프롬프트/완성 토큰 수와 LLM 호출 수
+        agent_prompt_tokens (Dict[str, int]): 에이전트별 프롬프트 토큰 수
+    """
+
+    turn: CannedTurn
+    result: TurnResult
+    observed: Dict[str, Optional[str]] = field(default_factory=dict)
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    tokens: Dict[str, int] = field(default_factory=dict)
+    agent_prompt_tokens: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def expected(self) -> Dict[str, Optional[str]]:
+        return dict(self.turn.extra.get("expected") or {})
+
+    def recorded(self) -> CannedTurn:
+        """관측된 모델 출력으로 코퍼스 레코드를 다시 만듭니다 (정답 레이블은 유지)."""
+        data = self.turn.to_dict()
+        data.update(
+            {key: value for key, value in self.outputs.items() if value is not None}
+        )
+        return CannedTurn.from_dict(data)
+
+
+def observe(turn: CannedTurn, result: TurnResult, state: Dict[str, Any]) -> Observation:
+    """턴의 이벤트와 세션 상태에서 라우팅, 선택자 출력, 도구 인자, 토큰 사용량을 읽습니다."""
+    outputs: Dict[str, Any] = {}
+    for event in result.events:
+        for call in event.get_function_calls():
+            args = dict(call.args or {})
+            if call.name == "transfer_to_agent" and "route" not in outputs:
+                outputs["route"] = args.get("agent_name")
+            elif call.name == "text_search_tool":
+                outputs["search_query"] = args.get("query")
+            elif call.name == "geocode_tool":
+                outputs["address"] = args.get("address")
+                outputs["tool_language"] = args.get("language")
+            elif call.name == "reverse_geocode_tool":
+                outputs.update(lat=args.get("lat"), lng=args.get("lng"))
+                outputs["tool_language"] = args.get("language")
+        if event.is_final_response() and event.content and event.content.parts:
+            text = "".join(part.text or "" for part in event.content.parts)
+            if text:
+                outputs["narrative"] = text
+
+    fields = selected_fields(state.get("fields"))
+    outputs["fields"] = fields
+    outputs["types"] = selected_type(state.get("types")) or ("" if fields else None)
+    outputs["language"] = selected_language(state.get("language")) or outputs.get(
+        "tool_language"
+    )
+    if isinstance(state.get("rating_pricing"), str):
+        outputs["rating_pricing"] = state["rating_pricing"]
+    # 장소 검색은 language 선택자, 지오코딩은 도구 인자의 언어 코드를 비교합니다.
+    observed = {
+        "route": outputs.get("route"),
+        "field_tier": compute_sku_tier(fields.split(",")).label if fields else None,
+        "included_type": outputs["types"] or None,
+        "language_code": outputs["language"],
+    }
+    outputs.pop("tool_language", None)
+
+    history = state.get(COST_HISTORY_KEY) or []
+    record = history[-1] if history else {}
+    totals = record.get("totals") or {}
+    agent_prompt_tokens: Dict[str, int] = {}
+    for usage in record.get("llm") or []:
+        agent_prompt_tokens[usage["agent"]] = (
+            agent_prompt_tokens.get(usage["agent"], 0) + usage["prompt_tokens"]
+        )
+    return Observation(
+        turn=turn,
+        result=result,
+        observed=observed,
+        outputs=outputs,
+        tokens={key: int(totals.get(key, 0)) for key in TOKEN_KEYS},
+        agent_prompt_tokens=agent_prompt_tokens,
+    )
+
+
+async def run_corpus(args: argparse.Namespace) -> List[Observation]:
+    """코퍼스의 각 턴을 새 세션에서 순서대로 repeat번 실행합니다."""
+    corpus = load_turns(args.corpus)
+    observations: List[Observation] = []
+    async with OfflineEnvironment(fake_llm=not args.live) as env:
+        assert env.runner is not None
+        # 워밍업: 클라이언트 채널 연결 및 지연 임포트 비용을 측정에서 제외
+        for turn in corpus[: args.warmup]:
+            await run_turn(env.runner, USER_ID, await env.new_session(USER_ID), turn)
+        for _ in range(args.repeat):
+            for turn in corpus:
+                session_id = await env.new_session(USER_ID)
+                result = await run_turn(env.runner, USER_ID, session_id, turn)
+                session = await env.runner.session_service.get_session(
+                    app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+                )
+                observations.append(
+                    observe(turn, result, dict(session.state) if session else {})
+                )
+    return observations
+
+
+async def _reference_work() -> None:
+    for _ in range(100):
+        json.loads(json.dumps(_CALIBRATION_PAYLOAD, ensure_ascii=False))
+        await asyncio.sleep(0)
+
+
+def calibrate(rounds: int = 15) -> float:
+    """
+    기준 작업 실행 시간(ms)의 중앙값을 반환합니다.
+
+    지연 시간 예산은 이 값의 배수로 저장되므로 머신 속도 차이가 상쇄됩니다.
+    """
+
+    async def measure() -> List[float]:
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await _reference_work()
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    return statistics.median(asyncio.run(measure()))
+
+
+def _mean(values: Sequence[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def build_report(
+    observations: List[Observation], elapsed: float, calibration_ms: float, mode: str
+) -> Dict[str, Any]:
+    """
+    관측 결과를 집계합니다.
+
+    Args:
+        observations (List[Observation]): 턴별 관측 결과
+        elapsed (float): 전체 실행 시간 (초)
+        calibration_ms (float): 기준 작업 실행 시간 (calibrate())
+        mode (str): MODE_OFFLINE(기록된 출력 재현) 또는 MODE_LIVE(실제 모델)
+
+    Returns:
+        Dict[str, Any]: {"mode", "turns", "errors", "error_rate", "tokens": {키: 턴당 평균},
+            "agent_prompt_tokens": {에이전트: 호출된 턴의 평균}, "latency": {단계: 지연 시간 통계},
+            "calibration_ms", "latency_p95_ratio": {단계: p95 / calibration_ms},
+            "accuracy": {레이블: 일치율}, "mismatches": [설명]}
+    """
+    summary = summarize([o.result for o in observations], elapsed)
+
+    agent_samples: Dict[str, List[int]] = {}
+    for observation in observations:
+        for agent, tokens in observation.agent_prompt_tokens.items():
+            agent_samples.setdefault(agent, []).append(tokens)
+
+    counts: Dict[str, List[int]] = {label: [0, 0] for label in LABELS}
+    mismatches: List[str] = []
+    for observation in observations:
+        for label, expected in observation.expected.items():
+            if label not in counts:
+                continue
+            actual = observation.observed.get(label)
+            counts[label][1] += 1
+            if actual == expected:
+                counts[label][0] += 1
+            else:
+                mismatches.append(
+                    f"{observation.turn.text!r} {label}: expected {expected!r}, got {actual!r}"
+                )
+
+    return {
+        "mode": mode,
+        "turns": summary["turns"],
+        "errors": summary["errors"],
+        "error_rate": summary["error_rate"],
+        "tokens": {
+            key: _mean([o.tokens.get(key, 0) for o in observations])
+            for key in TOKEN_KEYS
+        },
+        "agent_prompt_tokens": {
+            agent: _mean(samples) for agent, samples in sorted(agent_samples.items())
+        },
+        "latency": summary["stages"],
+        "calibration_ms": calibration_ms,
+        "latency_p95_ratio": {
+            stage: stats["p95_ms"] / calibration_ms
+            for stage, stats in summary["stages"].items()
+        },
+        "accuracy": {
+            label: correct / total
+            for label, (correct, total) in counts.items()
+            if total
+        },
+        "mismatches": list(dict.fromkeys(mismatches)),
+        "summary": summary,
+    }
+
+
+def check_budgets(report: Dict[str, Any], budgets: Dict[str, Any]) -> List[str]:
+    """
+    예산을 벗어난 항목의 설명 목록을 반환합니다. 예산에 없는 항목은 검사하지 않습니다.
+
+    오프라인 모드에서는 정확도 하한 대신 레이블 불일치가 없는지(배선 검사)를 확인합니다.
+    """
+    regressions: List[str] = []
+    max_error_rate = budgets.get("max_error_rate")
+    if max_error_rate is not None and report["error_rate"] > max_error_rate:
+        regressions.append(
+            f"error_rate: {report['error_rate']:.2%} > {max_error_rate:.2%} {report['errors']}"
+        )
+    for key, limit in budgets.get("tokens", {}).items():
+        value = report["tokens"].get(key)
+        if value is not None and value > limit:
+            regressions.append(f"tokens.{key}: {value:.1f} > {limit} per turn")
+    for agent, limit in budgets.get("agent_prompt_tokens", {}).items():
+        value = report["agent_prompt_tokens"].get(agent)
+        if value is not None and value > limit:
+            regressions.append(f"agent_prompt_tokens.{agent}: {value:.1f} > {limit}")
+    calibration_ms = report["calibration_ms"]
+    for stage, limit in budgets.get("latency_p95_ratio", {}).items():
+        ratio = report["latency_p95_ratio"].get(stage)
+        if ratio is not None and ratio > limit:
+            regressions.append(
+                f"latency.{stage}: p95 {report['latency'][stage]['p95_ms']:.1f}ms = "
+                f"{ratio:.1f}x calibration > {limit}x ({limit * calibration_ms:.1f}ms)"
+            )
+    if report["mode"] == MODE_LIVE:
+        for label, floor in budgets.get("accuracy", {}).items():
+            value = report["accuracy"].get(label)
+            if value is not None and value < floor:
+                regressions.append(f"accuracy.{label}: {value:.2%} < {floor:.2%}")
+    else:
+        for label, value in report["accuracy"].items():
+            if value < 1.0:
+                regressions.append(
+                    f"plumbing.{label}: {value:.2%} of canned outputs observed"
+                )
+    return regressions
+
+
+def budgets_from_report(
+    report: Dict[str, Any],
+    token_headroom: float,
+    latency_headroom: float,
+    min_latency_ms: float,
+) -> Dict[str, Any]:
+    """
+    측정 결과에 여유분을 더해 예산을 만듭니다.
+
+    지연 시간 예산은 기준 작업 시간의 배수이며, min_latency_ms도 같은 배수로 환산합니다.
+    정확도 하한(현재 값)은 --live 실행 결과로만 만듭니다.
+    """
+    calibration_ms = report["calibration_ms"]
+    budgets: Dict[str, Any] = {
+        "max_error_rate": report["error_rate"],
+        "tokens": {
+            key: math.ceil(value * (1 + token_headroom))
+            for key, value in report["tokens"].items()
+        },
+        "agent_prompt_tokens": {
+            agent: math.ceil(value * (1 + token_headroom))
+            for agent, value in report["agent_prompt_tokens"].items()
+        },
+        # 참고용: 예산을 만든 실행의 기준 작업 시간 (검사에는 사용하지 않음)
+        "calibration_ms": round(calibration_ms, 3),
+        "latency_p95_ratio": {
+            stage: math.ceil(
+                max(min_latency_ms / calibration_ms, ratio * (1 + latency_headroom))
+                * 100
+            )
+            / 100
+            for stage, ratio in sorted(report["latency_p95_ratio"].items())
+        },
+    }
+    if report["mode"] == MODE_LIVE:
+        budgets["accuracy"] = {
+            label: math.floor(value * 100) / 100
+            for label, value in report["accuracy"].items()
+        }
+    return budgets
+
+
+def format_report(report: Dict[str, Any], budgets: Optional[Dict[str, Any]]) -> str:
+    budgets = budgets or {}
+    lines = [
+        format_summary(report["summary"]),
+        "",
+        f"{'tokens per turn':<36}{'mean':>10}{'budget':>10}",
+    ]
+    for key, value in report["tokens"].items():
+        lines.append(
+            f"{key:<36}{value:>10.1f}{budgets.get('tokens', {}).get(key, '-'):>10}"
+        )
+    lines.append(f"{'agent prompt tokens':<36}{'mean':>10}{'budget':>10}")
+    for agent, value in report["agent_prompt_tokens"].items():
+        limit = budgets.get("agent_prompt_tokens", {}).get(agent, "-")
+        lines.append(f"{agent:<36}{value:>10.1f}{limit:>10}")
+    calibration_ms = report["calibration_ms"]
+    lines.append(
+        f"{f'latency p95 (calibration {calibration_ms:.2f}ms)':<36}"
+        f"{'ms':>10}{'ratio':>10}{'budget':>10}{'budget ms':>10}"
+    )
+    for stage, ratio in sorted(report["latency_p95_ratio"].items()):
+        limit = budgets.get("latency_p95_ratio", {}).get(stage)
+        lines.append(
+            f"{stage:<36}{report['latency'][stage]['p95_ms']:>10.1f}{ratio:>10.1f}"
+            f"{'-' if limit is None else limit:>10}"
+            f"{'-' if limit is None else f'{limit * calibration_ms:.1f}':>10}"
+        )
+    if report["mode"] == MODE_LIVE:
+        lines.append(f"{'accuracy':<36}{'value':>10}{'floor':>10}")
+    else:
+        # 기록된 출력을 재현하므로 모델 정확도가 아니라 출력이 그대로 전달되는지를 봅니다.
+        lines.append(
+            f"{'label plumbing (canned outputs)':<36}{'match':>10}{'floor':>10}"
+        )
+    for label, value in report["accuracy"].items():
+        floor = (
+            budgets.get("accuracy", {}).get(label)
+            if report["mode"] == MODE_LIVE
+            else 1.0
+        )
+        lines.append(
+            f"{label:<36}{value:>10.0%}{'-' if floor is None else f'{floor:.0%}':>10}"
+        )
+    for mismatch in report["mismatches"]:
+        lines.append(f"  MISMATCH {mismatch}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument(
+        "--corpus", default=DEFAULT_CORPUS, help="레이블된 평가 코퍼스 JSONL 파일"
+    )
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS, help="예산 JSON 파일")
+    parser.add_argument("--repeat", type=int, default=3, help="코퍼스 반복 실행 횟수")
+    parser.add_argument(
+        "--warmup", type=int, default=3, help="측정 전에 실행할 워밍업 턴 수"
+    )
+    parser.add_argument(
+        "--live", action="store_true", help="가짜 LLM 대신 실제 모델 사용"
+    )
+    parser.add_argument(
+        "--record", help="관측된 모델 출력을 코퍼스 형식으로 저장할 JSONL 경로"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="예산을 벗어나면 종료 코드 1 반환"
+    )
+    parser.add_argument(
+        "--update-budgets", action="store_true", help="측정 결과로 예산 갱신"
+    )
+    parser.add_argument(
+        "--token-headroom", type=float, default=0.05, help="토큰 예산 여유 비율"
+    )
+    parser.add_argument(
+        "--latency-headroom", type=float, default=1.0, help="지연 시간 예산 여유 비율"
+    )
+    parser.add_argument(
+        "--min-latency-ms",
+        type=float,
+        default=20.0,
+        help="단계별 지연 시간 예산 하한 (ms, 기준 작업 시간의 배수로 환산하여 저장)",
+    )
+    parser.add_argument("--json", help="측정 결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--log-level", default="ERROR", help="로그 레벨")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    logging.basicConfig(level=args.log_level)
+
+    before = calibrate()
+    started = time.perf_counter()
+    observations = asyncio.run(run_corpus(args))
+    elapsed = time.perf_counter() - started
+    # 실행 전후 측정값의 평균으로 실행 중 머신 부하 변화의 영향을 줄입니다.
+    calibration_ms = (before + calibrate()) / 2
+    report = build_report(
+        observations, elapsed, calibration_ms, MODE_LIVE if args.live else MODE_OFFLINE
+    )
+
+    budgets: Optional[Dict[str, Any]] = None
+    if os.path.exists(args.budgets):
+        with open(args.budgets, encoding="utf-8") as f:
+            budgets = json.load(f)
+
+    print(format_report(report, budgets))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {key: value for key, value in report.items() if key != "summary"},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+    if args.record:
+        corpus_size = len(load_turns(args.corpus))
+        with open(args.record, "w", encoding="utf-8") as f:
+            for observation in observations[:corpus_size]:
+                f.write(
+                    json.dumps(observation.recorded().to_dict(), ensure_ascii=False)
+                    + "\n"
+                )
+        print(f"모델 출력 기록: {args.record}")
+    if args.update_budgets:
+        budgets = budgets_from_report(
+            report, args.token_headroom, args.latency_headroom, args.min_latency_ms
+        )
+        with open(args.budgets, "w", encoding="utf-8") as f:
+            json.dump(budgets, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"예산 갱신: {args.budgets}")
+    if args.check and budgets:
+        regressions = check_budgets(report, budgets)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+미리 정의된 출력을 반환하는 결정적(deterministic) 가짜 LLM입니다.
+
+각 에이전트에 FakeLlm 인스턴스를 하나씩 설치하고, 현재 처리 중인 턴(CannedTurn)을
+contextvar로 전달받아 선택자 출력, 도구 호출, 최종 응답을 재현합니다.
+"""
+
+import asyncio
+import json
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncGenerator, Dict, Iterable, Iterator, List, Optional, Union
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from google_maps_agents.models.schemas import SelectorOutput, selector_output_json
+
+# 에이전트별 기본 응답 지연 시간 (초). 실제 모델 호출 시간을 흉내 낼 때 사용합니다.
+DEFAULT_LLM_LATENCY: Dict[str, float] = {}
+
+
+@dataclass
+class CannedTurn:
+    """
+    가짜 LLM이 재현할 사용자 턴 하나의 정답 출력입니다.
+
+    Attributes:
+        text (str): 사용자 발화
+        route (str): 코디네이터가 위임할 하위 에이전트 이름
+        fields (str): fields_selector_agent 출력
+        types (str): types_selector_agent 출력
+        language (str): language_selector_agent 출력
+        rating_pricing (str): rating_pricing_selector_agent 출력
+        search_query (str): places_agent가 text_search_tool에 전달할 쿼리
+        address (str): geocode_agent가 geocode_tool에 전달할 주소
+        lat (Optional[float]): geocode_agent가 reverse_geocode_tool에 전달할 위도
+        lng (Optional[float]): geocode_agent가 reverse_geocode_tool에 전달할 경도
+        narrative (str): 도구 호출 이후의 최종 응답 텍스트
+    """
+
+    text: str
+    route: str = "places_sequential_agent"
+    fields: str = ""
+    types: str = ""
+    language: str = "ko"
+    rating_pricing: str = ""
+    search_query: str = ""
+    address: str = ""
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    narrative: str = "요청하신 결과를 찾았습니다."
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CannedTurn":
+        """JSONL 레코드에서 CannedTurn을 생성합니다. 알 수 없는 키는 extra에 보관합니다."""
+        known = {name for name in cls.__dataclass_fields__ if name != "extra"}
+        kwargs = {key: value for key, value in data.items() if key in known}
+        extra = {key: value for key, value in data.items() if key not in known}
+        return cls(**kwargs, extra=extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONL 레코드로 저장할 딕셔너리를 반환합니다."""
+        data = asdict(self)
+        data.update(data.pop("extra"))
+        return data
+
+
+def load_turns(path: str) -> List[CannedTurn]:
+    """JSONL 파일에서 CannedTurn 목록을 읽어 옵니다."""
+    with open(path, encoding="utf-8") as f:
+        return [CannedTurn.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+current_turn: ContextVar[CannedTurn] = ContextVar("current_turn")
+
+
+def _estimate_tokens(text: str) -> int:
+    """문자 수 기반의 결정적 토큰 수 추정치입니다."""
+    return max(1, len(text) // 4)
+
+
+def _request_text(llm_request: LlmRequest) -> str:
+    parts: List[str] = []
+    if llm_request.config and llm_request.config.system_instruction:
+        parts.append(str(llm_request.config.system_instruction))
+    for content in llm_request.contents:
+        for part in content.parts or []:
+            parts.append(part.text or "")
+            if part.function_response:
+                parts.append(json.dumps(part.function_response.response, default=str))
+    return "".join(parts)
+
+
+class FakeLlm(BaseLlm):
+    """
+    현재 턴의 정답 출력을 반환하는 가짜 LLM입니다.
+
+    Attributes:
+        model (str): 보고용 모델 이름
+        agent_name (str): 이 인스턴스를 사용하는 에이전트 이름
+        latency (float): 호출당 응답 지연 시간 (초)
+        stream_chunk_chars (int): 스트리밍 호출 시 부분 응답의 글자 수
+    """
+
+    agent_name: str
+    latency: float = 0.0
+    stream_chunk_chars: int = 8
+
+    def _output(self, llm_request: LlmRequest) -> types.Part | str:
+        turn = current_turn.get()
+        last = llm_request.contents[-1] if llm_request.contents else None
+        after_tool = last is not None and any(
+            part.function_response for part in last.parts or []
+        )
+
+        if self.agent_name == "coordinator_agent":
+            if after_tool:
+                return turn.narrative
+            return types.Part(
+                function_call=types.FunctionCall(
+                    name="transfer_to_agent", args={"agent_name": turn.route}
+                )
+            )
+        if self.agent_name == "places_agent":
+            if after_tool:
+                return turn.narrative
+            return types.Part(
+                function_call=types.FunctionCall(
+                    name="text_search_tool",
+                    args={"query": turn.search_query or turn.text},
+                )
+            )
+        if self.agent_name == "geocode_agent":
+            if after_tool:
+                return turn.narrative
+            if turn.lat is not None and turn.lng is not None:
+                name = "reverse_geocode_tool"
+                args = {
+                    "lat": turn.lat,
+                    "lng": turn.lng,
+                    "language": turn.language,
+                    "granularity": "",
+                }
+            else:
+                name = "geocode_tool"
+                args = {"address": turn.address or turn.text, "language": turn.language}
+            return types.Part(function_call=types.FunctionCall(name=name, args=args))
+
+        selector_outputs = {
+            "fields_selector_agent": turn.fields,
+            "types_selector_agent": turn.types,
+            "language_selector_agent": turn.language,
+            "rating_pricing_selector_agent": turn.rating_pricing,
+        }
+        output = selector_outputs.get(self.agent_name, turn.narrative)
+        # output_schema가 있는 선택자는 실제 모델처럼 스키마에 맞는 JSON을 반환합니다.
+        schema = llm_request.config.response_schema if llm_request.config else None
+        if isinstance(schema, type) and issubclass(schema, SelectorOutput):
+            return selector_output_json(schema, output) or output
+        return output
+
+    def _usage(
+        self, llm_request: LlmRequest, output: str
+    ) -> types.GenerateContentResponseUsageMetadata:
+        prompt_tokens = _estimate_tokens(_request_text(llm_request))
+        candidates_tokens = _estimate_tokens(output)
+        return types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt_tokens,
+            candidates_token_count=candidates_tokens,
+            total_token_count=prompt_tokens + candidates_tokens,
+        )
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """현재 턴의 정답 출력을 (선택적으로 스트리밍하여) 반환합니다."""
+        output = self._output(llm_request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if isinstance(output, types.Part):
+            call = output.function_call
+            usage = self._usage(llm_request, json.dumps(call.args if call else {}))
+            yield LlmResponse(
+                content=types.Content(role="model", parts=[output]),
+                usage_metadata=usage,
+            )
+            return
+
+        if stream:
+            for start in range(0, len(output), self.stream_chunk_chars):
+                chunk = output[start : start + self.stream_chunk_chars]
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=chunk)]),
+                    partial=True,
+                )
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=output)]),
+            usage_metadata=self._usage(llm_request, output),
+        )
+
+
+def iter_llm_agents(agent: BaseAgent) -> Iterator[LlmAgent]:
+    """에이전트 트리에 포함된 모든 LlmAgent를 순회합니다."""
+    if isinstance(agent, LlmAgent):
+        yield agent
+    for sub_agent in agent.sub_agents:
+        yield from iter_llm_agents(sub_agent)
+
+
+def install_fake_llms(
+    root: BaseAgent, latency: Optional[Dict[str, float]] = None
+) -> Dict[str, Union[str, BaseLlm]]:
+    """
+    에이전트 트리의 모든 LlmAgent 모델을 FakeLlm으로 교체합니다.
+
+    Args:
+        root (BaseAgent): root_agent
+        latency (Optional[Dict[str, float]]): 에이전트별 응답 지연 시간 (초).
+            "*" 키는 나머지 모든 에이전트에 적용됩니다.
+
+    Returns:
+        Dict[str, Union[str, BaseLlm]]: 원래 모델 (restore_models()에 전달)
+    """
+    latency = {**DEFAULT_LLM_LATENCY, **(latency or {})}
+    originals: Dict[str, Union[str, BaseLlm]] = {}
+    for agent in iter_llm_agents(root):
+        originals[agent.name] = agent.model
+        agent.model = FakeLlm(
+            model=f"fake-{agent.name}",
+            agent_name=agent.name,
+            latency=latency.get(agent.name, latency.get("*", 0.0)),
+        )
+    return originals
+
+
+def restore_models(root: BaseAgent, originals: Dict[str, Union[str, BaseLlm]]) -> None:
+    """install_fake_llms()로 교체한 모델을 원래대로 되돌립니다."""
+    for agent in iter_llm_agents(root):
+        if agent.name in originals:
+            agent.model = originals[agent.name]
+
+
+def turns_from_texts(texts: Iterable[str]) -> List[CannedTurn]:
+    """발화 텍스트만 있는 경우 기본 출력을 사용하는 CannedTurn 목록을 만듭니다."""
+    return [CannedTurn(text=text) for text in texts]
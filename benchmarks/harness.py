@@ -0,0 +1,270 @@
+"""
+대역 서버와 가짜 LLM을 root_agent에 연결하고, 턴 단위 지연 시간을 측정하는 공용 도구입니다.
+"""
+
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from google.adk.agents.run_config import RunConfig
+from google.adk.events import Event
+from google.adk.models.base_llm import BaseLlm
+from google.adk.runners import Runner
+from google.genai import types
+
+from .fake_llm import CannedTurn, current_turn, install_fake_llms, restore_models
+from .stub_servers import GeocodeStubServer, PlacesStubServer
+
+# 서비스 생성 시 필요한 API 키 (대역 서버는 키를 검사하지 않습니다)
+os.environ.setdefault("GOOGLE_PLACES_API_KEY", "offline-benchmark-key")
+os.environ.setdefault("GOOGLE_MAPS_API_KEY", "offline-benchmark-key")
+
+from google_maps_agents.agent import root_agent  # noqa: E402
+from google_maps_agents.tools import geocode, places  # noqa: E402
+from google_maps_agents.tools.registry import service_registry  # noqa: E402
+
+APP_NAME = "google_maps_agents_bench"
+TURN_STAGE = "turn"
+
+
+@dataclass
+class TurnResult:
+    """
+    사용자 턴 하나의 측정 결과입니다.
+
+    Attributes:
+        text (str): 사용자 발화
+        latency (float): 엔드투엔드 지연 시간 (초)
+        stages (Dict[str, float]): 단계(에이전트/도구)별 소요 시간 (초)
+        events (List[Event]): 턴 동안 생성된 ADK 이벤트
+        error (Optional[str]): 실행 중 발생한 오류
+    """
+
+    text: str
+    latency: float
+    stages: Dict[str, float] = field(default_factory=dict)
+    events: List[Event] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def stage_name(event: Event) -> str:
+    """이벤트를 만든 단계 이름을 반환합니다. 도구 응답 이벤트는 'tool:<이름>'으로 구분합니다."""
+    responses = event.get_function_responses()
+    if responses:
+        return f"tool:{responses[0].name}"
+    return event.author
+
+
+def attribute_stages(events: Iterable[Event], started_at: float) -> Dict[str, float]:
+    """
+    이벤트 타임스탬프 간격을 각 이벤트를 만든 단계에 귀속시켜 단계별 소요 시간을 계산합니다.
+
+    Args:
+        events (Iterable[Event]): 시간순 ADK 이벤트
+        started_at (float): 턴 시작 시각 (time.time())
+
+    Returns:
+        Dict[str, float]: 단계별 소요 시간 (초)
+    """
+    stages: Dict[str, float] = {}
+    previous = started_at
+    for event in events:
+        name = stage_name(event)
+        stages[name] = stages.get(name, 0.0) + max(0.0, event.timestamp - previous)
+        previous = max(previous, event.timestamp)
+    return stages
+
+
+async def run_turn(
+    runner: Runner,
+    user_id: str,
+    session_id: str,
+    turn: CannedTurn,
+    run_config: Optional[RunConfig] = None,
+) -> TurnResult:
+    """
+    사용자 턴 하나를 실행하고 엔드투엔드/단계별 지연 시간을 측정합니다.
+
+    Args:
+        runner (Runner): root_agent를 감싼 Runner
+        user_id (str): 사용자 ID
+        session_id (str): 세션 ID
+        turn (CannedTurn): 실행할 턴 (가짜 LLM이 사용할 정답 출력 포함)
+        run_config (Optional[RunConfig]): Runner 실행 설정
+
+    Returns:
+        TurnResult: 측정 결과
+    """
+    token = current_turn.set(turn)
+    message = types.Content(role="user", parts=[types.Part(text=turn.text)])
+    events: List[Event] = []
+    error: Optional[str] = None
+    started_at = time.time()
+    started = time.perf_counter()
+    try:
+        async for event in runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=message,
+            run_config=run_config or RunConfig(),
+        ):
+            events.append(event)
+            if event.error_code:
+                error = event.error_code
+    except Exception as e:
+        error = type(e).__name__
+    finally:
+        current_turn.reset(token)
+    latency = time.perf_counter() - started
+
+    for event in events:
+        for response in event.get_function_responses():
+            if isinstance(response.response, dict) and "error" in response.response:
+                error = error or f"tool:{response.name}"
+
+    return TurnResult(
+        text=turn.text,
+        latency=latency,
+        stages=attribute_stages(events, started_at),
+        events=events,
+        error=error,
+    )
+
+
+def percentile(values: List[float], q: float) -> float:
+    """값 목록의 q 백분위수(0~100)를 선형 보간으로 계산합니다."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[
+        min(98, max(0, int(q) - 1))
+    ]
+
+
+def summarize(results: List[TurnResult], elapsed: float) -> Dict[str, Any]:
+    """
+    턴 측정 결과를 집계합니다.
+
+    Returns:
+        Dict[str, Any]: {"turns", "errors", "error_rate", "throughput_rps",
+            "stages": {단계: {"count", "mean_ms", "p50_ms", "p95_ms", "p99_ms"}}}
+    """
+    samples: Dict[str, List[float]] = {TURN_STAGE: [r.latency for r in results]}
+    for result in results:
+        for name, seconds in result.stages.items():
+            samples.setdefault(name, []).append(seconds)
+
+    errors: Dict[str, int] = {}
+    for result in results:
+        if result.error:
+            errors[result.error] = errors.get(result.error, 0) + 1
+
+    return {
+        "turns": len(results),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(results) / elapsed if elapsed else 0.0,
+        "errors": errors,
+        "error_rate": sum(errors.values()) / len(results) if results else 0.0,
+        "stages": {
+            name: {
+                "count": len(values),
+                "mean_ms": statistics.fmean(values) * 1000,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+            }
+            for name, values in samples.items()
+        },
+    }
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """집계 결과를 사람이 읽기 쉬운 표 형태의 문자열로 변환합니다."""
+    lines = [
+        f"turns={summary['turns']} elapsed={summary['elapsed_s']:.2f}s "
+        f"throughput={summary['throughput_rps']:.1f} turns/s "
+        f"error_rate={summary['error_rate']:.2%} {summary['errors'] or ''}",
+        f"{'stage':<36}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}  (ms)",
+    ]
+    for name, stats in sorted(
+        summary["stages"].items(), key=lambda item: -item[1]["mean_ms"]
+    ):
+        lines.append(
+            f"{name:<36}{stats['count']:>7}{stats['mean_ms']:>10.2f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+class OfflineEnvironment:
+    """
+    대역 서버를 띄우고 서비스와 root_agent 모델을 오프라인용으로 교체하는 컨텍스트입니다.
+
+    실행 중인 이벤트 루프 안에서 async with로 사용합니다.
+
+    Example:
+        >>> async with OfflineEnvironment(places_latency=0.02) as env:
+        ...     result = await run_turn(env.runner, "bench", session.id, turn)
+    """
+
+    def __init__(
+        self,
+        places_latency: float = 0.0,
+        geocode_latency: float = 0.0,
+        llm_latency: Optional[Dict[str, float]] = None,
+        fake_llm: bool = True,
+        places_kwargs: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+    ):
+        self.places_server = PlacesStubServer(
+            latency=places_latency, **(places_kwargs or {})
+        )
+        self.geocode_server = GeocodeStubServer(latency=geocode_latency)
+        self.llm_latency = llm_latency
+        self.fake_llm = fake_llm
+        # 코퍼스를 반복 재생하므로 기본적으로 결과 캐시를 끄고 업스트림 경로를 측정합니다.
+        self.cache = cache
+        self.runner: Optional[Runner] = None
+        self._originals: Dict[str, Union[str, BaseLlm]] = {}
+
+    async def __aenter__(self) -> "OfflineEnvironment":
+        from google.adk.runners import InMemoryRunner
+
+        self.places_server.start()
+        self.geocode_server.start()
+        cache_kwargs = {} if self.cache else {"cache_ttl": 0}
+        await service_registry.aclose()
+        service_registry.set(
+            "places",
+            places.PlacesService(
+                client=self.places_server.create_client(), **cache_kwargs
+            ),
+        )
+        service_registry.set(
+            "geocoding",
+            geocode.GeocodingService(
+                base_url=self.geocode_server.base_url, **cache_kwargs
+            ),
+        )
+        if self.fake_llm:
+            self._originals = install_fake_llms(root_agent, self.llm_latency)
+        self.runner = InMemoryRunner(agent=root_agent, app_name=APP_NAME)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._originals:
+            restore_models(root_agent, self._originals)
+        await service_registry.aclose()
+        self.places_server.stop()
+        self.geocode_server.stop()
+
+    async def new_session(self, user_id: str = "bench") -> str:
+        """새 세션을 만들고 ID를 반환합니다."""
+        assert self.runner is not None
+        session = await self.runner.session_service.create_session(
+            app_name=APP_NAME, user_id=user_id
+        )
+        return session.id
@@ -0,0 +1,219 @@
+"""
+`python -X importtime` 기반 임포트/콜드 스타트 시간 벤치마크입니다.
+
+대상 모듈을 새 인터프리터에서 여러 번 임포트하여 누적 임포트 시간의 중앙값과
+최상위 패키지별 자체(self) 시간, 가장 느린 모듈을 보고합니다. 결과는 저장소에 기록된
+기준값(data/import_time_baseline.json)과 비교하며, --check를 지정하면 허용 범위를 넘는
+회귀가 있을 때 종료 코드 1을 반환합니다.
+
+사용법:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --check --tolerance 0.3
+    python -m benchmarks.import_time --update-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# 패키지 자체(google_maps_agents)는 지연 로딩으로 거의 비용이 없으므로, 실제 콜드 스타트인
+# 에이전트 생성(google_maps_agents.agent)과 config만 쓰는 경량 프로세스 경로를 측정합니다.
+DEFAULT_MODULES = ("google_maps_agents.agent", "google_maps_agents.config")
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "data", "import_time_baseline.json"
+)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class ImportProfile:
+    """
+    한 번의 임포트 측정 결과입니다.
+
+    Attributes:
+        module (str): 임포트한 모듈
+        total_ms (float): 대상 모듈의 누적 임포트 시간 (밀리초)
+        self_ms (Dict[str, float]): 모듈별 자체 임포트 시간 (밀리초)
+        cumulative_ms (Dict[str, float]): 모듈별 누적 임포트 시간 (밀리초)
+    """
+
+    module: str
+    total_ms: float
+    self_ms: Dict[str, float] = field(default_factory=dict)
+    cumulative_ms: Dict[str, float] = field(default_factory=dict)
+
+    def by_package(self) -> Dict[str, float]:
+        """최상위 패키지(google.* 는 두 단계)별 자체 시간 합계를 반환합니다."""
+        totals: Dict[str, float] = {}
+        for name, value in self.self_ms.items():
+            parts = name.split(".")
+            package = (
+                ".".join(parts[:2])
+                if parts[0] == "google" and len(parts) > 1
+                else parts[0]
+            )
+            totals[package] = totals.get(package, 0.0) + value
+        return totals
+
+
+def parse_importtime(stderr: str, module: str) -> ImportProfile:
+    """-X importtime 출력(stderr)을 파싱합니다."""
+    profile = ImportProfile(module=module, total_ms=0.0)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (
+            part.strip() for part in line.partition(":")[2].split("|", 2)
+        )
+        # 같은 모듈이 여러 번 나타나면(하위 모듈 임포트 중 재진입) 처음 값을 사용합니다.
+        profile.self_ms.setdefault(name, int(self_us) / 1000)
+        profile.cumulative_ms.setdefault(name, int(cumulative_us) / 1000)
+    profile.total_ms = profile.cumulative_ms.get(module, 0.0)
+    return profile
+
+
+def profile_import(module: str, python: str = sys.executable) -> ImportProfile:
+    """새 인터프리터에서 모듈을 임포트하고 임포트 시간을 측정합니다."""
+    pythonpath = os.pathsep.join(filter(None, [PROJECT_ROOT, os.getenv("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": pythonpath}
+    env.setdefault("GOOGLE_PLACES_API_KEY", "import-time-benchmark-key")
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=env,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} 임포트 실패:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr, module)
+
+
+def run_profiles(modules: List[str], runs: int, top: int) -> Dict[str, Dict[str, Any]]:
+    """모듈별로 runs번 측정하여 중앙값과 느린 모듈/패키지 목록을 집계합니다."""
+    report: Dict[str, Dict[str, Any]] = {}
+    for module in modules:
+        profiles = [profile_import(module) for _ in range(runs)]
+        median = statistics.median(p.total_ms for p in profiles)
+        # 중앙값에 가장 가까운 측정을 대표값으로 사용합니다.
+        representative = min(profiles, key=lambda p: abs(p.total_ms - median))
+        packages = sorted(representative.by_package().items(), key=lambda kv: -kv[1])
+        slowest = sorted(representative.self_ms.items(), key=lambda kv: -kv[1])
+        report[module] = {
+            "median_ms": median,
+            "min_ms": min(p.total_ms for p in profiles),
+            "max_ms": max(p.total_ms for p in profiles),
+            "modules_imported": len(representative.self_ms),
+            "packages_ms": dict(packages[:top]),
+            "slowest_self_ms": dict(slowest[:top]),
+        }
+    return report
+
+
+def compare(
+    report: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+    min_delta_ms: float = 0.0,
+) -> List[str]:
+    """
+    기준값 대비 median_ms가 tolerance 비율 이상, 그리고 min_delta_ms 이상 증가한 모듈의
+    설명 목록을 반환합니다. 수십 ms 이하의 가벼운 임포트는 측정 잡음만으로도 비율 한도를
+    넘기 때문에 절대 증가량 하한을 함께 적용합니다.
+    """
+    regressions: List[str] = []
+    for module, result in report.items():
+        base = baseline.get(module)
+        if not base:
+            continue
+        limit = float(base["median_ms"]) * (1 + tolerance)
+        limit = max(limit, float(base["median_ms"]) + min_delta_ms)
+        if float(result["median_ms"]) > limit:
+            regressions.append(
+                f"{module}: {result['median_ms']:.0f}ms > {base['median_ms']:.0f}ms x {1 + tolerance:.2f}"
+            )
+    return regressions
+
+
+def format_report(
+    report: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]]
+) -> str:
+    lines: List[str] = []
+    for module, result in report.items():
+        base = (baseline or {}).get(module)
+        delta = ""
+        if base:
+            change = float(result["median_ms"]) / float(base["median_ms"]) - 1
+            delta = f" (baseline {base['median_ms']:.0f}ms, {change:+.0%})"
+        lines.append(
+            f"{module}: median={result['median_ms']:.0f}ms min={result['min_ms']:.0f}ms "
+            f"max={result['max_ms']:.0f}ms modules={result['modules_imported']}{delta}"
+        )
+        lines.append("  packages (self ms):")
+        for name, value in result["packages_ms"].items():
+            lines.append(f"    {name:<48}{value:>10.1f}")
+        lines.append("  slowest modules (self ms):")
+        for name, value in result["slowest_self_ms"].items():
+            lines.append(f"    {name:<72}{value:>10.1f}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument(
+        "--module", action="append", help="측정할 모듈 (여러 번 지정 가능)"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="모듈별 측정 횟수")
+    parser.add_argument(
+        "--top", type=int, default=15, help="보고할 느린 모듈/패키지 수"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="측정 결과로 기준값 갱신"
+    )
+    parser.add_argument("--check", action="store_true", help="회귀 시 종료 코드 1 반환")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 증가 비율")
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=20.0,
+        help="회귀로 판단할 최소 증가량 (ms)",
+    )
+    parser.add_argument("--json", help="측정 결과를 저장할 JSON 파일 경로")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    report = run_profiles(args.module or list(DEFAULT_MODULES), args.runs, args.top)
+
+    baseline: Optional[Dict[str, Dict[str, Any]]] = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(format_report(report, baseline))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({**(baseline or {}), **report}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"기준값 갱신: {args.baseline}")
+    if args.check and baseline:
+        regressions = compare(report, baseline, args.tolerance, args.min_delta_ms)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
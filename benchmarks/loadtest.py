@@ -0,0 +1,313 @@
+"""
+JSONL 사용자 턴 코퍼스를 root_agent Runner에 재생하는 부하 발생기입니다.
+
+- closed 루프: --concurrency 개의 가상 사용자가 응답을 받은 뒤(선택적 think time 후) 다음 턴을 보냅니다.
+- open 루프: --rate(턴/초) 포아송 도착률로 응답 여부와 무관하게 턴을 보냅니다.
+  --concurrency는 동시 실행 상한으로 사용되며, 상한 대기 시간은 'queue' 단계로 집계됩니다.
+- --sessions N: N개의 세션을 재사용합니다(0이면 턴마다 새 세션). 한 세션에서는 턴이 순차 실행됩니다.
+- --backend stub: 로컬 대역 서버 + 가짜 LLM (--llm real로 실제 모델만 사용 가능)
+- --backend real: 실제 Google API와 모델 (.env의 API 키 필요)
+
+코퍼스 레코드는 최소한 발화 텍스트 필드(--text-key, 기본값 "text")를 포함해야 하며,
+CannedTurn의 나머지 필드는 가짜 LLM을 사용할 때만 의미가 있습니다.
+
+사용법:
+    python -m benchmarks.loadtest --mode open --rate 20 --duration 30 --sessions 16
+    python -m benchmarks.loadtest --mode closed --concurrency 8 --turns 500 --json load.json
+    python -m benchmarks.loadtest --backend real --corpus my_turns.jsonl --turns 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# 실제 백엔드 사용 시 harness가 더미 API 키를 설정하기 전에 .env를 읽어 옵니다.
+load_dotenv()
+
+from .fake_llm import CannedTurn  # noqa: E402
+from .harness import TurnResult  # noqa: E402
+from .harness import (
+    APP_NAME,
+    OfflineEnvironment,
+    format_summary,
+    root_agent,
+    run_turn,
+    summarize,
+)
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "data", "turns.jsonl")
+QUEUE_STAGE = "queue"
+USER_ID = "loadtest"
+
+
+def load_corpus(path: str, text_key: str = "text") -> List[CannedTurn]:
+    """
+    JSONL 코퍼스를 읽어 CannedTurn 목록으로 변환합니다.
+
+    text_key 필드가 없는 레코드는 건너뜁니다.
+    """
+    turns: List[CannedTurn] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            text = record.get(text_key)
+            if not isinstance(text, str) or not text.strip():
+                continue
+            record = {**record, "text": text}
+            if text_key != "text":
+                record.pop(text_key, None)
+            turns.append(CannedTurn.from_dict(record))
+    if not turns:
+        raise ValueError(f"'{text_key}' 필드를 가진 레코드가 없습니다: {path}")
+    return turns
+
+
+class SessionPool:
+    """
+    재사용할 세션 풀입니다. size가 0이면 턴마다 새 세션을 만듭니다.
+
+    같은 세션에서 턴이 동시에 실행되지 않도록 대여/반납 방식으로 관리합니다.
+    """
+
+    def __init__(self, runner, size: int):
+        self.runner = runner
+        self.size = size
+        self._idle: Optional[asyncio.Queue] = None
+
+    async def _create(self) -> str:
+        session = await self.runner.session_service.create_session(
+            app_name=self.runner.app_name, user_id=USER_ID
+        )
+        return session.id
+
+    async def start(self) -> None:
+        if self.size > 0:
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(await self._create())
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[str]:
+        if self._idle is None:
+            yield await self._create()
+            return
+        session_id = await self._idle.get()
+        try:
+            yield session_id
+        finally:
+            self._idle.put_nowait(session_id)
+
+
+class LoadTest:
+    """
+    코퍼스의 턴을 지정한 부하 모델로 실행하고 결과를 수집합니다.
+
+    Attributes:
+        runner: root_agent를 감싼 ADK Runner
+        corpus (List[CannedTurn]): 재생할 턴 목록 (순환 사용)
+        sessions (SessionPool): 세션 풀
+        concurrency (int): closed 루프의 가상 사용자 수 / open 루프의 동시 실행 상한
+        results (List[TurnResult]): 완료된 턴 결과
+    """
+
+    def __init__(
+        self, runner, corpus: List[CannedTurn], sessions: SessionPool, concurrency: int
+    ):
+        self.runner = runner
+        self.corpus = corpus
+        self.sessions = sessions
+        self.concurrency = concurrency
+        self.results: List[TurnResult] = []
+        self._next = 0
+
+    def _take(self) -> CannedTurn:
+        turn = self.corpus[self._next % len(self.corpus)]
+        self._next += 1
+        return turn
+
+    async def _execute(self, turn: CannedTurn, queued_at: float) -> None:
+        async with self.sessions.acquire() as session_id:
+            waited = time.perf_counter() - queued_at
+            result = await run_turn(self.runner, USER_ID, session_id, turn)
+        result.stages[QUEUE_STAGE] = waited
+        result.latency += waited
+        self.results.append(result)
+
+    async def run_closed(
+        self, turns: Optional[int], duration: Optional[float], think_time: float = 0.0
+    ) -> float:
+        """가상 사용자 concurrency명이 순차적으로 턴을 보냅니다. 경과 시간(초)을 반환합니다."""
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+
+        def more() -> bool:
+            if turns is not None and self._next >= turns:
+                return False
+            return deadline is None or time.perf_counter() < deadline
+
+        async def user() -> None:
+            while more():
+                await self._execute(self._take(), time.perf_counter())
+                if think_time:
+                    await asyncio.sleep(random.expovariate(1 / think_time))
+
+        await asyncio.gather(*(user() for _ in range(self.concurrency)))
+        return time.perf_counter() - started
+
+    async def run_open(
+        self, rate: float, turns: Optional[int], duration: Optional[float]
+    ) -> float:
+        """포아송 도착률 rate(턴/초)로 턴을 보냅니다. 경과 시간(초)을 반환합니다."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: List[asyncio.Task] = []
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+
+        async def limited(turn: CannedTurn, queued_at: float) -> None:
+            async with semaphore:
+                await self._execute(turn, queued_at)
+
+        next_arrival = started
+        while (turns is None or self._next < turns) and (
+            deadline is None or next_arrival < deadline
+        ):
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(
+                asyncio.create_task(limited(self._take(), time.perf_counter()))
+            )
+            next_arrival += random.expovariate(rate)
+
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+
+@asynccontextmanager
+async def backend(args: argparse.Namespace) -> AsyncIterator[object]:
+    """--backend/--llm 설정에 맞는 Runner를 제공합니다."""
+    if args.backend == "stub":
+        async with OfflineEnvironment(
+            places_latency=args.places_latency_ms / 1000,
+            geocode_latency=args.geocode_latency_ms / 1000,
+            llm_latency={"*": args.llm_latency_ms / 1000},
+            fake_llm=args.llm == "fake",
+            cache=args.cache,
+        ) as env:
+            yield env.runner
+        return
+
+    from google.adk.runners import InMemoryRunner
+
+    yield InMemoryRunner(agent=root_agent, app_name=APP_NAME)
+
+
+async def run_loadtest(args: argparse.Namespace) -> Dict[str, object]:
+    """설정에 따라 부하를 발생시키고 집계 결과를 반환합니다."""
+    args.llm = args.llm or ("fake" if args.backend == "stub" else "real")
+    if args.backend == "real" and args.llm == "fake":
+        raise ValueError("--backend real은 --llm real과 함께 사용해야 합니다.")
+    if args.mode == "open" and not args.rate:
+        raise ValueError("open 루프에는 --rate가 필요합니다.")
+
+    random.seed(args.seed)
+    corpus = load_corpus(args.corpus, args.text_key)
+    turns = args.turns if args.turns or args.duration else len(corpus)
+    async with backend(args) as runner:
+        sessions = SessionPool(runner, args.sessions)
+        await sessions.start()
+        load = LoadTest(runner, corpus, sessions, args.concurrency)
+        if args.mode == "open":
+            elapsed = await load.run_open(args.rate, turns, args.duration)
+        else:
+            elapsed = await load.run_closed(
+                turns, args.duration, args.think_time_ms / 1000
+            )
+
+    summary = summarize(load.results, elapsed)
+    summary["config"] = {
+        key: getattr(args, key)
+        for key in (
+            "mode",
+            "backend",
+            "llm",
+            "concurrency",
+            "rate",
+            "sessions",
+            "corpus",
+        )
+    }
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="사용자 턴 JSONL 파일")
+    parser.add_argument(
+        "--text-key", default="text", help="레코드에서 발화 텍스트를 읽을 필드"
+    )
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="closed: 가상 사용자 수 / open: 동시 실행 상한",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=0.0, help="open 루프 도착률 (턴/초)"
+    )
+    parser.add_argument("--turns", type=int, help="실행할 턴 수 (기본값: 코퍼스 크기)")
+    parser.add_argument(
+        "--duration", type=float, help="실행 시간 (초). --turns보다 먼저 도달하면 종료"
+    )
+    parser.add_argument(
+        "--think-time-ms",
+        type=float,
+        default=0.0,
+        help="closed 루프에서 턴 사이 평균 대기 시간 (지수 분포)",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=0,
+        help="재사용할 세션 수 (0이면 턴마다 새 세션)",
+    )
+    parser.add_argument("--backend", choices=("stub", "real"), default="stub")
+    parser.add_argument(
+        "--llm",
+        choices=("fake", "real"),
+        help="기본값: stub 백엔드는 fake, real 백엔드는 real",
+    )
+    parser.add_argument("--places-latency-ms", type=float, default=30.0)
+    parser.add_argument("--geocode-latency-ms", type=float, default=20.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--cache", action="store_true", help="stub 백엔드에서 결과 캐시 사용"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="도착 간격 난수 시드")
+    parser.add_argument("--json", help="집계 결과를 저장할 JSON 파일 경로")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    summary = asyncio.run(run_loadtest(args))
+    print(format_summary(summary))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
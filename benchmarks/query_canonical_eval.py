@@ -0,0 +1,139 @@
+"""
+쿼리 정규화(google_maps_agents.canonical)의 병합 정확도를 평가하는 하네스입니다.
+
+레이블된 쿼리 쌍(data/query_pairs.jsonl, {"a", "b", "same"})에 대해 정규형 일치와
+MinHash 근사 중복 탐지(임계값별)가 두 쿼리를 같은 캐시 키로 묶는지 확인하고,
+올바른 병합(재현율)과 잘못된 병합 수를 보고합니다. 잘못된 병합은 다른 장소 검색 결과를
+반환하게 되므로, --check를 지정하면 허용치를 넘는 잘못된 병합이 있을 때 종료 코드 1을 반환합니다.
+
+사용법:
+    python -m benchmarks.query_canonical_eval
+    python -m benchmarks.query_canonical_eval --thresholds 0.7,0.8,0.9 --check --threshold 0.8
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from google_maps_agents.canonical import NearDuplicateIndex, canonicalize_query
+
+DEFAULT_PAIRS = os.path.join(os.path.dirname(__file__), "data", "query_pairs.jsonl")
+
+
+@dataclass
+class MergeReport:
+    """
+    한 가지 병합 방식의 평가 결과입니다.
+
+    Attributes:
+        name (str): 방식 이름 (예: "canonical", "minhash@0.80")
+        true_merges (int): 같은 쌍을 묶은 수
+        missed_merges (int): 같은 쌍을 묶지 못한 수
+        false_merges (List[str]): 다른 쌍을 묶은 경우의 설명 목록
+    """
+
+    name: str
+    true_merges: int = 0
+    missed_merges: int = 0
+    false_merges: List[str] = field(default_factory=list)
+
+    @property
+    def recall(self) -> float:
+        total = self.true_merges + self.missed_merges
+        return self.true_merges / total if total else 0.0
+
+
+def load_pairs(path: str) -> List[Dict[str, object]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(pairs: List[Dict[str, object]], threshold: Optional[float]) -> MergeReport:
+    """
+    쌍마다 독립된 색인에 a를 먼저 등록한 뒤 b가 같은 키로 해석되는지 확인합니다.
+
+    threshold가 None이면 정규형 일치만 사용합니다.
+    """
+    report = MergeReport(
+        name="canonical" if threshold is None else f"minhash@{threshold:.2f}"
+    )
+    for pair in pairs:
+        a, b = canonicalize_query(str(pair["a"])), canonicalize_query(str(pair["b"]))
+        if threshold is None:
+            merged = a == b
+        else:
+            index = NearDuplicateIndex(threshold)
+            merged = index.resolve(a) == index.resolve(b)
+        if pair["same"]:
+            if merged:
+                report.true_merges += 1
+            else:
+                report.missed_merges += 1
+        elif merged:
+            report.false_merges.append(f"{pair['a']!r} ~ {pair['b']!r} ({a!r} / {b!r})")
+    return report
+
+
+def format_report(reports: List[MergeReport]) -> str:
+    lines = [f"{'method':<16}{'recall':>8}{'merged':>8}{'missed':>8}{'false':>8}"]
+    for report in reports:
+        lines.append(
+            f"{report.name:<16}{report.recall:>8.0%}{report.true_merges:>8}"
+            f"{report.missed_merges:>8}{len(report.false_merges):>8}"
+        )
+        for false_merge in report.false_merges:
+            lines.append(f"  FALSE MERGE {false_merge}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument(
+        "--pairs", default=DEFAULT_PAIRS, help="레이블된 쿼리 쌍 JSONL 파일"
+    )
+    parser.add_argument(
+        "--thresholds",
+        default="0.6,0.7,0.8,0.9",
+        help="평가할 MinHash 임계값 (쉼표 구분)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help="--check 대상 MinHash 임계값 (기본값: 정규형 일치만 검사)",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="잘못된 병합이 있으면 종료 코드 1 반환"
+    )
+    parser.add_argument(
+        "--max-false-merges", type=int, default=0, help="허용할 잘못된 병합 수"
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    pairs = load_pairs(args.pairs)
+    thresholds = [float(t) for t in args.thresholds.split(",") if t.strip()]
+    if args.threshold is not None and args.threshold not in thresholds:
+        thresholds.append(args.threshold)
+
+    reports = [evaluate(pairs, None)] + [evaluate(pairs, t) for t in sorted(thresholds)]
+    print(f"pairs={len(pairs)} same={sum(bool(p['same']) for p in pairs)}")
+    print(format_report(reports))
+
+    if args.check:
+        checked = [reports[0]]
+        if args.threshold is not None:
+            checked.append(evaluate(pairs, args.threshold))
+        failed = [r for r in checked if len(r.false_merges) > args.max_false_merges]
+        for report in failed:
+            print(f"REGRESSION {report.name}: {len(report.false_merges)} false merges")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+네트워크 없이 벤치마크를 실행하기 위한 로컬 대역(stand-in) 서버입니다.
+
+- GeocodeStubServer: v4beta geocode HTTP 엔드포인트(/address/{주소}, /location/{위도,경도})
+- PlacesStubServer: google.maps.places.v1.Places/SearchText gRPC 엔드포인트
+
+두 서버 모두 별도 스레드에서 동작하므로 벤치마크 대상 이벤트 루프와 경쟁하지 않습니다.
+"""
+
+import json
+import re
+import threading
+import time
+import zlib
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import grpc
+from google.maps import places_v1
+from google.maps.places_v1.services.places.transports.grpc_asyncio import (
+    PlacesGrpcAsyncIOTransport,
+)
+from google.maps.places_v1.types import Place, SearchTextRequest, SearchTextResponse
+
+PLACES_SERVICE_NAME = "google.maps.places.v1.Places"
+
+
+class GeocodeStubServer:
+    """
+    v4beta geocode 엔드포인트를 흉내 내는 HTTP 서버입니다.
+
+    Attributes:
+        latency (float): 요청당 응답 지연 시간 (초)
+        requests (int): 처리한 요청 수
+        base_url (str): GeocodingService(base_url=...)에 전달할 기본 URL
+    """
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1"):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 (http.server 규약)
+                stub._count()
+                if stub.latency:
+                    time.sleep(stub.latency)
+                path = urlparse(self.path).path
+                kind, _, value = path.rstrip("/").rpartition("/")
+                body = stub.build_response(kind.rsplit("/", 1)[-1], unquote(value))
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(200 if body["results"] else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                return
+
+        self._server = ThreadingHTTPServer((host, 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.base_url = f"http://{host}:{self._server.server_address[1]}/v4beta/geocode"
+
+    def _count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    @staticmethod
+    def build_response(kind: str, value: str) -> Dict[str, Any]:
+        """주소 또는 좌표에 대한 결정적 v4beta 응답을 생성합니다."""
+        if kind == "location":
+            lat, _, lng = value.partition(",")
+            latitude, longitude = float(lat), float(lng)
+            address = (
+                f"대한민국 서울특별시 중구 세종대로 {int(abs(latitude * 1000)) % 300}"
+            )
+        else:
+            seed = sum(value.encode("utf-8"))
+            latitude = 37.4 + (seed % 2000) / 10000
+            longitude = 126.8 + (seed % 3000) / 10000
+            address = f"대한민국 {value}"
+        return {
+            "results": [
+                {
+                    "placeId": f"stub-{zlib.crc32(f'{kind}/{value}'.encode())}",
+                    "location": {"latitude": latitude, "longitude": longitude},
+                    "granularity": "ROOFTOP",
+                    "formattedAddress": address,
+                    "addressComponents": [
+                        {
+                            "longText": "서울특별시",
+                            "types": ["administrative_area_level_1"],
+                        },
+                        {"longText": "대한민국", "types": ["country"]},
+                    ],
+                }
+            ]
+        }
+
+    def start(self) -> "GeocodeStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _snake(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class PlacesStubServer:
+    """
+    places_v1 SearchText를 흉내 내는 gRPC 서버입니다.
+
+    응답은 x-goog-fieldmask 메타데이터에 포함된 필드만 채우므로, 필드 마스크에 따라
+    실제 API와 비슷하게 페이로드 크기가 달라집니다.
+
+    Attributes:
+        latency (float): 요청당 응답 지연 시간 (초)
+        num_places (int): 기본 반환 장소 수 (요청의 max_result_count가 우선)
+        reviews_per_place (int): 장소당 리뷰 수
+        photos_per_place (int): 장소당 사진 수
+        review_chars (int): 리뷰 본문 길이
+        requests (int): 처리한 요청 수
+        address (str): 클라이언트가 접속할 host:port
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        num_places: int = 20,
+        reviews_per_place: int = 5,
+        photos_per_place: int = 10,
+        review_chars: int = 400,
+        max_workers: int = 64,
+        host: str = "127.0.0.1",
+    ):
+        self.latency = latency
+        self.num_places = num_places
+        self.reviews_per_place = reviews_per_place
+        self.photos_per_place = photos_per_place
+        self.review_chars = review_chars
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        handler = grpc.method_handlers_generic_handler(
+            PLACES_SERVICE_NAME,
+            {
+                "SearchText": grpc.unary_unary_rpc_method_handler(
+                    self._search_text,
+                    request_deserializer=SearchTextRequest.deserialize,
+                    response_serializer=SearchTextResponse.serialize,
+                )
+            },
+        )
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+        self._server.add_generic_rpc_handlers((handler,))
+        port = self._server.add_insecure_port(f"{host}:0")
+        self.address = f"{host}:{port}"
+
+    def _build_place(
+        self,
+        query: str,
+        index: int,
+        language_code: str,
+        origin: Tuple[float, float] = (37.49, 127.02),
+    ) -> Dict[str, Any]:
+        place_id = f"stub-{zlib.crc32(query.encode())}-{index}"
+        text = {"text": f"{query} {index + 1}", "language_code": language_code or "ko"}
+        return {
+            "name": f"places/{place_id}",
+            "id": place_id,
+            "display_name": text,
+            "formatted_address": f"대한민국 서울특별시 강남구 테헤란로 {100 + index}",
+            "short_formatted_address": f"강남구 테헤란로 {100 + index}",
+            "location": {
+                "latitude": origin[0] + index * 0.001,
+                "longitude": origin[1] + index * 0.001,
+            },
+            "primary_type": "cafe",
+            "types": ["cafe", "food", "point_of_interest", "establishment"],
+            "primary_type_display_name": {"text": "카페", "language_code": "ko"},
+            "rating": 3.5 + (index % 3) * 0.5,
+            "user_rating_count": 10 + index * 7,
+            "google_maps_uri": f"https://maps.google.com/?cid={index}",
+            "national_phone_number": f"02-555-{1000 + index}",
+            "website_uri": f"https://example.com/{place_id}",
+            "regular_opening_hours": {
+                "open_now": True,
+                "weekday_descriptions": [
+                    f"{day}: 오전 8:00~오후 10:00" for day in "월화수목금토일"
+                ],
+            },
+            "reviews": [
+                {
+                    "name": f"places/{place_id}/reviews/{n}",
+                    "rating": 4,
+                    "text": {
+                        "text": "리뷰" * (self.review_chars // 2),
+                        "language_code": "ko",
+                    },
+                }
+                for n in range(self.reviews_per_place)
+            ],
+            "photos": [
+                {
+                    "name": f"places/{place_id}/photos/{n}",
+                    "width_px": 4032,
+                    "height_px": 3024,
+                }
+                for n in range(self.photos_per_place)
+            ],
+        }
+
+    @staticmethod
+    def _masked(place: Dict[str, Any], mask: List[str]) -> Dict[str, Any]:
+        if "*" in mask or "places.*" in mask:
+            return place
+        keys = {
+            _snake(name.split(".")[1]) for name in mask if name.startswith("places.")
+        }
+        return {key: value for key, value in place.items() if key in keys}
+
+    def _search_text(self, request: SearchTextRequest, context: grpc.ServicerContext):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        metadata = dict(context.invocation_metadata())
+        fieldmask = metadata.get("x-goog-fieldmask", "")
+        if isinstance(fieldmask, bytes):
+            fieldmask = fieldmask.decode()
+        mask = [name.strip() for name in fieldmask.split(",")]
+        if not any(mask):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "FieldMask is a required parameter"
+            )
+
+        count = request.max_result_count or self.num_places
+        # 위치 편향/제한이 있으면 그 중심에서부터 장소를 배치합니다.
+        if "location_bias" in request:
+            center = request.location_bias.circle.center
+            origin = (center.latitude, center.longitude)
+        elif "location_restriction" in request:
+            low = request.location_restriction.rectangle.low
+            high = request.location_restriction.rectangle.high
+            origin = (
+                (low.latitude + high.latitude) / 2,
+                (low.longitude + high.longitude) / 2,
+            )
+        else:
+            origin = (37.49, 127.02)
+        places = [
+            Place(
+                self._masked(
+                    self._build_place(
+                        request.text_query, i, request.language_code, origin
+                    ),
+                    mask,
+                )
+            )
+            for i in range(count)
+        ]
+        return SearchTextResponse(places=places)
+
+    def start(self) -> "PlacesStubServer":
+        self._server.start()
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        self._server.stop(grace)
+
+    def create_client(self) -> places_v1.PlacesAsyncClient:
+        """
+        이 서버에 접속하는 PlacesAsyncClient를 생성합니다.
+
+        gRPC aio 채널은 생성된 이벤트 루프에 묶이므로 실행 중인 루프 안에서 호출해야 합니다.
+        """
+        channel = grpc.aio.insecure_channel(self.address)
+        return places_v1.PlacesAsyncClient(
+            transport=PlacesGrpcAsyncIOTransport(channel=channel)
+        )
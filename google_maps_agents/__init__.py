@@ -1 +1,19 @@
-from . import agent
+"""
+Google Maps API 멀티에이전트 패키지
+
+ADK 에이전트 스택과 클라이언트 라이브러리는 임포트 비용이 크므로, `agent` 모듈(root_agent)은
+처음 접근할 때 로드합니다. config, tools, telemetry 등 하위 모듈만 필요한 프로세스
+(메트릭 수집, 캐시 예열 등)는 에이전트를 생성하지 않습니다.
+"""
+
+import importlib
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # adk web/run은 패키지의 agent 속성 또는 root_agent를 찾으므로 접근 시점에 로드합니다.
+    if name == "agent":
+        return importlib.import_module(".agent", __name__)
+    if name == "root_agent":
+        return importlib.import_module(".agent", __name__).root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
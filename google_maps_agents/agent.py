@@ -3,7 +3,20 @@ from google.adk.models.google_llm import Gemini
 
 from .config import COORDINATOR_CONTENT_CONFIG, COORDINATOR_MODEL_NAME
 from .prompts import COORDINATOR_INSTRUCTION, GLOBAL_INSTRUCTION
-from .sub_agents.places_agent import geocode_agent, places_sequential_agent
+from .sub_agents.places_agent import get_geocode_agent, places_sequential_agent
+from .telemetry import (
+    configure_metrics,
+    configure_tracing,
+    trace_agent_end,
+    trace_agent_start,
+    trace_model_end,
+    trace_model_start,
+)
+
+# TRACING_HISTOGRAM_PATH가 설정된 경우 로컬 히스토그램 익스포터를 등록합니다.
+configure_tracing()
+# METRICS_PORT/METRICS_DUMP_PATH가 설정된 경우 메트릭 엔드포인트/파일 덤프를 활성화합니다.
+configure_metrics()
 
 
 class CoordinatorAgent(LlmAgent):
@@ -31,6 +44,10 @@ root_agent: CoordinatorAgent = CoordinatorAgent(
     instruction=COORDINATOR_INSTRUCTION,
     global_instruction=GLOBAL_INSTRUCTION,
     generate_content_config=COORDINATOR_CONTENT_CONFIG,
-    sub_agents=[places_sequential_agent, geocode_agent],
+    sub_agents=[places_sequential_agent, get_geocode_agent()],
     disallow_transfer_to_parent=True,  # 최상위 에이전트이므로 부모로 제어를 넘기지 않습니다.
+    before_agent_callback=trace_agent_start,
+    after_agent_callback=trace_agent_end,
+    before_model_callback=trace_model_start,
+    after_model_callback=trace_model_end,
 )
@@ -0,0 +1,280 @@
+"""
+업스트림 API 결과 캐시를 정의하는 파일입니다.
+
+값은 상태 저장소(shared_state.StateStore)에 보관되므로 멀티 프로세스 서빙 모드에서는
+모든 워커가 같은 캐시를 공유합니다. 같은 키에 대한 동시 조회는 프로세스 안에서 하나의
+업스트림 호출로 합쳐집니다(single flight). 공유 저장소를 사용할 때는 워커별 로컬 캐시(최대
+CACHE_LOCAL_MAX_ENTRIES개)를 앞에 두어 소프트 TTL 안의 항목은 IPC 없이 반환하고, 저장소 호출은
+이벤트 루프를 막지 않도록 스레드에서 실행합니다(shared_state.call_state_store).
+
+항목은 stale-while-revalidate 방식으로 갱신됩니다. 소프트 TTL(ttl)이 지난 항목은 하드 TTL(hard_ttl)까지
+즉시 반환되고, 그동안 백그라운드 작업 하나가 값을 새로 가져옵니다. 백그라운드 갱신은 이벤트 루프별로
+CACHE_REFRESH_CONCURRENCY개까지만 동시에 실행되며, 자리가 없으면 건너뛰어 대화형 요청을 지연시키지 않습니다.
+하드 TTL이 지난 항목은 stale_ttl 동안 더 보존되어 업스트림 장애 시 대체 응답으로만 사용됩니다.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from .config import CACHE_LOCAL_MAX_ENTRIES, CACHE_REFRESH_CONCURRENCY
+from .shared_state import call_state_store, is_shared_state
+from .telemetry.metrics import CACHE_REQUESTS, registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 캐시 결과 레이블
+RESULT_HIT = "hit"
+RESULT_MISS = "miss"
+RESULT_COALESCED = "coalesced"
+RESULT_STALE = "stale"
+# 소프트 TTL이 지나 즉시 반환하고 백그라운드 갱신을 요청한 경우
+RESULT_REVALIDATE = "revalidate"
+
+CACHE_REFRESHES = registry.counter(
+    "cache_refreshes_total",
+    "Background stale-while-revalidate refreshes by outcome (ok, error, skipped).",
+    ["cache", "outcome"],
+)
+
+# 이벤트 루프 -> 진행 중인 백그라운드 갱신 작업 (모든 캐시 네임스페이스가 함께 사용하는 한도)
+_refresh_tasks: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Set[asyncio.Task]]"
+) = weakref.WeakKeyDictionary()
+
+KEY_SEPARATOR = "\x1f"
+
+
+def is_cacheable(result: Dict[str, Any]) -> bool:
+    """오류 응답과 대체 응답(만료된 캐시, 오프라인 개략 결과 등)은 캐시하지 않습니다."""
+    return (
+        "error" not in result and not result.get("stale") and not result.get("degraded")
+    )
+
+
+class ResultCache:
+    """
+    네임스페이스 단위 TTL 결과 캐시입니다.
+
+    Attributes:
+        namespace (str): 캐시 네임스페이스 (메트릭의 cache 레이블로도 사용)
+        ttl (float): 소프트 TTL (초). 이 시간 안의 항목은 그대로 반환합니다.
+            0 이하이면 캐시를 사용하지 않습니다.
+        hard_ttl (float): 하드 TTL (초). ttl과 hard_ttl 사이의 항목은 즉시 반환하면서
+            백그라운드에서 갱신합니다. ttl 이하이면 백그라운드 갱신을 하지 않습니다.
+        stale_ttl (float): 하드 TTL이 지난 항목을 장애 대체용으로 추가 보존하는 시간 (초)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        hard_ttl: Optional[float] = None,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hard_ttl = max(ttl, hard_ttl if hard_ttl is not None else ttl)
+        self.stale_ttl = max(0.0, stale_ttl)
+        self._inflight: Dict[Tuple[int, str], "asyncio.Future[Dict[str, Any]]"] = {}
+        self._refreshing: Set[Tuple[int, str]] = set()
+        # 공유 저장소 앞의 워커별 로컬 캐시: 키 -> (저장 시각, 값)
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """키 구성 요소를 하나의 캐시 키 문자열로 합칩니다."""
+        return KEY_SEPARATOR.join("" if part is None else str(part) for part in parts)
+
+    def _remember(self, key: str, stored_at: float, value: Dict[str, Any]) -> None:
+        """공유 저장소를 사용할 때 항목을 워커별 로컬 캐시에도 보관합니다."""
+        if CACHE_LOCAL_MAX_ENTRIES <= 0 or not is_shared_state():
+            return
+        self._local[key] = (stored_at, value)
+        self._local.move_to_end(key)
+        while len(self._local) > CACHE_LOCAL_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        보존 중인 항목의 (값, 경과 시간)을 반환합니다. 저장소 오류는 캐시 미스로 처리합니다.
+
+        로컬 캐시의 항목이 소프트 TTL 안이면 저장소를 조회하지 않습니다. 그보다 오래된 항목은 다른
+        워커가 갱신했을 수 있으므로 저장소를 조회하고, 저장소에 없을 때만 로컬 항목을 사용합니다.
+        """
+        if not self.enabled:
+            return None
+        local = self._local.get(key)
+        if local is not None:
+            age = max(0.0, time.time() - local[0])
+            if age < self.ttl:
+                self._local.move_to_end(key)
+                return local[1], age
+        try:
+            entry = await call_state_store("cache_get", self.namespace, key)
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 ({self.namespace}): {e}")
+            entry = None
+        if entry is None:
+            if (
+                local is None
+                or time.time() - local[0] >= self.hard_ttl + self.stale_ttl
+            ):
+                self._local.pop(key, None)
+                return None
+            entry = local
+        stored_at, value = entry
+        self._remember(key, stored_at, value)
+        return value, max(0.0, time.time() - stored_at)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """하드 TTL 안의 값을 반환합니다."""
+        found = await self._lookup(key)
+        if found is None or found[1] >= self.hard_ttl:
+            return None
+        return found[0]
+
+    async def get_stale(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        유효 기간이 지났더라도 보존 중인 마지막 값과 그 경과 시간(초)을 반환합니다.
+
+        업스트림 장애(회로 열림, 호출 실패) 시 대체 응답으로 사용합니다.
+        """
+        found = await self._lookup(key)
+        if found is not None:
+            CACHE_REQUESTS.inc(cache=self.namespace, result=RESULT_STALE)
+        return found
+
+    async def stale_or(self, key: str, default: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        하드 TTL과 관계없이 보존 중인 마지막 값을 stale 표시와 경과 시간(stale_age_seconds)을 붙여 반환합니다.
+        없으면 default(보통 오류 응답)를 반환합니다.
+        """
+        found = await self.get_stale(key)
+        if found is None:
+            return default
+        value, age = found
+        return {**value, "stale": True, "stale_age_seconds": round(age, 1)}
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        self._remember(key, time.time(), value)
+        try:
+            await call_state_store(
+                "cache_set", self.namespace, key, value, self.hard_ttl + self.stale_ttl
+            )
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패 ({self.namespace}): {e}")
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        cacheable: Callable[[Dict[str, Any]], bool] = is_cacheable,
+    ) -> Dict[str, Any]:
+        """
+        캐시된 값을 반환하거나, 없으면 fetch()로 가져와 저장합니다.
+
+        소프트 TTL이 지난 값은 즉시 반환하고 fetch()로 백그라운드 갱신을 시작합니다.
+
+        Args:
+            key (str): 캐시 키
+            fetch (Callable[[], Awaitable[Dict[str, Any]]]): 업스트림 호출
+            cacheable (Callable[[Dict[str, Any]], bool]): 저장 여부 판단 함수
+
+        Returns:
+            Dict[str, Any]: 캐시 또는 업스트림 결과
+        """
+        if not self.enabled:
+            return await fetch()
+
+        found = await self._lookup(key)
+        if found is not None and found[1] < self.hard_ttl:
+            value, age = found
+            if age < self.ttl:
+                CACHE_REQUESTS.inc(cache=self.namespace, result=RESULT_HIT)
+            else:
+                CACHE_REQUESTS.inc(cache=self.namespace, result=RESULT_REVALIDATE)
+                self._schedule_refresh(key, fetch, cacheable)
+            return value
+
+        # 진행 중인 같은 키의 호출이 있으면 결과를 공유합니다 (이벤트 루프별).
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            CACHE_REQUESTS.inc(cache=self.namespace, result=RESULT_COALESCED)
+            return await asyncio.shield(pending)
+
+        CACHE_REQUESTS.inc(cache=self.namespace, result=RESULT_MISS)
+        future: "asyncio.Future[Dict[str, Any]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[inflight_key] = future
+        try:
+            result = await fetch()
+            if cacheable(result):
+                await self.set(key, result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 미처리 예외 경고가 남지 않도록 소비합니다.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        cacheable: Callable[[Dict[str, Any]], bool],
+    ) -> None:
+        """
+        키의 백그라운드 갱신을 시작합니다.
+
+        같은 키를 이미 가져오는 중이거나 루프의 갱신 한도가 찼으면 건너뜁니다.
+        갱신 작업은 호출한 요청의 트레이스 컨텍스트를 이어받지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        refresh_key = (id(loop), key)
+        if refresh_key in self._refreshing or refresh_key in self._inflight:
+            return
+        tasks = _refresh_tasks.setdefault(loop, set())
+        if len(tasks) >= CACHE_REFRESH_CONCURRENCY:
+            CACHE_REFRESHES.inc(cache=self.namespace, outcome="skipped")
+            return
+
+        async def refresh() -> None:
+            try:
+                result = await fetch()
+            except Exception as e:
+                logger.warning(f"캐시 백그라운드 갱신 실패 ({self.namespace}): {e}")
+                CACHE_REFRESHES.inc(cache=self.namespace, outcome="error")
+                return
+            finally:
+                self._refreshing.discard(refresh_key)
+            if cacheable(result):
+                await self.set(key, result)
+                CACHE_REFRESHES.inc(cache=self.namespace, outcome="ok")
+            else:
+                # 오류 응답이면 기존 항목을 유지하고 다음 요청에서 다시 시도합니다.
+                CACHE_REFRESHES.inc(cache=self.namespace, outcome="error")
+
+        self._refreshing.add(refresh_key)
+        task = loop.create_task(refresh(), context=contextvars.Context())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
@@ -0,0 +1,458 @@
+"""
+캐시 키에 사용할 검색 쿼리/주소 정규화(canonicalization)를 정의하는 파일입니다.
+
+"강남역 카페", "강남역 근처 카페", "강남역 카페 찾아줘", "카페 강남역"처럼 표현만 다른 쿼리가
+같은 캐시 키를 갖도록 다음 순서로 정규화합니다.
+
+1. 유니코드 NFKC 정규화(전각/반각 통일)와 대소문자 통일
+2. 문장 부호 제거와 공백 정리
+3. 토큰 끝의 조사 제거 (받침 규칙에 맞는 경우만, 남는 부분이 2글자 이상일 때만)
+4. 요청 표현("찾아줘", "추천해주세요" 등)과 위치 수식어("근처", "주변" 등) 토큰 제거
+5. 결과 개수 표현("3곳만", "top 5" 등) 제거 (개수는 캐시 키에 따로 포함됩니다).
+   뒤에 명사가 이어지는 개수("서울 3개 구")는 그 명사의 개수이므로 남깁니다.
+6. 토큰 정렬. 부정/대조/방향 표현("말고", "빼고", "대신", "까지" 등)이 있으면 순서가 의미를
+   가지므로("강남역 말고 홍대 카페"와 "홍대 말고 강남역 카페") 정렬하지 않습니다.
+
+QUERY_NEAR_DUPLICATE_THRESHOLD를 설정하면 정규화 결과가 서로 다르더라도 MinHash로 추정한
+문자 bigram 자카드 유사도가 임계값 이상이고 숫자 토큰이 같으면 먼저 본 쿼리의 키를 재사용합니다.
+순서를 유지하는 쿼리는 토큰 구성이 같아도 의미가 다를 수 있으므로 근사 중복 병합에서 제외합니다.
+잘못된 병합을 막기 위해 임계값을 바꿀 때는 benchmarks.query_canonical_eval로 확인합니다.
+
+주소는 canonicalize_address()로 국가명/광역 행정구역 표기/띄어쓰기 차이를 없앤 정규형을 사용합니다.
+"""
+
+import hashlib
+import random
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .config import QUERY_NEAR_DUPLICATE_MAX_ENTRIES, QUERY_NEAR_DUPLICATE_THRESHOLD
+
+# 받침이 있는 음절 뒤에만 오는 조사 / 받침이 없는 음절 뒤에만 오는 조사 / 받침과 무관한 조사.
+# "도", "로", "의", "이", "가"처럼 지명 끝 글자와 겹치기 쉬운 조사는 잘못된 병합을 막기 위해 제외합니다
+# (예: 제주도, 을지로, 호랑이).
+_PARTICLES_AFTER_BATCHIM = ("으로", "은", "을")
+_PARTICLES_AFTER_VOWEL = ("는", "를", "와")
+_PARTICLES_ANY = ("에서", "까지", "부터", "처럼", "에")
+
+# 검색 대상과 무관한 요청 표현/위치 수식어 토큰
+FILLER_TOKENS = frozenset(
+    {
+        "좀",
+        "주변",
+        "근처",
+        "부근",
+        "인근",
+        "가까운",
+        "추천",
+        "검색",
+        "어디",
+        "어디야",
+        "어디있어",
+        "있어",
+        "있나요",
+        "있는",
+        "곳",
+        "알려줘",
+        "찾아줘",
+        "보여줘",
+        "추천해줘",
+        "검색해줘",
+        "알려주세요",
+        "찾아주세요",
+        "보여주세요",
+        "추천해주세요",
+        "검색해주세요",
+        "please",
+        "near",
+        "nearby",
+        "around",
+        "find",
+        "show",
+        "me",
+        "recommend",
+    }
+)
+# 요청 어미로 끝나는 토큰 (예: "가볼만한데 알려줄래" -> "알려줄래" 제거)
+_FILLER_SUFFIX = re.compile(
+    r"(줘|줘요|줄래|줄래요|주세요|주실래요|싶어|싶어요|싶은데|할래|할까)$"
+)
+# 부정/대조/비교 표현 토큰. 이 토큰이 있는 쿼리는 토큰 순서를 유지합니다.
+ORDER_MARKER_TOKENS = frozenset(
+    {
+        "말고",
+        "말구",
+        "빼고",
+        "제외",
+        "제외하고",
+        "아닌",
+        "대신",
+        "보다",
+        "vs",
+        "not",
+        "except",
+        "without",
+        "instead",
+        "than",
+        "from",
+    }
+)
+# 토큰 끝에 붙은 부정/대조/방향 표현 (예: "강남역말고", "신촌부터", "홍대까지").
+# 이런 토큰은 조사를 제거하지 않고 그대로 남깁니다.
+_ORDER_MARKER_SUFFIX = re.compile(
+    r"(말고|말구|빼고|제외|제외하고|대신|보다|부터|까지)$"
+)
+# 결과 개수 표현 ("3곳만", "세 군데", "5개 정도", "top 5", "3 places").
+# 개수는 캐시 키에 따로 포함되므로 정규형에서는 제거합니다.
+_KOREAN_COUNTS = {
+    "한": 1,
+    "하나": 1,
+    "두": 2,
+    "둘": 2,
+    "세": 3,
+    "셋": 3,
+    "네": 4,
+    "넷": 4,
+    "다섯": 5,
+    "여섯": 6,
+    "일곱": 7,
+    "여덟": 8,
+    "아홉": 9,
+    "열": 10,
+}
+_RESULT_COUNT = re.compile(
+    r"(?:^|(?<=\s))(?:(?P<digits>\d{1,2})|(?P<korean>"
+    + "|".join(sorted(_KOREAN_COUNTS, key=len, reverse=True))
+    + r"))\s*(?:곳|군데|개)(?:\s*(?:만|씩|정도|쯤))?(?=\s|$|[^\w])"
+    + r"|\b(?:top|best)\s*(?P<top>\d{1,2})\b"
+    + r"|\b(?P<english>\d{1,2})\s*(?:places|spots|results|options)\b"
+)
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_DIGITS = re.compile(r"\d+")
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+
+def _has_batchim(char: str) -> Optional[bool]:
+    """한글 음절의 받침 유무를 반환합니다. 한글 음절이 아니면 None입니다."""
+    code = ord(char)
+    if not _HANGUL_BASE <= code <= _HANGUL_LAST:
+        return None
+    return (code - _HANGUL_BASE) % 28 != 0
+
+
+def strip_particle(token: str) -> str:
+    """토큰 끝의 조사를 제거합니다. 규칙에 맞지 않으면 그대로 반환합니다."""
+    for particles, batchim in (
+        (_PARTICLES_ANY, None),
+        (_PARTICLES_AFTER_BATCHIM, True),
+        (_PARTICLES_AFTER_VOWEL, False),
+    ):
+        for particle in particles:
+            if not token.endswith(particle):
+                continue
+            stem = token[: -len(particle)]
+            if len(stem) < 2:
+                continue
+            has_batchim = _has_batchim(stem[-1])
+            if has_batchim is None or (batchim is not None and has_batchim != batchim):
+                continue
+            return stem
+    return token
+
+
+def _is_filler(raw: str) -> bool:
+    """요청 표현/위치 수식어 토큰이면 True입니다."""
+    token = strip_particle(raw)
+    return (
+        token in FILLER_TOKENS
+        or raw in FILLER_TOKENS
+        or bool(_FILLER_SUFFIX.search(token))
+    )
+
+
+def _is_order_marker(token: str) -> bool:
+    return token in ORDER_MARKER_TOKENS or bool(_ORDER_MARKER_SUFFIX.search(token))
+
+
+def is_order_sensitive(canonical: str) -> bool:
+    """정규형에 부정/대조/방향 표현이 있어 토큰 순서가 의미를 가지면 True입니다."""
+    return any(_is_order_marker(token) for token in canonical.split())
+
+
+def _result_count_matches(text: str) -> Iterator["re.Match[str]"]:
+    """
+    정규화된 텍스트에서 결과 개수 표현을 찾습니다.
+
+    한국어 개수 표현 뒤에 요청 표현이 아닌 단어가 이어지면("서울 3개 구", "2곳 매장 비교")
+    그 단어의 개수이므로 결과 개수로 보지 않습니다.
+    """
+    for match in _RESULT_COUNT.finditer(text):
+        if match.group("digits") or match.group("korean"):
+            rest = _PUNCTUATION.sub(" ", text[match.end() :]).split()
+            if rest and not _is_filler(rest[0]):
+                continue
+        yield match
+
+
+def extract_result_count(text: str) -> Optional[int]:
+    """
+    쿼리/발화에서 요청한 결과 개수를 추출합니다. 개수 표현이 없으면 None입니다.
+
+    Example:
+        >>> extract_result_count("강남역 카페 3곳만 알려줘")
+        3
+        >>> extract_result_count("홍대 맛집 세 군데")
+        3
+        >>> extract_result_count("2호선 강남역 카페") is None
+        True
+        >>> extract_result_count("서울 3개 구 맛집") is None
+        True
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    match = next(_result_count_matches(text), None)
+    if match is None:
+        return None
+    if match.group("korean"):
+        return _KOREAN_COUNTS[match.group("korean")]
+    return int(match.group("digits") or match.group("top") or match.group("english"))
+
+
+def query_tokens(query: str) -> List[str]:
+    """정규화된 쿼리 토큰 목록(정렬 전)을 반환합니다."""
+    text = unicodedata.normalize("NFKC", query).casefold()
+    for match in reversed(list(_result_count_matches(text))):
+        text = f"{text[: match.start()]} {text[match.end() :]}"
+    raw_tokens = _PUNCTUATION.sub(" ", text).split()
+    # 순서를 유지하는 쿼리는 방향을 나타내는 조사("신촌에서 홍대까지")도 그대로 남깁니다.
+    ordered = any(_is_order_marker(raw) for raw in raw_tokens)
+    return [
+        raw if ordered else strip_particle(raw)
+        for raw in raw_tokens
+        if _is_order_marker(raw) or not _is_filler(raw)
+    ]
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    검색 쿼리를 캐시 키용 정규형으로 변환합니다.
+
+    모든 토큰이 제거되면 공백만 정리한 원문(소문자)을 반환합니다.
+    부정/대조/방향 표현이 있으면 토큰을 정렬하지 않고 원래 순서를 유지합니다.
+
+    Example:
+        >>> canonicalize_query("카페 강남역에서 찾아줘")
+        '강남역 카페'
+        >>> canonicalize_query("강남역 말고 홍대 카페 알려줘")
+        '강남역 말고 홍대 카페'
+    """
+    tokens = query_tokens(query)
+    if not tokens:
+        return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+    canonical = " ".join(tokens)
+    return canonical if is_order_sensitive(canonical) else " ".join(sorted(tokens))
+
+
+# --- MinHash 근사 중복 탐지 ---
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class NearDuplicateIndex:
+    """
+    정규화된 쿼리의 MinHash 서명을 LSH 밴드로 색인하여 근사 중복 쿼리를 찾는 색인입니다.
+
+    Attributes:
+        threshold (float): 같은 쿼리로 볼 최소 추정 자카드 유사도 (0~1)
+        num_perm (int): MinHash 해시 함수 수
+        bands (int): LSH 밴드 수 (num_perm의 약수)
+        max_entries (int): 보관할 최대 쿼리 수 (초과 시 오래 사용되지 않은 쿼리부터 제거)
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int = 64,
+        bands: int = 16,
+        max_entries: int = QUERY_NEAR_DUPLICATE_MAX_ENTRIES,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_entries = max_entries
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._lock = threading.Lock()
+        # 정규형 -> MinHash 서명
+        self._signatures: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+        # (밴드 번호, 밴드 서명) -> 정규형 집합
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+
+    @staticmethod
+    def shingles(canonical: str) -> Set[str]:
+        """경계 공백을 포함한 문자 bigram 집합을 반환합니다."""
+        text = f" {canonical} "
+        return {text[i : i + 2] for i in range(len(text) - 1)}
+
+    def signature(self, canonical: str) -> Tuple[int, ...]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+            for s in self.shingles(canonical)
+        ]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        rows = self.num_perm // self.bands
+        return [(i, signature[i * rows : (i + 1) * rows]) for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+        """두 서명의 추정 자카드 유사도를 반환합니다."""
+        return sum(x == y for x, y in zip(a, b)) / len(a)
+
+    def resolve(self, canonical: str) -> str:
+        """
+        근사 중복으로 판단되는 기존 정규형이 있으면 그것을, 없으면 canonical을 등록하고 반환합니다.
+
+        숫자 토큰(예: "1번 출구", "2호선")이 다르면 유사도와 관계없이 다른 쿼리로 봅니다.
+        순서를 유지하는 정규형(is_order_sensitive)은 토큰 구성이 같아도 의미가 다를 수 있으므로
+        색인하지 않고 그대로 반환합니다.
+        """
+        if is_order_sensitive(canonical):
+            return canonical
+        signature = self.signature(canonical)
+        digits = _DIGITS.findall(canonical)
+        with self._lock:
+            if canonical in self._signatures:
+                self._signatures.move_to_end(canonical)
+                return canonical
+            best, best_score = None, self.threshold
+            candidates: Set[str] = set()
+            for band in self._bands(signature):
+                candidates |= self._buckets.get(band, set())
+            for candidate in candidates:
+                if _DIGITS.findall(candidate) != digits:
+                    continue
+                score = self.similarity(signature, self._signatures[candidate])
+                if score >= best_score:
+                    best, best_score = candidate, score
+            if best is not None:
+                self._signatures.move_to_end(best)
+                return best
+            self._add(canonical, signature)
+            return canonical
+
+    def _add(self, canonical: str, signature: Tuple[int, ...]) -> None:
+        self._signatures[canonical] = signature
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, set()).add(canonical)
+        while len(self._signatures) > self.max_entries:
+            evicted, evicted_signature = self._signatures.popitem(last=False)
+            for band in self._bands(evicted_signature):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(evicted)
+                    if not bucket:
+                        del self._buckets[band]
+
+
+_near_duplicates: Optional[NearDuplicateIndex] = (
+    NearDuplicateIndex(QUERY_NEAR_DUPLICATE_THRESHOLD)
+    if QUERY_NEAR_DUPLICATE_THRESHOLD
+    else None
+)
+
+
+def query_cache_key(query: str) -> str:
+    """
+    검색 쿼리의 캐시 키 구성 요소를 반환합니다.
+
+    정규형을 반환하며, 근사 중복 탐지가 켜져 있으면 먼저 본 유사 쿼리의 정규형을 반환합니다.
+    """
+    canonical = canonicalize_query(query)
+    if _near_duplicates is None:
+        return canonical
+    return _near_duplicates.resolve(canonical)
+
+
+# --- 주소 정규화 ---
+# 광역 행정구역 표기 -> 정규형. 주소의 첫 토큰 전체가 일치할 때만 바꿉니다.
+_REGION_ALIASES: Dict[str, str] = {}
+for _canonical, _aliases in {
+    "서울": ("서울특별시", "서울시"),
+    "부산": ("부산광역시", "부산시"),
+    "대구": ("대구광역시", "대구시"),
+    "인천": ("인천광역시", "인천시"),
+    "광주": ("광주광역시",),
+    "대전": ("대전광역시", "대전시"),
+    "울산": ("울산광역시", "울산시"),
+    "세종": ("세종특별자치시", "세종시"),
+    "경기": ("경기도",),
+    "강원": ("강원특별자치도", "강원도"),
+    "충북": ("충청북도",),
+    "충남": ("충청남도",),
+    "전북": ("전북특별자치도", "전라북도"),
+    "전남": ("전라남도",),
+    "경북": ("경상북도",),
+    "경남": ("경상남도",),
+    "제주": ("제주특별자치도", "제주도"),
+}.items():
+    for _alias in (_canonical, *_aliases):
+        _REGION_ALIASES[_alias] = _canonical
+# 주소 앞의 국가명 (공백으로 구분된 토큰 단위로 비교합니다)
+_COUNTRY_TOKENS = (
+    ("republic", "of", "korea"),
+    ("south", "korea"),
+    ("대한민국",),
+    ("한국",),
+    ("korea",),
+)
+_ADDRESS_SEPARATOR = re.compile(r"[^\w\-]+")
+_LOT_SUFFIX = re.compile(r"(\d)번지")
+
+
+def canonicalize_address(address: str) -> str:
+    """
+    한국 주소를 캐시 키용 정규형으로 변환합니다.
+
+    국가명, 광역 행정구역 표기("서울특별시"/"서울시"/"서울"), 띄어쓰기, 문장 부호, "번지" 표기
+    차이를 없앱니다. 도로명 주소와 지번 주소는 서로 변환하지 않으며, 응답의 formattedAddress와
+    placeId를 보조 키로 저장하여 같은 위치를 공유합니다(GeocodingService 참고).
+
+    국가명과 행정구역 표기는 띄어쓰기를 없애기 전에 공백으로 구분된 앞쪽 토큰 단위로만 비교합니다.
+    국가명은 뒤에 광역 행정구역이 이어질 때만 제거하므로 "한국은행", "Korea University",
+    "서울시립대학교" 같은 이름은 그대로 남습니다.
+
+    Example:
+        >>> canonicalize_address("서울특별시 강남구 테헤란로 152")
+        '서울강남구테헤란로152'
+        >>> canonicalize_address("대한민국 서울 강남구 테헤란로152")
+        '서울강남구테헤란로152'
+    """
+    text = unicodedata.normalize("NFKC", address).casefold()
+    tokens = _ADDRESS_SEPARATOR.sub(" ", text).split()
+    for country in _COUNTRY_TOKENS:
+        rest = tokens[len(country) :]
+        if (
+            tuple(tokens[: len(country)]) == country
+            and rest
+            and rest[0] in _REGION_ALIASES
+        ):
+            tokens = rest
+            break
+    if tokens and tokens[0] in _REGION_ALIASES:
+        tokens[0] = _REGION_ALIASES[tokens[0]]
+    return _LOT_SUFFIX.sub(r"\1", "".join(tokens))
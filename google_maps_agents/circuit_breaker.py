@@ -0,0 +1,246 @@
+"""
+업스트림 API 엔드포인트별 서킷 브레이커를 정의하는 파일입니다.
+
+최근 호출 창(window)에서 실패(오류 또는 느린 호출) 비율이 임계값을 넘으면 회로를 열고,
+열린 동안에는 업스트림을 호출하지 않고 즉시 실패합니다(호출 측은 오래된 캐시 결과로 대체).
+open_seconds가 지나면 반열림(half-open) 상태에서 제한된 수의 시험 호출을 허용하고,
+시험 호출이 성공하면 회로를 닫고 실패하면 다시 엽니다.
+
+브레이커는 프로세스 단위로 공유되므로 여러 이벤트 루프의 서비스 인스턴스가 같은 상태를 봅니다.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+from .config import (
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_WINDOW_SIZE,
+)
+from .telemetry.metrics import registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 회로 상태
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+_STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+CIRCUIT_STATE = registry.gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state by endpoint (0=closed, 1=half_open, 2=open).",
+    ["endpoint"],
+)
+CIRCUIT_REJECTIONS = registry.counter(
+    "circuit_breaker_rejections_total",
+    "Upstream calls short-circuited while the breaker was open.",
+    ["endpoint"],
+)
+
+
+class CircuitBreaker:
+    """
+    엔드포인트 하나의 서킷 브레이커입니다.
+
+    Attributes:
+        name (str): 엔드포인트 이름 (예: "places.search_text")
+        slow_call_seconds (float): 이 시간보다 오래 걸린 호출은 실패로 간주합니다.
+        failure_rate (float): 회로를 여는 실패 비율 임계값 (0~1)
+        min_calls (int): 실패 비율을 판단하기 위한 최소 호출 수
+        window_size (int): 실패 비율을 계산할 최근 호출 수
+        open_seconds (float): 회로를 연 뒤 시험 호출을 허용하기까지의 시간 (초)
+        half_open_max_calls (int): 반열림 상태에서 동시에 허용할 시험 호출 수
+        is_failure (Callable[[BaseException], bool]): 예외가 업스트림 장애인지 판단하는 함수.
+            잘못된 요청/권한 오류처럼 호출 측 문제인 예외는 실패로 세지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slow_call_seconds: float,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        window_size: int = CIRCUIT_WINDOW_SIZE,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = lambda e: True,
+    ):
+        self.name = name
+        self.slow_call_seconds = slow_call_seconds
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window_size = window_size
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)  # True = 실패
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        CIRCUIT_STATE.set(0, endpoint=name)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning(
+            f"서킷 브레이커 상태 변경 ({self.name}): {self._state} -> {state}"
+        )
+        self._state = state
+        if state == STATE_OPEN:
+            self._opened_at = time.monotonic()
+        if state != STATE_HALF_OPEN:
+            self._trials = 0
+        if state == STATE_CLOSED:
+            self._outcomes.clear()
+        CIRCUIT_STATE.set(_STATE_VALUES[state], endpoint=self.name)
+
+    def allow(self) -> bool:
+        """
+        업스트림 호출을 허용할지 반환합니다.
+
+        열린 상태에서 open_seconds가 지나면 반열림 상태로 바꾸고 시험 호출을 허용합니다.
+        허용된 호출은 반드시 record()(또는 track())로 결과를 기록하거나 release()로 자리를
+        돌려줘야 합니다. 허용과 기록 사이에 다른 작업이 있으면 attempt()를 사용합니다.
+        """
+        with self._lock:
+            if self._state == STATE_OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    CIRCUIT_REJECTIONS.inc(endpoint=self.name)
+                    return False
+                self._transition(STATE_HALF_OPEN)
+            if self._state == STATE_HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    CIRCUIT_REJECTIONS.inc(endpoint=self.name)
+                    return False
+                self._trials += 1
+            return True
+
+    def record(self, failed: bool) -> None:
+        """허용된 호출의 결과를 기록하고 상태를 갱신합니다."""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._transition(STATE_OPEN if failed else STATE_CLOSED)
+                return
+            if self._state == STATE_OPEN:
+                return
+            self._outcomes.append(failed)
+            calls = len(self._outcomes)
+            if (
+                calls >= self.min_calls
+                and sum(self._outcomes) / calls >= self.failure_rate
+            ):
+                self._transition(STATE_OPEN)
+
+    def release(self) -> None:
+        """결과 없이 끝난(취소된) 호출의 반열림 시험 호출 자리를 돌려줍니다."""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """
+        블록 실행 시간과 예외로 호출 결과를 기록합니다. 예외는 그대로 다시 발생합니다.
+        작업 취소(CancelledError 등 Exception이 아닌 예외)는 결과로 기록하지 않습니다.
+
+        Example:
+            >>> if breaker.allow():
+            ...     with breaker.track():
+            ...         response = await client.search_text(...)
+        """
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.record(failed=self.is_failure(e))
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record(failed=time.monotonic() - started > self.slow_call_seconds)
+
+    @contextmanager
+    def attempt(self) -> Iterator["BreakerCall"]:
+        """
+        allow()와 결과 기록을 한 블록으로 묶습니다.
+
+        블록이 call.track()에 들어가기 전에 끝나면(요청 생성 중 예외, 키 토큰 대기 중 취소,
+        조기 반환 등) 허용받은 반열림 시험 호출 자리를 돌려주므로 회로가 반열림 상태에 갇히지 않습니다.
+
+        Example:
+            >>> with breaker.attempt() as call:
+            ...     if not call.allowed:
+            ...         return fallback
+            ...     request = build_request()
+            ...     with call.track():
+            ...         response = await client.search_text(request)
+        """
+        call = BreakerCall(self, self.allow())
+        try:
+            yield call
+        finally:
+            if call.allowed and not call.settled:
+                self.release()
+
+
+class BreakerCall:
+    """
+    CircuitBreaker.attempt()로 시작한 업스트림 호출 하나입니다.
+
+    Attributes:
+        breaker (CircuitBreaker): 호출을 허용한 서킷 브레이커
+        allowed (bool): 호출 허용 여부 (allow()의 결과)
+        settled (bool): track()으로 결과를 기록했거나 자리를 돌려줬는지 여부
+    """
+
+    def __init__(self, breaker: CircuitBreaker, allowed: bool):
+        self.breaker = breaker
+        self.allowed = allowed
+        self.settled = False
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """
+        breaker.track()으로 블록의 결과를 기록합니다. 예외는 그대로 다시 발생합니다.
+
+        API 키 교체 재시도처럼 허용받은 호출 하나에서 업스트림 요청을 여러 번 보내면 요청마다
+        사용합니다. 각 요청의 결과가 따로 기록되며, 반열림 상태에서는 첫 요청의 결과로 상태가 정해집니다.
+        """
+        # breaker.track()은 결과 기록 또는 자리 반환 중 하나를 반드시 수행합니다.
+        self.settled = True
+        with self.breaker.track():
+            yield
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str,
+    slow_call_seconds: float,
+    is_failure: Optional[Callable[[BaseException], bool]] = None,
+) -> CircuitBreaker:
+    """엔드포인트 이름별 프로세스 공용 서킷 브레이커를 반환합니다. 없으면 생성합니다."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            if is_failure is None:
+                breaker = CircuitBreaker(name, slow_call_seconds)
+            else:
+                breaker = CircuitBreaker(name, slow_call_seconds, is_failure=is_failure)
+            _breakers[name] = breaker
+        return breaker
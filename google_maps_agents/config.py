@@ -2,7 +2,13 @@
 에이전트와 관련된 설정값을 정의하는 파일입니다.
 """
 
-from google.genai import types
+import os
+from typing import TYPE_CHECKING
+
+from .tools.field_mask import SkuTier
+
+if TYPE_CHECKING:
+    from google.genai import types
 
 # --- 모델 설정 ---
 # 모델 이름은 여기서 관리합니다.
@@ -18,16 +24,204 @@ RATING_PRICING_SELECTOR_MODEL_NAME = "gemini-2.5-flash"
 PLACES_MODEL_NAME = "gemini-2.5-flash"
 GEOCODE_MODEL_NAME = "gemini-2.5-flash-lite"
 
+# --- 모델 계층(cascade) 설정 ---
+# 활성화하면 선택자 에이전트와 places_agent가 가장 빠른 모델을 먼저 시도하고,
+# 출력 검증(필드 마스크, 장소 유형, 언어 코드 등)에 실패한 경우에만 상위 모델로 승급합니다.
+MODEL_CASCADE_ENABLED = os.getenv("MODEL_CASCADE_ENABLED", "false").lower() == "true"
+CASCADE_FAST_MODEL_NAME = "gemini-2.5-flash-lite"
+CASCADE_ESCALATION_MODEL_NAME = "gemini-2.5-flash"
+
 # --- 생성 관련 설정 ---
 # 낮은 temperature 값은 모델의 응답을 더 일관성 있고 예측 가능하게 만듭니다.
-COORDINATOR_CONTENT_CONFIG = types.GenerateContentConfig(
-    temperature=0.1,
+# google.genai 임포트에 수 초가 걸리므로, *_CONTENT_CONFIG는 처음 접근할 때 생성합니다.
+# (config만 필요한 메트릭 수집, 캐시 예열 등의 프로세스는 google.genai를 로드하지 않습니다.)
+_CONTENT_CONFIG_TEMPERATURES = {
+    "COORDINATOR_CONTENT_CONFIG": 0.1,
+    "PLACES_CONTENT_CONFIG": 0.1,
+    "GEOCODE_CONTENT_CONFIG": 0.1,
+}
+
+# --- Places API 비용 설정 ---
+# 필드 마스크가 트리거할 수 있는 최대 SKU 등급입니다.
+# 'Essentials', 'Pro', 'Enterprise', 'Enterprise + Atmosphere' 중 하나를 지정하면
+# 초과 등급의 필드는 API 호출 전에 제외됩니다. None이면 제한하지 않습니다.
+# 잘못된 값은 도구 호출마다 실패하지 않도록 시작 시 ValueError로 알립니다.
+PLACES_MAX_SKU_TIER = (
+    SkuTier.parse(os.environ["PLACES_MAX_SKU_TIER"])
+    if os.getenv("PLACES_MAX_SKU_TIER")
+    else None
+)
+
+# --- Places 응답 크기 설정 ---
+# 쿼리에 개수 표현("3곳만")이 없을 때 요청할 기본 결과 수 (1~20). None이면 API 기본값(20)을 사용합니다.
+PLACES_DEFAULT_RESULT_COUNT = (
+    int(os.environ["PLACES_DEFAULT_RESULT_COUNT"])
+    if os.getenv("PLACES_DEFAULT_RESULT_COUNT")
+    else None
+)
+# 모델에 전달하기 전에 장소별로 남길 최대 리뷰/사진 수 (0이면 모두 제거, 음수이면 제한하지 않음)
+PLACES_MAX_REVIEWS_PER_PLACE = int(os.getenv("PLACES_MAX_REVIEWS_PER_PLACE", "3"))
+PLACES_MAX_PHOTOS_PER_PLACE = int(os.getenv("PLACES_MAX_PHOTOS_PER_PLACE", "3"))
+# 리뷰 본문의 최대 글자 수 (0 이하이면 자르지 않음)
+PLACES_MAX_REVIEW_CHARS = int(os.getenv("PLACES_MAX_REVIEW_CHARS", "500"))
+
+# --- 장소 사진 캐시 설정 ---
+# 사진 미디어를 내용 주소(SHA-256) 방식으로 저장할 디스크 캐시 디렉터리
+PHOTO_CACHE_DIR = os.getenv("PHOTO_CACHE_DIR", os.path.join(".cache", "photos"))
+# 디스크 캐시 최대 크기 (바이트). 초과하면 가장 오래 사용하지 않은 사진부터 삭제합니다.
+PHOTO_CACHE_MAX_BYTES = int(os.getenv("PHOTO_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# 썸네일 최대 가로/세로 크기 (픽셀, 1~4800)
+PHOTO_THUMBNAIL_MAX_WIDTH_PX = int(os.getenv("PHOTO_THUMBNAIL_MAX_WIDTH_PX", "400"))
+PHOTO_THUMBNAIL_MAX_HEIGHT_PX = int(os.getenv("PHOTO_THUMBNAIL_MAX_HEIGHT_PX", "400"))
+# 결과 목록의 썸네일을 동시에 가져올 최대 요청 수
+PHOTO_FETCH_CONCURRENCY = int(os.getenv("PHOTO_FETCH_CONCURRENCY", "8"))
+# 캐시된 사진을 제공하는 서빙 경로 (serve.py)
+PHOTO_URL_PREFIX = os.getenv("PHOTO_URL_PREFIX", "/photos")
+# 활성화하면 장소 카드에 첫 번째 사진의 썸네일 URL(photo_url)을 추가합니다 (places.photos 필드 선택 시).
+PLACE_CARD_PHOTOS_ENABLED = (
+    os.getenv("PLACE_CARD_PHOTOS_ENABLED", "false").lower() == "true"
 )
 
-PLACES_CONTENT_CONFIG = types.GenerateContentConfig(
-    temperature=0.1,
+# --- 투기적(speculative) 검색 설정 ---
+# 활성화하면 선택자 에이전트가 실행되는 동안 DEFAULT_FIELDS로 장소 검색을 먼저 시작하고,
+# 선택된 필드 마스크를 포함하는 경우 그 결과를 재사용합니다.
+SPECULATIVE_SEARCH_ENABLED = (
+    os.getenv("SPECULATIVE_SEARCH_ENABLED", "false").lower() == "true"
 )
+# 투기적 검색에 사용할 언어 코드 (LANGUAGE_SELECTOR_INSTRUCTION의 기본값과 동일)
+SPECULATIVE_LANGUAGE_CODE = "ko"
 
-GEOCODE_CONTENT_CONFIG = types.GenerateContentConfig(
-    temperature=0.1,
+# --- 트레이싱 설정 ---
+# 설정하면 에이전트/LLM/도구/업스트림 호출 span의 단계별 지연 시간 히스토그램을 이 경로에 JSON으로 기록합니다.
+# 설정하지 않으면 OpenTelemetry 기본 no-op 트레이서가 사용됩니다.
+TRACING_HISTOGRAM_PATH = os.getenv("TRACING_HISTOGRAM_PATH") or None
+
+# --- 메트릭 설정 ---
+# METRICS_PORT를 설정하면 http://<host>:<port>/metrics 에서 Prometheus 텍스트 형식 메트릭을 제공합니다.
+# METRICS_DUMP_PATH를 설정하면 프로세스 종료 시 같은 형식으로 파일에 기록합니다.
+METRICS_PORT = int(os.environ["METRICS_PORT"]) if os.getenv("METRICS_PORT") else None
+METRICS_DUMP_PATH = os.getenv("METRICS_DUMP_PATH") or None
+
+# --- 비용 집계 설정 ---
+# 세션 상태의 cost_history에 보관하는 최근 턴 수입니다. 0이면 턴별 기록은 로그에만 남기고
+# 세션 누적(cost_totals)만 상태에 기록합니다.
+COST_HISTORY_MAX_TURNS = int(os.getenv("COST_HISTORY_MAX_TURNS", "50"))
+
+# --- 결과 캐시 설정 ---
+# 업스트림 API 성공 결과를 캐시하는 시간(초)입니다. 0이면 해당 캐시를 사용하지 않습니다.
+PLACES_CACHE_TTL_SECONDS = float(os.getenv("PLACES_CACHE_TTL_SECONDS", "300"))
+GEOCODE_CACHE_TTL_SECONDS = float(os.getenv("GEOCODE_CACHE_TTL_SECONDS", "86400"))
+# 캐시 네임스페이스별 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+# 멀티 프로세스 서빙 모드에서 워커별로 공유 캐시 앞에 두는 로컬 캐시의 네임스페이스별 최대 항목 수입니다.
+# 소프트 TTL 안의 항목은 공유 상태 저장소를 거치지 않고(IPC 없이) 반환합니다. 0이면 사용하지 않습니다.
+CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1000"))
+
+# --- 업스트림 호출 속도 제한 ---
+# API별 초당 최대 요청 수입니다. None이면 제한하지 않습니다.
+# API 키 풀을 사용하면 키별 한도이며, 멀티 프로세스 서빙 모드에서는 모든 워커가 키별 토큰 버킷을 공유합니다.
+PLACES_RATE_LIMIT_QPS = (
+    float(os.environ["PLACES_RATE_LIMIT_QPS"])
+    if os.getenv("PLACES_RATE_LIMIT_QPS")
+    else None
+)
+GEOCODE_RATE_LIMIT_QPS = (
+    float(os.environ["GEOCODE_RATE_LIMIT_QPS"])
+    if os.getenv("GEOCODE_RATE_LIMIT_QPS")
+    else None
+)
+
+# --- API 키 풀 설정 ---
+# GOOGLE_PLACES_API_KEYS / GOOGLE_MAPS_API_KEYS에 쉼표로 구분한 여러 키를 지정하면 키 풀을 사용합니다.
+# 할당량 초과(ResourceExhausted, HTTP 429)와 권한 거부(PermissionDenied, HTTP 403)가 발생한 키를
+# 풀에서 제외하는 시간(초)입니다.
+API_KEY_EXHAUSTED_COOLDOWN_SECONDS = float(
+    os.getenv("API_KEY_EXHAUSTED_COOLDOWN_SECONDS", "60")
+)
+API_KEY_DENIED_COOLDOWN_SECONDS = float(
+    os.getenv("API_KEY_DENIED_COOLDOWN_SECONDS", "600")
 )
+# 다른 워커가 기록한 키 제외 상태를 상태 저장소에서 다시 읽는 간격(초)입니다.
+API_KEY_COOLDOWN_SYNC_SECONDS = float(os.getenv("API_KEY_COOLDOWN_SYNC_SECONDS", "1"))
+
+# --- 멀티 프로세스 서빙 설정 ---
+# 서빙 워커 프로세스 수입니다. 기본값은 CPU 코어 수입니다.
+SERVE_WORKERS = int(os.getenv("SERVE_WORKERS", "0")) or os.cpu_count() or 1
+
+# --- 서킷 브레이커 설정 ---
+# 최근 CIRCUIT_WINDOW_SIZE번의 호출 중 CIRCUIT_MIN_CALLS번 이상이 기록되고 실패(오류 또는 느린 호출)
+# 비율이 CIRCUIT_FAILURE_RATE 이상이면 엔드포인트 회로를 열고, CIRCUIT_OPEN_SECONDS 동안 즉시 실패합니다.
+CIRCUIT_WINDOW_SIZE = int(os.getenv("CIRCUIT_WINDOW_SIZE", "20"))
+CIRCUIT_MIN_CALLS = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+# 이 시간(초)보다 오래 걸린 호출은 실패로 간주합니다.
+PLACES_SLOW_CALL_SECONDS = float(os.getenv("PLACES_SLOW_CALL_SECONDS", "5"))
+GEOCODE_SLOW_CALL_SECONDS = float(os.getenv("GEOCODE_SLOW_CALL_SECONDS", "2"))
+# 캐시 TTL이 지난 결과를 추가로 보존하는 시간(초)입니다. 회로가 열려 있거나 업스트림 호출이
+# 실패하면 이 기간 안의 마지막 결과를 stale 표시와 함께 반환합니다.
+STALE_CACHE_SECONDS = float(os.getenv("STALE_CACHE_SECONDS", "86400"))
+
+# --- 캐시 백그라운드 갱신(stale-while-revalidate) 설정 ---
+# 결과 캐시 TTL(소프트 TTL)이 지난 항목은 하드 TTL까지 즉시 반환되고, 백그라운드에서 갱신됩니다.
+# 하드 TTL이 소프트 TTL 이하이면 백그라운드 갱신을 하지 않습니다.
+PLACES_CACHE_HARD_TTL_SECONDS = float(
+    os.getenv("PLACES_CACHE_HARD_TTL_SECONDS", "3600")
+)
+GEOCODE_CACHE_HARD_TTL_SECONDS = float(
+    os.getenv("GEOCODE_CACHE_HARD_TTL_SECONDS", "604800")
+)
+# 이벤트 루프(워커)별로 동시에 실행할 수 있는 최대 백그라운드 갱신 수
+CACHE_REFRESH_CONCURRENCY = int(os.getenv("CACHE_REFRESH_CONCURRENCY", "2"))
+
+# --- 쿼리 정규화 설정 ---
+# 설정하면 정규화 결과가 다른 쿼리도 MinHash 추정 유사도가 이 값(0~1) 이상이면 같은 캐시 키를 사용합니다.
+# 설정하지 않으면 정규화 결과가 정확히 같은 쿼리만 같은 키를 사용합니다.
+QUERY_NEAR_DUPLICATE_THRESHOLD = (
+    float(os.environ["QUERY_NEAR_DUPLICATE_THRESHOLD"])
+    if os.getenv("QUERY_NEAR_DUPLICATE_THRESHOLD")
+    else None
+)
+# 근사 중복 탐지 색인에 보관할 최대 쿼리 수 (프로세스별)
+QUERY_NEAR_DUPLICATE_MAX_ENTRIES = int(
+    os.getenv("QUERY_NEAR_DUPLICATE_MAX_ENTRIES", "10000")
+)
+# 선택자 에이전트 출력 메모 유효 시간(초)입니다. 0이면 사용하지 않습니다.
+# 정규화된 사용자 발화가 같으면 선택자 LLM을 호출하지 않고 저장된 출력을 재사용합니다.
+SELECTOR_MEMO_TTL_SECONDS = float(os.getenv("SELECTOR_MEMO_TTL_SECONDS", "0"))
+
+# --- GPS 경로 일괄 역지오코딩 설정 ---
+# 경로 단순화(Douglas–Peucker) 허용 오차(미터)입니다. 단순화된 경로에서 이보다 가까운 점은 건너뜁니다.
+TRACE_SIMPLIFY_TOLERANCE_M = float(os.getenv("TRACE_SIMPLIFY_TOLERANCE_M", "15"))
+# 역지오코딩 격자 칸 크기(미터)입니다. 같은 칸의 점은 한 번만 역지오코딩하며,
+# 단순화 후에도 이 거리만큼 이동할 때마다 최소 한 점을 남겨 경로 전체의 주소를 얻습니다.
+TRACE_CELL_SIZE_M = float(os.getenv("TRACE_CELL_SIZE_M", "50"))
+# 경로 하나를 처리할 때 동시에 보낼 최대 역지오코딩 요청 수
+TRACE_GEOCODE_CONCURRENCY = int(os.getenv("TRACE_GEOCODE_CONCURRENCY", "4"))
+
+# --- 오프라인 개략 역지오코딩 설정 ---
+# 행정구역 경계 색인 디렉터리입니다 (python -m google_maps_agents.tools.admin_boundary build로 생성).
+# 설정하면 시/도, 시/군/구, 읍/면/동 수준만 필요한 역지오코딩을 API 호출 없이 처리하고,
+# 업스트림 장애 시 역지오코딩 대체 응답으로 사용합니다.
+ADMIN_BOUNDARY_INDEX_PATH = os.getenv("ADMIN_BOUNDARY_INDEX_PATH") or None
+
+# --- 기준 위치(anchor) 주변 검색 설정 ---
+# 활성화하면 "서울역 근처 약국"처럼 기준 위치가 있는 쿼리는 기준 위치를 지오코딩하여
+# 검색 영역을 지정하고, 결과를 거리순으로 정렬/반경 필터링하며 distance_m을 추가합니다.
+PLACES_DISTANCE_RANKING_ENABLED = (
+    os.getenv("PLACES_DISTANCE_RANKING_ENABLED", "false").lower() == "true"
+)
+# 기준 위치 주변 검색 반경 (미터)
+PLACES_ANCHOR_RADIUS_M = float(os.getenv("PLACES_ANCHOR_RADIUS_M", "2000"))
+# "bias": 반경 안의 결과를 우선(location_bias), "restriction": 반경을 감싸는 사각형으로 제한(location_restriction)
+PLACES_ANCHOR_LOCATION_MODE = os.getenv("PLACES_ANCHOR_LOCATION_MODE", "bias").lower()
+
+
+def __getattr__(name: str) -> "types.GenerateContentConfig":
+    if name not in _CONTENT_CONFIG_TEMPERATURES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from google.genai import types
+
+    config = types.GenerateContentConfig(temperature=_CONTENT_CONFIG_TEMPERATURES[name])
+    globals()[name] = config
+    return config
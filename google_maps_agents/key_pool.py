@@ -0,0 +1,316 @@
+"""
+업스트림 API 키 풀을 정의하는 파일입니다.
+
+여러 프로젝트의 API 키를 함께 사용하여 한 프로젝트의 할당량에 처리량이 묶이지 않도록 합니다.
+키마다 별도 클라이언트와 토큰 버킷(RateLimiter)을 두고, 요청은 진행 중인 요청이 가장 적은 키로 보냅니다.
+
+할당량 초과(ResourceExhausted/429)나 권한 거부(PermissionDenied/403)가 발생한 키는 일정 시간 풀에서
+제외되고, 같은 요청은 남은 키로 다시 시도합니다. 제외 상태는 상태 저장소(shared_state.StateStore)에
+보관되므로 멀티 프로세스 서빙 모드에서는 모든 워커가 같은 키를 함께 제외합니다. 키 선택은 로컬에
+보관한 제외 만료 시각을 사용하고, 저장소는 API_KEY_COOLDOWN_SYNC_SECONDS마다 한 번만 조회합니다.
+키 자체는 로그/메트릭에 남기지 않고 SHA-256 앞 8자리(key_id)로만 식별합니다.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from .config import (
+    API_KEY_COOLDOWN_SYNC_SECONDS,
+    API_KEY_DENIED_COOLDOWN_SECONDS,
+    API_KEY_EXHAUSTED_COOLDOWN_SECONDS,
+)
+from .ratelimit import RateLimiter
+from .shared_state import call_state_store
+from .telemetry.metrics import registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 키 제외 사유
+REASON_EXHAUSTED = "exhausted"
+REASON_DENIED = "denied"
+
+_COOLDOWN_NAMESPACE = "api_key_cooldown"
+
+API_KEY_REQUESTS = registry.counter(
+    "api_key_requests_total",
+    "Upstream requests by API and pooled key id.",
+    ["api", "key"],
+)
+API_KEY_COOLDOWNS = registry.counter(
+    "api_key_cooldowns_total",
+    "Pooled keys removed from rotation by API, key id and reason (exhausted, denied).",
+    ["api", "key", "reason"],
+)
+API_KEY_IN_FLIGHT = registry.gauge(
+    "api_key_in_flight",
+    "In-flight upstream requests per pooled key (per process).",
+    ["api", "key"],
+)
+
+
+def _cooldown_seconds(reason: str) -> float:
+    return (
+        API_KEY_DENIED_COOLDOWN_SECONDS
+        if reason == REASON_DENIED
+        else API_KEY_EXHAUSTED_COOLDOWN_SECONDS
+    )
+
+
+def keys_from_env(pool_env: str, *single_envs: str) -> List[str]:
+    """
+    환경변수에서 API 키 목록을 읽습니다.
+
+    pool_env(쉼표로 구분한 키 목록)가 있으면 그 값을, 없으면 single_envs 중 처음 설정된 키 하나를 사용합니다.
+    중복 키는 제거됩니다.
+    """
+    keys = [key.strip() for key in os.getenv(pool_env, "").split(",") if key.strip()]
+    if not keys:
+        keys = [value for value in (os.getenv(name) for name in single_envs) if value][
+            :1
+        ]
+    return list(dict.fromkeys(keys))
+
+
+@dataclass(eq=False)
+class PooledKey:
+    """
+    풀에 속한 API 키 하나입니다.
+
+    Attributes:
+        key (str): API 키
+        key_id (str): 로그/메트릭용 식별자 (키의 SHA-256 앞 8자리)
+        limiter (RateLimiter): 키별 토큰 버킷
+        client (Any): 키 전용 클라이언트 (요청 파라미터로 키를 전달하는 API는 None)
+        in_flight (int): 이 프로세스에서 진행 중인 요청 수
+        requests (int): 이 프로세스에서 보낸 누적 요청 수
+    """
+
+    key: str
+    key_id: str
+    limiter: RateLimiter
+    client: Any = None
+    in_flight: int = 0
+    requests: int = 0
+
+
+class KeyPool:
+    """
+    API 키 풀입니다.
+
+    Attributes:
+        api (str): API 이름 (메트릭의 api 레이블, 토큰 버킷 이름 접두사)
+        keys (List[PooledKey]): 풀의 키 목록
+        classify (Callable[[BaseException], Optional[str]]): 예외를 키 제외 사유(REASON_*)로 분류하는 함수.
+            None을 반환하면 키 문제가 아니므로 그대로 다시 발생시킵니다.
+
+    Example:
+        >>> pool = KeyPool("geocode", ["key-a", "key-b"], rate_limit=10.0, classify=classify_http)
+        >>> response = await pool.call(lambda key: client.get(url, params={"key": key.key}))
+
+    키 교체 재시도는 call() 안에서 이뤄지므로, 업스트림 호출 추적(track_upstream, 서킷 브레이커
+    track())은 call() 바깥이 아니라 request 안에서 시도마다 시작합니다.
+    """
+
+    def __init__(
+        self,
+        api: str,
+        keys: Sequence[str],
+        rate_limit: Optional[float] = None,
+        classify: Optional[Callable[[BaseException], Optional[str]]] = None,
+        make_client: Optional[Callable[[str], Any]] = None,
+    ):
+        """
+        Args:
+            api (str): API 이름
+            keys (Sequence[str]): API 키 목록 (1개 이상)
+            rate_limit (Optional[float]): 키별 초당 최대 요청 수. None이면 제한하지 않습니다.
+            classify (Optional[Callable[[BaseException], Optional[str]]]): 예외 분류 함수
+            make_client (Optional[Callable[[str], Any]]): 키별 클라이언트 생성 함수
+
+        Raises:
+            ValueError: 키가 없는 경우
+        """
+        if not keys:
+            raise ValueError(f"{api} API 키가 없습니다.")
+        self.api = api
+        self.classify = classify or (lambda error: None)
+        self.keys: List[PooledKey] = []
+        for key in keys:
+            key_id = hashlib.sha256(key.encode()).hexdigest()[:8]
+            self.keys.append(
+                PooledKey(
+                    key=key,
+                    key_id=key_id,
+                    limiter=RateLimiter(f"{api}:{key_id}", rate_limit),
+                    client=make_client(key) if make_client else None,
+                )
+            )
+        # key_id -> 제외 만료 시각 (상태 저장소 값의 로컬 사본)
+        self._cooldown_until: Dict[str, float] = {}
+        self._synced_at = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def cooling_down(self, pooled: PooledKey) -> bool:
+        """키가 풀에서 일시 제외되어 있는지 로컬에 보관한 제외 만료 시각으로 확인합니다."""
+        return self._cooldown_until.get(pooled.key_id, 0.0) > time.time()
+
+    async def sync_cooldowns(self) -> None:
+        """
+        다른 워커가 기록한 키 제외 상태를 상태 저장소에서 읽어 로컬 만료 시각을 갱신합니다.
+
+        API_KEY_COOLDOWN_SYNC_SECONDS에 한 번만 조회하므로 요청마다 키별 IPC가 발생하지 않습니다.
+        저장소 오류 시에는 로컬 상태를 그대로 사용합니다.
+        """
+        now = time.time()
+        if now - self._synced_at < API_KEY_COOLDOWN_SYNC_SECONDS:
+            return
+        # 동시에 들어온 요청이 같은 조회를 반복하지 않도록 먼저 기록합니다.
+        self._synced_at = now
+        for pooled in self.keys:
+            try:
+                entry = await call_state_store(
+                    "cache_get", _COOLDOWN_NAMESPACE, f"{self.api}:{pooled.key_id}"
+                )
+            except Exception as e:
+                logger.warning(f"API 키 상태 조회 실패 ({self.api}): {e}")
+                return
+            if entry is not None:
+                stored_at, reason = entry
+                until = stored_at + _cooldown_seconds(reason)
+                if until > self._cooldown_until.get(pooled.key_id, 0.0):
+                    self._cooldown_until[pooled.key_id] = until
+
+    async def cooldown(self, pooled: PooledKey, reason: str) -> None:
+        """키를 사유별 시간 동안 풀에서 제외합니다."""
+        seconds = _cooldown_seconds(reason)
+        logger.warning(
+            f"API 키 일시 제외 ({self.api}:{pooled.key_id}, {reason}, {seconds:.0f}초)"
+        )
+        API_KEY_COOLDOWNS.inc(api=self.api, key=pooled.key_id, reason=reason)
+        self._cooldown_until[pooled.key_id] = time.time() + seconds
+        try:
+            await call_state_store(
+                "cache_set",
+                _COOLDOWN_NAMESPACE,
+                f"{self.api}:{pooled.key_id}",
+                reason,
+                seconds,
+            )
+        except Exception as e:
+            logger.warning(f"API 키 상태 저장 실패 ({self.api}): {e}")
+
+    def select(self, exclude: Sequence[PooledKey] = ()) -> Optional[PooledKey]:
+        """
+        진행 중인 요청이 가장 적은 사용 가능한 키를 반환합니다 (같으면 누적 요청이 적은 키).
+
+        exclude를 제외한 모든 키가 제외 상태이면 None입니다. 단, exclude가 비어 있으면
+        (첫 시도) 제외 상태와 관계없이 가장 덜 사용된 키를 반환하여 요청을 계속 진행합니다.
+        """
+        candidates = [pooled for pooled in self.keys if pooled not in exclude]
+        available = [pooled for pooled in candidates if not self.cooling_down(pooled)]
+        if not available:
+            if exclude or not candidates:
+                return None
+            available = candidates
+        return min(available, key=lambda pooled: (pooled.in_flight, pooled.requests))
+
+    def _select_first(self) -> PooledKey:
+        """첫 시도에 사용할 키를 고릅니다. 첫 시도는 키가 제외 상태여도 진행합니다."""
+        pooled = self.select()
+        if pooled is None:
+            # 빈 풀은 생성 시 거부하므로, 제외할 키가 없는 첫 선택은 항상 키를 반환합니다.
+            raise RuntimeError(f"{self.api} API 키 풀에 선택할 키가 없습니다.")
+        return pooled
+
+    @asynccontextmanager
+    async def lease(
+        self, pooled: Optional[PooledKey] = None
+    ) -> AsyncIterator[PooledKey]:
+        """
+        키(지정하지 않으면 select()로 고른 키)의 토큰을 얻고 블록이 끝날 때까지 진행 중으로 표시합니다.
+
+        call()은 시도마다 이 블록 안에서 request를 실행하므로, 속도 제한 대기는 request 안의
+        업스트림 호출 추적 구간에 포함되지 않습니다.
+
+        Example:
+            >>> async with pool.lease() as pooled:
+            ...     response = await client.get(url, params={"key": pooled.key})
+        """
+        if pooled is None:
+            await self.sync_cooldowns()
+            pooled = self._select_first()
+        pooled.in_flight += 1
+        pooled.requests += 1
+        API_KEY_IN_FLIGHT.set(pooled.in_flight, api=self.api, key=pooled.key_id)
+        API_KEY_REQUESTS.inc(api=self.api, key=pooled.key_id)
+        try:
+            await pooled.limiter.acquire()
+            yield pooled
+        finally:
+            pooled.in_flight -= 1
+            API_KEY_IN_FLIGHT.set(pooled.in_flight, api=self.api, key=pooled.key_id)
+
+    async def call(self, request: Callable[[PooledKey], Awaitable[T]]) -> T:
+        """
+        선택한 키로 request를 실행합니다.
+
+        시도마다 lease()로 키의 토큰을 얻은 뒤 request(pooled)를 호출합니다. 키 문제(할당량 초과,
+        권한 거부)로 실패하면 그 키를 제외하고 남은 키로 다시 시도하며, 더 시도할 키가 없으면
+        마지막 예외를 그대로 발생시킵니다. request는 시도 하나만 추적해야 합니다.
+
+        Example:
+            >>> async def search(pooled):
+            ...     with track_upstream("places"), call.track():
+            ...         return await pooled.client.search_text(request=request)
+            >>> response = await pool.call(search)
+        """
+        await self.sync_cooldowns()
+        tried: List[PooledKey] = []
+        pooled = self._select_first()
+        while True:
+            try:
+                async with self.lease(pooled):
+                    return await request(pooled)
+            except Exception as e:
+                reason = self.classify(e)
+                if reason is None:
+                    raise
+                await self.cooldown(pooled, reason)
+                tried.append(pooled)
+                retry = self.select(exclude=tried)
+                if retry is None:
+                    raise
+                pooled = retry
+            logger.info(f"다른 API 키로 재시도 ({self.api}:{pooled.key_id})")
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """키별 상태(식별자, 진행 중/누적 요청 수, 제외 여부)를 반환합니다."""
+        return [
+            {
+                "key_id": pooled.key_id,
+                "in_flight": pooled.in_flight,
+                "requests": pooled.requests,
+                "cooling_down": self.cooling_down(pooled),
+            }
+            for pooled in self.keys
+        ]
@@ -0,0 +1,49 @@
+"""
+에이전트가 사용하는 LLM 인스턴스 생성 및 출력 검증 모듈
+"""
+
+from .cascade import CascadeLlm, get_cascade_stats, get_model, text_validator
+from .memo import seed_selector_memo, selector_memo_callbacks
+from .schemas import (
+    FieldsSelection,
+    LanguageSelection,
+    SelectorOutput,
+    TypeSelection,
+    is_valid_fields_output,
+    is_valid_language_output,
+    is_valid_types_output,
+    selected_fields,
+    selected_language,
+    selected_type,
+    selector_output_json,
+)
+from .validators import (
+    get_known_language_codes,
+    get_known_place_types,
+    is_valid_rating_pricing_output,
+    tool_call_validator,
+)
+
+__all__ = [
+    "CascadeLlm",
+    "get_cascade_stats",
+    "get_model",
+    "text_validator",
+    "seed_selector_memo",
+    "selector_memo_callbacks",
+    "FieldsSelection",
+    "LanguageSelection",
+    "SelectorOutput",
+    "TypeSelection",
+    "selected_fields",
+    "selected_language",
+    "selected_type",
+    "selector_output_json",
+    "get_known_language_codes",
+    "get_known_place_types",
+    "is_valid_fields_output",
+    "is_valid_language_output",
+    "is_valid_rating_pricing_output",
+    "is_valid_types_output",
+    "tool_call_validator",
+]
@@ -0,0 +1,231 @@
+"""
+모델 계층(cascade) 호출을 위한 LLM 래퍼를 정의하는 파일입니다.
+
+가장 저렴하고 빠른 모델을 먼저 호출하고, 출력 검증에 실패한 경우에만
+상위 모델로 승급(escalation)합니다.
+"""
+
+import logging
+import threading
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+from ..config import (
+    CASCADE_ESCALATION_MODEL_NAME,
+    CASCADE_FAST_MODEL_NAME,
+    MODEL_CASCADE_ENABLED,
+)
+from ..telemetry.metrics import registry
+from ..telemetry.tracing import MODEL_METADATA_KEY, REJECTED_USAGE_METADATA_KEY
+from .validators import response_text
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+ResponseValidator = Callable[[List[LlmResponse]], bool]
+
+CASCADE_SERVED = registry.counter(
+    "llm_cascade_served_total",
+    "Cascade calls by agent and the model that produced the final response.",
+    ["agent", "model"],
+)
+CASCADE_ESCALATIONS = registry.counter(
+    "llm_cascade_escalations_total", "Cascade escalations by agent.", ["agent"]
+)
+
+
+class CascadeStats:
+    """
+    에이전트별 모델 계층 호출 통계를 집계하는 클래스입니다.
+
+    Attributes:
+        calls (Dict[str, int]): 에이전트별 전체 호출 수
+        served (Dict[str, Dict[str, int]]): 에이전트별로 최종 응답을 생성한 모델 분포
+        escalations (Dict[str, int]): 에이전트별 승급 횟수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self.served: Dict[str, Dict[str, int]] = {}
+        self.escalations: Dict[str, int] = {}
+
+    def record(self, agent_name: str, model_name: str, escalations: int) -> None:
+        """한 번의 계층 호출 결과를 기록합니다."""
+        with self._lock:
+            self.calls[agent_name] = self.calls.get(agent_name, 0) + 1
+            served = self.served.setdefault(agent_name, {})
+            served[model_name] = served.get(model_name, 0) + 1
+            self.escalations[agent_name] = (
+                self.escalations.get(agent_name, 0) + escalations
+            )
+        CASCADE_SERVED.inc(agent=agent_name, model=model_name)
+        if escalations:
+            CASCADE_ESCALATIONS.inc(escalations, agent=agent_name)
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        에이전트별 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Dict[str, object]]:
+                {"fields_selector_agent": {"calls": 10, "escalations": 1,
+                 "escalation_rate": 0.1, "served": {"gemini-2.5-flash-lite": 9, ...}}}
+        """
+        with self._lock:
+            return {
+                agent_name: {
+                    "calls": calls,
+                    "escalations": self.escalations.get(agent_name, 0),
+                    "escalation_rate": self.escalations.get(agent_name, 0) / calls,
+                    "served": dict(self.served.get(agent_name, {})),
+                }
+                for agent_name, calls in self.calls.items()
+            }
+
+
+_cascade_stats = CascadeStats()
+
+
+def get_cascade_stats() -> Dict[str, Dict[str, object]]:
+    """모델 계층 호출 통계(에이전트별 승급 비율)를 반환합니다."""
+    return _cascade_stats.snapshot()
+
+
+def _tier_usage(model: str, responses: List[LlmResponse]) -> Dict[str, Any]:
+    """승급으로 버려진 단계의 토큰 사용량입니다. 스트리밍 응답은 마지막 사용량이 누적값입니다."""
+    usage = next(
+        (r.usage_metadata for r in reversed(responses) if r.usage_metadata is not None),
+        None,
+    )
+    return {
+        "model": model,
+        "prompt_tokens": (usage.prompt_token_count or 0) if usage else 0,
+        "completion_tokens": (usage.candidates_token_count or 0) if usage else 0,
+    }
+
+
+def _annotate(
+    response: LlmResponse, model: str, rejected: List[Dict[str, Any]]
+) -> LlmResponse:
+    """
+    응답을 만든 모델과 버려진 단계의 사용량을 custom_metadata에 기록합니다.
+
+    after_model_callback(trace_model_end)은 첫 단계의 요청만 보므로, 이 값으로 토큰과 호출 수를
+    실제 모델에 귀속시킵니다. 버려진 단계 사용량은 첫 번째 완료 응답에만 한 번 붙입니다.
+    """
+    metadata = {**(response.custom_metadata or {}), MODEL_METADATA_KEY: model}
+    if rejected and not response.partial:
+        metadata[REJECTED_USAGE_METADATA_KEY] = list(rejected)
+        rejected.clear()
+    response.custom_metadata = metadata
+    return response
+
+
+def text_validator(check: Callable[[str], bool]) -> ResponseValidator:
+    """텍스트 검사 함수를 LLM 응답 목록 검증 함수로 변환합니다."""
+
+    def validate(responses: List[LlmResponse]) -> bool:
+        return check(response_text(responses))
+
+    return validate
+
+
+class CascadeLlm(BaseLlm):
+    """
+    여러 모델을 비용 순서대로 시도하는 LLM 래퍼입니다.
+
+    각 단계의 응답을 validator로 검증하고, 실패하거나 오류가 발생하면 다음 단계의
+    모델로 같은 요청을 다시 보냅니다. 마지막 단계의 응답은 검증 없이 반환합니다.
+    검증이 끝나야 응답을 내보낼 수 있으므로 마지막 이전 단계의 스트리밍 응답은
+    모두 수집된 뒤 한 번에 전달됩니다.
+
+    Attributes:
+        model (str): 첫 번째 단계의 모델 이름
+        agent_name (str): 통계 집계에 사용할 에이전트 이름
+        tiers (List[BaseLlm]): 비용 오름차순으로 정렬된 모델 목록
+        validator (ResponseValidator): 응답 유효성 검사 함수
+    """
+
+    agent_name: str
+    tiers: List[BaseLlm]
+    validator: ResponseValidator
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """모델 계층을 순서대로 호출하여 검증을 통과한 응답을 반환합니다."""
+        rejected: List[Dict[str, Any]] = []
+        for index, llm in enumerate(self.tiers):
+            is_last = index == len(self.tiers) - 1
+            request = llm_request.model_copy(deep=True)
+            request.model = llm.model
+
+            if is_last:
+                _cascade_stats.record(self.agent_name, llm.model, index)
+                async for response in llm.generate_content_async(request, stream):
+                    yield _annotate(response, llm.model, rejected)
+                return
+
+            try:
+                responses = [
+                    response
+                    async for response in llm.generate_content_async(request, stream)
+                ]
+            except Exception as e:
+                logger.warning(
+                    f"{self.agent_name}: {llm.model} 호출 실패, 상위 모델로 승급: {e}"
+                )
+                rejected.append(_tier_usage(llm.model, []))
+                continue
+
+            if not any(r.error_code for r in responses) and self.validator(responses):
+                _cascade_stats.record(self.agent_name, llm.model, index)
+                for response in responses:
+                    yield _annotate(response, llm.model, rejected)
+                return
+
+            logger.info(
+                f"{self.agent_name}: {llm.model} 출력 검증 실패, 상위 모델로 승급"
+            )
+            rejected.append(_tier_usage(llm.model, responses))
+
+
+def get_model(
+    agent_name: str, model_name: str, validator: Optional[ResponseValidator] = None
+) -> BaseLlm:
+    """
+    에이전트에 사용할 모델 인스턴스를 생성합니다.
+
+    MODEL_CASCADE_ENABLED가 켜져 있고 validator가 주어진 경우 CASCADE_FAST_MODEL_NAME,
+    설정된 모델, CASCADE_ESCALATION_MODEL_NAME 순서의 CascadeLlm을 반환합니다.
+    그 외에는 설정된 모델의 Gemini 인스턴스를 반환합니다.
+
+    Args:
+        agent_name (str): 에이전트 이름
+        model_name (str): config.py에 설정된 에이전트의 모델 이름
+        validator (Optional[ResponseValidator]): 응답 유효성 검사 함수
+
+    Returns:
+        BaseLlm: Gemini 또는 CascadeLlm 인스턴스
+    """
+    if not MODEL_CASCADE_ENABLED or validator is None:
+        return Gemini(model=model_name)
+
+    names: List[str] = []
+    for name in (CASCADE_FAST_MODEL_NAME, model_name, CASCADE_ESCALATION_MODEL_NAME):
+        if name not in names:
+            names.append(name)
+    if len(names) == 1:
+        return Gemini(model=model_name)
+
+    return CascadeLlm(
+        model=names[0],
+        agent_name=agent_name,
+        tiers=[Gemini(model=name) for name in names],
+        validator=validator,
+    )
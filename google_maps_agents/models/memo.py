@@ -0,0 +1,142 @@
+"""
+선택자(selector) 에이전트 출력 메모를 정의하는 파일입니다.
+
+정규화된 사용자 발화(canonical.query_cache_key)가 같은 요청에 대해서는 선택자 LLM을 다시
+호출하지 않고 이전에 검증을 통과한 출력을 재사용합니다. 메모는 결과 캐시(ResultCache)에
+저장되므로 멀티 프로세스 서빙 모드에서는 워커 간에 공유됩니다.
+
+선택자 출력은 대화 기록에 따라 달라질 수 있으므로("거기 말고 다른 데"), 이전 사용자 턴이 있는
+세션에서는 메모를 조회하거나 저장하지 않습니다.
+"""
+
+import logging
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from ..cache import RESULT_HIT, RESULT_MISS, ResultCache
+from ..canonical import query_cache_key
+from ..config import SELECTOR_MEMO_TTL_SECONDS
+from ..telemetry.metrics import CACHE_REQUESTS
+from .validators import clean_output, response_text
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_memo = ResultCache("selector", SELECTOR_MEMO_TTL_SECONDS)
+
+
+def _has_prior_turns(callback_context: CallbackContext) -> bool:
+    """세션에 현재 호출(invocation) 이전의 사용자 메시지가 있으면 True입니다."""
+    # ADK의 CallbackContext는 세션 이벤트를 공개 속성으로 제공하지 않습니다.
+    session = callback_context._invocation_context.session
+    return any(
+        event.author == "user" and event.invocation_id != callback_context.invocation_id
+        for event in session.events
+    )
+
+
+def _memo_key(callback_context: CallbackContext) -> Optional[str]:
+    """
+    에이전트 이름과 정규화된 사용자 발화로 메모 키를 만듭니다.
+    발화가 없거나 이전 사용자 턴이 있는 세션이면 None입니다.
+    """
+    if not _memo.enabled or not callback_context.user_content:
+        return None
+    if _has_prior_turns(callback_context):
+        return None
+    text = "".join(
+        part.text or "" for part in callback_context.user_content.parts or []
+    )
+    if not text.strip():
+        return None
+    return ResultCache.make_key(callback_context.agent_name, query_cache_key(text))
+
+
+class SelectorMemoCallbacks(NamedTuple):
+    """
+    선택자 LlmAgent의 모델 콜백 쌍입니다.
+
+    Attributes:
+        lookup: before_model_callback. 메모가 있으면 LLM 호출 대신 저장된 출력을 응답으로 반환합니다.
+        store: after_model_callback. 검증을 통과한 최종 출력을 메모에 저장합니다.
+    """
+
+    lookup: Callable[[CallbackContext, LlmRequest], Awaitable[Optional[LlmResponse]]]
+    store: Callable[[CallbackContext, LlmResponse], Awaitable[None]]
+
+
+def selector_memo_callbacks(check: Callable[[str], bool]) -> SelectorMemoCallbacks:
+    """
+    선택자 LlmAgent에 등록할 메모 콜백을 반환합니다.
+
+    SELECTOR_MEMO_TTL_SECONDS가 0이면 두 콜백 모두 아무 일도 하지 않습니다.
+
+    Args:
+        check (Callable[[str], bool]): 출력 텍스트 검증 함수 (예: is_valid_types_output)
+
+    Example:
+        >>> memo = selector_memo_callbacks(is_valid_types_output)
+        >>> LlmAgent(
+        ...     name="types_selector_agent",
+        ...     before_model_callback=[memo.lookup, trace_model_start],
+        ...     after_model_callback=[trace_model_end, memo.store],
+        ... )
+    """
+
+    async def lookup(
+        callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        key = _memo_key(callback_context)
+        if key is None:
+            return None
+        cached = await _memo.get(key)
+        # 출력 형식이 바뀌기 전에 저장된 메모는 사용하지 않습니다.
+        if cached is not None and not check(cached["text"]):
+            cached = None
+        CACHE_REQUESTS.inc(
+            cache=_memo.namespace, result=RESULT_HIT if cached else RESULT_MISS
+        )
+        if cached is None:
+            return None
+        logger.info(
+            f"선택자 메모 사용 ({callback_context.agent_name}): {cached['text']}"
+        )
+        return LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=cached["text"])])
+        )
+
+    async def store(
+        callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> None:
+        if llm_response.partial or llm_response.error_code:
+            return None
+        key = _memo_key(callback_context)
+        if key is None:
+            return None
+        text = clean_output(response_text([llm_response]))
+        if check(text):
+            await _memo.set(key, {"text": text})
+        return None
+
+    return SelectorMemoCallbacks(lookup=lookup, store=store)
+
+
+async def seed_selector_memo(agent_name: str, utterance: str, text: str) -> bool:
+    """
+    선택자 출력 메모에 값을 직접 저장합니다 (캐시 예열용).
+
+    메모가 비활성화되어 있거나 발화가 비어 있으면 저장하지 않습니다. 출력 검증은 호출 측 책임입니다.
+
+    Returns:
+        bool: 저장 여부
+    """
+    if not _memo.enabled or not utterance.strip():
+        return False
+    await _memo.set(
+        ResultCache.make_key(agent_name, query_cache_key(utterance)), {"text": text}
+    )
+    return True
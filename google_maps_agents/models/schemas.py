@@ -0,0 +1,152 @@
+"""
+선택자(selector) 에이전트의 구조화된 출력 스키마를 정의하는 파일입니다.
+
+각 스키마는 LlmAgent.output_schema로 지정되어 응답이 JSON(response_schema)으로 제한되고,
+ADK가 검증한 딕셔너리가 output_key 상태에 저장됩니다. 허용 값(enum)은 prompts.py의 필드/장소 유형/
+언어 코드 목록을 그대로 사용하므로, 목록 밖의 값이나 설명문, 마크다운은 생성되지 않습니다.
+
+상태 값 예시:
+    fields:   {"fields": ["places.id", "places.displayName"]}
+    types:    {"included_type": "cafe"}  (유형을 지정하지 않으면 {})
+    language: {"language_code": "ko"}
+"""
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from ..tools.field_mask import FIELD_PREFIX, get_field_sku_table, resolve_field
+from .validators import clean_output, get_known_language_codes, get_known_place_types
+
+# 스키마 enum은 프롬프트 목록 순서를 유지하여 매번 같은 response_schema를 만듭니다.
+# 허용 값은 실행 시점에 목록에서 만들어지므로, 정적 타입 검사기에는 str로 보입니다.
+if TYPE_CHECKING:
+    PlaceField = str
+    PlaceType = str
+    LanguageCode = str
+else:
+    PlaceField = Literal.__getitem__(
+        tuple(name for name in get_field_sku_table() if name.startswith(FIELD_PREFIX))
+    )
+    PlaceType = Literal.__getitem__(tuple(sorted(get_known_place_types())))
+    LanguageCode = Literal.__getitem__(tuple(sorted(get_known_language_codes())))
+
+
+class SelectorOutput(BaseModel):
+    """선택자 출력 스키마의 추상 기반 클래스입니다. 하위 클래스는 from_text를 구현해야 합니다."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    @classmethod
+    @abstractmethod
+    def from_text(cls, text: str) -> Optional["SelectorOutput"]:
+        """이전 형식의 자유 텍스트 출력(예: 검색 기록 값)을 스키마로 변환합니다. 올바르지 않으면 None입니다."""
+
+
+class FieldsSelection(SelectorOutput):
+    """fields_selector_agent 출력입니다."""
+
+    fields: List[PlaceField] = Field(
+        min_length=1,
+        description="응답에 포함할 Places API 필드 목록 (기본 필드 세트 포함)",
+    )
+
+    @classmethod
+    def from_text(cls, text: str) -> Optional["FieldsSelection"]:
+        tokens = [
+            token for token in clean_output(text).replace(",", " ").split() if token
+        ]
+        try:
+            return cls(fields=[resolve_field(token) or token for token in tokens])
+        except ValidationError:
+            return None
+
+
+class TypeSelection(SelectorOutput):
+    """types_selector_agent 출력입니다."""
+
+    included_type: Optional[PlaceType] = Field(
+        default=None,
+        description="검색 결과를 제한할 장소 유형 하나. 특별한 요청이 없으면 생략",
+    )
+
+    @classmethod
+    def from_text(cls, text: str) -> Optional["TypeSelection"]:
+        try:
+            return cls(included_type=clean_output(text) or None)
+        except ValidationError:
+            return None
+
+
+class LanguageSelection(SelectorOutput):
+    """language_selector_agent 출력입니다."""
+
+    language_code: LanguageCode = Field(description="응답 언어 코드 (기본값 ko)")
+
+    @classmethod
+    def from_text(cls, text: str) -> Optional["LanguageSelection"]:
+        try:
+            return cls(language_code=clean_output(text))
+        except ValidationError:
+            return None
+
+
+def _matches(schema: type[SelectorOutput], text: str) -> bool:
+    try:
+        schema.model_validate_json(clean_output(text))
+    except ValidationError:
+        return False
+    return True
+
+
+def is_valid_fields_output(text: str) -> bool:
+    """필드 선택 출력이 FieldsSelection JSON인지 확인합니다."""
+    return _matches(FieldsSelection, text)
+
+
+def is_valid_types_output(text: str) -> bool:
+    """장소 유형 출력이 TypeSelection JSON인지 확인합니다."""
+    return _matches(TypeSelection, text)
+
+
+def is_valid_language_output(text: str) -> bool:
+    """언어 코드 출력이 LanguageSelection JSON인지 확인합니다."""
+    return _matches(LanguageSelection, text)
+
+
+def selector_output_json(schema: type[SelectorOutput], text: str) -> Optional[str]:
+    """
+    자유 텍스트 값을 선택자의 JSON 출력으로 변환합니다 (메모 예열, 오프라인 대역 모델용).
+
+    Example:
+        >>> selector_output_json(TypeSelection, "cafe")
+        '{"included_type":"cafe"}'
+    """
+    selection = schema.from_text(text)
+    return selection.model_dump_json(exclude_none=True) if selection else None
+
+
+# --- 상태 값 읽기 ---
+# 구조화된 출력 도입 전 세션에는 문자열 값이 남아 있을 수 있으므로 두 형식을 모두 받습니다.
+
+
+def selected_fields(value: Any) -> Optional[str]:
+    """fields 상태 값을 필드 마스크 문자열로 변환합니다. 값이 없으면 None입니다."""
+    if isinstance(value, dict):
+        return ",".join(value.get("fields") or []) or None
+    return value or None
+
+
+def selected_type(value: Any) -> Optional[str]:
+    """types 상태 값에서 장소 유형을 반환합니다. 지정하지 않았으면 None입니다."""
+    if isinstance(value, dict):
+        return value.get("included_type") or None
+    return (clean_output(value) or None) if isinstance(value, str) else None
+
+
+def selected_language(value: Any) -> Optional[str]:
+    """language 상태 값에서 언어 코드를 반환합니다. 값이 없으면 None입니다."""
+    if isinstance(value, dict):
+        return value.get("language_code") or None
+    return (clean_output(value) or None) if isinstance(value, str) else None
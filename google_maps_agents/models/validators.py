@@ -0,0 +1,121 @@
+"""
+선택자(selector) 에이전트 출력의 유효성을 검사하는 함수들을 정의하는 파일입니다.
+
+허용되는 장소 유형과 언어 코드는 prompts.py에 나열된 목록을 그대로 사용합니다.
+필드/장소 유형/언어 선택자의 출력 스키마와 검증 함수는 schemas.py에 있습니다.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Callable, FrozenSet, List
+
+from google.adk.models.llm_response import LlmResponse
+
+from ..prompts import LANGUAGE_SELECTOR_INSTRUCTION, TYPES_SELECTOR_INSTRUCTION
+
+_LIST_ITEM_PATTERN = re.compile(r"^- ([\w-]+)", re.MULTILINE)
+_CODE_FENCE_PATTERN = re.compile(r"^```\w*|```$", re.MULTILINE)
+
+PRICE_LEVELS: FrozenSet[str] = frozenset(
+    {
+        "PRICE_LEVEL_UNSPECIFIED",
+        "PRICE_LEVEL_INEXPENSIVE",
+        "PRICE_LEVEL_MODERATE",
+        "PRICE_LEVEL_EXPENSIVE",
+        "PRICE_LEVEL_VERY_EXPENSIVE",
+    }
+)
+
+
+def _section(text: str, header: str) -> str:
+    """지시문에서 header로 시작하는 섹션 본문(다음 '## ' 헤더 전까지)을 잘라냅니다."""
+    start = text.index(header) + len(header)
+    end = text.find("\n## ", start)
+    return text[start : end if end != -1 else None]
+
+
+@lru_cache(maxsize=1)
+def get_known_place_types() -> FrozenSet[str]:
+    """TYPES_SELECTOR_INSTRUCTION의 '장소 유형 목록'에 있는 유형 코드를 반환합니다."""
+    body = _section(TYPES_SELECTOR_INSTRUCTION, "### 장소 유형 목록")
+    return frozenset(_LIST_ITEM_PATTERN.findall(body))
+
+
+@lru_cache(maxsize=1)
+def get_known_language_codes() -> FrozenSet[str]:
+    """LANGUAGE_SELECTOR_INSTRUCTION의 'languageCode 유형 목록'에 있는 언어 코드를 반환합니다."""
+    body = _section(LANGUAGE_SELECTOR_INSTRUCTION, "### languageCode 유형 목록")
+    return frozenset(_LIST_ITEM_PATTERN.findall(body))
+
+
+def response_text(responses: List[LlmResponse]) -> str:
+    """
+    LLM 응답 목록에서 최종 텍스트를 추출합니다.
+
+    스트리밍 호출의 경우 부분(partial) 응답을 제외한 최종 응답만 사용합니다.
+    """
+    final = [r for r in responses if not r.partial] or responses
+    return "".join(
+        part.text or ""
+        for response in final
+        if response.content and response.content.parts
+        for part in response.content.parts
+    )
+
+
+def clean_output(text: str) -> str:
+    """마크다운 코드 블록 표시와 앞뒤 공백을 제거합니다."""
+    return _CODE_FENCE_PATTERN.sub("", text).strip()
+
+
+def is_valid_rating_pricing_output(text: str) -> bool:
+    """평점/가격대 출력이 비어 있거나 올바른 JSON 조건인지 확인합니다."""
+    value = clean_output(text)
+    if not value:
+        return True
+    try:
+        data = json.loads(value)
+    except json.JSONDecodeError:
+        return False
+    if not isinstance(data, dict):
+        return False
+    min_rating = data.get("minRating", 0.0)
+    price_levels = data.get("priceLevels", [])
+    return (
+        isinstance(min_rating, (int, float))
+        and 0.0 <= min_rating <= 5.0
+        and isinstance(price_levels, list)
+        and set(price_levels) <= PRICE_LEVELS
+    )
+
+
+def tool_call_validator(
+    tool_names: FrozenSet[str],
+) -> Callable[[List[LlmResponse]], bool]:
+    """
+    도구를 사용하는 에이전트의 응답 검증 함수를 생성합니다.
+
+    함수 호출이 있다면 모두 알려진 도구에 인자를 채워 호출해야 하고,
+    함수 호출이 없다면 비어 있지 않은 텍스트 응답이어야 합니다.
+
+    Args:
+        tool_names (FrozenSet[str]): 에이전트에 등록된 도구 이름
+
+    Returns:
+        Callable[[List[LlmResponse]], bool]: 응답 검증 함수
+    """
+
+    def validate(responses: List[LlmResponse]) -> bool:
+        calls = [
+            part.function_call
+            for response in responses
+            if response.content and response.content.parts
+            for part in response.content.parts
+            if part.function_call
+        ]
+        if calls:
+            return all(call.name in tool_names and call.args for call in calls)
+        return bool(response_text(responses).strip())
+
+    return validate
@@ -0,0 +1,416 @@
+"""
+결과 캐시 예열(pre-warm) 작업을 정의하는 파일입니다.
+
+자주 검색되는 쿼리/주소의 빈도 목록을 읽어, 기존 PlacesService/GeocodingService를 통해
+장소 검색/지오코딩 캐시를 채우고 선택자 출력 메모를 저장합니다. 업스트림 호출은 서비스의
+속도 제한기를 그대로 거치며, 빈도가 높은 항목부터 처리하다가 시간 또는 호출 수 예산에 도달하면 멈춥니다.
+
+빈도 목록은 다음 중 하나 이상에서 가져옵니다.
+- 파일: JSONL({"kind": "places"|"geocode", "query", "count", "fields", "types", "language",
+  "utterance"}) 또는 한 줄에 하나씩 "<빈도>\\t<쿼리>" / "<쿼리>" 형식의 텍스트 (장소 검색)
+- ADK 데이터베이스 세션 저장소의 places_search_history / geocoding_history 상태
+
+캐시는 상태 저장소(shared_state)에 보관되므로, 멀티 프로세스 서빙 모드에서는 serve가 공유 상태
+매니저를 시작한 뒤 워커를 띄우기 전에 예열합니다(serve --prewarm). 이 모듈을 단독으로 실행하면
+현재 프로세스의 캐시만 채우므로 빈도 목록 확인(--dry-run)이나 예산/호출 수 점검에 사용합니다.
+
+사용법:
+    python -m google_maps_agents.serve --prewarm hot_queries.jsonl --prewarm-seconds 60
+    python -m google_maps_agents.prewarm --sessions sqlite:///./sessions.db --top 200 --dry-run
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+KIND_PLACES = "places"
+KIND_GEOCODE = "geocode"
+# ADK API 서버가 이 에이전트 패키지에 사용하는 앱 이름
+APP_NAME = "google_maps_agents"
+
+
+@dataclass
+class PrewarmEntry:
+    """
+    예열할 검색 하나입니다.
+
+    Attributes:
+        kind (str): "places"(장소 검색) 또는 "geocode"(주소 지오코딩)
+        query (str): 장소 검색 쿼리 또는 주소
+        count (int): 관측 빈도 (높을수록 먼저 예열)
+        fields (Optional[str]): 장소 검색 필드 마스크 (None이면 DEFAULT_FIELDS)
+        types (Optional[str]): 장소 타입 선택자 출력
+        language (Optional[str]): 언어 선택자 출력 / 지오코딩 언어 코드
+        utterance (Optional[str]): 이 검색을 만든 사용자 발화 (선택자 출력 메모 예열용)
+    """
+
+    kind: str
+    query: str
+    count: int = 1
+    fields: Optional[str] = None
+    types: Optional[str] = None
+    language: Optional[str] = None
+    utterance: Optional[str] = None
+
+    def identity(self) -> Tuple[Any, ...]:
+        return (self.kind, self.query, self.fields, self.types, self.language)
+
+
+@dataclass
+class PrewarmReport:
+    """
+    예열 결과 요약입니다.
+
+    Attributes:
+        entries (int): 예열 대상 항목 수
+        warmed (int): 업스트림을 호출하여 캐시를 채운 항목 수
+        already_cached (int): 이미 캐시에 있어 호출하지 않은 항목 수
+        failed (int): 오류 응답을 받은 항목 수
+        skipped (int): 예산 소진으로 처리하지 못한 항목 수
+        memo_seeded (int): 저장한 선택자 출력 메모 수
+        elapsed_seconds (float): 소요 시간 (초)
+        errors (List[str]): 오류 응답 예시 (최대 10개)
+    """
+
+    entries: int = 0
+    warmed: int = 0
+    already_cached: int = 0
+    failed: int = 0
+    skipped: int = 0
+    memo_seeded: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _parse_line(line: str) -> Optional[PrewarmEntry]:
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        data = json.loads(line)
+        return PrewarmEntry(
+            kind=data.get("kind", KIND_PLACES),
+            query=data["query"],
+            count=int(data.get("count", 1)),
+            fields=data.get("fields"),
+            types=data.get("types"),
+            language=data.get("language"),
+            utterance=data.get("utterance"),
+        )
+    count, sep, query = line.partition("\t")
+    if sep and count.strip().isdigit():
+        return PrewarmEntry(kind=KIND_PLACES, query=query.strip(), count=int(count))
+    return PrewarmEntry(kind=KIND_PLACES, query=line)
+
+
+def load_entries(path: str) -> List[PrewarmEntry]:
+    """빈도 목록 파일(JSONL 또는 텍스트)을 읽습니다."""
+    with open(path, encoding="utf-8") as f:
+        return [entry for entry in map(_parse_line, f) if entry is not None]
+
+
+def entries_from_state(state: Dict[str, Any]) -> List[PrewarmEntry]:
+    """세션 상태의 places_search_history / geocoding_history에서 예열 항목을 추출합니다."""
+    entries: List[PrewarmEntry] = []
+    for record in state.get("places_search_history") or []:
+        if not record.get("query") or "error" in (record.get("result") or {}):
+            continue
+        entries.append(
+            PrewarmEntry(
+                kind=KIND_PLACES,
+                query=record["query"],
+                fields=record.get("fields")
+                or (record.get("field_mask") or {}).get("mask"),
+                types=record.get("types"),
+                language=record.get("language"),
+                utterance=record.get("utterance"),
+            )
+        )
+    for record in state.get("geocoding_history") or []:
+        if not record.get("address") or "error" in (record.get("result") or {}):
+            continue
+        entries.append(
+            PrewarmEntry(
+                kind=KIND_GEOCODE,
+                query=record["address"],
+                language=record.get("language"),
+            )
+        )
+    return entries
+
+
+def mine_session_histories(
+    session_service_uri: str, app_name: str = APP_NAME
+) -> List[PrewarmEntry]:
+    """
+    ADK 데이터베이스 세션 저장소(예: sqlite:///./sessions.db)의 모든 세션 상태에서 예열 항목을 추출합니다.
+    """
+    from google.adk.sessions.database_session_service import (
+        DatabaseSessionService,
+        StorageSession,
+    )
+
+    service = DatabaseSessionService(db_url=session_service_uri)
+    entries: List[PrewarmEntry] = []
+    with service.database_session_factory() as session:
+        rows = session.query(StorageSession.state).filter(
+            StorageSession.app_name == app_name
+        )
+        for (state,) in rows:
+            entries.extend(entries_from_state(dict(state or {})))
+    logger.info(f"세션 기록에서 예열 항목 {len(entries)}개 추출: {session_service_uri}")
+    return entries
+
+
+def aggregate(
+    entries: Iterable[PrewarmEntry], top: Optional[int] = None
+) -> List[PrewarmEntry]:
+    """같은 검색을 합쳐 빈도를 더하고, 빈도가 높은 순으로 top개를 반환합니다."""
+    merged: Dict[Tuple[Any, ...], PrewarmEntry] = {}
+    for entry in entries:
+        existing = merged.get(entry.identity())
+        if existing is None:
+            merged[entry.identity()] = PrewarmEntry(**asdict(entry))
+        else:
+            existing.count += entry.count
+            existing.utterance = existing.utterance or entry.utterance
+    ordered = sorted(merged.values(), key=lambda entry: -entry.count)
+    return ordered[:top] if top else ordered
+
+
+async def _seed_memo(entry: PrewarmEntry) -> int:
+    """
+    항목의 선택자 출력이 출력 스키마를 통과하면 선택자 메모에 JSON 출력으로 저장하고 저장 수를 반환합니다.
+    """
+    from .models import (
+        FieldsSelection,
+        LanguageSelection,
+        TypeSelection,
+        seed_selector_memo,
+        selector_output_json,
+    )
+
+    if not entry.utterance:
+        return 0
+    seeded = 0
+    for agent_name, value, schema in (
+        ("fields_selector_agent", entry.fields, FieldsSelection),
+        ("types_selector_agent", entry.types, TypeSelection),
+        ("language_selector_agent", entry.language, LanguageSelection),
+    ):
+        output = selector_output_json(schema, value) if value is not None else None
+        if output is not None and await seed_selector_memo(
+            agent_name, entry.utterance, output
+        ):
+            seeded += 1
+    return seeded
+
+
+async def _warm_entry(entry: PrewarmEntry, report: PrewarmReport) -> bool:
+    """
+    항목 하나를 예열합니다. 업스트림 호출이 필요했으면 True를 반환합니다.
+
+    장소 검색은 text_search_tool과 같은 필드 마스크 검증/검색 영역/결과 수 제한 규칙을 적용하여
+    같은 캐시 키를 사용합니다.
+    """
+    from .config import PLACES_MAX_SKU_TIER
+    from .tools.field_mask import validate_field_mask
+    from .tools.geocode import get_geocoding_service
+    from .tools.places import (
+        DEFAULT_FIELDS,
+        get_places_service,
+        resolve_search_area,
+        result_limit,
+        search_field_mask,
+    )
+
+    if entry.kind == KIND_GEOCODE:
+        service = await get_geocoding_service()
+        language = entry.language or "ko"
+        if (
+            await service.cache.get(service.address_key(entry.query, language))
+            is not None
+        ):
+            report.already_cached += 1
+            return False
+        result = await service.geocode(entry.query, language)
+    else:
+        service = await get_places_service()
+        area = await resolve_search_area(entry.query, entry.language)
+        field_mask = validate_field_mask(
+            entry.fields or DEFAULT_FIELDS,
+            fallback=DEFAULT_FIELDS,
+            max_tier=PLACES_MAX_SKU_TIER,
+        )
+        fields = search_field_mask(field_mask, area)
+        limit = result_limit(entry.query, entry.utterance) if area is None else None
+        report.memo_seeded += await _seed_memo(entry)
+        key = service.cache_key(
+            entry.query, fields, entry.types or "", entry.language or "", area, limit
+        )
+        if await service.cache.get(key) is not None:
+            report.already_cached += 1
+            return False
+        result = await service.text_search(
+            entry.query,
+            fields,
+            entry.types or "",
+            entry.language or "",
+            area=area,
+            max_result_count=limit,
+        )
+
+    if "error" in result or result.get("stale"):
+        report.failed += 1
+        if len(report.errors) < 10:
+            report.errors.append(
+                f"{entry.kind}:{entry.query}: {result.get('error', 'stale')}"
+            )
+    else:
+        report.warmed += 1
+    return True
+
+
+async def prewarm(
+    entries: List[PrewarmEntry],
+    max_seconds: Optional[float] = None,
+    max_calls: Optional[int] = None,
+    concurrency: int = 4,
+) -> PrewarmReport:
+    """
+    빈도 순으로 정렬된 항목을 예열합니다.
+
+    Args:
+        entries (List[PrewarmEntry]): 예열 항목 (aggregate() 결과)
+        max_seconds (Optional[float]): 시간 예산 (초). 지나면 새 항목을 시작하지 않습니다.
+        max_calls (Optional[int]): 업스트림 호출 예산 (이미 캐시된 항목은 세지 않습니다)
+        concurrency (int): 동시에 처리할 항목 수
+
+    Returns:
+        PrewarmReport: 예열 결과 요약
+    """
+    report = PrewarmReport(entries=len(entries))
+    started = time.monotonic()
+    deadline = started + max_seconds if max_seconds else None
+    queue: "asyncio.Queue[PrewarmEntry]" = asyncio.Queue()
+    for entry in entries:
+        queue.put_nowait(entry)
+    calls = 0
+
+    def budget_left() -> bool:
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        return max_calls is None or calls < max_calls
+
+    async def worker() -> None:
+        nonlocal calls
+        while not queue.empty() and budget_left():
+            entry = queue.get_nowait()
+            # 호출 예산은 시작 시점에 예약합니다 (동시 작업이 예산을 넘지 않도록).
+            calls += 1
+            try:
+                called = await _warm_entry(entry, report)
+            except Exception as e:
+                logger.warning(f"예열 실패 ({entry.kind}:{entry.query}): {e}")
+                report.failed += 1
+                called = True
+            if not called:
+                calls -= 1
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    report.skipped = queue.qsize()
+    report.elapsed_seconds = round(time.monotonic() - started, 3)
+    logger.info(f"캐시 예열 완료: {report.to_dict()}")
+    return report
+
+
+def run_prewarm(
+    entries: List[PrewarmEntry],
+    max_seconds: Optional[float] = None,
+    max_calls: Optional[int] = None,
+    concurrency: int = 4,
+) -> PrewarmReport:
+    """새 이벤트 루프에서 예열을 실행하고, 그 루프에서 만든 서비스 연결을 정리합니다."""
+    from .tools.registry import service_registry
+
+    async def run() -> PrewarmReport:
+        try:
+            return await prewarm(entries, max_seconds, max_calls, concurrency)
+        finally:
+            await service_registry.aclose()
+
+    return asyncio.run(run())
+
+
+def collect_entries(
+    files: Iterable[str] = (),
+    session_service_uri: Optional[str] = None,
+    app_name: str = APP_NAME,
+    top: Optional[int] = None,
+) -> List[PrewarmEntry]:
+    """파일과 세션 저장소에서 예열 항목을 모아 빈도 순으로 합칩니다."""
+    entries: List[PrewarmEntry] = []
+    for path in files:
+        entries.extend(load_entries(path))
+    if session_service_uri:
+        entries.extend(mine_session_histories(session_service_uri, app_name))
+    return aggregate(entries, top)
+
+
+def add_prewarm_arguments(parser: argparse.ArgumentParser, prefix: str = "") -> None:
+    """예열 예산/동시성 인자를 추가합니다 (serve에서는 prefix="prewarm-")."""
+    parser.add_argument(f"--{prefix}top", type=int, help="빈도 상위 N개만 예열")
+    parser.add_argument(f"--{prefix}seconds", type=float, help="시간 예산 (초)")
+    parser.add_argument(f"--{prefix}max-calls", type=int, help="업스트림 호출 예산")
+    parser.add_argument(
+        f"--{prefix}concurrency", type=int, default=4, help="동시 예열 수"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument(
+        "--file", action="append", default=[], help="빈도 목록 파일 (여러 번 지정 가능)"
+    )
+    parser.add_argument(
+        "--sessions", help="예열 항목을 추출할 ADK 데이터베이스 세션 저장소 URI"
+    )
+    parser.add_argument("--app-name", default=APP_NAME, help="세션 저장소의 앱 이름")
+    add_prewarm_arguments(parser)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="예열하지 않고 항목 목록만 출력"
+    )
+    parser.add_argument("--json", help="예열 결과를 저장할 JSON 파일 경로")
+    return parser
+
+
+def main() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.INFO)
+    entries = collect_entries(args.file, args.sessions, args.app_name, args.top)
+    if args.dry_run:
+        for entry in entries:
+            print(f"{entry.count:>6}  {entry.kind:<8}{entry.query}")
+        return
+    report = run_prewarm(entries, args.seconds, args.max_calls, args.concurrency)
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
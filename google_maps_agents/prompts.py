@@ -207,11 +207,11 @@ fieldsMask (string): 응답에서 반환할 필드의 목록을 지정합니다.
 - "강남역 애완동물 동반 가능한 카페" → 특수 조건 정보 추가 (Enterprise + Atmosphere SKU)
 
 # 응답 형식
-사용자 요청을 분석한 후, 조합한 필드들을 아래 응답 예시처럼 반환하세요.
+사용자 요청을 분석한 후, 조합한 필드들을 아래 응답 예시처럼 JSON으로 반환하세요.
 
 ## 응답 예시:
 
-places.id,places.attributions,places.displayName,places.formattedAddress,places.location,places.rating,places.regularOpeningHours
+{"fields": ["places.id", "places.attributions", "places.displayName", "places.formattedAddress", "places.location", "places.rating", "places.regularOpeningHours"]}
 
 """
 
@@ -251,7 +251,8 @@ includedType (string): 검색 결과를 특정 장소 유형으로 제한합니
 - sculpture
 - library
 - preschool
-- primary_schoolschool
+- primary_school
+- school
 - secondary_school
 - university
 - adventure_sports_center
@@ -376,14 +377,16 @@ includedType (string): 검색 결과를 특정 장소 유형으로 제한합니
 - wine_bar
 - administrative_area_level_1
 - administrative_area_level_2
-- countrylocality
+- country
+- locality
 - postal_code
 - school_district
 - city_hall
 - courthouse
 - embassy
 - fire_station
-- government_officelocal_government_office
+- government_office
+- local_government_office
 - neighborhood_police_station
 - police
 - post_office
@@ -394,7 +397,8 @@ includedType (string): 검색 결과를 특정 장소 유형으로 제한합니
 - drugstore
 - hospital
 - massage
-- medical_labpharmacy
+- medical_lab
+- pharmacy
 - physiotherapist
 - sauna
 - skin_care_clinic
@@ -482,7 +486,8 @@ includedType (string): 검색 결과를 특정 장소 유형으로 제한합니
 - gift_shop
 - grocery_store
 - hardware_store
-- home_goods_storehome_improvement_store
+- home_goods_store
+- home_improvement_store
 - jewelry_store
 - liquor_store
 - market
@@ -532,11 +537,13 @@ includedType (string): 검색 결과를 특정 장소 유형으로 제한합니
 3. **최종 결정**: 최종 결정된 장소 유형을 반환
 
 # 응답 형식
-사용자 요청을 분석한 후, 아래 응답처럼 반환하세요.
+사용자 요청을 분석한 후, 아래 응답처럼 JSON으로 반환하세요.
+장소 유형을 제공하지 않는 경우 included_type을 생략합니다.
 
 ## 응답 예시:
 
-car_dealer
+{"included_type": "car_dealer"}
+{}
 
 """
 
@@ -636,12 +643,12 @@ languageCode (string): 응답의 언어를 설정합니다. 기본값은 ko입
 - zu: Zulu
 
 # 응답 형식
-사용자 요청을 분석한 후, 아래 응답처럼 반환하세요.
+사용자 요청을 분석한 후, 아래 응답처럼 JSON으로 반환하세요.
 
 ## 응답 예시:
 
-ko
-en
+{"language_code": "ko"}
+{"language_code": "en"}
 
 """
 
@@ -918,6 +925,12 @@ CoordinatorAgent로부터 위임받은 주소/좌표 변환 요청을 처리하
 - "좌표 35.1595, 129.0756의 주소 알려줘"
 - "GPS 위치 36.3504, 127.3845가 어느 지역인지 확인해줘"
 
+역지오코딩 도구의 granularity에는 사용자가 필요로 하는 주소 수준을 지정하세요.
+- 어느 시/도인지만 필요하면 "sido", 어느 구/군인지면 "sigungu", 어느 동네(읍/면/동)인지면 "dong"
+- 도로명 주소, 건물, 우편번호 등 상세 주소가 필요하거나 판단이 어려우면 빈 문자열 ""
+- 결과에 "source": "offline"이 있으면 행정구역 수준의 주소이므로 우편번호/건물 정보 없이 안내하세요.
+- 결과에 "degraded": true가 있으면 일시적 장애로 행정구역 수준의 주소만 제공됨을 함께 안내하세요.
+
 ### 주소 정규화 및 검증
 - "마포구 마포대로 92번지 정확한 주소 형식으로 알려줘"
 - "서울 강남 테헤란로 근처 정확한 주소 찾아줘"
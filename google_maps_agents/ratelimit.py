@@ -0,0 +1,53 @@
+"""
+업스트림 API 호출 속도 제한기를 정의하는 파일입니다.
+
+토큰 버킷 상태는 상태 저장소(shared_state.StateStore)에 보관되므로 멀티 프로세스 서빙 모드에서는
+모든 워커가 하나의 한도를 공유합니다.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from .shared_state import call_state_store
+from .telemetry.metrics import registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_WAIT = registry.histogram(
+    "rate_limit_wait_seconds",
+    "Time spent waiting for an upstream rate-limit token.",
+    ["api"],
+)
+
+
+class RateLimiter:
+    """
+    API별 토큰 버킷 속도 제한기입니다.
+
+    Attributes:
+        name (str): 버킷 이름 (API 이름)
+        rate (Optional[float]): 초당 허용 요청 수. None이면 제한하지 않습니다.
+        burst (float): 순간 최대 요청 수 (기본값: rate, 최소 1)
+    """
+
+    def __init__(self, name: str, rate: Optional[float], burst: Optional[float] = None):
+        self.name = name
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+
+    async def acquire(self) -> None:
+        """토큰을 하나 얻을 때까지 기다립니다. 저장소 오류 시에는 제한 없이 진행합니다."""
+        if not self.rate:
+            return
+        try:
+            wait = await call_state_store(
+                "take_token", self.name, self.rate, self.burst
+            )
+        except Exception as e:
+            logger.warning(f"속도 제한 상태 조회 실패 ({self.name}): {e}")
+            return
+        RATE_LIMIT_WAIT.observe(wait, api=self.name)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,236 @@
+"""
+멀티 프로세스 서빙 진입점입니다.
+
+하나의 수신 소켓 뒤에서 N개의 워커 프로세스(uvicorn workers)가 ADK API 서버를 실행합니다.
+각 워커는 자체 이벤트 루프와 서비스 인스턴스를 가지며, 결과 캐시와 속도 제한 상태는
+부모 프로세스가 시작한 공유 상태 매니저(shared_state)를 통해 모든 워커가 공유합니다.
+
+세션은 기본적으로 워커별 메모리에 저장되므로, 워커가 2개 이상이면 --session-service-uri
+(예: sqlite:///./sessions.db)로 공유 세션 저장소를 지정하거나 로드 밸런서에서 세션 고정이 필요합니다.
+
+--prewarm / --prewarm-sessions를 지정하면 워커를 띄우기 전에 공유 캐시를 자주 검색되는 쿼리/주소로
+예열합니다 (google_maps_agents.prewarm 참고).
+
+POST /stream은 장소 카드와 설명 텍스트를 Server-Sent Events로 점진적으로 전달합니다
+(google_maps_agents.streaming 참고):
+    curl -N -X POST localhost:8000/stream -H 'Content-Type: application/json' \
+        -d '{"user_id": "u1", "message": "강남역 카페"}'
+
+사용법:
+    python -m google_maps_agents.serve --workers 4 --port 8000 \\
+        --session-service-uri sqlite:///./sessions.db
+    python -m google_maps_agents.serve --prewarm hot_queries.jsonl --prewarm-sessions \\
+        --session-service-uri sqlite:///./sessions.db --prewarm-seconds 60
+"""
+
+import argparse
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+from .config import SERVE_WORKERS
+from .prewarm import APP_NAME, add_prewarm_arguments, collect_entries, run_prewarm
+from .shared_state import start_shared_state
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스가 사용할 ADK 세션 저장소 URI를 전달하는 환경변수
+SESSION_SERVICE_URI_ENV = "SERVE_SESSION_SERVICE_URI"
+# ADK가 에이전트 패키지(google_maps_agents)를 찾을 디렉터리
+AGENTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_app():
+    """
+    워커 프로세스에서 호출되는 FastAPI 앱 팩토리입니다.
+
+    ADK API 서버(/run, /run_sse 등)에 워커별 메트릭 경로(/metrics), 캐시된 장소 사진 경로
+    (PHOTO_URL_PREFIX/<digest>.<ext>), 장소 카드 스트리밍 경로(/stream)를 추가합니다.
+    """
+    from fastapi import HTTPException
+    from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+    from google.adk.cli.fast_api import get_fast_api_app
+    from pydantic import BaseModel
+
+    from .config import PHOTO_URL_PREFIX
+    from .streaming import format_sse, stream_turn
+    from .telemetry import render_metrics
+    from .tools.photos import PhotoCache
+    from .tools.registry import service_registry
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        # 워커 종료 시 이 이벤트 루프의 gRPC 채널/HTTP 연결 풀을 정리합니다.
+        await service_registry.aclose()
+
+    app = get_fast_api_app(
+        agents_dir=AGENTS_DIR,
+        session_service_uri=os.getenv(SESSION_SERVICE_URI_ENV) or None,
+        web=False,
+        lifespan=lifespan,
+    )
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def metrics() -> str:
+        return render_metrics()
+
+    photo_cache = PhotoCache()
+
+    @app.get(PHOTO_URL_PREFIX.rstrip("/") + "/{filename}")
+    def photo(filename: str) -> FileResponse:
+        # 파일 이름이 내용의 해시이므로 같은 URL의 내용은 바뀌지 않습니다.
+        path = photo_cache.path(filename)
+        if path is None:
+            raise HTTPException(status_code=404)
+        return FileResponse(
+            path,
+            media_type=photo_cache.content_type(filename),
+            headers={"Cache-Control": "public, max-age=31536000, immutable"},
+        )
+
+    class StreamRequest(BaseModel):
+        """POST /stream 요청 본문입니다. session_id가 없거나 저장소에 없으면 세션을 새로 만듭니다."""
+
+        user_id: str
+        message: str
+        session_id: Optional[str] = None
+
+    stream_runner: Dict[str, Any] = {}
+
+    def get_stream_runner():
+        """스트리밍 경로용 Runner를 첫 요청 시 생성합니다. 세션 저장소 URI는 ADK API 서버와 같습니다."""
+        if "runner" not in stream_runner:
+            from google.adk.runners import Runner
+            from google.adk.sessions import (
+                DatabaseSessionService,
+                InMemorySessionService,
+            )
+
+            from .agent import root_agent
+
+            uri = os.getenv(SESSION_SERVICE_URI_ENV)
+            stream_runner["runner"] = Runner(
+                app_name=APP_NAME,
+                agent=root_agent,
+                session_service=(
+                    DatabaseSessionService(db_url=uri)
+                    if uri
+                    else InMemorySessionService()
+                ),
+            )
+        return stream_runner["runner"]
+
+    @app.post("/stream")
+    async def stream(req: StreamRequest) -> StreamingResponse:
+        # 첫 이벤트로 세션 ID를 보내므로 클라이언트는 다음 발화에서 같은 세션을 이어 갈 수 있습니다.
+        runner = get_stream_runner()
+        session = None
+        if req.session_id:
+            session = await runner.session_service.get_session(
+                app_name=APP_NAME, user_id=req.user_id, session_id=req.session_id
+            )
+        if session is None:
+            session = await runner.session_service.create_session(
+                app_name=APP_NAME, user_id=req.user_id, session_id=req.session_id
+            )
+
+        async def events():
+            yield format_sse({"type": "session", "session_id": session.id})
+            try:
+                async for stream_event in stream_turn(
+                    runner, req.user_id, session.id, req.message
+                ):
+                    yield format_sse(stream_event)
+            except Exception as e:
+                logger.exception(f"스트리밍 실행 실패: {e}")
+                yield format_sse({"type": "error", "message": str(e)})
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    return app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=SERVE_WORKERS, help="워커 프로세스 수"
+    )
+    parser.add_argument("--session-service-uri", help="공유 ADK 세션 저장소 URI")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument(
+        "--prewarm",
+        action="append",
+        default=[],
+        help="캐시 예열용 빈도 목록 파일 (여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "--prewarm-sessions",
+        action="store_true",
+        help="--session-service-uri의 세션 검색 기록으로 캐시 예열",
+    )
+    add_prewarm_arguments(parser, prefix="prewarm-")
+    return parser
+
+
+def prewarm_shared_cache(args: argparse.Namespace) -> None:
+    """워커 시작 전에 공유 캐시를 예열합니다. 실패해도 서빙은 계속합니다."""
+    sessions_uri = args.session_service_uri if args.prewarm_sessions else None
+    if not args.prewarm and not sessions_uri:
+        if args.prewarm_sessions:
+            logger.warning("--prewarm-sessions에는 --session-service-uri가 필요합니다.")
+        return
+    try:
+        entries = collect_entries(args.prewarm, sessions_uri, top=args.prewarm_top)
+        run_prewarm(
+            entries,
+            args.prewarm_seconds,
+            args.prewarm_max_calls,
+            args.prewarm_concurrency,
+        )
+    except Exception as e:
+        logger.warning(f"캐시 예열 실패: {e}")
+
+
+def main() -> None:
+    import uvicorn
+
+    args = build_parser().parse_args()
+    logging.basicConfig(level=args.log_level.upper())
+
+    if args.session_service_uri:
+        os.environ[SESSION_SERVICE_URI_ENV] = args.session_service_uri
+    elif args.workers > 1:
+        logger.warning(
+            "세션이 워커별 메모리에 저장됩니다. 여러 워커가 세션을 공유하려면 "
+            "--session-service-uri를 지정하세요."
+        )
+    # 워커마다 별도 메트릭 포트를 열면 충돌하므로, 서빙 모드에서는 /metrics 경로를 사용합니다.
+    os.environ.pop("METRICS_PORT", None)
+
+    # 워커는 spawn으로 시작되어 환경변수로 공유 상태 매니저 주소를 전달받습니다.
+    manager = start_shared_state()
+    try:
+        prewarm_shared_cache(args)
+        uvicorn.run(
+            "google_maps_agents.serve:create_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level=args.log_level,
+        )
+    finally:
+        manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+캐시와 속도 제한 상태를 보관하는 상태 저장소를 정의하는 파일입니다.
+
+단일 프로세스에서는 프로세스 내부 StateStore를 사용하고, 멀티 프로세스 서빙 모드(serve.py)에서는
+부모 프로세스가 시작한 매니저 서버의 StateStore를 모든 워커가 프록시로 공유합니다.
+워커는 환경변수(SHARED_STATE_ADDRESS, SHARED_STATE_AUTHKEY)로 매니저 주소를 전달받습니다.
+프록시 호출은 IPC 왕복 동안 블로킹되므로 비동기 코드에서는 call_state_store()로 호출합니다.
+
+캐시 항목의 신선도(TTL) 판단은 호출 측이 저장 시각(stored_at)을 보고 결정하며, 저장소는
+보존 기간(retain_seconds)이 지난 항목과 최대 항목 수를 넘는 항목만 제거합니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.managers import BaseManager
+from typing import Any, Dict, Optional, Tuple, cast
+
+from .config import CACHE_MAX_ENTRIES
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+SHARED_STATE_ADDRESS_ENV = "SHARED_STATE_ADDRESS"
+SHARED_STATE_AUTHKEY_ENV = "SHARED_STATE_AUTHKEY"
+
+# (저장 시각, 값)
+CacheEntry = Tuple[float, Any]
+
+
+class StateStore:
+    """
+    네임스페이스별 LRU 캐시와 토큰 버킷을 보관하는 저장소입니다.
+
+    모든 연산은 한 번의 호출(멀티 프로세스 모드에서는 한 번의 IPC 왕복)로 원자적으로 수행됩니다.
+
+    Attributes:
+        max_entries (int): 네임스페이스별 최대 캐시 항목 수
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # 네임스페이스 -> 키 -> (만료 시각, 저장 시각, 값)
+        self._caches: Dict[str, "OrderedDict[str, Tuple[float, float, Any]]"] = {}
+        # 버킷 이름 -> (토큰 수, 마지막 갱신 시각)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def cache_get(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        """보존 기간이 지나지 않은 항목의 (저장 시각, 값)을 반환합니다. 없으면 None입니다."""
+        now = time.time()
+        with self._lock:
+            cache = self._caches.get(namespace)
+            entry = cache.get(key) if cache is not None else None
+            if cache is None or entry is None:
+                return None
+            if entry[0] <= now:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry[1], entry[2]
+
+    def cache_set(
+        self, namespace: str, key: str, value: Any, retain_seconds: float
+    ) -> None:
+        """값을 저장하고 retain_seconds 동안 보존합니다."""
+        now = time.time()
+        with self._lock:
+            cache = self._caches.setdefault(namespace, OrderedDict())
+            cache[key] = (now + retain_seconds, now, value)
+            cache.move_to_end(key)
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+
+    def cache_delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            cache = self._caches.get(namespace)
+            if cache:
+                cache.pop(key, None)
+
+    def cache_size(self, namespace: str) -> int:
+        with self._lock:
+            return len(self._caches.get(namespace) or ())
+
+    def take_token(self, name: str, rate: float, burst: float) -> float:
+        """
+        토큰 버킷에서 토큰 하나를 예약합니다.
+
+        토큰이 부족하면 음수 잔량으로 예약하고, 호출 측이 기다려야 할 시간(초)을 반환합니다.
+        예약 방식이므로 동시에 대기하는 호출들이 같은 토큰을 두고 경쟁하지 않습니다.
+
+        Returns:
+            float: 대기 시간 (초). 즉시 사용 가능하면 0.0
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(name, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            self._buckets[name] = (tokens, now)
+        return -tokens / rate if tokens < 0 else 0.0
+
+
+# --- 매니저 서버 (멀티 프로세스 공유) ---
+_server_store: Optional[StateStore] = None
+
+
+def _get_server_store() -> StateStore:
+    """매니저 서버 프로세스 안에서 공유 StateStore를 반환합니다."""
+    global _server_store
+    if _server_store is None:
+        _server_store = StateStore()
+    return _server_store
+
+
+class StateManager(BaseManager):
+    """공유 StateStore를 제공하는 multiprocessing 매니저입니다."""
+
+
+StateManager.register("StateStore", callable=_get_server_store)
+
+
+def _format_address(address: Any) -> str:
+    if isinstance(address, tuple):
+        return f"{address[0]}:{address[1]}"
+    return str(address)
+
+
+def _parse_address(value: str) -> Any:
+    host, sep, port = value.rpartition(":")
+    if sep and port.isdigit() and not value.startswith("/"):
+        return host, int(port)
+    return value
+
+
+def start_shared_state() -> StateManager:
+    """
+    공유 상태 매니저 서버를 시작하고, 이후 생성되는 워커 프로세스가 접속할 수 있도록
+    주소와 인증 키를 환경변수에 기록합니다.
+
+    Returns:
+        StateManager: 실행 중인 매니저 (종료 시 shutdown() 호출)
+    """
+    authkey = os.urandom(16)
+    manager = StateManager(authkey=authkey)
+    manager.start()
+    os.environ[SHARED_STATE_ADDRESS_ENV] = _format_address(manager.address)
+    os.environ[SHARED_STATE_AUTHKEY_ENV] = authkey.hex()
+    logger.info(f"공유 상태 매니저 시작: {manager.address}")
+    return manager
+
+
+_store: Optional[StateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """
+    현재 프로세스에서 사용할 상태 저장소를 반환합니다.
+
+    SHARED_STATE_ADDRESS가 설정되어 있으면 공유 매니저의 StateStore 프록시를,
+    그렇지 않으면 프로세스 내부 StateStore를 반환합니다.
+    """
+    global _store
+    store = _store
+    if store is not None:
+        return store
+    with _store_lock:
+        if _store is None:
+            address = os.getenv(SHARED_STATE_ADDRESS_ENV)
+            if address:
+                manager = StateManager(
+                    address=_parse_address(address),
+                    authkey=bytes.fromhex(os.environ[SHARED_STATE_AUTHKEY_ENV]),
+                )
+                manager.connect()
+                # 등록된 타입의 프록시는 StateStore와 같은 메서드를 제공합니다.
+                _store = cast(StateStore, getattr(manager, "StateStore")())
+                logger.info(f"공유 상태 저장소 연결: {address} (pid={os.getpid()})")
+            else:
+                _store = StateStore()
+        return _store
+
+
+def is_shared_state() -> bool:
+    """현재 프로세스가 공유 매니저의 StateStore(프록시)를 사용하면 True입니다."""
+    return bool(os.getenv(SHARED_STATE_ADDRESS_ENV))
+
+
+async def call_state_store(method: str, *args: Any) -> Any:
+    """
+    상태 저장소의 메서드를 비동기 코드에서 호출합니다.
+
+    프로세스 내부 StateStore는 바로 호출하고, 공유 매니저 프록시 호출(연결 포함)은 이벤트 루프가
+    IPC 왕복 동안 멈추지 않도록 스레드에서 실행합니다. 프록시는 스레드별로 연결을 따로 엽니다.
+
+    Example:
+        >>> entry = await call_state_store("cache_get", "places", key)
+    """
+    if not is_shared_state():
+        return getattr(get_state_store(), method)(*args)
+    return await asyncio.to_thread(lambda: getattr(get_state_store(), method)(*args))
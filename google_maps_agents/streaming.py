@@ -0,0 +1,116 @@
+"""
+장소 검색 결과를 클라이언트에 점진적으로 전달하는 스트리밍 모드를 정의하는 파일입니다.
+
+text_search_tool이 반환되는 즉시 간략 장소 카드를 담은 "results_available" 이벤트를 보내고,
+이어서 places_agent가 생성하는 설명 텍스트를 조각 단위로 전달합니다.
+UI는 LLM 응답을 기다리지 않고 지도 핀을 먼저 렌더링할 수 있습니다.
+"""
+
+import json
+import logging
+from typing import Any, AsyncGenerator, Dict, FrozenSet
+
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.genai import types
+
+from .tools.places import PLACE_CARDS_STATE_KEY
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 사용자에게 텍스트를 전달하는 에이전트 (선택자 에이전트의 출력은 내부 상태로만 사용됩니다)
+NARRATIVE_AGENTS: FrozenSet[str] = frozenset(
+    {"coordinator_agent", "places_agent", "geocode_agent"}
+)
+
+
+def _event_text(event: Event) -> str:
+    """이벤트에 포함된 텍스트 파트를 이어 붙여 반환합니다."""
+    if not event.content or not event.content.parts:
+        return ""
+    return "".join(part.text or "" for part in event.content.parts)
+
+
+def to_stream_events(event: Event) -> list[Dict[str, Any]]:
+    """
+    ADK 이벤트를 클라이언트용 스트리밍 이벤트로 변환합니다.
+
+    Args:
+        event (Event): Runner가 생성한 ADK 이벤트
+
+    Returns:
+        list[Dict[str, Any]]: 아래 형태의 이벤트 목록 (해당 없으면 빈 목록)
+            {"type": "results_available", "author", "query", "places": [장소 카드들]}
+            {"type": "text_delta", "author", "text"}  # 부분 텍스트
+            {"type": "text_done", "author", "text"}   # 전체 텍스트
+    """
+    stream_events: list[Dict[str, Any]] = []
+
+    cards = event.actions.state_delta.get(PLACE_CARDS_STATE_KEY)
+    if isinstance(cards, dict):
+        stream_events.append(
+            {
+                "type": "results_available",
+                "author": event.author,
+                "query": cards.get("query"),
+                "places": cards.get("places", []),
+            }
+        )
+
+    if event.author in NARRATIVE_AGENTS:
+        text = _event_text(event)
+        if text and event.partial:
+            stream_events.append(
+                {"type": "text_delta", "author": event.author, "text": text}
+            )
+        elif text and event.is_final_response():
+            stream_events.append(
+                {"type": "text_done", "author": event.author, "text": text}
+            )
+
+    return stream_events
+
+
+async def stream_turn(
+    runner: Runner, user_id: str, session_id: str, message: str
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    사용자 발화 하나를 SSE 스트리밍 모드로 실행하며 클라이언트용 이벤트를 생성합니다.
+
+    Args:
+        runner (Runner): root_agent를 감싼 ADK Runner
+        user_id (str): 사용자 ID
+        session_id (str): 세션 ID
+        message (str): 사용자 발화
+
+    Yields:
+        Dict[str, Any]: to_stream_events()가 반환하는 형태의 이벤트
+
+    Example:
+        >>> async for item in stream_turn(runner, "user", session.id, "강남역 카페"):
+        ...     if item["type"] == "results_available":
+        ...         render_pins(item["places"])
+        ...     else:
+        ...         append_text(item["text"])
+    """
+    new_message = types.Content(role="user", parts=[types.Part(text=message)])
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+    async for event in runner.run_async(
+        user_id=user_id,
+        session_id=session_id,
+        new_message=new_message,
+        run_config=run_config,
+    ):
+        for stream_event in to_stream_events(event):
+            if stream_event["type"] == "results_available":
+                logger.info(f"장소 카드 전송: {len(stream_event['places'])}개")
+            yield stream_event
+
+
+def format_sse(stream_event: Dict[str, Any]) -> str:
+    """스트리밍 이벤트를 Server-Sent Events 메시지 문자열로 변환합니다."""
+    data = json.dumps(stream_event, ensure_ascii=False)
+    return f"event: {stream_event['type']}\ndata: {data}\n\n"
@@ -2,9 +2,16 @@
 Places 에이전트 모듈
 """
 
-from .agent import (fields_selector_agent, geocode_agent,
-                    language_selector_agent, places_agent,
-                    places_sequential_agent, types_selector_agent)
+from typing import Any
+
+from .agent import (
+    fields_selector_agent,
+    get_geocode_agent,
+    language_selector_agent,
+    places_agent,
+    places_sequential_agent,
+    types_selector_agent,
+)
 
 __all__ = [
     "places_sequential_agent",
@@ -12,5 +19,12 @@ __all__ = [
     "fields_selector_agent",
     "types_selector_agent",
     "language_selector_agent",
-    "geocode_agent",
+    "get_geocode_agent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # geocode_agent는 처음 접근할 때 생성합니다 (get_geocode_agent 참고).
+    if name == "geocode_agent":
+        return get_geocode_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
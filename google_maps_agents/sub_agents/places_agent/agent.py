@@ -1,18 +1,51 @@
+from typing import Optional
+
 from google.adk.agents import LlmAgent, SequentialAgent
 from google.adk.models.google_llm import Gemini
 
-from ...config import (FIELDS_SELECTOR_MODEL_NAME, GEOCODE_CONTENT_CONFIG,
-                       GEOCODE_MODEL_NAME, LANGUAGE_SELECTOR_MODEL_NAME,
-                       PLACES_CONTENT_CONFIG, PLACES_MODEL_NAME,
-                       RATING_PRICING_SELECTOR_MODEL_NAME,
-                       TYPES_SELECTOR_MODEL_NAME)
-from ...prompts import (FIELDS_SELECTOR_INSTRUCTION, GEOCODE_INSTRUCTION,
-                        GLOBAL_INSTRUCTION, LANGUAGE_SELECTOR_INSTRUCTION,
-                        PLACES_INSTRUCTION,
-                        RATING_PRICING_SELECTOR_INSTRUCTION,
-                        TYPES_SELECTOR_INSTRUCTION)
-from ...tools.geocode import geocode_tool, reverse_geocode_tool
-from ...tools.places import text_search_tool
+from ...config import (
+    FIELDS_SELECTOR_MODEL_NAME,
+    GEOCODE_CONTENT_CONFIG,
+    GEOCODE_MODEL_NAME,
+    LANGUAGE_SELECTOR_MODEL_NAME,
+    PLACES_CONTENT_CONFIG,
+    PLACES_MODEL_NAME,
+    RATING_PRICING_SELECTOR_MODEL_NAME,
+    TYPES_SELECTOR_MODEL_NAME,
+)
+from ...models import (
+    FieldsSelection,
+    LanguageSelection,
+    TypeSelection,
+    get_model,
+    is_valid_fields_output,
+    is_valid_language_output,
+    is_valid_rating_pricing_output,
+    is_valid_types_output,
+    selector_memo_callbacks,
+    text_validator,
+    tool_call_validator,
+)
+from ...prompts import (
+    FIELDS_SELECTOR_INSTRUCTION,
+    GEOCODE_INSTRUCTION,
+    GLOBAL_INSTRUCTION,
+    LANGUAGE_SELECTOR_INSTRUCTION,
+    PLACES_INSTRUCTION,
+    RATING_PRICING_SELECTOR_INSTRUCTION,
+    TYPES_SELECTOR_INSTRUCTION,
+)
+from ...telemetry.tracing import (
+    trace_agent_end,
+    trace_agent_start,
+    trace_model_end,
+    trace_model_start,
+)
+from ...tools.places import (
+    discard_speculative_search,
+    start_speculative_search,
+    text_search_tool,
+)
 
 
 class PlacesAgent(LlmAgent):
@@ -33,51 +66,107 @@ class PlacesAgent(LlmAgent):
     """
 
 
+_fields_memo = selector_memo_callbacks(is_valid_fields_output)
 fields_selector_agent: PlacesAgent = PlacesAgent(
     name="fields_selector_agent",
-    model=Gemini(model=FIELDS_SELECTOR_MODEL_NAME),
+    model=get_model(
+        "fields_selector_agent",
+        FIELDS_SELECTOR_MODEL_NAME,
+        text_validator(is_valid_fields_output),
+    ),
     description="textQuery를 분석하고, 최적의 장소 필드를 선택하는 에이전트입니다.",
     instruction=FIELDS_SELECTOR_INSTRUCTION,
     generate_content_config=PLACES_CONTENT_CONFIG,
+    output_schema=FieldsSelection,
+    # output_schema를 사용하는 에이전트는 다른 에이전트로 전환할 수 없습니다.
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
     output_key="fields",
+    before_agent_callback=trace_agent_start,
+    after_agent_callback=trace_agent_end,
+    before_model_callback=[_fields_memo.lookup, trace_model_start],
+    after_model_callback=[trace_model_end, _fields_memo.store],
 )
 
+_types_memo = selector_memo_callbacks(is_valid_types_output)
 types_selector_agent: PlacesAgent = PlacesAgent(
     name="types_selector_agent",
-    model=Gemini(model=TYPES_SELECTOR_MODEL_NAME),
+    model=get_model(
+        "types_selector_agent",
+        TYPES_SELECTOR_MODEL_NAME,
+        text_validator(is_valid_types_output),
+    ),
     description="textSearch 요청을 분석하고, 최적의 선택 파라미터를 선택하는 에이전트입니다.",
     instruction=TYPES_SELECTOR_INSTRUCTION,
     generate_content_config=PLACES_CONTENT_CONFIG,
+    output_schema=TypeSelection,
+    # output_schema를 사용하는 에이전트는 다른 에이전트로 전환할 수 없습니다.
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
     output_key="types",
+    before_agent_callback=trace_agent_start,
+    after_agent_callback=trace_agent_end,
+    before_model_callback=[_types_memo.lookup, trace_model_start],
+    after_model_callback=[trace_model_end, _types_memo.store],
 )
 
+_language_memo = selector_memo_callbacks(is_valid_language_output)
 language_selector_agent: PlacesAgent = PlacesAgent(
     name="language_selector_agent",
-    model=Gemini(model=LANGUAGE_SELECTOR_MODEL_NAME),
+    model=get_model(
+        "language_selector_agent",
+        LANGUAGE_SELECTOR_MODEL_NAME,
+        text_validator(is_valid_language_output),
+    ),
     description="textSearch 요청을 분석하고, 최적의 언어를 선택하는 에이전트입니다.",
     instruction=LANGUAGE_SELECTOR_INSTRUCTION,
     generate_content_config=PLACES_CONTENT_CONFIG,
+    output_schema=LanguageSelection,
+    # output_schema를 사용하는 에이전트는 다른 에이전트로 전환할 수 없습니다.
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
     output_key="language",
+    before_agent_callback=trace_agent_start,
+    after_agent_callback=trace_agent_end,
+    before_model_callback=[_language_memo.lookup, trace_model_start],
+    after_model_callback=[trace_model_end, _language_memo.store],
 )
 
+_rating_pricing_memo = selector_memo_callbacks(is_valid_rating_pricing_output)
 rating_pricing_selector_agent: PlacesAgent = PlacesAgent(
     name="rating_pricing_selector_agent",
-    model=Gemini(model=RATING_PRICING_SELECTOR_MODEL_NAME),
+    model=get_model(
+        "rating_pricing_selector_agent",
+        RATING_PRICING_SELECTOR_MODEL_NAME,
+        text_validator(is_valid_rating_pricing_output),
+    ),
     description="textSearch 요청을 분석하고, 최적의 평점 및 가격대를 선택하는 에이전트입니다.",
     instruction=RATING_PRICING_SELECTOR_INSTRUCTION,
     generate_content_config=PLACES_CONTENT_CONFIG,
     output_key="rating_pricing",
+    before_agent_callback=trace_agent_start,
+    after_agent_callback=trace_agent_end,
+    before_model_callback=[_rating_pricing_memo.lookup, trace_model_start],
+    after_model_callback=[trace_model_end, _rating_pricing_memo.store],
 )
 
 places_agent: PlacesAgent = PlacesAgent(
     name="places_agent",
-    model=Gemini(model=PLACES_MODEL_NAME),
+    model=get_model(
+        "places_agent",
+        PLACES_MODEL_NAME,
+        tool_call_validator(frozenset({text_search_tool.__name__})),
+    ),
     description="장소 검색 요청을 처리하는 에이전트입니다.",
     # prompts.py 파일에서 가져온 변수를 사용합니다.
     instruction=PLACES_INSTRUCTION,
     global_instruction=GLOBAL_INSTRUCTION,
     generate_content_config=PLACES_CONTENT_CONFIG,
     tools=[text_search_tool],
+    before_agent_callback=trace_agent_start,
+    after_agent_callback=trace_agent_end,
+    before_model_callback=trace_model_start,
+    after_model_callback=trace_model_end,
 )
 
 places_sequential_agent = SequentialAgent(
@@ -89,6 +178,8 @@ places_sequential_agent = SequentialAgent(
     ],
     name="places_sequential_agent",
     description="LLM을 사용하여 TextSearch 요청을 처리하기 위해 절차를 가진 에이전트입니다.",
+    before_agent_callback=[start_speculative_search, trace_agent_start],
+    after_agent_callback=[discard_speculative_search, trace_agent_end],
 )
 
 
@@ -108,13 +199,32 @@ class GeocodeAgent(LlmAgent):
     """
 
 
-geocode_agent: GeocodeAgent = GeocodeAgent(
-    name="geocode_agent",
-    model=Gemini(model=GEOCODE_MODEL_NAME),
-    description="Geocoding 요청을 처리하는 에이전트입니다.",
-    # prompts.py 파일에서 가져온 변수를 사용합니다.
-    instruction=GEOCODE_INSTRUCTION,
-    global_instruction=GLOBAL_INSTRUCTION,
-    generate_content_config=GEOCODE_CONTENT_CONFIG,
-    tools=[geocode_tool, reverse_geocode_tool],
-)
+_geocode_agent: Optional[GeocodeAgent] = None
+
+
+def get_geocode_agent() -> GeocodeAgent:
+    """
+    geocode_agent를 처음 요청할 때 생성하여 반환합니다.
+
+    지오코딩 요청은 장소 검색보다 드물므로, places 파이프라인만 사용하는 프로세스
+    (벤치마크, 캐시 예열 등)는 이 에이전트와 모델 인스턴스를 만들지 않습니다.
+    """
+    global _geocode_agent
+    if _geocode_agent is None:
+        from ...tools.geocode import geocode_tool, reverse_geocode_tool
+
+        _geocode_agent = GeocodeAgent(
+            name="geocode_agent",
+            model=Gemini(model=GEOCODE_MODEL_NAME),
+            description="Geocoding 요청을 처리하는 에이전트입니다.",
+            # prompts.py 파일에서 가져온 변수를 사용합니다.
+            instruction=GEOCODE_INSTRUCTION,
+            global_instruction=GLOBAL_INSTRUCTION,
+            generate_content_config=GEOCODE_CONTENT_CONFIG,
+            tools=[geocode_tool, reverse_geocode_tool],
+            before_agent_callback=trace_agent_start,
+            after_agent_callback=trace_agent_end,
+            before_model_callback=trace_model_start,
+            after_model_callback=trace_model_end,
+        )
+    return _geocode_agent
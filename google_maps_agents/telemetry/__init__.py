@@ -0,0 +1,39 @@
+"""
+트레이싱, 메트릭 등 관측(observability) 관련 모듈
+"""
+
+from .cost import record_upstream_call
+from .metrics import (
+    configure_metrics,
+    get_metrics_registry,
+    render_metrics,
+    start_metrics_server,
+    track_upstream,
+)
+from .tracing import (
+    configure_tracing,
+    get_latency_histograms,
+    start_span,
+    trace_agent_end,
+    trace_agent_start,
+    trace_model_end,
+    trace_model_start,
+    traced_tool,
+)
+
+__all__ = [
+    "configure_metrics",
+    "configure_tracing",
+    "get_latency_histograms",
+    "get_metrics_registry",
+    "record_upstream_call",
+    "render_metrics",
+    "start_metrics_server",
+    "start_span",
+    "trace_agent_end",
+    "trace_agent_start",
+    "trace_model_end",
+    "trace_model_start",
+    "traced_tool",
+    "track_upstream",
+]
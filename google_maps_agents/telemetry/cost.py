@@ -0,0 +1,326 @@
+"""
+사용자 턴(invocation) 단위 비용 집계를 정의하는 파일입니다.
+
+턴마다 에이전트/모델별 LLM 호출 수와 프롬프트/완성 토큰 수, 업스트림 API별 청구 SKU와 호출 수를 모읍니다.
+턴을 시작한 에이전트가 끝나면 집계 결과를 세션 상태(cost_history에 최근 COST_HISTORY_MAX_TURNS개 턴의
+기록, cost_totals에 세션 누적)에 기록하고, 턴 단위 분포를 메트릭으로 보고합니다. 턴별 기록은 로그에도 남습니다.
+
+- LLM 사용량: trace_model_end가 invocation_id로 턴을 찾아 기록합니다 (선택자 메모로 생략된 호출은 0).
+- 업스트림 호출: 서비스가 실제 API 요청 직전에 record_upstream_call()을 호출합니다. 캐시 적중/합쳐진
+  호출은 청구되지 않으므로 기록되지 않으며, 백그라운드 캐시 갱신은 어느 턴에도 속하지 않습니다.
+
+세션 기록에서 비용이 큰 발화 패턴을 찾으려면:
+    python -m google_maps_agents.telemetry.cost --sessions sqlite:///./sessions.db --top 20
+"""
+
+import argparse
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..config import COST_HISTORY_MAX_TURNS
+from .metrics import registry
+
+if TYPE_CHECKING:
+    from google.adk.agents.callback_context import CallbackContext
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+COST_HISTORY_KEY = "cost_history"
+COST_TOTALS_KEY = "cost_totals"
+# 끝나지 않은 턴(오류로 after 콜백이 호출되지 않은 경우 포함)을 보관하는 최대 수
+MAX_OPEN_TURNS = 1024
+
+BILLABLE_REQUESTS = registry.counter(
+    "upstream_billable_requests_total",
+    "Upstream Google API requests sent (billable) by API and SKU.",
+    ["api", "sku"],
+)
+TURN_LLM_TOKENS = registry.histogram(
+    "turn_llm_tokens",
+    "LLM tokens per user turn by kind (prompt/completion).",
+    ["kind"],
+    buckets=(250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000),
+)
+TURN_LLM_CALLS = registry.histogram(
+    "turn_llm_calls",
+    "LLM calls per user turn.",
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15),
+)
+TURN_BILLABLE_REQUESTS = registry.histogram(
+    "turn_billable_requests",
+    "Billable upstream requests per user turn by API.",
+    ["api"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50),
+)
+
+
+class TurnCost:
+    """
+    턴 하나의 비용 집계입니다.
+
+    Attributes:
+        invocation_id (str): ADK invocation ID
+        owner (str): 턴을 시작한 에이전트 이름 (이 에이전트가 끝나면 기록합니다)
+        llm (Dict[Tuple[str, str], List[int]]): (에이전트, 모델) -> [호출 수, 프롬프트 토큰, 완성 토큰]
+        upstream (Dict[Tuple[str, str], int]): (API, SKU) -> 호출 수
+    """
+
+    __slots__ = ("invocation_id", "owner", "started", "llm", "upstream")
+
+    def __init__(self, invocation_id: str, owner: str):
+        self.invocation_id = invocation_id
+        self.owner = owner
+        self.started = time.perf_counter()
+        self.llm: Dict[Tuple[str, str], List[int]] = {}
+        self.upstream: Dict[Tuple[str, str], int] = {}
+
+    def add_llm(
+        self, agent: str, model: str, prompt_tokens: int, completion_tokens: int
+    ) -> None:
+        usage = self.llm.setdefault((agent, model), [0, 0, 0])
+        usage[0] += 1
+        usage[1] += prompt_tokens
+        usage[2] += completion_tokens
+
+    def add_upstream(self, api: str, sku: str) -> None:
+        self.upstream[(api, sku)] = self.upstream.get((api, sku), 0) + 1
+
+    def totals(self) -> Dict[str, int]:
+        return {
+            "llm_calls": sum(usage[0] for usage in self.llm.values()),
+            "prompt_tokens": sum(usage[1] for usage in self.llm.values()),
+            "completion_tokens": sum(usage[2] for usage in self.llm.values()),
+            "upstream_calls": sum(self.upstream.values()),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "invocation_id": self.invocation_id,
+            "llm": [
+                {
+                    "agent": agent,
+                    "model": model,
+                    "calls": calls,
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                }
+                for (agent, model), (
+                    calls,
+                    prompt_tokens,
+                    completion_tokens,
+                ) in self.llm.items()
+            ],
+            "upstream": [
+                {"api": api, "sku": sku, "calls": calls}
+                for (api, sku), calls in self.upstream.items()
+            ],
+            "totals": self.totals(),
+            "duration_seconds": round(time.perf_counter() - self.started, 3),
+        }
+
+
+_turns: "OrderedDict[str, TurnCost]" = OrderedDict()
+# 현재 턴. 업스트림 호출은 invocation_id를 모르므로 컨텍스트 변수로 찾습니다.
+# 턴 안에서 시작된 작업(투기적 검색 등)은 생성 시점의 컨텍스트를 복사하므로 같은 턴으로 집계됩니다.
+_current_turn: contextvars.ContextVar[Optional[TurnCost]] = contextvars.ContextVar(
+    "current_turn_cost", default=None
+)
+
+
+def begin_turn(callback_context: "CallbackContext") -> None:
+    """에이전트 시작 시 호출됩니다. 턴의 첫 에이전트이면 집계를 시작합니다."""
+    invocation_id = callback_context.invocation_id
+    turn = _turns.get(invocation_id)
+    if turn is None:
+        turn = _turns[invocation_id] = TurnCost(
+            invocation_id, callback_context.agent_name
+        )
+        while len(_turns) > MAX_OPEN_TURNS:
+            _turns.popitem(last=False)
+    _current_turn.set(turn)
+
+
+def record_llm_usage(
+    invocation_id: str,
+    agent: str,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+) -> None:
+    """LLM 호출 한 번의 토큰 사용량을 턴에 기록합니다."""
+    turn = _turns.get(invocation_id)
+    if turn is not None:
+        turn.add_llm(agent, model, prompt_tokens, completion_tokens)
+
+
+def record_upstream_call(api: str, sku: str) -> None:
+    """
+    청구되는 업스트림 API 요청 한 번을 기록합니다. 서비스가 요청을 보내기 직전에 호출합니다.
+
+    Args:
+        api (str): API 이름 (예: "places", "geocode")
+        sku (str): 청구 SKU (예: "Text Search Pro", "Geocoding")
+    """
+    BILLABLE_REQUESTS.inc(api=api, sku=sku)
+    turn = _current_turn.get()
+    if turn is not None:
+        turn.add_upstream(api, sku)
+
+
+def _utterance(callback_context: "CallbackContext") -> Optional[str]:
+    content = callback_context.user_content
+    if content is None:
+        return None
+    return "".join(part.text or "" for part in content.parts or []) or None
+
+
+def _merge_totals(previous: Optional[Dict[str, Any]], turn: TurnCost) -> Dict[str, Any]:
+    """세션 누적 비용에 턴 비용을 더한 새 딕셔너리를 반환합니다."""
+    totals = {key: int((previous or {}).get(key, 0)) for key in turn.totals()}
+    for key, value in turn.totals().items():
+        totals[key] += value
+    upstream = dict((previous or {}).get("upstream_by_sku", {}))
+    for (api, sku), calls in turn.upstream.items():
+        upstream[f"{api}:{sku}"] = upstream.get(f"{api}:{sku}", 0) + calls
+    turns = int((previous or {}).get("turns", 0)) + 1
+    return {**totals, "turns": turns, "upstream_by_sku": upstream}
+
+
+def end_turn(callback_context: "CallbackContext") -> None:
+    """
+    에이전트 종료 시 호출됩니다. 턴을 시작한 에이전트이면 집계를 세션 상태와 메트릭에 기록합니다.
+    """
+    turn = _turns.get(callback_context.invocation_id)
+    if turn is None or turn.owner != callback_context.agent_name:
+        return
+    del _turns[callback_context.invocation_id]
+    if _current_turn.get() is turn:
+        _current_turn.set(None)
+
+    record = {
+        **turn.to_dict(),
+        "utterance": _utterance(callback_context),
+        "timestamp": datetime.now().isoformat(),
+    }
+    state = callback_context.state
+    # 상태 변경이 이벤트의 state_delta로 기록되도록 새 리스트/딕셔너리를 할당합니다.
+    # 긴 세션에서 상태가 계속 커지지 않도록 최근 턴만 보관합니다.
+    if COST_HISTORY_MAX_TURNS > 0:
+        history = [*(state.get(COST_HISTORY_KEY) or []), record]
+        state[COST_HISTORY_KEY] = history[-COST_HISTORY_MAX_TURNS:]
+    state[COST_TOTALS_KEY] = _merge_totals(state.get(COST_TOTALS_KEY), turn)
+
+    totals = record["totals"]
+    TURN_LLM_TOKENS.observe(totals["prompt_tokens"], kind="prompt")
+    TURN_LLM_TOKENS.observe(totals["completion_tokens"], kind="completion")
+    TURN_LLM_CALLS.observe(totals["llm_calls"])
+    by_api: Dict[str, int] = {}
+    for (api, _), calls in turn.upstream.items():
+        by_api[api] = by_api.get(api, 0) + calls
+    for api, calls in by_api.items():
+        TURN_BILLABLE_REQUESTS.observe(calls, api=api)
+    logger.info(
+        f"턴 비용: {totals} llm={record['llm']} upstream={record['upstream']} "
+        f"utterance={record['utterance']!r}"
+    )
+
+
+def summarize_cost_history(
+    records: List[Dict[str, Any]], top: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    턴 비용 기록을 정규화된 발화(쿼리 캐시 키)별로 묶어 총 토큰 수가 큰 순으로 반환합니다.
+
+    Returns:
+        List[Dict[str, Any]]: {"pattern", "example", "turns", "prompt_tokens", "completion_tokens",
+            "llm_calls", "upstream": {"api:sku": 호출 수}} 목록
+    """
+    from ..canonical import canonicalize_query
+
+    patterns: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        utterance = record.get("utterance") or ""
+        pattern = canonicalize_query(utterance) or utterance
+        summary = patterns.setdefault(
+            pattern,
+            {
+                "pattern": pattern,
+                "example": utterance,
+                "turns": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "llm_calls": 0,
+                "upstream": {},
+            },
+        )
+        totals = record.get("totals") or {}
+        summary["turns"] += 1
+        for key in ("prompt_tokens", "completion_tokens", "llm_calls"):
+            summary[key] += int(totals.get(key, 0))
+        for call in record.get("upstream") or []:
+            sku = f"{call['api']}:{call['sku']}"
+            summary["upstream"][sku] = summary["upstream"].get(sku, 0) + int(
+                call["calls"]
+            )
+    ordered = sorted(
+        patterns.values(), key=lambda s: -(s["prompt_tokens"] + s["completion_tokens"])
+    )
+    return ordered[:top]
+
+
+def load_cost_history(
+    session_service_uri: str, app_name: str = "google_maps_agents"
+) -> List[Dict[str, Any]]:
+    """
+    ADK 데이터베이스 세션 저장소의 모든 세션에서 턴 비용 기록을 읽습니다.
+
+    세션마다 최근 COST_HISTORY_MAX_TURNS개 턴만 보관되므로 긴 세션의 앞쪽 턴은 포함되지 않습니다.
+    """
+    from google.adk.sessions.database_session_service import (
+        DatabaseSessionService,
+        StorageSession,
+    )
+
+    service = DatabaseSessionService(db_url=session_service_uri)
+    records: List[Dict[str, Any]] = []
+    with service.database_session_factory() as session:
+        rows = session.query(StorageSession.state).filter(
+            StorageSession.app_name == app_name
+        )
+        for (state,) in rows:
+            records.extend((state or {}).get(COST_HISTORY_KEY) or [])
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="세션 기록에서 비용이 큰 발화 패턴을 찾습니다."
+    )
+    parser.add_argument(
+        "--sessions", required=True, help="ADK 데이터베이스 세션 저장소 URI"
+    )
+    parser.add_argument("--app-name", default="google_maps_agents")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    records = load_cost_history(args.sessions, args.app_name)
+    print(f"turns={len(records)}")
+    print(f"{'tokens':>8}{'calls':>7}{'turns':>7}  upstream / pattern")
+    for summary in summarize_cost_history(records, args.top):
+        tokens = summary["prompt_tokens"] + summary["completion_tokens"]
+        upstream = ", ".join(
+            f"{sku}={calls}" for sku, calls in sorted(summary["upstream"].items())
+        )
+        print(
+            f"{tokens:>8}{summary['llm_calls']:>7}{summary['turns']:>7}  "
+            f"[{upstream}] {summary['example']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+종료된 span의 지속 시간을 단계(span 이름)별 히스토그램으로 집계하는 로컬 익스포터입니다.
+
+opentelemetry-sdk 임포트 비용이 있으므로 configure_tracing()에서 히스토그램 기록이
+활성화된 경우에만 임포트됩니다.
+"""
+
+import bisect
+import json
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+# 히스토그램 버킷 경계 (밀리초)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+)
+
+
+class LatencyHistogram:
+    """
+    고정 버킷 지연 시간 히스토그램입니다.
+
+    Attributes:
+        buckets (Sequence[float]): 버킷 상한 경계 (밀리초)
+        counts (List[int]): 버킷별 개수 (마지막 원소는 +Inf 버킷)
+        count (int): 전체 관측 수
+        total_ms (float): 관측값 합계 (밀리초)
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "buckets_ms": {
+                **{f"le_{bound:g}": n for bound, n in zip(self.buckets, self.counts)},
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+class LatencyHistogramExporter(SpanExporter):
+    """
+    종료된 span의 지속 시간을 span 이름(단계)별 히스토그램으로 집계하여 JSON 파일로 기록하는 익스포터입니다.
+
+    Attributes:
+        path (str): 히스토그램을 기록할 파일 경로
+        flush_interval (float): 파일 기록 최소 간격 (초)
+    """
+
+    def __init__(self, path: str, flush_interval: float = 5.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with self._lock:
+            for span in spans:
+                if span.start_time is None or span.end_time is None:
+                    continue
+                histogram = self._histograms.setdefault(span.name, LatencyHistogram())
+                histogram.observe((span.end_time - span.start_time) / 1e6)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.write()
+        return SpanExportResult.SUCCESS
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 히스토그램을 딕셔너리로 반환합니다."""
+        with self._lock:
+            return {name: h.to_dict() for name, h in sorted(self._histograms.items())}
+
+    def write(self) -> None:
+        """현재 히스토그램을 파일에 기록합니다."""
+        data = self.snapshot()
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        self._last_flush = time.monotonic()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        self.write()
+        return True
+
+    def shutdown(self) -> None:
+        self.write()
@@ -0,0 +1,353 @@
+"""
+용량 계획을 위한 카운터/게이지/히스토그램 메트릭 레지스트리를 정의하는 파일입니다.
+
+서비스와 도구는 모듈 수준 메트릭 객체에 값을 보고하고, 레지스트리는 Prometheus 텍스트 형식으로
+HTTP 엔드포인트(METRICS_PORT) 또는 파일(METRICS_DUMP_PATH)을 통해 노출됩니다.
+값 갱신은 딕셔너리 조회와 잠금 한 번으로 끝나므로 핫 패스 오버헤드는 무시할 수 있습니다.
+"""
+
+import atexit
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from ..config import METRICS_DUMP_PATH, METRICS_PORT
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 기본 버킷 경계 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    15.0,
+    30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """레이블별 값을 보관하는 메트릭의 공통 기반 클래스입니다."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 노출 형식의 줄 목록을 반환합니다."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터입니다."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def values(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {value:g}"
+            for key, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """증가/감소가 가능한 게이지입니다."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램입니다."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # 레이블 값 -> [버킷별 개수..., +Inf 개수, 합계]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._values.get(key)
+            if data is None:
+                data = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            data[index] += 1
+            data[-1] += value
+
+    def count(self, **labels: str) -> float:
+        data = self._values.get(self._key(labels))
+        return sum(data[:-1]) if data else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(data)) for key, data in self._values.items())
+        lines = self.header()
+        for key, data in items:
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, float("inf")), data[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                labels = _format_labels((*self.labelnames, "le"), (*key, le))
+                lines.append(f"{self.name}_bucket{labels} {cumulative:g}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {data[-1]:g}")
+            lines.append(f"{self.name}_count{labels} {cumulative:g}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """
+    메트릭을 이름으로 등록하고 Prometheus 텍스트 형식으로 출력하는 레지스트리입니다.
+
+    같은 이름으로 다시 등록하면 기존 메트릭 객체를 반환합니다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls: Type[M], name: str, *args: Any) -> M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            if not isinstance(metric, cls):
+                raise TypeError(
+                    f"{name}은(는) 이미 {metric.kind} 메트릭으로 등록되어 있습니다."
+                )
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """등록된 모든 메트릭을 Prometheus 텍스트 노출 형식으로 반환합니다."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in sorted(metrics, key=lambda m: m.name):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """현재 메트릭을 Prometheus 텍스트 형식으로 파일에 기록합니다."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+
+
+registry = MetricsRegistry()
+
+# --- 공용 메트릭 ---
+UPSTREAM_LATENCY = registry.histogram(
+    "upstream_request_duration_seconds",
+    "Latency of upstream Google API calls by API and status.",
+    ["api", "status"],
+)
+UPSTREAM_ERRORS = registry.counter(
+    "upstream_errors_total",
+    "Upstream Google API errors by API and error class.",
+    ["api", "error"],
+)
+LLM_CALLS = registry.counter(
+    "llm_calls_total", "LLM calls by agent and model.", ["agent", "model"]
+)
+LLM_TOKENS = registry.counter(
+    "llm_tokens_total",
+    "LLM tokens by agent, model and kind (prompt/completion).",
+    ["agent", "model", "kind"],
+)
+LLM_LATENCY = registry.histogram(
+    "llm_call_duration_seconds",
+    "LLM call latency by agent and model.",
+    ["agent", "model"],
+)
+TOOL_IN_FLIGHT = registry.gauge(
+    "tool_calls_in_flight", "Concurrent in-flight tool calls.", ["tool"]
+)
+TOOL_CALLS = registry.counter(
+    "tool_calls_total", "Tool calls by tool and status.", ["tool", "status"]
+)
+TOOL_LATENCY = registry.histogram(
+    "tool_call_duration_seconds", "Tool call latency by tool.", ["tool"]
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Cache lookups by cache and result.", ["cache", "result"]
+)
+
+
+@contextmanager
+def track_upstream(api: str) -> Iterator[None]:
+    """
+    업스트림 API 호출의 지연 시간을 기록하고, 예외 발생 시 오류 클래스별 카운터를 증가시킵니다.
+
+    예외는 그대로 다시 발생하므로 호출 측의 기존 오류 처리에 영향을 주지 않습니다.
+
+    Example:
+        >>> with track_upstream("places"):
+        ...     response = await client.search_text(...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        UPSTREAM_ERRORS.inc(api=api, error=type(e).__name__)
+        UPSTREAM_LATENCY.observe(time.perf_counter() - started, api=api, status="error")
+        raise
+    UPSTREAM_LATENCY.observe(time.perf_counter() - started, api=api, status="ok")
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """프로세스 전역 메트릭 레지스트리를 반환합니다."""
+    return registry
+
+
+def render_metrics() -> str:
+    """전역 레지스트리의 메트릭을 Prometheus 텍스트 형식으로 반환합니다."""
+    return registry.render()
+
+
+_metrics_server: Optional[ThreadingHTTPServer] = None
+_dump_path: Optional[str] = None
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    /metrics 경로로 Prometheus 텍스트 형식 메트릭을 제공하는 HTTP 서버를 백그라운드 스레드로 시작합니다.
+
+    Args:
+        port (int): 수신 포트 (0이면 임의 포트)
+        host (str): 수신 주소
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (server_address로 실제 포트 확인)
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 (http.server 규약)
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            payload = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            return
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(
+        f"메트릭 엔드포인트 시작: http://{host}:{server.server_address[1]}/metrics"
+    )
+    return server
+
+
+def configure_metrics(
+    port: Optional[int] = METRICS_PORT, dump_path: Optional[str] = METRICS_DUMP_PATH
+) -> None:
+    """
+    설정에 따라 메트릭 HTTP 엔드포인트를 시작하고, 종료 시 파일 덤프를 등록합니다.
+
+    Args:
+        port (Optional[int]): 메트릭 HTTP 포트. None이면 엔드포인트를 열지 않습니다.
+        dump_path (Optional[str]): 프로세스 종료 시 메트릭을 기록할 파일 경로
+    """
+    global _metrics_server, _dump_path
+    if port is not None and _metrics_server is None:
+        _metrics_server = start_metrics_server(port)
+    if dump_path and _dump_path is None:
+        _dump_path = dump_path
+        atexit.register(registry.dump, dump_path)
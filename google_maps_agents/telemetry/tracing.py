@@ -0,0 +1,303 @@
+"""
+에이전트, 도구, 업스트림 API 호출에 대한 OpenTelemetry 호환 트레이싱을 정의하는 파일입니다.
+
+TracerProvider가 설정되지 않은 경우 OpenTelemetry API의 기본 no-op 구현이 사용되므로
+계측 비용은 무시할 수 있는 수준입니다. TRACING_HISTOGRAM_PATH가 설정되면 로컬
+LatencyHistogramExporter가 단계(span 이름)별 지연 시간 히스토그램을 파일로 기록합니다.
+"""
+
+import contextvars
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from opentelemetry import context as otel_context
+from opentelemetry import trace
+from opentelemetry.trace import Span, Status, StatusCode
+
+from ..config import TRACING_HISTOGRAM_PATH
+from .cost import begin_turn, end_turn, record_llm_usage
+from .metrics import (
+    LLM_CALLS,
+    LLM_LATENCY,
+    LLM_TOKENS,
+    TOOL_CALLS,
+    TOOL_IN_FLIGHT,
+    TOOL_LATENCY,
+)
+
+if TYPE_CHECKING:
+    from .histograms import LatencyHistogramExporter
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("google_maps_agents")
+
+T = TypeVar("T")
+
+# LLM 래퍼(CascadeLlm)가 응답의 custom_metadata에 남기는 값입니다.
+# 응답을 실제로 만든 모델 이름과, 응답 전에 버려진 호출들의 [{"model", "prompt_tokens",
+# "completion_tokens"}] 목록으로, 요청의 모델 대신 이 값으로 호출/토큰을 귀속시킵니다.
+MODEL_METADATA_KEY = "llm_model"
+REJECTED_USAGE_METADATA_KEY = "llm_rejected_usage"
+
+
+@contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    현재 컨텍스트의 하위 span을 시작합니다. 값이 None인 속성은 제외됩니다.
+
+    Example:
+        >>> with start_span("places.search_text", api="places") as span:
+        ...     span.set_attribute("places.count", 3)
+    """
+    with tracer.start_as_current_span(
+        name, attributes={k: v for k, v in attributes.items() if v is not None}
+    ) as span:
+        yield span
+
+
+def traced_tool(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    ADK 비동기 도구 함수를 'tool.<함수 이름>' span으로 감싸고 호출 수/동시 실행 수/지연 시간 메트릭을 기록합니다.
+
+    functools.wraps로 시그니처와 docstring을 유지하므로 ADK의 함수 선언 생성에 영향이 없습니다.
+    """
+    tool_name = func.__name__
+    span_name = f"tool.{tool_name}"
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        status = "exception"
+        TOOL_IN_FLIGHT.inc(tool=tool_name)
+        started = time.perf_counter()
+        try:
+            with start_span(span_name, tool=tool_name) as span:
+                result = await func(*args, **kwargs)
+                status = "ok"
+                if isinstance(result, dict) and "error" in result:
+                    status = "error"
+                    span.set_status(Status(StatusCode.ERROR, str(result["error"])))
+                return result
+        finally:
+            TOOL_IN_FLIGHT.dec(tool=tool_name)
+            TOOL_LATENCY.observe(time.perf_counter() - started, tool=tool_name)
+            TOOL_CALLS.inc(tool=tool_name, status=status)
+
+    return wrapper
+
+
+# --- 에이전트/모델 콜백 ---
+# 에이전트 실행과 LLM 호출은 ADK 콜백 사이에 걸쳐 있으므로 span을 직접 시작/종료합니다.
+class _OpenSpan:
+    """콜백 사이에 걸쳐 열려 있는 span과 메트릭 기록에 필요한 정보입니다."""
+
+    __slots__ = ("span", "model", "started", "token")
+
+    def __init__(
+        self,
+        span: Span,
+        model: Optional[str],
+        token: Optional[contextvars.Token[otel_context.Context]] = None,
+    ):
+        self.span = span
+        self.model = model
+        self.started = time.perf_counter()
+        self.token = token
+
+
+# 열려 있는 span은 턴(invocation)을 실행하는 작업의 컨텍스트에 보관합니다. 값을 바꿀 때마다 새 딕셔너리를
+# 설정하므로 다른 턴과 공유되지 않고, after 콜백 전에 오류로 끝난 턴의 항목은 컨텍스트와 함께 사라집니다.
+_open_spans: contextvars.ContextVar[Optional[Dict[Tuple[str, str, str], _OpenSpan]]] = (
+    contextvars.ContextVar("open_spans", default=None)
+)
+
+
+def _open(
+    kind: str,
+    callback_context: CallbackContext,
+    name: str,
+    model: Optional[str] = None,
+    attach: bool = False,
+    **attributes: Any,
+) -> None:
+    key = (kind, callback_context.invocation_id, callback_context.agent_name)
+    spans = dict(_open_spans.get() or {})
+    previous = spans.pop(key, None)
+    if previous is not None:
+        # 이전 호출이 오류로 종료되어 after 콜백이 호출되지 않은 경우
+        previous.span.set_status(Status(StatusCode.ERROR, "callback not completed"))
+        previous.span.end()
+    if model is not None:
+        attributes["llm.model"] = model
+    span = tracer.start_span(
+        name, attributes={k: v for k, v in attributes.items() if v is not None}
+    )
+    # attach하면 이후 도구/업스트림 span이 이 span의 하위 span이 됩니다.
+    token = otel_context.attach(trace.set_span_in_context(span)) if attach else None
+    spans[key] = _OpenSpan(span, model, token)
+    _open_spans.set(spans)
+
+
+def _close(kind: str, callback_context: CallbackContext) -> Optional[_OpenSpan]:
+    spans = dict(_open_spans.get() or {})
+    opened = spans.pop(
+        (kind, callback_context.invocation_id, callback_context.agent_name), None
+    )
+    _open_spans.set(spans)
+    if opened is not None and opened.token is not None:
+        otel_context.detach(opened.token)
+    return opened
+
+
+def trace_agent_start(callback_context: CallbackContext) -> None:
+    """before_agent_callback: 'agent.<이름>' span을 시작하고, 턴의 첫 에이전트이면 비용 집계를 시작합니다."""
+    begin_turn(callback_context)
+    _open(
+        "agent",
+        callback_context,
+        f"agent.{callback_context.agent_name}",
+        attach=True,
+        agent=callback_context.agent_name,
+        invocation_id=callback_context.invocation_id,
+    )
+    return None
+
+
+def trace_agent_end(callback_context: CallbackContext) -> None:
+    """after_agent_callback: 'agent.<이름>' span을 종료하고, 턴을 시작한 에이전트이면 비용을 기록합니다."""
+    end_turn(callback_context)
+    opened = _close("agent", callback_context)
+    if opened is not None:
+        opened.span.end()
+    return None
+
+
+def trace_model_start(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> None:
+    """
+    before_model_callback: 'llm.<에이전트 이름>' span을 시작합니다.
+
+    ADK는 before_model_callback 이후에 자체 'call_llm' span을 현재 span으로 설정하고 그 안에서
+    after_model_callback을 호출하므로, LLM span은 현재 span으로 설정하지 않습니다 (중첩 순서가 어긋남).
+    LLM 호출 중에는 하위 span이 없고, 도구 호출은 응답 이후 에이전트 span 아래에서 실행됩니다.
+    """
+    _open(
+        "llm",
+        callback_context,
+        f"llm.{callback_context.agent_name}",
+        model=llm_request.model or "",
+        agent=callback_context.agent_name,
+    )
+    return None
+
+
+def _record_tokens(
+    invocation_id: str,
+    agent: str,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+) -> None:
+    LLM_TOKENS.inc(prompt_tokens, agent=agent, model=model, kind="prompt")
+    LLM_TOKENS.inc(completion_tokens, agent=agent, model=model, kind="completion")
+    record_llm_usage(invocation_id, agent, model, prompt_tokens, completion_tokens)
+
+
+def trace_model_end(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> None:
+    """after_model_callback: 토큰 수를 기록하고 'llm.<에이전트 이름>' span을 종료합니다."""
+    if llm_response.partial:
+        return None
+    opened = _close("llm", callback_context)
+    if opened is None:
+        return None
+    metadata = llm_response.custom_metadata or {}
+    span, agent = opened.span, callback_context.agent_name
+    invocation_id = callback_context.invocation_id
+    model = metadata.get(MODEL_METADATA_KEY) or opened.model or ""
+    span.set_attribute("llm.model", model)
+
+    # 응답 전에 버려진 호출(모델 계층 승급)도 각 모델의 호출/토큰으로 기록합니다.
+    for rejected in metadata.get(REJECTED_USAGE_METADATA_KEY) or []:
+        LLM_CALLS.inc(agent=agent, model=rejected["model"])
+        _record_tokens(
+            invocation_id,
+            agent,
+            rejected["model"],
+            rejected["prompt_tokens"],
+            rejected["completion_tokens"],
+        )
+
+    LLM_CALLS.inc(agent=agent, model=model)
+    LLM_LATENCY.observe(time.perf_counter() - opened.started, agent=agent, model=model)
+    usage = llm_response.usage_metadata
+    if usage is not None:
+        prompt_tokens = usage.prompt_token_count or 0
+        completion_tokens = usage.candidates_token_count or 0
+        span.set_attribute("llm.prompt_tokens", prompt_tokens)
+        span.set_attribute("llm.completion_tokens", completion_tokens)
+        span.set_attribute("llm.total_tokens", usage.total_token_count or 0)
+        _record_tokens(invocation_id, agent, model, prompt_tokens, completion_tokens)
+    if llm_response.error_code:
+        span.set_status(Status(StatusCode.ERROR, llm_response.error_message or ""))
+    span.end()
+    return None
+
+
+# --- 로컬 히스토그램 익스포터 ---
+_histogram_exporter: Optional["LatencyHistogramExporter"] = None
+
+
+def configure_tracing(histogram_path: Optional[str] = TRACING_HISTOGRAM_PATH) -> None:
+    """
+    로컬 히스토그램 익스포터를 TracerProvider에 등록합니다.
+
+    histogram_path가 없으면 아무 작업도 하지 않습니다(no-op 트레이싱 유지).
+    이미 SDK TracerProvider가 설정되어 있으면(예: adk web --trace_to_cloud) 해당 provider에
+    익스포터만 추가합니다.
+
+    Args:
+        histogram_path (Optional[str]): 히스토그램 JSON 파일 경로
+    """
+    global _histogram_exporter
+    if not histogram_path or _histogram_exporter is not None:
+        return
+
+    # SDK는 히스토그램 기록이 활성화된 경우에만 임포트합니다(콜드 스타트 단축).
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    from .histograms import LatencyHistogramExporter
+
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        provider = TracerProvider()
+        trace.set_tracer_provider(provider)
+
+    _histogram_exporter = LatencyHistogramExporter(histogram_path)
+    provider.add_span_processor(SimpleSpanProcessor(_histogram_exporter))
+    logger.info(f"지연 시간 히스토그램 기록: {histogram_path}")
+
+
+def get_latency_histograms() -> Dict[str, Dict[str, Any]]:
+    """로컬 익스포터가 집계한 단계별 히스토그램을 반환합니다. 비활성화 시 빈 딕셔너리입니다."""
+    return _histogram_exporter.snapshot() if _histogram_exporter else {}
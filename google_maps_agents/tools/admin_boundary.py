@@ -0,0 +1,494 @@
+"""
+행정구역 경계 색인을 이용한 오프라인 개략 역지오코딩을 정의하는 파일입니다.
+
+시/도, 시/군/구, 읍/면/동 수준의 주소만 필요한 역지오코딩은 Geocoding API를 호출하지 않고
+디스크의 행정구역 경계 색인에서 점-다각형 포함 검사(point-in-polygon)로 답합니다.
+업스트림 장애 시 캐시에 이전 결과가 없으면 역지오코딩 결과의 대체 응답으로도 사용됩니다.
+
+색인은 GeoJSON 경계 데이터(예: 통계청 SGIS 행정구역 경계)에서 한 번 생성하며, 저장소에 포함되지 않습니다.
+좌표/오프셋 배열은 .npy 파일로 저장되어 메모리 매핑(np.load(mmap_mode="r"))으로 읽으므로,
+여러 워커 프로세스가 같은 페이지 캐시를 공유합니다. 균일 격자 공간 색인으로 후보 다각형을 찾은 뒤
+경계 상자 검사와 짝홀 규칙(even-odd) 교차 검사를 수행합니다.
+
+사용법:
+    python -m google_maps_agents.tools.admin_boundary build --out ./admin_index \\
+        --layer sido=sido.geojson --layer sigungu=sigungu.geojson --layer dong=dong.geojson
+    python -m google_maps_agents.tools.admin_boundary lookup --index ./admin_index 37.5665 126.9780
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import ADMIN_BOUNDARY_INDEX_PATH
+from ..telemetry.metrics import registry
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 행정구역 수준 (넓은 것부터)
+LEVEL_SIDO = "sido"
+LEVEL_SIGUNGU = "sigungu"
+LEVEL_DONG = "dong"
+LEVELS = (LEVEL_SIDO, LEVEL_SIGUNGU, LEVEL_DONG)
+# v4beta addressComponents의 types 값과의 대응
+_COMPONENT_TYPES = {
+    LEVEL_SIDO: ["administrative_area_level_1", "political"],
+    LEVEL_SIGUNGU: ["sublocality_level_1", "sublocality", "political"],
+    LEVEL_DONG: ["sublocality_level_2", "sublocality", "political"],
+}
+INDEX_VERSION = 1
+
+# 개략 역지오코딩 결과
+OUTCOME_HIT = "hit"
+OUTCOME_MISS = "miss"
+OUTCOME_FALLBACK = "fallback"
+
+COARSE_GEOCODES = registry.counter(
+    "coarse_reverse_geocodes_total",
+    "Offline administrative-boundary reverse geocodes by outcome (hit/miss/fallback).",
+    ["outcome"],
+)
+
+
+class AdminBoundaryIndex:
+    """
+    메모리 매핑된 행정구역 경계 색인입니다.
+
+    디렉터리 구성:
+        meta.json: 버전, 격자 정보(west, south, cell_deg, cols, rows), 수준 목록
+        features.json: 행정구역 목록 ({"level", "code", "names": {언어 코드: 이름},
+            "parents": {상위 수준: 행정구역 인덱스}})
+        vertices.npy: 모든 닫힌 고리(ring)의 꼭짓점 (경도, 위도), float64 (V, 2)
+        ring_offsets.npy: 고리별 꼭짓점 시작 오프셋, int64 (R + 1)
+        polygon_rings.npy: 다각형별 고리 시작 오프셋, int64 (P + 1) (첫 고리는 외곽, 나머지는 구멍)
+        polygon_bbox.npy: 다각형별 경계 상자 (west, south, east, north), float64 (P, 4)
+        polygon_feature.npy: 다각형이 속한 행정구역 인덱스, int32 (P)
+        grid_offsets.npy / grid_items.npy: 격자 칸별 후보 다각형 목록 (CSR), int64
+
+    Attributes:
+        path (str): 색인 디렉터리 경로
+        features (List[Dict[str, Any]]): 행정구역 목록
+        levels (Tuple[str, ...]): 색인에 포함된 행정구역 수준
+    """
+
+    def __init__(self, path: str):
+        import numpy as np
+
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(
+                f"지원하지 않는 행정구역 색인 버전입니다: {meta.get('version')}"
+            )
+        with open(os.path.join(path, "features.json"), encoding="utf-8") as f:
+            self.features: List[Dict[str, Any]] = json.load(f)
+        self.levels: Tuple[str, ...] = tuple(meta["levels"])
+        grid = meta["grid"]
+        self._west, self._south = grid["west"], grid["south"]
+        self._cell_deg, self._cols, self._rows = (
+            grid["cell_deg"],
+            grid["cols"],
+            grid["rows"],
+        )
+
+        def load(name: str) -> "np.ndarray":
+            # np.memmap 하위 클래스는 슬라이싱마다 부가 비용이 있어 일반 ndarray 뷰로 사용합니다.
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r").view(
+                np.ndarray
+            )
+
+        self._vertices = load("vertices")
+        self._ring_offsets = load("ring_offsets")
+        self._polygon_rings = load("polygon_rings")
+        self._polygon_bbox = load("polygon_bbox")
+        self._polygon_feature = load("polygon_feature")
+        self._grid_offsets = load("grid_offsets")
+        self._grid_items = load("grid_items")
+
+    def _candidates(self, lat: float, lng: float) -> "np.ndarray":
+        """좌표의 격자 칸에 걸치고 경계 상자가 좌표를 포함하는 다각형 인덱스 배열을 반환합니다."""
+        col = int((lng - self._west) // self._cell_deg)
+        row = int((lat - self._south) // self._cell_deg)
+        if not (0 <= col < self._cols and 0 <= row < self._rows):
+            return self._grid_items[:0]
+        cell = row * self._cols + col
+        polygons = self._grid_items[
+            self._grid_offsets[cell] : self._grid_offsets[cell + 1]
+        ]
+        bbox = self._polygon_bbox[polygons]
+        point = (lng, lat)
+        inside = ((bbox[:, :2] <= point) & (bbox[:, 2:] >= point)).all(axis=1)
+        return polygons[inside]
+
+    def _contains(self, polygon: int, lat: float, lng: float) -> bool:
+        import numpy as np
+
+        ring_offsets = self._ring_offsets
+        first_ring, last_ring = (
+            self._polygon_rings[polygon],
+            self._polygon_rings[polygon + 1],
+        )
+        # 짝홀 규칙: 외곽 고리와 구멍 고리의 교차 수를 합치면 구멍 안의 점은 짝수가 됩니다.
+        # 고리는 닫힌 상태(첫 꼭짓점 = 마지막 꼭짓점)로 저장되어 있어 연속한 두 꼭짓점이 한 변입니다.
+        vertices = self._vertices[ring_offsets[first_ring] : ring_offsets[last_ring]]
+        xs, ys = vertices[:, 0], vertices[:, 1]
+        above = ys > lat
+        spans = above[1:] != above[:-1]
+        # 고리 경계를 넘는 (마지막 꼭짓점 -> 다음 고리 첫 꼭짓점) 변은 제외합니다.
+        if last_ring - first_ring > 1:
+            spans[
+                ring_offsets[first_ring + 1 : last_ring] - ring_offsets[first_ring] - 1
+            ] = False
+        edges = np.flatnonzero(spans)
+        if not len(edges):
+            return False
+        x0, y0, x1, y1 = xs[edges], ys[edges], xs[edges + 1], ys[edges + 1]
+        x_cross = x0 + (lat - y0) * (x1 - x0) / (y1 - y0)
+        return int(np.count_nonzero(lng < x_cross)) % 2 == 1
+
+    def lookup(self, lat: float, lng: float) -> Dict[str, Dict[str, Any]]:
+        """좌표를 포함하는 수준별 행정구역 {수준: 행정구역}을 반환합니다."""
+        found: Dict[str, Dict[str, Any]] = {}
+        # 격자 칸의 후보는 세밀한 수준부터 정렬되어 있어, 읍/면/동을 찾으면 상위 구역은 코드로 채워집니다.
+        for polygon in self._candidates(lat, lng).tolist():
+            feature = self.features[int(self._polygon_feature[polygon])]
+            if feature["level"] not in found and self._contains(polygon, lat, lng):
+                found[feature["level"]] = feature
+                for level, parent in feature.get("parents", {}).items():
+                    found.setdefault(level, self.features[parent])
+        return found
+
+    def reverse_geocode(
+        self,
+        lat: float,
+        lng: float,
+        granularity: Optional[str],
+        language_code: str = "ko",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        좌표를 granularity 수준까지의 행정구역 주소로 변환합니다.
+
+        Args:
+            lat (float): 위도
+            lng (float): 경도
+            granularity (Optional[str]): 필요한 가장 세밀한 수준 ("sido", "sigungu", "dong").
+                None이면 좌표에서 찾을 수 있는 가장 세밀한 수준을 사용합니다.
+            language_code (str, optional): 행정구역 이름 언어 코드. 이름이 없으면 한국어 이름을 사용합니다.
+
+        Returns:
+            Optional[Dict[str, Any]]: reverse_geocode 결과 형식의 주소 정보 ("source": "offline").
+                좌표가 색인 밖이거나 요청한 수준을 답할 수 없으면 None
+        """
+        if granularity is not None and granularity not in self.levels:
+            return None
+        found = self.lookup(lat, lng)
+        if granularity is None:
+            granularity = next(
+                (level for level in reversed(LEVELS) if level in found), None
+            )
+        if granularity not in found:
+            return None
+        wanted = LEVELS[: LEVELS.index(granularity) + 1]
+        components = []
+        for level in wanted:
+            feature = found.get(level)
+            if feature is None:
+                continue
+            names = feature["names"]
+            name = (
+                names.get(language_code)
+                or names.get("ko")
+                or next(iter(names.values()))
+            )
+            components.append(
+                {
+                    "longText": name,
+                    "shortText": name,
+                    "types": _COMPONENT_TYPES[level],
+                    "languageCode": language_code if language_code in names else "ko",
+                }
+            )
+        names = [component["longText"] for component in components]
+        # 영문 주소는 좁은 구역부터 표기합니다.
+        formatted = (
+            ", ".join(reversed(names)) if language_code == "en" else " ".join(names)
+        )
+        return {
+            "formatted_address": formatted,
+            "place_id": None,
+            "location_type": granularity,
+            "address_components": components,
+            "administrative_codes": {
+                level: found[level].get("code") for level in wanted if level in found
+            },
+            "input_coordinates": {"lat": lat, "lng": lng},
+            "source": "offline",
+        }
+
+
+_index: Optional[AdminBoundaryIndex] = None
+_index_loaded = False
+
+
+def get_boundary_index() -> Optional[AdminBoundaryIndex]:
+    """
+    ADMIN_BOUNDARY_INDEX_PATH의 색인을 프로세스당 한 번 불러옵니다.
+
+    경로가 설정되지 않았거나 불러오지 못하면 None이며, 이 경우 개략 역지오코딩은 항상 API를 사용합니다.
+    """
+    global _index, _index_loaded
+    if not _index_loaded:
+        _index_loaded = True
+        if ADMIN_BOUNDARY_INDEX_PATH:
+            try:
+                _index = AdminBoundaryIndex(ADMIN_BOUNDARY_INDEX_PATH)
+                logger.info(
+                    f"행정구역 경계 색인 로드: {ADMIN_BOUNDARY_INDEX_PATH} "
+                    f"(행정구역 {len(_index.features)}개, 수준 {_index.levels})"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"행정구역 경계 색인을 불러오지 못했습니다 ({ADMIN_BOUNDARY_INDEX_PATH}): {e}"
+                )
+    return _index
+
+
+def coarse_reverse_geocode(
+    lat: float,
+    lng: float,
+    granularity: Optional[str],
+    language_code: str = "ko",
+    fallback: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    색인이 있으면 오프라인 개략 역지오코딩 결과를, 없거나 답할 수 없으면 None을 반환합니다.
+
+    granularity가 None이면 가장 세밀한 수준으로 답합니다.
+    fallback=True이면 업스트림 장애 대체 응답으로 집계합니다.
+    """
+    index = get_boundary_index()
+    if index is None:
+        return None
+    result = index.reverse_geocode(lat, lng, granularity, language_code)
+    if result is None:
+        COARSE_GEOCODES.inc(outcome=OUTCOME_MISS)
+    else:
+        COARSE_GEOCODES.inc(outcome=OUTCOME_FALLBACK if fallback else OUTCOME_HIT)
+    return result
+
+
+def _iter_polygons(geometry: Dict[str, Any]) -> Iterable[List[List[List[float]]]]:
+    if geometry["type"] == "Polygon":
+        yield geometry["coordinates"]
+    elif geometry["type"] == "MultiPolygon":
+        yield from geometry["coordinates"]
+
+
+def _link_parents(features: List[Dict[str, Any]]) -> None:
+    """
+    행정구역 코드가 상위 구역 코드로 시작하면(예: 11 → 11110 → 1111051500) 상위 구역을 parents에 기록합니다.
+
+    parents가 있는 구역을 찾으면 상위 구역의 점-다각형 검사를 생략합니다.
+    """
+    by_level: Dict[str, Dict[str, int]] = {level: {} for level in LEVELS}
+    for index, feature in enumerate(features):
+        if feature["code"]:
+            by_level[feature["level"]][feature["code"]] = index
+    for feature in features:
+        code = feature["code"]
+        parents = {}
+        for level in LEVELS[: LEVELS.index(feature["level"])]:
+            for length in sorted(
+                {len(parent) for parent in by_level[level]}, reverse=True
+            ):
+                if length < len(code) and code[:length] in by_level[level]:
+                    parents[level] = by_level[level][code[:length]]
+                    break
+        if parents:
+            feature["parents"] = parents
+
+
+def build_index(
+    layers: List[Tuple[str, str]],
+    out_dir: str,
+    cell_deg: float = 0.02,
+    name_property: str = "name",
+    english_name_property: str = "name_eng",
+    code_property: str = "code",
+) -> None:
+    """
+    GeoJSON 경계 데이터(수준별 FeatureCollection)에서 색인 디렉터리를 생성합니다.
+
+    Args:
+        layers (List[Tuple[str, str]]): (수준, GeoJSON 파일 경로) 목록
+        out_dir (str): 색인을 저장할 디렉터리
+        cell_deg (float, optional): 공간 색인 격자 칸 크기 (도)
+        name_property (str, optional): 한국어 이름 속성
+        english_name_property (str, optional): 영문 이름 속성 (없으면 생략)
+        code_property (str, optional): 행정구역 코드 속성
+    """
+    import numpy as np
+
+    features: List[Dict[str, Any]] = []
+    vertices: List["np.ndarray"] = []
+    ring_offsets = [0]
+    polygon_rings = [0]
+    polygon_bbox: List[Tuple[float, float, float, float]] = []
+    polygon_feature: List[int] = []
+
+    for level, path in layers:
+        if level not in LEVELS:
+            raise ValueError(
+                f"알 수 없는 행정구역 수준입니다: {level} (가능한 값: {', '.join(LEVELS)})"
+            )
+        with open(path, encoding="utf-8") as f:
+            collection = json.load(f)
+        for item in collection["features"]:
+            properties = item.get("properties") or {}
+            names = {"ko": str(properties[name_property])}
+            if properties.get(english_name_property):
+                names["en"] = str(properties[english_name_property])
+            feature_id = len(features)
+            features.append(
+                {
+                    "level": level,
+                    "code": str(properties.get(code_property, "")),
+                    "names": names,
+                }
+            )
+            for polygon in _iter_polygons(item["geometry"]):
+                for ring in polygon:
+                    ring_array = np.asarray(ring, dtype=np.float64)[:, :2]
+                    if not np.array_equal(ring_array[0], ring_array[-1]):
+                        ring_array = np.vstack((ring_array, ring_array[:1]))
+                    vertices.append(ring_array)
+                    ring_offsets.append(ring_offsets[-1] + len(ring_array))
+                polygon_rings.append(polygon_rings[-1] + len(polygon))
+                outer = np.asarray(polygon[0], dtype=np.float64)[:, :2]
+                polygon_bbox.append(
+                    (
+                        outer[:, 0].min(),
+                        outer[:, 1].min(),
+                        outer[:, 0].max(),
+                        outer[:, 1].max(),
+                    )
+                )
+                polygon_feature.append(feature_id)
+
+    _link_parents(features)
+
+    bbox = np.asarray(polygon_bbox, dtype=np.float64).reshape(-1, 4)
+    west, south = float(bbox[:, 0].min()), float(bbox[:, 1].min())
+    cols = int((bbox[:, 2].max() - west) // cell_deg) + 1
+    rows = int((bbox[:, 3].max() - south) // cell_deg) + 1
+    cells: List[List[int]] = [[] for _ in range(rows * cols)]
+    for polygon, (p_west, p_south, p_east, p_north) in enumerate(bbox):
+        col0, col1 = int((p_west - west) // cell_deg), int((p_east - west) // cell_deg)
+        row0, row1 = int((p_south - south) // cell_deg), int(
+            (p_north - south) // cell_deg
+        )
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                cells[row * cols + col].append(polygon)
+    # 세밀한 수준의 다각형을 먼저 검사하도록 칸별 후보를 정렬합니다.
+    rank = {level: -LEVELS.index(level) for level in LEVELS}
+    for cell in cells:
+        cell.sort(key=lambda polygon: rank[features[polygon_feature[polygon]]["level"]])
+    grid_offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+    grid_offsets[1:] = np.cumsum([len(cell) for cell in cells])
+
+    os.makedirs(out_dir, exist_ok=True)
+    arrays = {
+        "vertices": np.concatenate(vertices) if vertices else np.zeros((0, 2)),
+        "ring_offsets": np.asarray(ring_offsets, dtype=np.int64),
+        "polygon_rings": np.asarray(polygon_rings, dtype=np.int64),
+        "polygon_bbox": bbox,
+        "polygon_feature": np.asarray(polygon_feature, dtype=np.int32),
+        "grid_offsets": grid_offsets,
+        "grid_items": np.asarray([p for cell in cells for p in cell], dtype=np.int64),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), array)
+    with open(os.path.join(out_dir, "features.json"), "w", encoding="utf-8") as f:
+        json.dump(features, f, ensure_ascii=False)
+    meta = {
+        "version": INDEX_VERSION,
+        "levels": [level for level in LEVELS if any(lv == level for lv, _ in layers)],
+        "grid": {
+            "west": west,
+            "south": south,
+            "cell_deg": cell_deg,
+            "cols": cols,
+            "rows": rows,
+        },
+    }
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    logger.info(
+        f"행정구역 경계 색인 생성: {out_dir} (행정구역 {len(features)}개, 다각형 {len(bbox)}개, "
+        f"격자 {cols}x{rows})"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="GeoJSON 경계 데이터에서 색인 생성")
+    build.add_argument("--out", required=True, help="색인 디렉터리")
+    build.add_argument(
+        "--layer",
+        action="append",
+        required=True,
+        help="<수준>=<GeoJSON 경로> (수준: sido/sigungu/dong)",
+    )
+    build.add_argument("--cell-deg", type=float, default=0.02, help="격자 칸 크기 (도)")
+    build.add_argument("--name-property", default="name")
+    build.add_argument("--english-name-property", default="name_eng")
+    build.add_argument("--code-property", default="code")
+
+    lookup = commands.add_parser("lookup", help="좌표의 행정구역 조회")
+    lookup.add_argument(
+        "--index", default=ADMIN_BOUNDARY_INDEX_PATH, help="색인 디렉터리"
+    )
+    lookup.add_argument("--granularity", default=LEVEL_DONG, choices=LEVELS)
+    lookup.add_argument("--language", default="ko")
+    lookup.add_argument("lat", type=float)
+    lookup.add_argument("lng", type=float)
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "build":
+        layers = [tuple(layer.split("=", 1)) for layer in args.layer]
+        build_index(
+            layers,
+            args.out,
+            cell_deg=args.cell_deg,
+            name_property=args.name_property,
+            english_name_property=args.english_name_property,
+            code_property=args.code_property,
+        )
+        return
+    if not args.index:
+        raise SystemExit("--index 또는 ADMIN_BOUNDARY_INDEX_PATH를 지정하세요.")
+    index = AdminBoundaryIndex(args.index)
+    started = time.perf_counter()
+    result = index.reverse_geocode(args.lat, args.lng, args.granularity, args.language)
+    elapsed_us = (time.perf_counter() - started) * 1e6
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"{elapsed_us:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
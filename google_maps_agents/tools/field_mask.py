@@ -0,0 +1,284 @@
+"""Places API fieldMask 검증 및 SKU 비용 추정 도구.
+
+fields_selector_agent가 자유 텍스트로 반환한 필드 마스크를 API 호출 전에
+정규화/중복 제거/보정하고, 해당 마스크가 트리거하는 SKU 등급을 계산합니다.
+SKU 등급별 필드 목록은 FIELDS_SELECTOR_INSTRUCTION에 나열된 표를 그대로 사용합니다.
+"""
+
+import difflib
+import logging
+import re
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from ..prompts import FIELDS_SELECTOR_INSTRUCTION
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 상수 정의
+FIELD_PREFIX = "places."
+WILDCARD_FIELDS = ("*", "places.*")
+# 오타 보정 시 허용하는 최소 유사도 (difflib 기준)
+TYPO_MATCH_CUTOFF = 0.85
+
+_SKU_HEADER_PATTERN = re.compile(r"^### \*\*(.+?) SKU 필드 목록", re.MULTILINE)
+_SKU_FIELD_PATTERN = re.compile(r"^- ([A-Za-z][\w.]*)\s*:", re.MULTILINE)
+_SECTION_END_PATTERN = re.compile(r"^#{1,3} ", re.MULTILINE)
+_SPLIT_PATTERN = re.compile(r"[,\s]+")
+_QUOTE_CHARS = "`'\"[]{}()"
+# 마크다운 강조(**rating**)도 제거합니다. 와일드카드는 이 문자를 제거하기 전에 확인합니다.
+_STRIP_CHARS = _QUOTE_CHARS + "*"
+
+
+class SkuTier(IntEnum):
+    """
+    Text Search 요청에 청구되는 SKU 등급입니다.
+
+    요청에 포함된 필드 중 가장 높은 등급의 SKU가 청구되므로 값의 대소 비교가 가능합니다.
+    """
+
+    ESSENTIALS = 0
+    PRO = 1
+    ENTERPRISE = 2
+    ENTERPRISE_ATMOSPHERE = 3
+
+    @property
+    def label(self) -> str:
+        """FIELDS_SELECTOR_INSTRUCTION에서 사용하는 SKU 이름을 반환합니다."""
+        return _TIER_LABELS[self]
+
+    @classmethod
+    def parse(cls, value: "str | int | SkuTier") -> "SkuTier":
+        """
+        문자열/정수 표현을 SkuTier로 변환합니다.
+
+        Args:
+            value: "Enterprise", "enterprise_atmosphere", "Enterprise + Atmosphere", 2 등
+
+        Raises:
+            ValueError: 알 수 없는 SKU 등급인 경우
+        """
+        if isinstance(value, SkuTier):
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        key = re.sub(r"[\s+_-]+", "_", value.strip()).upper()
+        if key in cls.__members__:
+            return cls[key]
+        raise ValueError(f"알 수 없는 SKU 등급입니다: {value}")
+
+
+_TIER_LABELS: Dict[SkuTier, str] = {
+    SkuTier.ESSENTIALS: "Essentials",
+    SkuTier.PRO: "Pro",
+    SkuTier.ENTERPRISE: "Enterprise",
+    SkuTier.ENTERPRISE_ATMOSPHERE: "Enterprise + Atmosphere",
+}
+
+
+@lru_cache(maxsize=1)
+def get_field_sku_table() -> Dict[str, SkuTier]:
+    """
+    FIELDS_SELECTOR_INSTRUCTION의 SKU 필드 목록을 파싱하여 필드→SKU 등급 표를 반환합니다.
+
+    Returns:
+        Dict[str, SkuTier]: {"places.displayName": SkuTier.PRO, ...}
+    """
+    label_to_tier = {label: tier for tier, label in _TIER_LABELS.items()}
+    headers = list(_SKU_HEADER_PATTERN.finditer(FIELDS_SELECTOR_INSTRUCTION))
+    table: Dict[str, SkuTier] = {}
+
+    for header in headers:
+        tier = label_to_tier[header.group(1)]
+        body_start = FIELDS_SELECTOR_INSTRUCTION.index("\n", header.end()) + 1
+        section_end = _SECTION_END_PATTERN.search(
+            FIELDS_SELECTOR_INSTRUCTION, body_start
+        )
+        body = FIELDS_SELECTOR_INSTRUCTION[
+            body_start : section_end.start() if section_end else None
+        ]
+        for match in _SKU_FIELD_PATTERN.finditer(body):
+            table[match.group(1)] = tier
+
+    return table
+
+
+@lru_cache(maxsize=1)
+def _get_lookup_index() -> Tuple[Dict[str, str], List[str]]:
+    """대소문자/snake_case 변형을 정식 필드명으로 매핑하는 색인을 만듭니다."""
+    index: Dict[str, str] = {}
+    for name in get_field_sku_table():
+        short = name.removeprefix(FIELD_PREFIX)
+        snake = re.sub(r"(?<!^)(?=[A-Z])", "_", short)
+        for alias in (name, short, snake, FIELD_PREFIX + snake):
+            index[alias.lower()] = name
+    return index, list(get_field_sku_table())
+
+
+@dataclass
+class FieldMaskResult:
+    """
+    필드 마스크 검증 결과입니다.
+
+    Attributes:
+        mask (str): API에 전달할 정규화된 필드 마스크
+        fields (List[str]): 정규화된 필드 목록 (입력 순서 유지)
+        tier (SkuTier): 마스크가 트리거하는 SKU 등급
+        repaired (Dict[str, str]): 보정된 필드 {원본: 보정값}
+        dropped (List[str]): 인식할 수 없어 제외된 필드
+        downgraded (List[str]): 최대 SKU 등급 제한으로 제외된 필드
+    """
+
+    mask: str
+    fields: List[str]
+    tier: SkuTier
+    repaired: Dict[str, str] = field(default_factory=dict)
+    dropped: List[str] = field(default_factory=list)
+    downgraded: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """입력 마스크가 보정/제외/다운그레이드되었는지 여부입니다."""
+        return bool(self.repaired or self.dropped or self.downgraded)
+
+    def to_dict(self) -> Dict[str, object]:
+        """세션 상태나 로그에 기록하기 위한 딕셔너리 표현을 반환합니다."""
+        return {
+            "mask": self.mask,
+            "sku_tier": self.tier.label,
+            "repaired": self.repaired,
+            "dropped": self.dropped,
+            "downgraded": self.downgraded,
+        }
+
+
+def resolve_field(token: str) -> Optional[str]:
+    """
+    단일 필드 토큰을 정식 필드명으로 변환합니다.
+
+    "rating", "places.Rating", "regular_opening_hours", "places.displayName.text",
+    "places.raiting"(오타)과 같은 입력을 처리합니다.
+
+    Args:
+        token (str): 필드 토큰
+
+    Returns:
+        Optional[str]: 정식 필드명(하위 경로 포함) 또는 인식할 수 없는 경우 None
+    """
+    unquoted = token.strip(_QUOTE_CHARS)
+    if unquoted in WILDCARD_FIELDS:
+        return unquoted
+    token = unquoted.strip(_STRIP_CHARS).rstrip(".")
+    if not token:
+        return None
+
+    index, known = _get_lookup_index()
+
+    # 하위 경로(places.displayName.text)는 최상위 필드만 확인하고 경로를 유지합니다.
+    parts = token.split(".")
+    has_prefix = parts[0].lower() == "places"
+    head_len = 2 if has_prefix else 1
+    head, sub_path = ".".join(parts[:head_len]), parts[head_len:]
+
+    resolved = index.get(head.lower())
+    if resolved is None:
+        candidate = head if has_prefix else FIELD_PREFIX + head
+        matches = difflib.get_close_matches(
+            candidate, known, n=1, cutoff=TYPO_MATCH_CUTOFF
+        )
+        if not matches:
+            return None
+        resolved = matches[0]
+
+    return ".".join([resolved, *sub_path])
+
+
+def field_tier(field_name: str) -> SkuTier:
+    """정식 필드명의 SKU 등급을 반환합니다. 와일드카드는 최고 등급으로 취급합니다."""
+    if field_name in WILDCARD_FIELDS:
+        return SkuTier.ENTERPRISE_ATMOSPHERE
+    table = get_field_sku_table()
+    parts = field_name.split(".")
+    head = ".".join(parts[:2]) if parts[0] == "places" else parts[0]
+    return table.get(head, SkuTier.ENTERPRISE_ATMOSPHERE)
+
+
+def compute_sku_tier(fields: List[str]) -> SkuTier:
+    """필드 목록이 트리거하는 SKU 등급(가장 높은 등급)을 계산합니다."""
+    return max((field_tier(name) for name in fields), default=SkuTier.ESSENTIALS)
+
+
+def validate_field_mask(
+    raw_mask: Optional[str],
+    fallback: str,
+    max_tier: "str | SkuTier | None" = None,
+) -> FieldMaskResult:
+    """
+    자유 텍스트 필드 마스크를 정규화하고 SKU 등급을 계산합니다.
+
+    공백/개행/마크다운 기호를 제거하고, 필드명을 정식 표기로 보정한 뒤 중복을 제거합니다.
+    max_tier가 지정되면 해당 등급을 초과하는 필드를 제외합니다.
+
+    Args:
+        raw_mask (Optional[str]): LLM이 생성한 필드 마스크 텍스트
+        fallback (str): 유효한 필드가 하나도 없을 때 사용할 기본 필드 마스크
+        max_tier (str | SkuTier | None, optional): 허용할 최대 SKU 등급
+
+    Returns:
+        FieldMaskResult: 정규화된 마스크와 SKU 등급, 보정 내역
+
+    Example:
+        >>> result = validate_field_mask(" places.id, rating,\\nplaces.id ", DEFAULT_FIELDS)
+        >>> result.mask
+        'places.id,places.rating'
+        >>> result.tier.label
+        'Enterprise'
+    """
+    fields: List[str] = []
+    repaired: Dict[str, str] = {}
+    dropped: List[str] = []
+
+    for token in _SPLIT_PATTERN.split(raw_mask or ""):
+        if (
+            not token.strip(_STRIP_CHARS)
+            and token.strip(_QUOTE_CHARS) not in WILDCARD_FIELDS
+        ):
+            continue
+        resolved = resolve_field(token)
+        if resolved is None:
+            dropped.append(token)
+            continue
+        if resolved != token:
+            repaired[token] = resolved
+        if resolved not in fields:
+            fields.append(resolved)
+
+    if not fields:
+        fields = [name for name in fallback.split(",") if name]
+
+    downgraded: List[str] = []
+    if max_tier is not None:
+        limit = SkuTier.parse(max_tier)
+        downgraded = [name for name in fields if field_tier(name) > limit]
+        fields = [name for name in fields if field_tier(name) <= limit]
+        if not fields:
+            fields = [
+                name
+                for name in fallback.split(",")
+                if name and field_tier(name) <= limit
+            ] or [FIELD_PREFIX + "id"]
+
+    result = FieldMaskResult(
+        mask=",".join(fields),
+        fields=fields,
+        tier=compute_sku_tier(fields),
+        repaired=repaired,
+        dropped=dropped,
+        downgraded=downgraded,
+    )
+    if result.changed:
+        logger.warning(f"필드 마스크 보정: {result.to_dict()}")
+    return result
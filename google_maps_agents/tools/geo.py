@@ -0,0 +1,242 @@
+"""
+기준 위치(anchor) 주변 장소 검색과 위치 경로(trace) 처리를 위한 거리 계산 도구를 정의하는 파일입니다.
+
+"서울역 근처 약국"처럼 기준 위치가 있는 쿼리는 기준 위치를 한 번 지오코딩한 뒤,
+SearchText 요청에 위치 편향(location_bias) 또는 위치 제한(location_restriction)을 지정하고,
+반환된 모든 장소와의 하버사인 거리를 NumPy로 한 번에 계산하여 반경 필터링/거리순 정렬을 수행합니다.
+
+GPS 경로 일괄 역지오코딩(GeocodingService.reverse_geocode_trace)에는 경로 단순화(Douglas–Peucker),
+누적 이동 거리, 격자 칸 분류를 제공합니다.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 지구 평균 반지름 (미터)
+EARTH_RADIUS_M = 6_371_008.8
+# SearchText location_bias 원의 최대 반경 (미터)
+MAX_BIAS_RADIUS_M = 50_000.0
+
+# "<기준 위치> 근처 <검색 대상>" / "<검색 대상> near <기준 위치>"
+_ANCHOR_BEFORE = re.compile(
+    r"^\s*(?P<anchor>.+?)\s*(?:근처|주변|부근|인근|옆|에서\s*가까운)(?:에\s*있는|에서|의|에)?\s+(?P<target>.+?)\s*$"
+)
+_ANCHOR_AFTER = re.compile(
+    r"^\s*(?P<target>.+?)\s+(?:near|around|nearby)\s+(?P<anchor>.+?)\s*$", re.IGNORECASE
+)
+
+
+def split_anchor(query: str) -> Optional[Tuple[str, str]]:
+    """
+    쿼리에서 (기준 위치, 검색 대상)을 분리합니다. 기준 위치 표현이 없으면 None입니다.
+
+    Example:
+        >>> split_anchor("서울역 근처 약국")
+        ('서울역', '약국')
+        >>> split_anchor("pharmacy near Seoul Station")
+        ('Seoul Station', 'pharmacy')
+    """
+    for pattern in (_ANCHOR_BEFORE, _ANCHOR_AFTER):
+        match = pattern.match(query)
+        if match:
+            return match.group("anchor"), match.group("target")
+    return None
+
+
+@dataclass(frozen=True)
+class SearchArea:
+    """
+    기준 위치 주변 검색 영역입니다.
+
+    Attributes:
+        lat (float): 기준 위치 위도
+        lng (float): 기준 위치 경도
+        radius_m (float): 검색 반경 (미터)
+        restrict (bool): True이면 결과를 영역 안으로 제한(location_restriction)하고,
+            False이면 영역 안의 결과를 우선(location_bias)합니다.
+    """
+
+    lat: float
+    lng: float
+    radius_m: float
+    restrict: bool = False
+
+    def cache_key(self) -> str:
+        """캐시 키 구성 요소 (약 1m 단위로 반올림)를 반환합니다."""
+        mode = "restrict" if self.restrict else "bias"
+        return f"{mode}:{self.lat:.5f},{self.lng:.5f},{self.radius_m:.0f}"
+
+    def bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """반경 원을 감싸는 ((남서 위도, 남서 경도), (북동 위도, 북동 경도))를 반환합니다."""
+        dlat = math.degrees(self.radius_m / EARTH_RADIUS_M)
+        dlng = dlat / max(math.cos(math.radians(self.lat)), 1e-6)
+        return (self.lat - dlat, self.lng - dlng), (self.lat + dlat, self.lng + dlng)
+
+    def to_request_params(self) -> Dict[str, Any]:
+        """SearchTextRequest 생성 인자(location_bias 또는 location_restriction)를 반환합니다."""
+        from google.geo.type.types import Viewport
+        from google.maps.places_v1.types import Circle, SearchTextRequest
+        from google.type.latlng_pb2 import LatLng
+
+        if self.restrict:
+            # SearchText의 위치 제한은 사각형(viewport)만 지원합니다.
+            (south, west), (north, east) = self.bounds()
+            return {
+                "location_restriction": SearchTextRequest.LocationRestriction(
+                    rectangle=Viewport(
+                        low=LatLng(latitude=south, longitude=west),
+                        high=LatLng(latitude=north, longitude=east),
+                    )
+                )
+            }
+        return {
+            "location_bias": SearchTextRequest.LocationBias(
+                circle=Circle(
+                    center=LatLng(latitude=self.lat, longitude=self.lng),
+                    radius=min(self.radius_m, MAX_BIAS_RADIUS_M),
+                )
+            )
+        }
+
+
+def haversine_m(
+    lat: Any, lng: Any, lats: "np.ndarray", lngs: "np.ndarray"
+) -> "np.ndarray":
+    """
+    기준 좌표에서 좌표 배열까지의 하버사인 거리(미터) 배열을 반환합니다. NaN 좌표는 NaN입니다.
+
+    기준 좌표도 같은 길이의 배열이면 원소별 거리를 계산합니다.
+    """
+    import numpy as np
+
+    lat0 = np.radians(lat)
+    lat1 = np.radians(lats)
+    dlat = lat1 - lat0
+    dlng = np.radians(lngs - lng)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat0) * np.cos(lat1) * np.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def rank_by_distance(
+    places: List[Dict[str, Any]], area: SearchArea
+) -> List[Dict[str, Any]]:
+    """
+    장소 목록을 기준 위치로부터의 거리순으로 정렬하고, 반경 밖의 장소를 제외합니다.
+
+    각 장소에는 distance_m(정수, 미터)이 추가됩니다. 좌표가 없는 장소는 제외됩니다.
+    거리가 같으면 원래(관련성) 순서를 유지합니다.
+
+    Args:
+        places (List[Dict[str, Any]]): places_v1.Place.to_dict() 결과 목록
+        area (SearchArea): 기준 위치와 반경
+
+    Returns:
+        List[Dict[str, Any]]: 거리순으로 정렬된 새 장소 목록
+    """
+    import numpy as np
+
+    if not places:
+        return []
+    coords = np.array(
+        [
+            (
+                (place.get("location") or {}).get("latitude", np.nan),
+                (place.get("location") or {}).get("longitude", np.nan),
+            )
+            for place in places
+        ],
+        dtype=float,
+    )
+    distances = haversine_m(area.lat, area.lng, coords[:, 0], coords[:, 1])
+    order = np.argsort(distances, kind="stable")
+    keep = order[distances[order] <= area.radius_m]
+    return [{**places[i], "distance_m": int(round(float(distances[i])))} for i in keep]
+
+
+def _project_m(
+    lats: "np.ndarray", lngs: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """좌표 배열을 평균 위도 기준 등장방형 평면 좌표(미터)로 변환합니다. 수 km 규모 경로에서는 오차가 무시할 만합니다."""
+    import numpy as np
+
+    lat0 = float(np.mean(lats))
+    lng0 = float(np.mean(lngs))
+    x = np.radians(lngs - lng0) * math.cos(math.radians(lat0)) * EARTH_RADIUS_M
+    y = np.radians(lats - lat0) * EARTH_RADIUS_M
+    return x, y
+
+
+def simplify_polyline(
+    lats: "np.ndarray", lngs: "np.ndarray", tolerance_m: float
+) -> "np.ndarray":
+    """
+    Douglas–Peucker 알고리즘으로 경로를 단순화하고, 남길 점의 인덱스 배열(오름차순)을 반환합니다.
+
+    제거된 모든 점은 단순화된 경로의 선분에서 tolerance_m 이내에 있습니다.
+    첫 점과 마지막 점은 항상 남깁니다.
+    """
+    import numpy as np
+
+    n = len(lats)
+    if n <= 2 or tolerance_m <= 0:
+        return np.arange(n)
+    x, y = _project_m(lats, lngs)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    # 긴 경로에서도 재귀 한도에 걸리지 않도록 스택으로 처리합니다.
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1 : end] - x[start], y[start + 1 : end] - y[start]
+        length2 = dx * dx + dy * dy
+        if length2 == 0.0:
+            distances = np.hypot(px, py)
+        else:
+            # 선분(직선이 아닌)까지의 거리: 되돌아가는 경로도 단순화에서 사라지지 않습니다.
+            t = np.clip((px * dx + py * dy) / length2, 0.0, 1.0)
+            distances = np.hypot(px - t * dx, py - t * dy)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance_m:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+
+def cumulative_distance_m(lats: "np.ndarray", lngs: "np.ndarray") -> "np.ndarray":
+    """경로 시작점부터 각 점까지의 누적 이동 거리(미터) 배열을 반환합니다."""
+    import numpy as np
+
+    lat0, lat1 = np.radians(lats[:-1]), np.radians(lats[1:])
+    dlng = np.radians(lngs[1:] - lngs[:-1])
+    a = (
+        np.sin((lat1 - lat0) / 2) ** 2
+        + np.cos(lat0) * np.cos(lat1) * np.sin(dlng / 2) ** 2
+    )
+    steps = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    return np.concatenate(([0.0], np.cumsum(steps)))
+
+
+def grid_cells(lats: "np.ndarray", lngs: "np.ndarray", cell_m: float) -> "np.ndarray":
+    """
+    각 좌표가 속한 격자 칸 (행, 열) 배열(shape=(n, 2))을 반환합니다.
+
+    칸의 남북 크기는 cell_m이고, 동서 크기는 행의 중심 위도에서 약 cell_m이 되도록 경도 폭을 조정합니다.
+    같은 좌표는 어느 경로에서든 같은 칸에 속합니다.
+    """
+    import numpy as np
+
+    dlat = math.degrees(cell_m / EARTH_RADIUS_M)
+    rows = np.floor(lats / dlat)
+    dlng = dlat / np.maximum(np.cos(np.radians((rows + 0.5) * dlat)), 1e-6)
+    cols = np.floor(lngs / dlng)
+    return np.stack((rows, cols), axis=1).astype(np.int64)
@@ -1,54 +1,171 @@
 # google_maps_agents/tools/geocode.py
 """Google Maps Geocoding API Tools for PlacesAgent."""
 
+import asyncio
 import logging
-import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 import httpx
 from google.adk.tools import ToolContext
 
+from ..cache import ResultCache
+from ..canonical import canonicalize_address
+from ..circuit_breaker import BreakerCall, get_circuit_breaker
+from ..config import (
+    GEOCODE_CACHE_HARD_TTL_SECONDS,
+    GEOCODE_CACHE_TTL_SECONDS,
+    GEOCODE_RATE_LIMIT_QPS,
+    GEOCODE_SLOW_CALL_SECONDS,
+    STALE_CACHE_SECONDS,
+    TRACE_CELL_SIZE_M,
+    TRACE_GEOCODE_CONCURRENCY,
+    TRACE_SIMPLIFY_TOLERANCE_M,
+)
+from ..key_pool import (
+    REASON_DENIED,
+    REASON_EXHAUSTED,
+    KeyPool,
+    PooledKey,
+    keys_from_env,
+)
+from ..telemetry import record_upstream_call, start_span, traced_tool, track_upstream
+from .admin_boundary import coarse_reverse_geocode
+from .registry import service_registry
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 # 상수 정의
-GEOCODING_BASE_URL = "https://geocode.googleapis.com/v4beta/geocode/address"
-REVERSE_GEOCODING_BASE_URL = "https://geocode.googleapis.com/v4beta/geocode/location"
+GEOCODE_API_BASE_URL = "https://geocode.googleapis.com/v4beta/geocode"
+GEOCODING_BASE_URL = f"{GEOCODE_API_BASE_URL}/address"
+REVERSE_GEOCODING_BASE_URL = f"{GEOCODE_API_BASE_URL}/location"
+# 주소/역지오코딩 요청에 청구되는 SKU
+GEOCODING_SKU = "Geocoding"
+
+
+def _key_error(error: BaseException) -> Optional[str]:
+    """429/403 응답은 해당 API 키의 할당량/권한 문제이므로 키 풀에서 그 키를 일시 제외합니다."""
+    if isinstance(error, httpx.HTTPStatusError):
+        if error.response.status_code == 429:
+            return REASON_EXHAUSTED
+        if error.response.status_code == 403:
+            return REASON_DENIED
+    return None
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    """429를 제외한 4xx 응답은 요청 측 문제이므로 서킷 브레이커 실패로 세지 않습니다."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return True
 
 
 class GeocodingService:
     """
     Google Maps Geocoding API를 위한 래퍼 클래스입니다.
 
-    Geocoding 엔드포인트를 사용하며, 주소→좌표(geocode), 좌표→주소(reverse_geocode)를 제공합니다.
+    Geocoding 엔드포인트를 사용하며, 주소→좌표(geocode), 좌표→주소(reverse_geocode),
+    GPS 경로 일괄 역지오코딩(reverse_geocode_trace)을 제공합니다.
 
     Attributes:
-        api_key (str): Google Maps API 키
+        keys (KeyPool): API 키 풀 (키별 속도 제한기)
         latlng (str): 위도/경도 좌표
+        cache (ResultCache): 지오코딩 결과 캐시
+        address_breaker (CircuitBreaker): 주소 지오코딩 엔드포인트 서킷 브레이커 (프로세스 공용)
+        location_breaker (CircuitBreaker): 역지오코딩 엔드포인트 서킷 브레이커 (프로세스 공용)
+        client (httpx.AsyncClient): 연결 풀을 재사용하는 HTTP 클라이언트
 
     Raises:
         ValueError: API 키 환경변수가 설정되지 않은 경우
     """
 
-    def __init__(self, timeout: float = 5.0):
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        base_url: str = GEOCODE_API_BASE_URL,
+        cache_ttl: float = GEOCODE_CACHE_TTL_SECONDS,
+        cache_hard_ttl: float = GEOCODE_CACHE_HARD_TTL_SECONDS,
+        rate_limit: Optional[float] = GEOCODE_RATE_LIMIT_QPS,
+    ):
         """
         GeocodingService 인스턴스를 초기화합니다.
+
+        Args:
+            timeout (float, optional): API 요청 타임아웃 시간 (초). 기본값은 5.0초.
+            base_url (str, optional): v4beta geocode 엔드포인트 기본 URL.
+                로컬 대역 서버 등 다른 엔드포인트를 사용할 때 지정합니다.
+            cache_ttl (float, optional): 결과 캐시 유효 시간(소프트 TTL, 초). 0이면 캐시하지 않습니다.
+            cache_hard_ttl (float, optional): 캐시 하드 TTL (초). 소프트 TTL이 지난 결과는
+                이때까지 즉시 반환되며 백그라운드에서 갱신됩니다.
+            rate_limit (Optional[float], optional): 키별 초당 최대 API 요청 수. None이면 제한하지 않습니다.
         """
-        # 두 환경변수 중 하나를 사용 (우선순위: GOOGLE_PLACES_API_KEY > GOOGLE_MAPS_API_KEY)
-        self.api_key: Optional[str] = os.getenv("GOOGLE_PLACES_API_KEY") or os.getenv(
-            "GOOGLE_MAPS_API_KEY"
+        self.geocoding_url: str = f"{base_url}/address"
+        self.reverse_geocoding_url: str = f"{base_url}/location"
+        # 키 목록(GOOGLE_MAPS_API_KEYS)이 없으면 단일 키 환경변수 중 하나를 사용
+        # (우선순위: GOOGLE_PLACES_API_KEY > GOOGLE_MAPS_API_KEY)
+        api_keys = keys_from_env(
+            "GOOGLE_MAPS_API_KEYS", "GOOGLE_PLACES_API_KEY", "GOOGLE_MAPS_API_KEY"
         )
         self.timeout: float = timeout
+        self.cache = ResultCache(
+            "geocode", cache_ttl, stale_ttl=STALE_CACHE_SECONDS, hard_ttl=cache_hard_ttl
+        )
+        self.address_breaker = get_circuit_breaker(
+            "geocode.address",
+            GEOCODE_SLOW_CALL_SECONDS,
+            is_failure=_is_upstream_failure,
+        )
+        self.location_breaker = get_circuit_breaker(
+            "geocode.location",
+            GEOCODE_SLOW_CALL_SECONDS,
+            is_failure=_is_upstream_failure,
+        )
 
-        if not self.api_key:
+        if not api_keys:
             raise ValueError(
                 "Google Maps API 키가 설정되지 않았습니다. "
-                "환경변수 'GOOGLE_PLACES_API_KEY' 또는 'GOOGLE_MAPS_API_KEY'를 설정해주세요. "
+                "환경변수 'GOOGLE_MAPS_API_KEYS'(쉼표 구분 목록), 'GOOGLE_PLACES_API_KEY' 또는 'GOOGLE_MAPS_API_KEY'를 설정해주세요. "
                 "예시: GOOGLE_MAPS_API_KEY=AIza..."
             )
 
+        # 키는 요청 파라미터로 전달되므로 모든 키가 하나의 연결 풀을 함께 사용합니다.
+        self.keys = KeyPool("geocode", api_keys, rate_limit, classify=_key_error)
+        # 요청마다 새 연결을 맺지 않도록 연결 풀을 재사용합니다 (이벤트 루프별 인스턴스).
+        self.client = httpx.AsyncClient(timeout=self.timeout)
+
+    async def _get(
+        self, url: str, params: Dict[str, str], span_name: str, call: BreakerCall
+    ) -> httpx.Response:
+        """
+        키 풀에서 고른 키로 GET 요청을 보내고, 오류 상태 코드이면 HTTPStatusError를 발생시킵니다.
+
+        키 문제로 실패하면 풀의 다른 키로 다시 시도합니다. 키의 토큰(속도 제한 대기)은 시도마다
+        먼저 얻으므로, 업스트림 호출 추적(span_name 구간, track_upstream, call.track())에는 요청
+        하나만 포함됩니다.
+        """
+
+        async def request(pooled: PooledKey) -> httpx.Response:
+            with (
+                track_upstream("geocode"),
+                start_span(span_name, api="geocode") as span,
+                call.track(),
+            ):
+                response = await self.client.get(
+                    url, params={**params, "key": pooled.key}
+                )
+                span.set_attribute("http.status_code", response.status_code)
+                response.raise_for_status()
+                return response
+
+        return await self.keys.call(request)
+
+    async def aclose(self) -> None:
+        """연결 풀을 닫습니다."""
+        await self.client.aclose()
+
     async def geocode(self, address: str, language_code: str = "ko") -> Dict[str, Any]:
         """
         주소를 위도/경도 좌표로 변환합니다.
@@ -58,65 +175,145 @@ class GeocodingService:
             language_code (str, optional): 언어 코드(예: 'ko').
 
         Returns:
-            Dict[str, Any]: 좌표 및 주소 정보 또는 오류 정보
+            Dict[str, Any]: 좌표 및 주소 정보 또는 오류 정보.
+                업스트림 장애 시에는 만료된 마지막 캐시 결과에 "stale": True가 붙어 반환될 수 있습니다.
+
+        Note:
+            캐시 키에는 정규화된 주소(canonicalize_address)를 사용하므로 "서울특별시 강남구"와
+            "서울 강남구"처럼 표기만 다른 주소는 결과를 공유합니다. 성공 결과는 응답의
+            formattedAddress와 placeId로도 저장되어, 도로명/지번처럼 다른 형태로 입력된 같은 위치도
+            한 번 조회된 뒤에는 캐시에서 반환됩니다.
         """
+        key = self.address_key(address, language_code)
+        return await self.cache.get_or_fetch(
+            key, lambda: self._geocode_uncached(key, address, language_code)
+        )
+
+    @staticmethod
+    def address_key(address: str, language_code: str) -> str:
+        """주소 지오코딩 결과의 캐시 키를 반환합니다."""
+        return ResultCache.make_key(
+            "address", canonicalize_address(address), language_code
+        )
+
+    @staticmethod
+    def place_id_key(place_id: str, language_code: str) -> str:
+        """placeId로 저장된 주소 지오코딩 결과의 캐시 키를 반환합니다."""
+        return ResultCache.make_key("place", place_id, language_code)
+
+    async def get_cached_by_place_id(
+        self, place_id: str, language_code: str = "ko"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        placeId로 저장된 주소 지오코딩 결과를 반환합니다. 없으면 None입니다 (업스트림 호출 없음).
+
+        Places API 검색 결과의 id는 Geocoding placeId와 같으므로 장소 좌표/주소 재조회에 사용할 수 있습니다.
+        """
+        return await self.cache.get(self.place_id_key(place_id, language_code))
+
+    async def _store_secondary_keys(
+        self, key: str, result: Dict[str, Any], language_code: str
+    ) -> None:
+        """성공 결과를 formattedAddress/placeId 보조 키로도 저장합니다."""
+        secondary = set()
+        if result.get("formatted_address"):
+            secondary.add(self.address_key(result["formatted_address"], language_code))
+        if result.get("place_id"):
+            secondary.add(self.place_id_key(result["place_id"], language_code))
+        for secondary_key in secondary - {key}:
+            await self.cache.set(secondary_key, result)
+
+    async def _geocode_uncached(
+        self, key: str, address: str, language_code: str
+    ) -> Dict[str, Any]:
+        """캐시를 거치지 않고 주소 지오코딩 API를 호출합니다. 장애 시 key의 만료된 캐시 항목으로 대체합니다."""
         # 주소를 URL 경로로 인코딩
-        encoded_address = quote(address, safe='')
-        url = f"{GEOCODING_BASE_URL}/{encoded_address}"
-        
-        # 쿼리 파라미터로 API 키와 언어 설정
-        params = {"key": self.api_key}
+        encoded_address = quote(address, safe="")
+        url = f"{self.geocoding_url}/{encoded_address}"
+
+        # 쿼리 파라미터로 언어 설정 (API 키는 요청 시 키 풀에서 선택)
+        params = {}
         if language_code:
             params["languageCode"] = language_code
 
-        try:
-            logger.info(f"지오코딩 요청: {address}")
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
+        with self.address_breaker.attempt() as call:
+            if not call.allowed:
+                logger.warning(f"서킷 브레이커 열림, 지오코딩 생략: {address}")
+                return await self.cache.stale_or(
+                    key,
+                    {
+                        "error": "지오코딩 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+                        "address": address,
+                    },
+                )
+            try:
+                logger.info(f"지오코딩 요청: {address}")
+                record_upstream_call("geocode", GEOCODING_SKU)
+                response = await self._get(
+                    url, params, "upstream.geocode.address", call
+                )
                 data = response.json()
-                
-            # v4beta 응답 구조 처리
-            logger.info(f"v4beta 응답 데이터: {data}")
-            
-            results = data.get("results", [])
-            if not results:
-                return {"error": "주소를 찾을 수 없습니다.", "address": address}
-
-            result = results[0]
-            # v4beta 구조: location 직접 참조, formattedAddress 등
-            location = result.get("location", {})
-            return {
-                "lat": location.get("latitude"),
-                "lng": location.get("longitude"), 
-                "formatted_address": result.get("formattedAddress"),
-                "place_id": result.get("placeId"),
-                "location_type": result.get("granularity"),  # v4beta에서는 granularity
-                "address_components": result.get("addressComponents", []),
-                "input_address": address,
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"지오코딩 상태 오류: {e}")
-            return {
-                "error": f"지오코딩 중 HTTP 상태 오류가 발생했습니다: {e}",
-                "address": address,
-            }
-        except httpx.RequestError as e:
-            logger.error(f"지오코딩 요청 실패: {e}")
-            return {
-                "error": f"지오코딩 중 오류가 발생했습니다: {e}",
-                "address": address,
-            }
-        except Exception as e:
-            logger.error(f"지오코딩 예상치 못한 오류: {e}")
-            return {
-                "error": f"예상치 못한 오류가 발생했습니다: {e}",
-                "address": address,
-            }
+
+                # v4beta 응답 구조 처리
+                logger.info(f"v4beta 응답 데이터: {data}")
+
+                results = data.get("results", [])
+                if not results:
+                    return {"error": "주소를 찾을 수 없습니다.", "address": address}
+
+                result = results[0]
+                # v4beta 구조: location 직접 참조, formattedAddress 등
+                location = result.get("location", {})
+                geocoded = {
+                    "lat": location.get("latitude"),
+                    "lng": location.get("longitude"),
+                    "formatted_address": result.get("formattedAddress"),
+                    "place_id": result.get("placeId"),
+                    "location_type": result.get(
+                        "granularity"
+                    ),  # v4beta에서는 granularity
+                    "address_components": result.get("addressComponents", []),
+                    "input_address": address,
+                }
+                await self._store_secondary_keys(key, geocoded, language_code)
+                return geocoded
+
+            except httpx.HTTPStatusError as e:
+                logger.error(f"지오코딩 상태 오류: {e}")
+                error = {
+                    "error": f"지오코딩 중 HTTP 상태 오류가 발생했습니다: {e}",
+                    "address": address,
+                }
+                return (
+                    await self.cache.stale_or(key, error)
+                    if _is_upstream_failure(e)
+                    else error
+                )
+            except httpx.RequestError as e:
+                logger.error(f"지오코딩 요청 실패: {e}")
+                return await self.cache.stale_or(
+                    key,
+                    {
+                        "error": f"지오코딩 중 오류가 발생했습니다: {e}",
+                        "address": address,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"지오코딩 예상치 못한 오류: {e}")
+                return await self.cache.stale_or(
+                    key,
+                    {
+                        "error": f"예상치 못한 오류가 발생했습니다: {e}",
+                        "address": address,
+                    },
+                )
 
     async def reverse_geocode(
-        self, lat: float, lng: float, language_code: str = "ko"
+        self,
+        lat: float,
+        lng: float,
+        language_code: str = "ko",
+        granularity: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         위도/경도 좌표를 주소로 변환합니다.
@@ -125,81 +322,264 @@ class GeocodingService:
             lat (float): 위도
             lng (float): 경도
             language_code (str, optional): 언어 코드(예: 'ko'). 기본값은 Google 기본언어
+            granularity (Optional[str], optional): 필요한 가장 세밀한 주소 수준.
+                "sido", "sigungu", "dong"이면 행정구역 경계 색인(ADMIN_BOUNDARY_INDEX_PATH)에서
+                API 호출 없이 답하고, 색인이 없거나 답할 수 없으면 API를 호출합니다.
+                None이면 항상 API를 호출합니다 (도로명/건물 수준).
 
         Returns:
-            Dict[str, Any]: 주소 정보 또는 오류 정보
+            Dict[str, Any]: 주소 정보 또는 오류 정보.
+                업스트림 장애 시에는 만료된 마지막 캐시 결과에 "stale": True가 붙어 반환되거나,
+                캐시가 없으면 행정구역 수준의 오프라인 결과("source": "offline", "degraded": True)가
+                반환될 수 있습니다.
+        """
+        if granularity:
+            coarse = coarse_reverse_geocode(lat, lng, granularity, language_code)
+            if coarse is not None:
+                return coarse
+        key = ResultCache.make_key(
+            "location", f"{lat:.6f}", f"{lng:.6f}", language_code
+        )
+        return await self.cache.get_or_fetch(
+            key, lambda: self._reverse_geocode_uncached(key, lat, lng, language_code)
+        )
+
+    async def _reverse_geocode_uncached(
+        self, key: str, lat: float, lng: float, language_code: str
+    ) -> Dict[str, Any]:
+        """
+        캐시를 거치지 않고 역지오코딩 API를 호출합니다.
+
+        장애 시 key의 만료된 캐시 항목으로, 없으면 오프라인 행정구역 결과로 대체합니다.
         """
         # 좌표를 URL 경로로 인코딩
         location_path = f"{lat},{lng}"
-        encoded_location = quote(location_path, safe='')
-        url = f"{REVERSE_GEOCODING_BASE_URL}/{encoded_location}"
-        
-        # 쿼리 파라미터로 API 키와 언어 설정
-        params = {"key": self.api_key}
+        encoded_location = quote(location_path, safe="")
+        url = f"{self.reverse_geocoding_url}/{encoded_location}"
+
+        # 쿼리 파라미터로 언어 설정 (API 키는 요청 시 키 풀에서 선택)
+        params = {}
         if language_code:
             params["language_code"] = language_code
 
-        try:
-            logger.info(f"역지오코딩 요청: lat={lat}, lng={lng}")
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
+        with self.location_breaker.attempt() as call:
+            if not call.allowed:
+                logger.warning(
+                    f"서킷 브레이커 열림, 역지오코딩 생략: lat={lat}, lng={lng}"
+                )
+                return await self._location_fallback(
+                    key,
+                    lat,
+                    lng,
+                    language_code,
+                    {
+                        "error": "역지오코딩 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+                        "lat": lat,
+                        "lng": lng,
+                    },
+                )
+            try:
+                logger.info(f"역지오코딩 요청: lat={lat}, lng={lng}")
+                record_upstream_call("geocode", GEOCODING_SKU)
+                response = await self._get(
+                    url, params, "upstream.geocode.location", call
+                )
                 data = response.json()
 
-            # v4beta 응답 구조 처리
-            results = data.get("results", [])
-            if not results:
+                # v4beta 응답 구조 처리
+                results = data.get("results", [])
+                if not results:
+                    return {
+                        "error": "해당 좌표의 주소를 찾을 수 없습니다.",
+                        "lat": lat,
+                        "lng": lng,
+                    }
+
+                result = results[0]
                 return {
-                    "error": "해당 좌표의 주소를 찾을 수 없습니다.",
+                    "formatted_address": result.get("formattedAddress"),
+                    "place_id": result.get("placeId"),
+                    "location_type": result.get("granularity"),
+                    "address_components": result.get("addressComponents", []),
+                    "input_coordinates": {"lat": lat, "lng": lng},
+                }
+
+            except httpx.HTTPStatusError as e:
+                logger.error(f"역지오코딩 상태 오류: {e}")
+                error = {
+                    "error": f"역지오코딩 중 HTTP 상태 오류가 발생했습니다: {e}",
                     "lat": lat,
                     "lng": lng,
                 }
+                return (
+                    await self._location_fallback(key, lat, lng, language_code, error)
+                    if _is_upstream_failure(e)
+                    else error
+                )
+            except httpx.RequestError as e:
+                logger.error(f"역지오코딩 요청 실패: {e}")
+                return await self._location_fallback(
+                    key,
+                    lat,
+                    lng,
+                    language_code,
+                    {
+                        "error": f"역지오코딩 중 오류가 발생했습니다: {e}",
+                        "lat": lat,
+                        "lng": lng,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"역지오코딩 예상치 못한 오류: {e}")
+                return await self._location_fallback(
+                    key,
+                    lat,
+                    lng,
+                    language_code,
+                    {
+                        "error": f"예상치 못한 오류가 발생했습니다: {e}",
+                        "lat": lat,
+                        "lng": lng,
+                    },
+                )
+
+    async def _location_fallback(
+        self,
+        key: str,
+        lat: float,
+        lng: float,
+        language_code: str,
+        error: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """역지오코딩 장애 대체 응답: 만료된 캐시 → 가장 세밀한 오프라인 행정구역 결과 → error 순입니다."""
+        result = await self.cache.stale_or(key, error)
+        if result is not error:
+            return result
+        coarse = coarse_reverse_geocode(lat, lng, None, language_code, fallback=True)
+        return error if coarse is None else {**coarse, "degraded": True}
+
+    async def reverse_geocode_trace(
+        self,
+        points: Sequence[Tuple[float, float]],
+        language_code: str = "ko",
+        tolerance_m: float = TRACE_SIMPLIFY_TOLERANCE_M,
+        cell_m: float = TRACE_CELL_SIZE_M,
+        concurrency: int = TRACE_GEOCODE_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """
+        GPS 경로(좌표 목록)의 모든 점에 주소를 일괄로 할당합니다.
+
+        1. Douglas–Peucker로 경로를 단순화하고(tolerance_m), 이동 거리 cell_m마다 최소 한 점을 남깁니다.
+        2. 남은 점을 cell_m 크기의 격자 칸으로 묶어, 칸마다 첫 점 하나만 역지오코딩합니다
+           (동시 요청 수는 concurrency로 제한하며, 캐시/속도 제한/서킷 브레이커는 reverse_geocode와 같습니다).
+        3. 원래의 각 점에는 자기 칸의 주소를, 자기 칸이 역지오코딩되지 않았으면
+           경로상 가장 가까운 남은 점의 주소를 할당합니다.
+
+        Args:
+            points (Sequence[Tuple[float, float]]): 경로 순서대로 정렬된 (위도, 경도) 목록
+            language_code (str, optional): 언어 코드(예: 'ko')
+            tolerance_m (float, optional): 경로 단순화 허용 오차 (미터). 0이면 단순화하지 않습니다.
+            cell_m (float, optional): 격자 칸 크기 (미터)
+            concurrency (int, optional): 동시에 보낼 최대 역지오코딩 요청 수
 
-            result = results[0]
-            return {
-                "formatted_address": result.get("formattedAddress"),
-                "place_id": result.get("placeId"),
-                "location_type": result.get("granularity"),
-                "address_components": result.get("addressComponents", []),
-                "input_coordinates": {"lat": lat, "lng": lng},
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"역지오코딩 상태 오류: {e}")
-            return {
-                "error": f"역지오코딩 중 HTTP 상태 오류가 발생했습니다: {e}",
-                "lat": lat,
-                "lng": lng,
-            }
-        except httpx.RequestError as e:
-            logger.error(f"역지오코딩 요청 실패: {e}")
-            return {
-                "error": f"역지오코딩 중 오류가 발생했습니다: {e}",
-                "lat": lat,
-                "lng": lng,
-            }
-        except Exception as e:
-            logger.error(f"역지오코딩 예상치 못한 오류: {e}")
-            return {
-                "error": f"예상치 못한 오류가 발생했습니다: {e}",
-                "lat": lat,
-                "lng": lng,
-            }
-
-
-# 전역 인스턴스를 함수로 지연 로딩 (싱글톤)
-_geocoding_service_instance: Optional[GeocodingService] = None
-
-
-def get_geocoding_service() -> GeocodingService:
-    """GeocodingService 싱글톤 인스턴스를 반환합니다."""
-    global _geocoding_service_instance
-    if _geocoding_service_instance is None:
-        _geocoding_service_instance = GeocodingService()
-    return _geocoding_service_instance
-
-
-async def geocode_tool(address: str, language: str, tool_context: ToolContext) -> Dict[str, Any]:
+        Returns:
+            Dict[str, Any]: 다음 키를 가진 결과 또는 오류 정보
+                - addresses: 역지오코딩한 칸별 결과 목록 (reverse_geocode 결과 형식)
+                - point_addresses: 원래 점마다 addresses의 인덱스
+                - stats: points(원래 점 수), simplified_points(단순화 후 점 수),
+                  requests(역지오코딩 요청 수), failed(오류 결과 수),
+                  call_reduction(점마다 호출할 때 대비 줄어든 요청 비율)
+        """
+        import numpy as np
+
+        from .geo import (
+            cumulative_distance_m,
+            grid_cells,
+            haversine_m,
+            simplify_polyline,
+        )
+
+        if not points:
+            return {"error": "경로에 좌표가 없습니다."}
+        coords = np.asarray(points, dtype=float)
+        if coords.ndim != 2 or coords.shape[1] != 2 or not np.isfinite(coords).all():
+            return {"error": "경로 좌표는 (위도, 경도) 숫자 쌍의 목록이어야 합니다."}
+        lats, lngs = coords[:, 0], coords[:, 1]
+        n = len(coords)
+
+        kept = simplify_polyline(lats, lngs, tolerance_m)
+        if n > 1 and cell_m > 0:
+            # 직선 구간이 길게 단순화되어도 cell_m을 이동할 때마다 한 점을 남깁니다.
+            steps = np.floor(cumulative_distance_m(lats, lngs) / cell_m)
+            kept = np.union1d(kept, np.flatnonzero(np.diff(steps)) + 1)
+
+        cells = (
+            grid_cells(lats, lngs, cell_m)
+            if cell_m > 0
+            else np.stack((np.arange(n), np.zeros(n, dtype=np.int64)), axis=1)
+        )
+        cell_index: Dict[Tuple[int, int], int] = {}
+        representatives: List[int] = []
+        for i in kept:
+            cell = (int(cells[i, 0]), int(cells[i, 1]))
+            if cell not in cell_index:
+                cell_index[cell] = len(representatives)
+                representatives.append(int(i))
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def lookup(i: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.reverse_geocode(
+                    float(lats[i]), float(lngs[i]), language_code
+                )
+
+        addresses = await asyncio.gather(*(lookup(i) for i in representatives))
+
+        # 남은 점 사이에 있던 점은 경로상 앞/뒤의 남은 점 중 가까운 쪽의 칸을 사용합니다.
+        kept_cells = np.array(
+            [cell_index[(int(cells[i, 0]), int(cells[i, 1]))] for i in kept],
+            dtype=np.int64,
+        )
+        after = np.clip(np.searchsorted(kept, np.arange(n)), 0, len(kept) - 1)
+        before = np.clip(after - 1, 0, len(kept) - 1)
+        to_after = haversine_m(lats, lngs, lats[kept[after]], lngs[kept[after]])
+        to_before = haversine_m(lats, lngs, lats[kept[before]], lngs[kept[before]])
+        nearest = np.where(to_before <= to_after, kept_cells[before], kept_cells[after])
+        point_addresses = [
+            cell_index.get((int(cells[i, 0]), int(cells[i, 1])), int(nearest[i]))
+            for i in range(n)
+        ]
+
+        requests = len(representatives)
+        stats = {
+            "points": n,
+            "simplified_points": int(len(kept)),
+            "requests": requests,
+            "failed": sum(1 for address in addresses if "error" in address),
+            "call_reduction": round(1 - requests / n, 4),
+        }
+        logger.info(f"경로 역지오코딩: {stats}")
+        return {
+            "addresses": list(addresses),
+            "point_addresses": point_addresses,
+            "stats": stats,
+        }
+
+
+# 이벤트 루프별 인스턴스를 레지스트리에서 지연 생성합니다.
+service_registry.register("geocoding", GeocodingService)
+
+
+async def get_geocoding_service() -> GeocodingService:
+    """현재 이벤트 루프의 GeocodingService 인스턴스를 반환합니다."""
+    return await service_registry.get("geocoding")
+
+
+@traced_tool
+async def geocode_tool(
+    address: str, language: str, tool_context: ToolContext
+) -> Dict[str, Any]:
     """
     주소를 좌표로 변환하는 ADK 도구입니다.
 
@@ -212,7 +592,7 @@ async def geocode_tool(address: str, language: str, tool_context: ToolContext) -
     """
     logger.info(f"llm_language_code_data: {language}")
 
-    service = get_geocoding_service()
+    service = await get_geocoding_service()
     result = await service.geocode(address=address, language_code=language)
 
     # 상태에 저장
@@ -222,6 +602,7 @@ async def geocode_tool(address: str, language: str, tool_context: ToolContext) -
     tool_context.state["geocoding_history"].append(
         {
             "address": address,
+            "language": language,
             "result": result,
             "timestamp": datetime.now().isoformat(),
         }
@@ -230,8 +611,9 @@ async def geocode_tool(address: str, language: str, tool_context: ToolContext) -
     return result
 
 
+@traced_tool
 async def reverse_geocode_tool(
-    lat: float, lng: float, language: str, tool_context: ToolContext
+    lat: float, lng: float, language: str, granularity: str, tool_context: ToolContext
 ) -> Dict[str, Any]:
     """
     좌표를 주소로 변환하는 ADK 도구입니다.
@@ -239,6 +621,8 @@ async def reverse_geocode_tool(
     Args:
         lat (float): 위도
         lng (float): 경도
+        granularity (str): 필요한 주소 수준. 시/도만 필요하면 "sido", 시/군/구까지면 "sigungu",
+            읍/면/동까지면 "dong", 도로명/건물 등 상세 주소가 필요하면 빈 문자열 ""
         tool_context (ToolContext): ADK 도구 컨텍스트
 
     Returns:
@@ -246,9 +630,9 @@ async def reverse_geocode_tool(
     """
     logger.info(f"llm_language_code_data: {language}")
 
-    service = get_geocoding_service()
+    service = await get_geocoding_service()
     result = await service.reverse_geocode(
-        lat=lat, lng=lng, language_code=language
+        lat=lat, lng=lng, language_code=language, granularity=granularity or None
     )
 
     # 상태에 저장
@@ -258,6 +642,7 @@ async def reverse_geocode_tool(
     tool_context.state["reverse_geocoding_history"].append(
         {
             "coordinates": {"lat": lat, "lng": lng},
+            "granularity": granularity,
             "result": result,
             "timestamp": datetime.now().isoformat(),
         }
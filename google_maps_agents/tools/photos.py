@@ -0,0 +1,540 @@
+"""
+장소 사진 미디어를 가져와 디스크에 캐시하는 서비스를 정의하는 파일입니다.
+
+places.photos 필드는 사진 리소스 이름만 반환하므로, 클라이언트가 사진을 보려면 사진마다
+GetPhotoMedia(Place Details Photos SKU)를 호출해야 합니다. PhotoService는 결과 목록의 썸네일을
+동시에 가져와 내용 주소(SHA-256) 방식의 디스크 캐시에 저장하고, serve.py가 제공하는 고정 로컬 URL
+(PHOTO_URL_PREFIX/<digest>.<ext>)을 반환합니다. 같은 사진/크기를 다시 요청하면 업스트림 호출 없이
+캐시에서 응답합니다.
+
+디스크 레이아웃 (PHOTO_CACHE_DIR):
+    blobs/<digest[:2]>/<digest>.<ext>   사진 본문 (같은 내용은 한 번만 저장)
+    refs/<sha1(사진 이름, 크기)>         "<digest>.<ext>" (요청 -> 본문 참조)
+
+모든 쓰기는 임시 파일 + os.replace로 원자적으로 수행되므로 여러 워커 프로세스가 같은 디렉터리를
+공유할 수 있습니다. 캐시 크기가 PHOTO_CACHE_MAX_BYTES를 넘으면 마지막 사용 시각(mtime)이 가장 오래된
+본문부터 삭제하며, 본문이 사라진 참조는 다음 조회에서 캐시 미스로 처리됩니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..cache import RESULT_COALESCED, RESULT_HIT, RESULT_MISS
+from ..circuit_breaker import get_circuit_breaker
+from ..config import (
+    PHOTO_CACHE_DIR,
+    PHOTO_CACHE_MAX_BYTES,
+    PHOTO_FETCH_CONCURRENCY,
+    PHOTO_THUMBNAIL_MAX_HEIGHT_PX,
+    PHOTO_THUMBNAIL_MAX_WIDTH_PX,
+    PHOTO_URL_PREFIX,
+    PLACES_SLOW_CALL_SECONDS,
+)
+from ..key_pool import PooledKey
+from ..telemetry import record_upstream_call, start_span, track_upstream
+from ..telemetry.metrics import CACHE_REQUESTS, registry
+from .registry import service_registry
+
+if TYPE_CHECKING:
+    from .places import PlacesService
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+PHOTO_SKU = "Place Details Photos"
+# GetPhotoMedia의 max_width_px / max_height_px 허용 범위 상한
+MAX_PHOTO_PX = 4800
+# 캐시 크기를 초과하면 이 비율까지 줄입니다 (삭제가 매번 일어나지 않도록 여유를 둡니다).
+EVICTION_TARGET_RATIO = 0.9
+
+_CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+_EXTENSION_CONTENT_TYPES = {
+    ext: ctype for ctype, ext in _CONTENT_TYPE_EXTENSIONS.items()
+}
+# 서빙 경로에서 허용하는 파일 이름 (경로 조작 방지)
+_BLOB_NAME = re.compile(r"^([0-9a-f]{64})(\.(?:jpg|png|webp|gif|bin))$")
+
+PHOTO_CACHE_EVICTIONS = registry.counter(
+    "photo_cache_evictions_total",
+    "Photo blobs removed from the on-disk cache by the LRU size cap.",
+)
+PHOTO_CACHE_BYTES = registry.gauge(
+    "photo_cache_bytes",
+    "Approximate size of the on-disk photo cache in bytes.",
+)
+
+
+@dataclass
+class CachedPhoto:
+    """
+    디스크 캐시에 저장된 사진 하나입니다.
+
+    Attributes:
+        digest (str): 본문의 SHA-256 (16진수)
+        extension (str): 파일 확장자 (예: ".jpg")
+        size_bytes (int): 본문 크기
+    """
+
+    digest: str
+    extension: str
+    size_bytes: int
+
+    @property
+    def filename(self) -> str:
+        return f"{self.digest}{self.extension}"
+
+    @property
+    def content_type(self) -> str:
+        return _EXTENSION_CONTENT_TYPES.get(self.extension, "application/octet-stream")
+
+    @property
+    def url(self) -> str:
+        """serve.py가 제공하는 고정 로컬 URL입니다. 내용이 같으면 URL도 같습니다."""
+        return f"{PHOTO_URL_PREFIX.rstrip('/')}/{self.filename}"
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 이름을 바꿔, 다른 프로세스가 쓰다 만 파일을 읽지 않도록 합니다."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class PhotoCache:
+    """
+    내용 주소 방식의 사진 디스크 캐시입니다 (LRU 크기 제한).
+
+    Attributes:
+        directory (str): 캐시 디렉터리
+        max_bytes (int): 최대 크기 (바이트). 0 이하이면 제한하지 않습니다.
+
+    Example:
+        >>> cache = PhotoCache("/tmp/photos", max_bytes=64 * 1024 * 1024)
+        >>> photo = cache.store("places/X/photos/Y|400x400", data, "image/jpeg")
+        >>> cache.lookup("places/X/photos/Y|400x400").url
+        '/photos/3f2a....jpg'
+    """
+
+    def __init__(
+        self, directory: str = PHOTO_CACHE_DIR, max_bytes: int = PHOTO_CACHE_MAX_BYTES
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # 프로세스가 추정한 캐시 크기 (None이면 아직 디렉터리를 스캔하지 않음)
+        self._size: Optional[int] = None
+
+    def _ref_path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, "refs", hashlib.sha1(key.encode()).hexdigest()
+        )
+
+    def _blob_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], f"{digest}{extension}")
+
+    def path(self, filename: str) -> Optional[str]:
+        """
+        서빙할 본문 파일 경로를 반환합니다. 잘못된 이름이거나 없으면 None입니다.
+
+        Args:
+            filename (str): "<digest>.<ext>" 형식의 파일 이름 (CachedPhoto.filename)
+        """
+        match = _BLOB_NAME.match(filename)
+        if match is None:
+            return None
+        path = self._blob_path(match.group(1), match.group(2))
+        return path if os.path.isfile(path) else None
+
+    @staticmethod
+    def content_type(filename: str) -> str:
+        """본문 파일 이름의 확장자로 Content-Type을 반환합니다."""
+        return _EXTENSION_CONTENT_TYPES.get(
+            os.path.splitext(filename)[1], "application/octet-stream"
+        )
+
+    def lookup(self, key: str) -> Optional[CachedPhoto]:
+        """요청 키의 캐시된 사진을 반환하고 마지막 사용 시각을 갱신합니다. 없으면 None입니다."""
+        ref_path = self._ref_path(key)
+        try:
+            with open(ref_path, encoding="utf-8") as f:
+                match = _BLOB_NAME.match(f.read().strip())
+        except OSError:
+            return None
+        if match is None:
+            return None
+        digest, extension = match.groups()
+        blob_path = self._blob_path(digest, extension)
+        try:
+            # LRU 순서는 mtime으로 관리합니다 (noatime 마운트에서도 동작).
+            os.utime(blob_path)
+            size = os.path.getsize(blob_path)
+        except OSError:
+            # 크기 제한으로 본문이 삭제된 참조입니다.
+            try:
+                os.unlink(ref_path)
+            except OSError:
+                pass
+            return None
+        return CachedPhoto(digest, extension, size)
+
+    def store(self, key: str, data: bytes, content_type: Optional[str]) -> CachedPhoto:
+        """사진 본문을 저장하고 요청 키가 본문을 가리키도록 합니다."""
+        content_type = (content_type or "").split(";")[0].strip().lower()
+        photo = CachedPhoto(
+            digest=hashlib.sha256(data).hexdigest(),
+            extension=_CONTENT_TYPE_EXTENSIONS.get(content_type, ".bin"),
+            size_bytes=len(data),
+        )
+        blob_path = self._blob_path(photo.digest, photo.extension)
+        if os.path.exists(blob_path):
+            os.utime(blob_path)
+        else:
+            _atomic_write(blob_path, data)
+            if self._size is not None:
+                self._size += photo.size_bytes
+        _atomic_write(self._ref_path(key), photo.filename.encode())
+        self._enforce_limit()
+        return photo
+
+    def _scan(self) -> List[Tuple[str, os.stat_result]]:
+        """본문 파일의 (경로, stat) 목록을 반환합니다."""
+        entries = []
+        blobs_dir = os.path.join(self.directory, "blobs")
+        for root, _, files in os.walk(blobs_dir):
+            for name in files:
+                if name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    entries.append((path, os.stat(path)))
+                except OSError:
+                    continue
+        return entries
+
+    def _sweep_refs(self) -> int:
+        """본문이 삭제된 요청 키 참조 파일을 지우고 지운 수를 반환합니다."""
+        removed = 0
+        refs_dir = os.path.join(self.directory, "refs")
+        try:
+            names = os.listdir(refs_dir)
+        except OSError:
+            return 0
+        for name in names:
+            if name.startswith(".tmp-"):
+                continue
+            ref_path = os.path.join(refs_dir, name)
+            try:
+                with open(ref_path, encoding="utf-8") as f:
+                    match = _BLOB_NAME.match(f.read().strip())
+            except OSError:
+                continue
+            if match is not None and os.path.exists(self._blob_path(*match.groups())):
+                continue
+            try:
+                os.unlink(ref_path)
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _enforce_limit(self) -> None:
+        """
+        추정 크기가 한도를 넘으면 디렉터리를 다시 스캔하여 오래 사용하지 않은 본문부터 삭제합니다.
+
+        본문을 삭제했으면 그 본문을 가리키던 참조 파일도 함께 정리합니다.
+        """
+        if self.max_bytes <= 0:
+            return
+        if self._size is not None and self._size <= self.max_bytes:
+            return
+        entries = self._scan()
+        total = sum(stat.st_size for _, stat in entries)
+        evicted = False
+        if total > self.max_bytes:
+            target = self.max_bytes * EVICTION_TARGET_RATIO
+            for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= stat.st_size
+                evicted = True
+                PHOTO_CACHE_EVICTIONS.inc()
+        if evicted:
+            self._sweep_refs()
+        self._size = total
+        PHOTO_CACHE_BYTES.set(total)
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    """잘못된 요청/권한 오류와 4xx 응답(429 제외)은 업스트림 장애로 세지 않습니다."""
+    from google.api_core.exceptions import InvalidArgument, NotFound, PermissionDenied
+
+    if isinstance(error, (InvalidArgument, NotFound, PermissionDenied)):
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
+class PhotoService:
+    """
+    장소 사진 썸네일을 가져와 디스크 캐시를 통해 제공하는 서비스입니다.
+
+    GetPhotoMedia는 PlacesService의 API 키 풀(키별 gRPC 클라이언트와 속도 제한기)을 재사용하며,
+    반환된 photo_uri의 본문은 httpx 연결 풀로 내려받습니다.
+
+    Attributes:
+        places (PlacesService): 현재 이벤트 루프의 장소 검색 서비스
+        cache (PhotoCache): 사진 디스크 캐시
+        timeout (float): 요청 타임아웃 (초)
+        client (httpx.AsyncClient): 사진 본문을 내려받는 HTTP 클라이언트
+        breaker (CircuitBreaker): GetPhotoMedia 엔드포인트 서킷 브레이커 (프로세스 공용)
+
+    Example:
+        >>> service = await get_photo_service()
+        >>> photos = await service.fetch_many(["places/X/photos/Y"], max_width_px=400)
+        >>> photos[0]["url"]
+        '/photos/3f2a....jpg'
+    """
+
+    def __init__(
+        self,
+        places: "PlacesService",
+        cache: Optional[PhotoCache] = None,
+        timeout: float = 15.0,
+    ):
+        self.places = places
+        self.cache = cache or PhotoCache()
+        self.timeout = timeout
+        self.client = httpx.AsyncClient(timeout=timeout, follow_redirects=True)
+        self.breaker = get_circuit_breaker(
+            "places.photo_media",
+            PLACES_SLOW_CALL_SECONDS,
+            is_failure=_is_upstream_failure,
+        )
+        # 요청 키 -> 진행 중인 다운로드 (같은 사진의 동시 요청을 하나로 합칩니다)
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    async def aclose(self) -> None:
+        """연결 풀을 닫습니다. gRPC 채널은 PlacesService가 정리합니다."""
+        await self.client.aclose()
+
+    @staticmethod
+    def cache_key(
+        name: str, max_width_px: Optional[int], max_height_px: Optional[int]
+    ) -> str:
+        """사진 리소스 이름과 요청 크기로 캐시 키를 만듭니다."""
+        return f"{name}|{max_width_px or 0}x{max_height_px or 0}"
+
+    async def fetch(
+        self,
+        name: str,
+        max_width_px: Optional[int] = PHOTO_THUMBNAIL_MAX_WIDTH_PX,
+        max_height_px: Optional[int] = PHOTO_THUMBNAIL_MAX_HEIGHT_PX,
+    ) -> Dict[str, Any]:
+        """
+        사진 하나를 캐시에서 찾거나 업스트림에서 가져와 저장합니다.
+
+        Args:
+            name (str): 사진 리소스 이름 (places.photos[].name, 예: "places/ChIJ.../photos/AUc...")
+            max_width_px (Optional[int]): 최대 가로 크기 (1~4800). 가로/세로 중 하나는 필요합니다.
+            max_height_px (Optional[int]): 최대 세로 크기 (1~4800)
+
+        Returns:
+            Dict[str, Any]:
+                성공 시: {"name", "url", "digest", "content_type", "size_bytes"}
+                실패 시: {"error": "오류메시지", "name": 사진 이름}
+        """
+        max_width_px = min(max_width_px, MAX_PHOTO_PX) if max_width_px else None
+        max_height_px = min(max_height_px, MAX_PHOTO_PX) if max_height_px else None
+        if not max_width_px and not max_height_px:
+            return {
+                "error": "max_width_px 또는 max_height_px가 필요합니다.",
+                "name": name,
+            }
+
+        key = self.cache_key(name, max_width_px, max_height_px)
+        # 참조 읽기와 mtime 갱신은 디스크 I/O이므로 이벤트 루프 밖에서 실행합니다.
+        cached = await asyncio.to_thread(self.cache.lookup, key)
+        if cached is not None:
+            CACHE_REQUESTS.inc(cache="photos", result=RESULT_HIT)
+            return {"name": name, **self._describe(cached)}
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            CACHE_REQUESTS.inc(cache="photos", result=RESULT_COALESCED)
+            return await asyncio.shield(pending)
+
+        CACHE_REQUESTS.inc(cache="photos", result=RESULT_MISS)
+        future: "asyncio.Future[Dict[str, Any]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            result = await self._fetch_uncached(key, name, max_width_px, max_height_px)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def fetch_many(
+        self,
+        names: List[str],
+        max_width_px: Optional[int] = PHOTO_THUMBNAIL_MAX_WIDTH_PX,
+        max_height_px: Optional[int] = PHOTO_THUMBNAIL_MAX_HEIGHT_PX,
+        concurrency: int = PHOTO_FETCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사진을 최대 concurrency개씩 동시에 가져옵니다. 결과 순서는 names와 같습니다.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_one(name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.fetch(name, max_width_px, max_height_px)
+
+        with start_span("places.photos.fetch_many", **{"photos.count": len(names)}):
+            return list(await asyncio.gather(*(fetch_one(name) for name in names)))
+
+    async def _fetch_uncached(
+        self,
+        key: str,
+        name: str,
+        max_width_px: Optional[int],
+        max_height_px: Optional[int],
+    ) -> Dict[str, Any]:
+        """GetPhotoMedia로 photo_uri를 받아 본문을 내려받고 디스크 캐시에 저장합니다."""
+        from google.api_core.exceptions import GoogleAPIError
+        from google.maps.places_v1.types import GetPhotoMediaRequest, PhotoMedia
+
+        with self.breaker.attempt() as call:
+            if not call.allowed:
+                logger.warning(f"서킷 브레이커 열림, 사진 요청 생략: {name}")
+                return {
+                    "error": "사진 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+                    "name": name,
+                }
+            try:
+                request = GetPhotoMediaRequest(
+                    name=f"{name}/media",
+                    max_width_px=max_width_px or 0,
+                    max_height_px=max_height_px or 0,
+                    skip_http_redirect=True,
+                )
+                record_upstream_call("places", PHOTO_SKU)
+
+                # 키 풀이 시도마다 키의 토큰(속도 제한 대기)을 먼저 얻으므로, 추적 구간에는
+                # 업스트림 요청 하나만 포함됩니다. 다른 키로 재시도하면 따로 추적합니다.
+                async def get_media(pooled: PooledKey) -> PhotoMedia:
+                    with (
+                        start_span("upstream.places.get_photo_media", api="places"),
+                        track_upstream("places"),
+                        call.track(),
+                    ):
+                        return await pooled.client.get_photo_media(
+                            request=request, timeout=self.timeout
+                        )
+
+                media = await self.places.keys.call(get_media)
+                with (
+                    start_span("upstream.places.photo_download", api="places"),
+                    track_upstream("places"),
+                    call.track(),
+                ):
+                    response = await self.client.get(media.photo_uri)
+                    response.raise_for_status()
+                photo = await asyncio.to_thread(
+                    self.cache.store,
+                    key,
+                    response.content,
+                    response.headers.get("content-type"),
+                )
+                logger.info(f"사진 캐시 저장: {name} ({photo.size_bytes} bytes)")
+                return {"name": name, **self._describe(photo)}
+
+            except GoogleAPIError as e:
+                logger.error(f"사진 메타데이터 요청 실패: {e}")
+                return {"error": f"Google API 오류가 발생했습니다: {e}", "name": name}
+
+            except httpx.HTTPError as e:
+                logger.error(f"사진 다운로드 실패: {e}")
+                return {
+                    "error": f"사진 다운로드 중 오류가 발생했습니다: {e}",
+                    "name": name,
+                }
+
+            except Exception as e:
+                logger.error(f"예상치 못한 오류: {e}")
+                return {"error": f"예상치 못한 오류가 발생했습니다: {e}", "name": name}
+
+    @staticmethod
+    def _describe(photo: CachedPhoto) -> Dict[str, Any]:
+        description = asdict(photo)
+        description.pop("extension")
+        return {"url": photo.url, "content_type": photo.content_type, **description}
+
+
+async def _create_photo_service() -> PhotoService:
+    # 같은 루프의 PlacesService gRPC 채널을 공유합니다.
+    return PhotoService(await service_registry.get("places"))
+
+
+# 이벤트 루프별 인스턴스를 레지스트리에서 지연 생성합니다.
+service_registry.register("photos", _create_photo_service)
+
+
+async def get_photo_service() -> PhotoService:
+    """현재 이벤트 루프의 PhotoService 인스턴스를 반환합니다."""
+    return await service_registry.get("photos")
+
+
+async def attach_card_photos(
+    cards: List[Dict[str, Any]], places: List[Dict[str, Any]]
+) -> None:
+    """
+    장소 카드에 첫 번째 사진의 썸네일 URL(photo_url)을 추가합니다.
+
+    cards와 places는 같은 순서여야 합니다 (to_place_card 결과). 사진이 없거나 가져오지 못한
+    장소의 카드는 그대로 둡니다.
+    """
+    targets = [
+        (card, place["photos"][0]["name"])
+        for card, place in zip(cards, places)
+        if place.get("photos") and place["photos"][0].get("name")
+    ]
+    if not targets:
+        return
+    service = await get_photo_service()
+    results = await service.fetch_many([name for _, name in targets])
+    for (card, _), result in zip(targets, results):
+        if "url" in result:
+            card["photo_url"] = result["url"]
@@ -1,22 +1,123 @@
 """Google Maps Places API Tools for PlacesAgent using Google Cloud Client Library."""
 
 import logging
-import os
 from datetime import datetime
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools import ToolContext
 from google.api_core import client_options
-from google.api_core.exceptions import (GoogleAPIError, InvalidArgument,
-                                        PermissionDenied, ResourceExhausted)
-from google.maps import places_v1
-from google.maps.places_v1.types import Place, PriceLevel, SearchTextRequest
+from google.api_core.exceptions import (
+    GoogleAPIError,
+    InvalidArgument,
+    PermissionDenied,
+    ResourceExhausted,
+)
+from opentelemetry import trace
+
+from ..cache import ResultCache
+from ..canonical import extract_result_count, query_cache_key
+from ..circuit_breaker import get_circuit_breaker
+from ..config import (
+    PLACE_CARD_PHOTOS_ENABLED,
+    PLACES_ANCHOR_LOCATION_MODE,
+    PLACES_ANCHOR_RADIUS_M,
+    PLACES_CACHE_HARD_TTL_SECONDS,
+    PLACES_CACHE_TTL_SECONDS,
+    PLACES_DEFAULT_RESULT_COUNT,
+    PLACES_DISTANCE_RANKING_ENABLED,
+    PLACES_MAX_PHOTOS_PER_PLACE,
+    PLACES_MAX_REVIEW_CHARS,
+    PLACES_MAX_REVIEWS_PER_PLACE,
+    PLACES_MAX_SKU_TIER,
+    PLACES_RATE_LIMIT_QPS,
+    PLACES_SLOW_CALL_SECONDS,
+    SPECULATIVE_LANGUAGE_CODE,
+    SPECULATIVE_SEARCH_ENABLED,
+    STALE_CACHE_SECONDS,
+)
+from ..key_pool import (
+    REASON_DENIED,
+    REASON_EXHAUSTED,
+    KeyPool,
+    PooledKey,
+    keys_from_env,
+)
+from ..models.schemas import selected_fields, selected_language, selected_type
+from ..telemetry import record_upstream_call, start_span, traced_tool, track_upstream
+from .field_mask import (
+    WILDCARD_FIELDS,
+    FieldMaskResult,
+    compute_sku_tier,
+    validate_field_mask,
+)
+from .geo import SearchArea, rank_by_distance, split_anchor
+from .geocode import get_geocoding_service
+from .photos import attach_card_photos
+from .registry import service_registry
+from .speculative import discard_speculation, resolve_speculation, start_speculation
+
+# google.maps.places_v1은 첫 PlacesService 생성 시점에 임포트합니다(콜드 스타트 단축).
+if TYPE_CHECKING:
+    from google.maps import places_v1
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 # 상수 정의
 DEFAULT_FIELDS = "places.id,places.attributions,places.displayName,places.formattedAddress,places.location"
+# 검색 직후 클라이언트에 먼저 전달할 간략 장소 카드의 상태 키
+PLACE_CARDS_STATE_KEY = "place_cards"
+# SearchText API의 max_result_count 허용 범위 상한
+MAX_RESULT_COUNT = 20
+
+
+def result_limit(query: str, utterance: Optional[str] = None) -> Optional[int]:
+    """
+    검색 결과 수 제한을 정합니다.
+
+    쿼리, 사용자 발화의 개수 표현("3곳만", "top 5") 순으로 찾고, 없으면 PLACES_DEFAULT_RESULT_COUNT를
+    사용합니다. 결과는 1~MAX_RESULT_COUNT로 보정되며, 제한이 없으면 None입니다.
+    """
+    count = extract_result_count(query)
+    if count is None and utterance:
+        count = extract_result_count(utterance)
+    if count is None:
+        count = PLACES_DEFAULT_RESULT_COUNT
+    if count is None:
+        return None
+    return min(max(count, 1), MAX_RESULT_COUNT)
+
+
+def _trim_place(place: "places_v1.Place") -> None:
+    """
+    모델에 전달할 페이로드를 줄이기 위해 장소의 리뷰/사진 수와 리뷰 본문 길이를 제한합니다.
+
+    to_dict() 변환 전에 protobuf 객체에서 직접 잘라 변환 비용도 함께 줄입니다.
+    """
+    if PLACES_MAX_REVIEWS_PER_PLACE >= 0:
+        del place.reviews[PLACES_MAX_REVIEWS_PER_PLACE:]
+    if PLACES_MAX_PHOTOS_PER_PLACE >= 0:
+        del place.photos[PLACES_MAX_PHOTOS_PER_PLACE:]
+    if PLACES_MAX_REVIEW_CHARS > 0:
+        for review in place.reviews:
+            for text in (review.text, review.original_text):
+                if len(text.text) > PLACES_MAX_REVIEW_CHARS:
+                    text.text = text.text[:PLACES_MAX_REVIEW_CHARS] + "…"
+
+
+def _key_error(error: BaseException) -> Optional[str]:
+    """할당량 초과/권한 거부는 해당 API 키의 문제이므로 키 풀에서 그 키를 일시 제외합니다."""
+    if isinstance(error, ResourceExhausted):
+        return REASON_EXHAUSTED
+    if isinstance(error, PermissionDenied):
+        return REASON_DENIED
+    return None
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    """잘못된 요청/권한 오류는 업스트림 장애가 아니므로 서킷 브레이커 실패로 세지 않습니다."""
+    return not isinstance(error, (InvalidArgument, PermissionDenied))
 
 
 class PlacesService:
@@ -27,52 +128,98 @@ class PlacesService:
     텍스트 검색, 필드 마스킹, 다국어 지원 등의 고급 기능을 포함합니다.
 
     Attributes:
-        api_key (str): Google Places API 키
         timeout (float): API 요청 타임아웃 시간 (초)
-        client (places_v1.PlacesAsyncClient): 비동기 Places API 클라이언트
+        keys (KeyPool): API 키 풀. 키마다 비동기 Places API 클라이언트(places_v1.PlacesAsyncClient)와
+            속도 제한기를 가집니다.
+        cache (ResultCache): 검색 결과 캐시
+        breaker (CircuitBreaker): SearchText 엔드포인트 서킷 브레이커 (프로세스 공용)
 
     Raises:
-        ValueError: GOOGLE_PLACES_API_KEY 환경변수가 설정되지 않은 경우
+        ValueError: GOOGLE_PLACES_API_KEYS / GOOGLE_PLACES_API_KEY 환경변수가 설정되지 않은 경우
 
     Example:
         service = PlacesService(timeout=20.0)
         result = await service.text_search("강남역 카페", "places.displayName", "", "ko")
     """
 
-    def __init__(self, timeout: float = 15.0):
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        client: "places_v1.PlacesAsyncClient | None" = None,
+        cache_ttl: float = PLACES_CACHE_TTL_SECONDS,
+        cache_hard_ttl: float = PLACES_CACHE_HARD_TTL_SECONDS,
+        rate_limit: float | None = PLACES_RATE_LIMIT_QPS,
+    ):
         """
         PlacesService 인스턴스를 초기화합니다.
         환경변수에서 API 키를 가져오고, Google Cloud Client를 설정합니다.
 
         Args:
             timeout (float, optional): API 요청 타임아웃 시간 (초). 기본값은 15.0초.
+            client (places_v1.PlacesAsyncClient | None, optional): 사용할 클라이언트.
+                로컬 대역 서버 등 다른 엔드포인트를 사용할 때 지정하며, 이때는 첫 번째 키만 사용합니다.
+                None이면 키마다 API 키로 인증하는 기본 클라이언트를 생성합니다.
+            cache_ttl (float, optional): 검색 결과 캐시 유효 시간(소프트 TTL, 초). 0이면 캐시하지 않습니다.
+            cache_hard_ttl (float, optional): 캐시 하드 TTL (초). 소프트 TTL이 지난 결과는
+                이때까지 즉시 반환되며 백그라운드에서 갱신됩니다.
+            rate_limit (float | None, optional): 키별 초당 최대 API 요청 수. None이면 제한하지 않습니다.
 
         Raises:
-            ValueError: GOOGLE_PLACES_API_KEY 환경변수가 설정되지 않은 경우
+            ValueError: GOOGLE_PLACES_API_KEYS / GOOGLE_PLACES_API_KEY 환경변수가 설정되지 않은 경우
 
         Note:
-            API 키는 반드시 'GOOGLE_PLACES_API_KEY' 환경변수로 설정되어야 합니다.
+            API 키는 'GOOGLE_PLACES_API_KEYS'(쉼표로 구분한 키 목록) 또는 'GOOGLE_PLACES_API_KEY'
+            환경변수로 설정되어야 합니다.
         """
-        self.api_key: str | None = os.getenv("GOOGLE_PLACES_API_KEY")
         self.timeout: float = timeout
+        api_keys = keys_from_env("GOOGLE_PLACES_API_KEYS", "GOOGLE_PLACES_API_KEY")
 
-        if not self.api_key:
+        if not api_keys:
             raise ValueError(
                 "Google Places API 키가 설정되지 않았습니다."
-                "환경변수 'GOOGLE_PLACES_API_KEY'를 설정해주세요."
+                "환경변수 'GOOGLE_PLACES_API_KEYS'(쉼표 구분 목록) 또는 'GOOGLE_PLACES_API_KEY'를 설정해주세요."
                 "예시: GOOGLE_PLACES_API_KEY=AIza..."
             )
 
-        # 타입 검사기를 위한 명시적 체크
-        assert self.api_key is not None  # 타입 검사기를 위한 명시적 체크
-        # 클라이언트 옵션 설정 (API key 인증)
-        options = client_options.ClientOptions(api_key=self.api_key)
-
-        # Places 클라이언트 초기화
-        self.client = places_v1.PlacesAsyncClient(client_options=options)
+        if client is None:
+            from google.maps import places_v1
+
+            def make_client(api_key: str) -> "places_v1.PlacesAsyncClient":
+                # 클라이언트 옵션 설정 (API key 인증)
+                options = client_options.ClientOptions(api_key=api_key)
+                return places_v1.PlacesAsyncClient(client_options=options)
+
+        else:
+            api_keys = api_keys[:1]
+
+            def make_client(api_key: str) -> "places_v1.PlacesAsyncClient":
+                return client
+
+        self.keys = KeyPool(
+            "places", api_keys, rate_limit, classify=_key_error, make_client=make_client
+        )
+        self.cache = ResultCache(
+            "places", cache_ttl, stale_ttl=STALE_CACHE_SECONDS, hard_ttl=cache_hard_ttl
+        )
+        self.breaker = get_circuit_breaker(
+            "places.search_text",
+            PLACES_SLOW_CALL_SECONDS,
+            is_failure=_is_upstream_failure,
+        )
+
+    async def aclose(self) -> None:
+        """키별 클라이언트의 gRPC 채널을 닫습니다."""
+        for pooled in self.keys.keys:
+            await pooled.client.transport.close()
 
     async def text_search(
-        self, query: str, fields: str, types: str, language_code: str
+        self,
+        query: str,
+        fields: str,
+        types: str,
+        language_code: str,
+        area: Optional[SearchArea] = None,
+        max_result_count: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         텍스트 쿼리를 사용하여 장소를 검색합니다.
@@ -91,6 +238,10 @@ class PlacesService:
             language_code (str): 응답 언어 코드 (ISO 639-1).
                 예: "ko" (한국어), "en" (영어), "ja" (일본어)
                 빈 문자열인 경우 기본 언어 사용
+            area (Optional[SearchArea]): 기준 위치 주변 검색 영역.
+                지정하면 요청에 location_bias 또는 location_restriction을 추가합니다.
+            max_result_count (Optional[int]): 요청할 최대 결과 수 (1~20).
+                None이면 API 기본값(20)을 사용합니다.
 
         Returns:
             Dict[str, Any]: 검색 결과를 포함한 딕셔너리
@@ -118,85 +269,318 @@ class PlacesService:
             - 검색 결과는 관련성(RELEVANCE) 순으로 정렬됩니다
             - 최소 평점은 0.0으로 설정되어 모든 평점의 장소가 포함됩니다
             - 가격 수준은 UNSPECIFIED로 설정되어 모든 가격대가 포함됩니다
+            - 장소별 리뷰/사진 수와 리뷰 본문 길이는 PLACES_MAX_REVIEWS_PER_PLACE,
+              PLACES_MAX_PHOTOS_PER_PLACE, PLACES_MAX_REVIEW_CHARS로 제한됩니다
+            - 캐시 키에는 정규화된 쿼리를 사용하므로 조사/요청 표현/어순만 다른 쿼리는 결과를 공유합니다
+            - 성공 결과는 캐시되며, 멀티 프로세스 서빙 시 워커 간에 공유됩니다.
+              cache_ttl이 지난 결과는 cache_hard_ttl까지 즉시 반환되고 백그라운드에서 갱신됩니다
+            - 서킷 브레이커가 열려 있거나 일시적 오류가 발생하면 만료된 마지막 캐시 결과를
+              "stale": True, "stale_age_seconds"와 함께 반환합니다 (없으면 오류 응답)
         """
-        try:
-            logger.info(f"장소 검색 요청: {query}")
-
-            # SearchTextRequest 생성 - 빈 문자열 처리 개선
-            request_params = {
-                "text_query": query,
-                "min_rating": 0.0,
-                "price_levels": [PriceLevel.PRICE_LEVEL_UNSPECIFIED],
-                "rank_preference": SearchTextRequest.RankPreference.RELEVANCE,
-                "include_pure_service_area_businesses": False,
-            }
+        key = self.cache_key(
+            query, fields, types, language_code, area, max_result_count
+        )
+        return await self.cache.get_or_fetch(
+            key,
+            lambda: self._text_search_uncached(
+                key, query, fields, types, language_code, area, max_result_count
+            ),
+        )
+
+    @staticmethod
+    def cache_key(
+        query: str,
+        fields: str,
+        types: str,
+        language_code: str,
+        area: Optional[SearchArea] = None,
+        max_result_count: Optional[int] = None,
+    ) -> str:
+        """텍스트 검색 결과의 캐시 키를 반환합니다. 인자는 text_search()와 같습니다."""
+        return ResultCache.make_key(
+            query_cache_key(query),
+            ",".join(sorted(field.strip() for field in fields.split(","))),
+            types,
+            language_code,
+            area.cache_key() if area else None,
+            max_result_count,
+        )
+
+    async def _text_search_uncached(
+        self,
+        key: str,
+        query: str,
+        fields: str,
+        types: str,
+        language_code: str,
+        area: Optional[SearchArea] = None,
+        max_result_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        캐시를 거치지 않고 SearchText API를 호출합니다. 인자와 반환값은 text_search()와 같으며,
+        key는 업스트림 장애 시 대체할 만료된 캐시 항목의 키입니다.
+        """
+        from google.maps.places_v1.types import (
+            Place,
+            PriceLevel,
+            SearchTextRequest,
+            SearchTextResponse,
+        )
+
+        with self.breaker.attempt() as call:
+            if not call.allowed:
+                logger.warning(f"서킷 브레이커 열림, 장소 검색 생략: {query}")
+                return await self.cache.stale_or(
+                    key,
+                    {
+                        "error": "장소 검색 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+                        "query": query,
+                    },
+                )
+            try:
+                logger.info(f"장소 검색 요청: {query}")
+
+                # SearchTextRequest 생성 - 빈 문자열 처리 개선
+                request_params = {
+                    "text_query": query,
+                    "min_rating": 0.0,
+                    "price_levels": [PriceLevel.PRICE_LEVEL_UNSPECIFIED],
+                    "rank_preference": SearchTextRequest.RankPreference.RELEVANCE,
+                    "include_pure_service_area_businesses": False,
+                }
+
+                # 빈 문자열이 아닌 경우만 추가
+                if language_code:
+                    request_params["language_code"] = language_code
+                if types:
+                    request_params["included_type"] = types
+                if area is not None:
+                    request_params.update(area.to_request_params())
+                if max_result_count:
+                    request_params["max_result_count"] = max_result_count
+
+                request = SearchTextRequest(**request_params)
+
+                # API 호출 (요청에 포함된 필드 중 가장 높은 등급의 SKU가 청구됩니다)
+                sku_tier = compute_sku_tier(fields.split(",")).label
+                record_upstream_call("places", f"Text Search {sku_tier}")
+
+                # 키 풀이 시도마다 키의 토큰(속도 제한 대기)을 먼저 얻으므로, 추적 구간에는
+                # 업스트림 요청 하나만 포함됩니다. 다른 키로 재시도하면 따로 추적합니다.
+                async def search(pooled: PooledKey) -> SearchTextResponse:
+                    with (
+                        start_span(
+                            "upstream.places.search_text",
+                            api="places",
+                            **{"places.sku_tier": sku_tier},
+                        ) as span,
+                        track_upstream("places"),
+                        call.track(),
+                    ):
+                        response = await pooled.client.search_text(
+                            request=request,
+                            metadata=[("x-goog-fieldmask", fields)],
+                            timeout=self.timeout,
+                        )
+                        span.set_attribute("places.count", len(response.places))
+                        return response
+
+                response = await self.keys.call(search)
+
+                # 응답을 딕셔너리로 변환
+                places_list = []
+                with start_span(
+                    "places.to_dict", **{"places.count": len(response.places)}
+                ):
+                    for place in response.places:
+                        # 리뷰/사진을 줄인 뒤 protobuf 객체를 딕셔너리로 변환
+                        _trim_place(place)
+                        place_dict = Place.to_dict(place)
+                        places_list.append(place_dict)
+
+                if not places_list:
+                    logger.info(f"검색 결과 없음: {query}")
+                    return {"error": "검색 결과가 없습니다.", "query": query}
+
+                logger.info(f"검색 성공: {len(places_list)}개 결과")
+                return {"places": places_list}
+
+            except InvalidArgument as e:
+                logger.error(f"잘못된 요청 파라미터: {e}")
+                return {
+                    "error": "잘못된 요청입니다. 쿼리나 필드를 확인해주세요.",
+                    "query": query,
+                }
+
+            except PermissionDenied as e:
+                logger.error(f"권한 거부: {e}")
+                return {
+                    "error": "API 키가 유효하지 않거나 접근 권한이 없습니다.",
+                    "query": query,
+                }
+
+            except ResourceExhausted as e:
+                logger.error(f"할당량 초과: {e}")
+                return await self.cache.stale_or(
+                    key, {"error": "API 호출 한도를 초과했습니다.", "query": query}
+                )
+
+            except GoogleAPIError as e:
+                logger.error(f"Google API 오류: {e}")
+                return await self.cache.stale_or(
+                    key,
+                    {"error": f"Google API 오류가 발생했습니다: {e}", "query": query},
+                )
+
+            except Exception as e:
+                logger.error(f"예상치 못한 오류: {e}")
+                return await self.cache.stale_or(
+                    key,
+                    {"error": f"예상치 못한 오류가 발생했습니다: {e}", "query": query},
+                )
+
+
+def to_place_card(place: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Place 딕셔너리를 지도 핀/카드 렌더링에 필요한 최소 정보로 축약합니다.
 
-            # 빈 문자열이 아닌 경우만 추가
-            if language_code:
-                request_params["language_code"] = language_code
-            if types:
-                request_params["included_type"] = types
+    요청하지 않은 필드(빈 문자열, 0 등 기본값)는 카드에서 제외됩니다.
 
-            request = SearchTextRequest(**request_params)
+    Args:
+        place (Dict[str, Any]): places_v1.Place.to_dict() 결과
 
-            # API 호출
-            response = await self.client.search_text(
-                request=request, metadata=[("x-goog-fieldmask", fields)]
-            )
+    Returns:
+        Dict[str, Any]: {"id", "name", "address", "lat", "lng", "rating", ...} 형태의 카드
+    """
+    location = place.get("location") or {}
+    card = {
+        "id": place.get("id"),
+        "name": (place.get("display_name") or {}).get("text"),
+        "address": place.get("short_formatted_address")
+        or place.get("formatted_address"),
+        "lat": location.get("latitude"),
+        "lng": location.get("longitude"),
+        "primary_type": (place.get("primary_type_display_name") or {}).get("text"),
+        "rating": place.get("rating"),
+        "user_rating_count": place.get("user_rating_count"),
+        "google_maps_uri": place.get("google_maps_uri"),
+        "distance_m": place.get("distance_m"),
+    }
+    return {key: value for key, value in card.items() if value}
+
+
+# 이벤트 루프별 인스턴스를 레지스트리에서 지연 생성합니다.
+# PlacesAsyncClient의 gRPC aio 채널은 처음 사용한 이벤트 루프에 묶입니다.
+service_registry.register("places", PlacesService)
+
+
+async def get_places_service() -> PlacesService:
+    """현재 이벤트 루프의 PlacesService 인스턴스를 반환합니다."""
+    return await service_registry.get("places")
+
+
+async def _registry_text_search(
+    query: str,
+    fields: str,
+    types: str,
+    language_code: str,
+    max_result_count: Optional[int],
+) -> Dict[str, Any]:
+    """현재 이벤트 루프의 PlacesService로 텍스트 검색을 수행합니다 (투기적 검색용)."""
+    service = await get_places_service()
+    return await service.text_search(
+        query, fields, types, language_code, max_result_count=max_result_count
+    )
 
-            # 응답을 딕셔너리로 변환
-            places_list = []
-            for place in response.places:
-                # protobuf 객체를 딕셔너리로 변환
-                place_dict = places_v1.Place.to_dict(place)
-                places_list.append(place_dict)
 
-            if not places_list:
-                logger.info(f"검색 결과 없음: {query}")
-                return {"error": "검색 결과가 없습니다.", "query": query}
+def search_field_mask(field_mask: FieldMaskResult, area: Optional[SearchArea]) -> str:
+    """검색에 사용할 필드 마스크를 반환합니다. 검색 영역이 있으면 거리 계산용 좌표 필드를 포함합니다."""
+    if area is not None and not set(field_mask.fields) & {
+        "places.location",
+        *WILDCARD_FIELDS,
+    }:
+        return f"{field_mask.mask},places.location"
+    return field_mask.mask
 
-            logger.info(f"검색 성공: {len(places_list)}개 결과")
-            return {"places": places_list}
 
-        except InvalidArgument as e:
-            logger.error(f"잘못된 요청 파라미터: {e}")
-            return {
-                "error": "잘못된 요청입니다. 쿼리나 필드를 확인해주세요.",
-                "query": query,
-            }
+async def resolve_search_area(
+    query: str, language_code: str | None
+) -> Optional[SearchArea]:
+    """
+    쿼리의 기준 위치("서울역 근처 약국"의 "서울역")를 지오코딩하여 검색 영역을 반환합니다.
 
-        except PermissionDenied as e:
-            logger.error(f"권한 거부: {e}")
-            return {
-                "error": "API 키가 유효하지 않거나 접근 권한이 없습니다.",
-                "query": query,
-            }
+    PLACES_DISTANCE_RANKING_ENABLED가 꺼져 있거나, 기준 위치가 없거나, 지오코딩에 실패하면 None입니다.
+    지오코딩 결과는 지오코딩 캐시를 사용하므로 같은 기준 위치는 한 번만 조회됩니다.
+    """
+    if not PLACES_DISTANCE_RANKING_ENABLED:
+        return None
+    parsed = split_anchor(query)
+    if parsed is None:
+        return None
+    anchor = parsed[0]
+    try:
+        geocoding_service = await get_geocoding_service()
+    except ValueError as e:
+        logger.warning(f"기준 위치 지오코딩 불가: {e}")
+        return None
+    geocoded = await geocoding_service.geocode(anchor, language_code or "ko")
+    if (
+        "error" in geocoded
+        or geocoded.get("lat") is None
+        or geocoded.get("lng") is None
+    ):
+        logger.info(f"기준 위치를 찾을 수 없음: {anchor}")
+        return None
+    return SearchArea(
+        lat=geocoded["lat"],
+        lng=geocoded["lng"],
+        radius_m=PLACES_ANCHOR_RADIUS_M,
+        restrict=PLACES_ANCHOR_LOCATION_MODE == "restriction",
+    )
 
-        except ResourceExhausted as e:
-            logger.error(f"할당량 초과: {e}")
-            return {"error": "API 호출 한도를 초과했습니다.", "query": query}
 
-        except GoogleAPIError as e:
-            logger.error(f"Google API 오류: {e}")
-            return {"error": f"Google API 오류가 발생했습니다: {e}", "query": query}
+def start_speculative_search(callback_context: CallbackContext) -> None:
+    """
+    places_sequential_agent 시작 시 DEFAULT_FIELDS로 투기적 장소 검색을 시작합니다.
 
-        except Exception as e:
-            logger.error(f"예상치 못한 오류: {e}")
-            return {"error": f"예상치 못한 오류가 발생했습니다: {e}", "query": query}
+    before_agent_callback으로 등록되며, SPECULATIVE_SEARCH_ENABLED가 꺼져 있으면
+    아무 작업도 하지 않습니다. 사용자 발화를 그대로 쿼리로 사용하고, 결과 수 제한도
+    text_search_tool과 같은 규칙(result_limit)으로 정합니다.
 
+    Args:
+        callback_context (CallbackContext): ADK 콜백 컨텍스트
+    """
+    if not SPECULATIVE_SEARCH_ENABLED or not callback_context.user_content:
+        return None
 
-# 전역 인스턴스를 함수로 지연 로딩
-_places_service_instance: PlacesService | None = None
+    query = "".join(
+        part.text or "" for part in callback_context.user_content.parts or []
+    )
+    start_speculation(
+        key=callback_context.invocation_id,
+        query=query,
+        fields=DEFAULT_FIELDS,
+        language_code=SPECULATIVE_LANGUAGE_CODE,
+        max_result_count=result_limit(query),
+        search=_registry_text_search,
+    )
+    return None
 
 
-def get_places_service() -> PlacesService:
-    """PlacesService 싱글톤 인스턴스를 반환합니다."""
-    global _places_service_instance
-    if _places_service_instance is None:
-        _places_service_instance = PlacesService()
-    return _places_service_instance
+def discard_speculative_search(callback_context: CallbackContext) -> None:
+    """
+    places_sequential_agent 종료 시 사용되지 않은 투기적 검색을 정리합니다.
+
+    after_agent_callback으로 등록됩니다.
+
+    Args:
+        callback_context (CallbackContext): ADK 콜백 컨텍스트
+    """
+    discard_speculation(callback_context.invocation_id)
+    return None
 
 
+@traced_tool
 async def text_search_tool(query: str, tool_context: ToolContext) -> Dict[str, Any]:
     """
     에이전트에서 사용하는 텍스트 기반 장소 검색 도구입니다.
@@ -211,9 +595,9 @@ async def text_search_tool(query: str, tool_context: ToolContext) -> Dict[str, A
         tool_context (ToolContext): ADK 도구 컨텍스트 객체.
             에이전트 간 상태 공유 및 검색 기록 저장에 사용됩니다.
             다음 키들을 포함할 수 있습니다:
-            - "fields": 이전 에이전트가 선택한 필드 마스크
-            - "types": 이전 에이전트가 선택한 장소 타입
-            - "language": 이전 에이전트가 선택한 언어 코드
+            - "fields": 이전 에이전트가 선택한 필드 목록 ({"fields": [...]})
+            - "types": 이전 에이전트가 선택한 장소 타입 ({"included_type": ...})
+            - "language": 이전 에이전트가 선택한 언어 코드 ({"language_code": ...})
 
     Returns:
         Dict[str, Any]: PlacesService.text_search()와 동일한 형식의 검색 결과
@@ -222,7 +606,11 @@ async def text_search_tool(query: str, tool_context: ToolContext) -> Dict[str, A
 
     Side Effects:
         - tool_context.state에 검색 기록을 "places_search_history" 키로 저장
-        - 각 검색 기록에는 쿼리, 결과, 타임스탬프가 포함됨
+        - 각 검색 기록에는 쿼리, 사용자 발화, 결과, 필드 마스크 검증 결과(SKU 등급), 검색에 사용한
+          필드/타입/언어, 타임스탬프가 포함됨 (캐시 예열 작업이 같은 검색을 재현하는 데 사용)
+        - 검색 결과의 간략 장소 카드를 "place_cards" 키로 저장
+          (도구 응답 이벤트의 state_delta로 LLM 응답 생성 전에 클라이언트에 전달됨)
+        - PLACE_CARD_PHOTOS_ENABLED가 켜져 있으면 카드에 첫 번째 사진의 캐시된 썸네일 URL(photo_url)을 추가
 
     Example:
         >>> # 에이전트 워크플로우에서 사용될 때:
@@ -235,25 +623,88 @@ async def text_search_tool(query: str, tool_context: ToolContext) -> Dict[str, A
 
     Note:
         - fields가 설정되지 않은 경우 기본 필드 세트를 사용합니다
+        - fields는 API 호출 전에 정규화/보정되며, PLACES_MAX_SKU_TIER를 초과하는 필드는 제외됩니다
+        - 투기적 검색이 진행 중이고 최종 요청과 같은 요청이면 그 결과를 재사용합니다
+        - PLACES_DISTANCE_RANKING_ENABLED가 켜져 있고 쿼리에 기준 위치("서울역 근처")가 있으면
+          기준 위치 주변으로 검색하고, 반경 안의 결과만 거리순으로 정렬하여 distance_m을 추가합니다
+        - 쿼리나 발화에 개수 표현("3곳만")이 있으면 그 수만큼만 요청/반환합니다 (없으면
+          PLACES_DEFAULT_RESULT_COUNT)
         - 모든 검색은 기록되어 추후 분석이나 캐싱에 활용할 수 있습니다
         - 이 함수는 에이전트 워크플로우의 마지막 단계에서 실행됩니다
     """
-    llm_fields_data = tool_context.state.get("fields", DEFAULT_FIELDS)
+    # 선택자 출력은 output_schema로 검증된 딕셔너리입니다 (models.schemas 참고).
+    llm_fields_data = (
+        selected_fields(tool_context.state.get("fields")) or DEFAULT_FIELDS
+    )
     logger.info(f"llm_fields_data: {llm_fields_data}")
-    llm_types_data = tool_context.state.get("types")
+    field_mask = validate_field_mask(
+        llm_fields_data, fallback=DEFAULT_FIELDS, max_tier=PLACES_MAX_SKU_TIER
+    )
+    logger.info(f"field_mask: {field_mask.mask} (SKU: {field_mask.tier.label})")
+    span = trace.get_current_span()
+    span.set_attribute("places.sku_tier", field_mask.tier.label)
+    llm_types_data = selected_type(tool_context.state.get("types"))
     logger.info(f"llm_types_data: {llm_types_data}")
-    llm_language_code_data = tool_context.state.get("language")
+    llm_language_code_data = selected_language(tool_context.state.get("language"))
     logger.info(f"llm_language_code_data: {llm_language_code_data}")
 
     # 지연 로딩된 서비스 사용
-    places_service = get_places_service()
+    places_service = await get_places_service()
+
+    # 기준 위치가 있으면 검색 영역을 지정하고, 거리 계산을 위해 좌표 필드를 포함합니다.
+    area = await resolve_search_area(query, llm_language_code_data)
+    mask = search_field_mask(field_mask, area)
 
-    result = await places_service.text_search(
+    user_content = tool_context.user_content
+    utterance = (
+        "".join(part.text or "" for part in user_content.parts or [])
+        if user_content
+        else None
+    )
+    # 결과 수 제한은 업스트림 요청에 적용합니다. 거리순 정렬 시에는 반경 안의 후보를 충분히 받은 뒤
+    # 정렬 결과를 자릅니다.
+    limit = result_limit(query, utterance)
+    span.set_attribute("places.result_limit", limit or 0)
+    max_result_count = limit if area is None else None
+
+    result: Optional[Dict[str, Any]]
+    result, speculation = await resolve_speculation(
+        key=tool_context.invocation_id,
         query=query,
-        fields=llm_fields_data,
+        fields=mask,
         types=llm_types_data,
         language_code=llm_language_code_data,
+        max_result_count=max_result_count,
+        area=area,
     )
+    span.set_attribute("speculation.outcome", speculation)
+    if result is None:
+        result = await places_service.text_search(
+            query=query,
+            fields=mask,
+            types=llm_types_data or "",
+            language_code=llm_language_code_data or "",
+            area=area,
+            max_result_count=max_result_count,
+        )
+
+    if area is not None and result.get("places"):
+        with start_span(
+            "places.rank_by_distance", **{"places.count": len(result["places"])}
+        ):
+            ranked = rank_by_distance(result["places"], area)
+        span.set_attribute("places.within_radius", len(ranked))
+        if ranked:
+            result = {**result, "places": ranked}
+        else:
+            result = {
+                "error": "기준 위치 반경 안에 검색 결과가 없습니다.",
+                "query": query,
+            }
+
+    # 거리순 정렬 결과는 제한보다 많을 수 있습니다.
+    if limit and len(result.get("places", [])) > limit:
+        result = {**result, "places": result["places"][:limit]}
 
     # 상태에 저장
     if "places_search_history" not in tool_context.state:
@@ -262,9 +713,21 @@ async def text_search_tool(query: str, tool_context: ToolContext) -> Dict[str, A
     tool_context.state["places_search_history"].append(
         {
             "query": query,
+            "utterance": utterance,
+            "field_mask": field_mask.to_dict(),
+            "fields": mask,
+            "types": llm_types_data,
+            "language": llm_language_code_data,
+            "max_result_count": limit,
+            "speculation": speculation,
+            "area": area.cache_key() if area else None,
             "result": result,
             "timestamp": datetime.now().isoformat(),
         }
     )
+    cards = [to_place_card(place) for place in result.get("places", [])]
+    if PLACE_CARD_PHOTOS_ENABLED:
+        await attach_card_photos(cards, result.get("places", []))
+    tool_context.state[PLACE_CARDS_STATE_KEY] = {"query": query, "places": cards}
 
     return result
@@ -0,0 +1,121 @@
+"""
+이벤트 루프별 서비스 인스턴스 레지스트리를 정의하는 파일입니다.
+
+gRPC aio 채널과 httpx 연결 풀은 처음 사용한 이벤트 루프에 묶이므로, 서비스 인스턴스를
+이벤트 루프마다 하나씩 생성하여 재사용합니다. 같은 루프에서 동시에 처음 요청되더라도
+루프별 asyncio.Lock으로 인스턴스는 한 번만 생성되며, aclose()로 연결을 명시적으로 정리합니다.
+"""
+
+import asyncio
+import inspect
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+ServiceFactory = Callable[[], Union[Any, Awaitable[Any]]]
+# (서비스 이름, 인스턴스) -> None
+LifecycleHook = Callable[[str, Any], Union[None, Awaitable[None]]]
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class ServiceRegistry:
+    """
+    이벤트 루프별로 서비스 인스턴스를 생성/보관/정리하는 레지스트리입니다.
+
+    Example:
+        >>> registry.register("places", PlacesService)
+        >>> service = await registry.get("places")
+        >>> await registry.aclose()  # 현재 루프의 서비스 연결 정리
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, ServiceFactory] = {}
+        # 이벤트 루프 -> 서비스 이름 -> 인스턴스 (루프가 사라지면 항목도 제거됩니다)
+        self._instances: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]"
+        ) = weakref.WeakKeyDictionary()
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (weakref.WeakKeyDictionary())
+        self._on_create: List[LifecycleHook] = []
+        self._on_close: List[LifecycleHook] = []
+
+    def register(self, name: str, factory: ServiceFactory) -> None:
+        """서비스 팩토리를 등록합니다. 팩토리는 동기 또는 비동기 호출 가능 객체입니다."""
+        self._factories[name] = factory
+
+    def add_lifecycle_hooks(
+        self,
+        on_create: Optional[LifecycleHook] = None,
+        on_close: Optional[LifecycleHook] = None,
+    ) -> None:
+        """서비스 생성 직후/정리 직전에 호출할 훅을 추가합니다 (예: 예열, 메트릭 보고)."""
+        if on_create is not None:
+            self._on_create.append(on_create)
+        if on_close is not None:
+            self._on_close.append(on_close)
+
+    async def get(self, name: str) -> Any:
+        """
+        현재 이벤트 루프의 서비스 인스턴스를 반환합니다. 없으면 생성합니다.
+
+        Raises:
+            KeyError: 등록되지 않은 서비스 이름인 경우
+        """
+        loop = asyncio.get_running_loop()
+        services = self._instances.get(loop)
+        if services is not None and name in services:
+            return services[name]
+
+        if name not in self._factories:
+            raise KeyError(f"등록되지 않은 서비스입니다: {name}")
+        lock = self._locks.setdefault(loop, {}).setdefault(name, asyncio.Lock())
+        async with lock:
+            services = self._instances.setdefault(loop, {})
+            if name not in services:
+                instance = await _maybe_await(self._factories[name]())
+                for hook in self._on_create:
+                    await _maybe_await(hook(name, instance))
+                services[name] = instance
+                logger.debug(f"서비스 생성: {name} (loop={id(loop):#x})")
+            return services[name]
+
+    def set(self, name: str, instance: Any) -> None:
+        """
+        현재 이벤트 루프의 서비스 인스턴스를 직접 지정합니다 (대역 서버, 테스트 등).
+
+        기존 인스턴스는 정리되지 않으므로 필요하면 먼저 aclose(name)를 호출합니다.
+        """
+        self._instances.setdefault(asyncio.get_running_loop(), {})[name] = instance
+
+    async def aclose(self, name: Optional[str] = None) -> None:
+        """
+        현재 이벤트 루프의 서비스(name이 없으면 전체)를 정리하고 레지스트리에서 제거합니다.
+
+        각 인스턴스의 aclose()가 있으면 호출하며, 정리 중 오류는 기록만 하고 계속 진행합니다.
+        """
+        services = self._instances.get(asyncio.get_running_loop())
+        if not services:
+            return
+        names = [name] if name is not None else list(services)
+        for service_name in names:
+            instance = services.pop(service_name, None)
+            if instance is None:
+                continue
+            try:
+                for hook in self._on_close:
+                    await _maybe_await(hook(service_name, instance))
+                close = getattr(instance, "aclose", None)
+                if close is not None:
+                    await _maybe_await(close())
+            except Exception as e:
+                logger.warning(f"서비스 정리 실패 ({service_name}): {e}")
+
+
+service_registry = ServiceRegistry()
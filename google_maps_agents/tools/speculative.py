@@ -0,0 +1,228 @@
+"""기본 필드를 사용한 투기적(speculative) 장소 검색 관리 도구.
+
+선택자 에이전트들이 필드/유형/언어를 결정하는 동안 기본 필드로 미리 검색을 시작하고,
+text_search_tool이 호출되면 최종 요청 파라미터와 비교하여 같은 요청일 때만 결과를 재사용합니다.
+쿼리는 결과 캐시와 같은 캐시 키 형태(canonical.query_cache_key)로 비교하므로
+"강남역 근처 카페 찾아줘"(발화)와 "강남역 근처 카페"(도구 쿼리)는 같은 검색으로 봅니다.
+장소 유형, 언어, 결과 수, 검색 영역이 하나라도 다르면 결과 집합과 순위가 달라지므로 재사용하지 않습니다.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+from ..canonical import query_cache_key
+from ..telemetry.metrics import CACHE_REQUESTS, registry
+from .field_mask import WILDCARD_FIELDS
+from .geo import SearchArea
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# (query, fields, types, language_code, max_result_count) -> 검색 결과
+SearchFunction = Callable[
+    [str, str, str, str, Optional[int]], Coroutine[Any, Any, Dict[str, Any]]
+]
+
+# 투기적 검색 결과 처리 결과
+OUTCOME_HIT = "hit"  # 투기적 결과를 그대로 재사용
+OUTCOME_MISS = "miss"  # 파라미터 불일치 또는 오류로 전체 검색 수행
+OUTCOME_NONE = "none"  # 진행 중인 투기적 검색 없음
+
+SPECULATIVE_CALLS = registry.counter(
+    "speculative_search_calls_total",
+    "Speculative Places searches by event (started/wasted_calls).",
+    ["event"],
+)
+# 통계 항목 -> cache_requests_total{cache="speculative"}의 result 레이블
+_CACHE_RESULTS = {"hits": OUTCOME_HIT, "misses": OUTCOME_MISS}
+
+
+class SpeculationStats:
+    """
+    투기적 검색의 성공/실패 통계를 집계하는 클래스입니다.
+
+    Attributes:
+        started (int): 시작된 투기적 검색 수
+        hits (int): 결과를 그대로 재사용한 횟수
+        misses (int): 파라미터 불일치/오류로 전체 검색을 다시 수행한 횟수
+        wasted_calls (int): 결과가 사용되지 않은 투기적 API 호출 수
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.wasted_calls = 0
+
+    def increment(self, name: str) -> None:
+        """지정한 카운터를 1 증가시키고 메트릭 레지스트리에도 보고합니다."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+        if name in _CACHE_RESULTS:
+            CACHE_REQUESTS.inc(cache="speculative", result=_CACHE_RESULTS[name])
+        else:
+            SPECULATIVE_CALLS.inc(event=name)
+
+    def snapshot(self) -> Dict[str, int]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        with self._lock:
+            return {
+                "started": self.started,
+                "hits": self.hits,
+                "misses": self.misses,
+                "wasted_calls": self.wasted_calls,
+            }
+
+
+class SpeculativeSearch:
+    """
+    진행 중인 투기적 검색 하나를 나타냅니다.
+
+    Attributes:
+        query (str): 검색 쿼리
+        fields (List[str]): 요청한 필드 목록
+        language_code (str): 요청한 언어 코드
+        max_result_count (Optional[int]): 요청한 최대 결과 수
+        task (asyncio.Task): 검색 작업
+    """
+
+    def __init__(
+        self,
+        query: str,
+        fields: str,
+        language_code: str,
+        max_result_count: Optional[int],
+        task: "asyncio.Task[Dict[str, Any]]",
+    ):
+        self.query = query
+        self.fields = [name for name in fields.split(",") if name]
+        self.language_code = language_code
+        self.max_result_count = max_result_count
+        self.task = task
+
+    def missing_fields(self, fields: str) -> List[str]:
+        """요청된 필드 중 투기적 검색이 포함하지 않은 필드를 반환합니다."""
+        if any(name in WILDCARD_FIELDS for name in self.fields):
+            return []
+        covered = set(self.fields)
+        missing = []
+        for name in (name for name in fields.split(",") if name):
+            head = ".".join(name.split(".")[:2])
+            if name not in covered and head not in covered:
+                missing.append(name)
+        return missing
+
+
+_stats = SpeculationStats()
+_pending: Dict[str, SpeculativeSearch] = {}
+
+
+def get_speculation_stats() -> Dict[str, int]:
+    """투기적 검색 통계(성공/실패/낭비된 호출 수)를 반환합니다."""
+    return _stats.snapshot()
+
+
+def start_speculation(
+    key: str,
+    query: str,
+    fields: str,
+    language_code: str,
+    max_result_count: Optional[int],
+    search: SearchFunction,
+) -> None:
+    """
+    투기적 검색을 백그라운드 작업으로 시작합니다. 장소 유형과 검색 영역 없이 검색합니다.
+
+    Args:
+        key (str): 검색을 식별하는 키 (invocation_id)
+        query (str): 사용자 쿼리
+        fields (str): 투기적 검색에 사용할 필드 마스크
+        language_code (str): 투기적 검색에 사용할 언어 코드
+        max_result_count (Optional[int]): 투기적 검색에 사용할 최대 결과 수
+        search (SearchFunction): PlacesService.text_search와 같은 검색 함수
+    """
+    if not query.strip() or key in _pending:
+        return
+    task = asyncio.create_task(
+        search(query, fields, "", language_code, max_result_count)
+    )
+    _pending[key] = SpeculativeSearch(
+        query, fields, language_code, max_result_count, task
+    )
+    _stats.increment("started")
+    logger.info(f"투기적 검색 시작: {query}")
+
+
+def discard_speculation(key: str) -> None:
+    """사용되지 않은 투기적 검색을 정리하고 낭비된 호출로 기록합니다."""
+    speculation = _pending.pop(key, None)
+    if speculation is None:
+        return
+    if not speculation.task.done():
+        speculation.task.cancel()
+    _stats.increment("wasted_calls")
+    logger.info(f"투기적 검색 미사용: {speculation.query}")
+
+
+async def resolve_speculation(
+    key: str,
+    query: str,
+    fields: str,
+    types: Optional[str],
+    language_code: Optional[str],
+    max_result_count: Optional[int] = None,
+    area: Optional[SearchArea] = None,
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    진행 중인 투기적 검색을 최종 요청 파라미터와 비교하여 같은 요청이면 결과를 재사용합니다.
+
+    쿼리(캐시 키 형태), 장소 유형, 언어 코드, 최대 결과 수가 같고 검색 영역이 없어야 합니다.
+    필드 마스크는 반환할 속성만 정하고 검색 결과와 순위에는 영향을 주지 않으므로, 투기적 검색의
+    필드가 최종 필드를 모두 포함하면 같은 요청으로 봅니다. 그 외에는 불일치로 처리하고
+    호출자가 전체 검색을 수행합니다.
+
+    Args:
+        key (str): 검색을 식별하는 키 (invocation_id)
+        query (str): 최종 검색 쿼리
+        fields (str): 최종 필드 마스크
+        types (Optional[str]): 최종 장소 유형
+        language_code (Optional[str]): 최종 언어 코드
+        max_result_count (Optional[int]): 최종 최대 결과 수
+        area (Optional[SearchArea]): 최종 검색의 기준 위치 영역
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], str]: (재사용 가능한 결과 또는 None, OUTCOME_* 값)
+    """
+    speculation = _pending.pop(key, None)
+    if speculation is None:
+        return None, OUTCOME_NONE
+
+    compatible = (
+        area is None
+        and not (types or "").strip()
+        and (language_code or "").strip() == speculation.language_code
+        and max_result_count == speculation.max_result_count
+        and query_cache_key(speculation.query) == query_cache_key(query)
+        and not speculation.missing_fields(fields)
+    )
+    if not compatible:
+        speculation.task.cancel()
+        _stats.increment("misses")
+        _stats.increment("wasted_calls")
+        return None, OUTCOME_MISS
+
+    try:
+        result = await speculation.task
+    except Exception as e:
+        logger.warning(f"투기적 검색 실패: {e}")
+        result = {"error": str(e)}
+    if "error" in result:
+        _stats.increment("misses")
+        _stats.increment("wasted_calls")
+        return None, OUTCOME_MISS
+
+    _stats.increment("hits")
+    return result, OUTCOME_HIT
@@ -0,0 +1,160 @@
+"""행정구역 경계 색인의 점-다각형 판정(구멍, 다중 다각형)과 개략 역지오코딩 테스트입니다."""
+
+import json
+
+import pytest
+
+from google_maps_agents.tools.admin_boundary import (
+    LEVEL_DONG,
+    LEVEL_SIDO,
+    LEVEL_SIGUNGU,
+    AdminBoundaryIndex,
+    build_index,
+)
+
+
+def ring(west, south, east, north):
+    """경계 상자의 닫히지 않은 고리 [경도, 위도] 목록을 반환합니다 (build_index가 닫습니다)."""
+    return [[west, south], [east, south], [east, north], [west, north]]
+
+
+def feature(code, name, geometry, name_eng=None):
+    properties = {"code": code, "name": name}
+    if name_eng:
+        properties["name_eng"] = name_eng
+    return {"type": "Feature", "properties": properties, "geometry": geometry}
+
+
+def write_layer(path, features):
+    path.write_text(
+        json.dumps(
+            {"type": "FeatureCollection", "features": features}, ensure_ascii=False
+        ),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    root = tmp_path_factory.mktemp("boundary")
+    sido = [
+        # 외곽 고리 + 구멍 하나, 그리고 떨어진 섬(다중 다각형)
+        feature(
+            "11",
+            "서울특별시",
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [
+                        ring(126.8, 37.4, 127.2, 37.7),
+                        ring(127.10, 37.60, 127.15, 37.65),
+                    ],
+                    [ring(126.5, 37.45, 126.55, 37.5)],
+                ],
+            },
+            name_eng="Seoul",
+        ),
+    ]
+    sigungu = [
+        feature(
+            "11680",
+            "강남구",
+            {"type": "Polygon", "coordinates": [ring(127.0, 37.45, 127.1, 37.55)]},
+            name_eng="Gangnam-gu",
+        ),
+    ]
+    dong = [
+        # 구멍이 두 개인 동과, 그중 한 구멍을 채우는 동
+        feature(
+            "1168064000",
+            "역삼동",
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    ring(127.02, 37.48, 127.06, 37.52),
+                    ring(127.03, 37.49, 127.04, 37.50),
+                    ring(127.045, 37.505, 127.055, 37.515),
+                ],
+            },
+            name_eng="Yeoksam-dong",
+        ),
+        feature(
+            "1168065000",
+            "섬동",
+            {"type": "Polygon", "coordinates": [ring(127.03, 37.49, 127.04, 37.50)]},
+        ),
+    ]
+    out = root / "index"
+    build_index(
+        [
+            (LEVEL_SIDO, write_layer(root / "sido.json", sido)),
+            (LEVEL_SIGUNGU, write_layer(root / "sigungu.json", sigungu)),
+            (LEVEL_DONG, write_layer(root / "dong.json", dong)),
+        ],
+        str(out),
+        cell_deg=0.05,
+    )
+    return AdminBoundaryIndex(str(out))
+
+
+def names(found):
+    return {level: feature["names"]["ko"] for level, feature in found.items()}
+
+
+def test_point_inside_outer_ring(index):
+    assert names(index.lookup(37.45, 126.9)) == {LEVEL_SIDO: "서울특별시"}
+
+
+def test_point_inside_hole_is_outside_polygon(index):
+    assert index.lookup(37.62, 127.12) == {}
+
+
+def test_point_inside_second_polygon_of_multipolygon(index):
+    assert names(index.lookup(37.47, 126.52)) == {LEVEL_SIDO: "서울특별시"}
+
+
+def test_point_outside_every_polygon(index):
+    assert index.lookup(37.8, 127.0) == {}
+    assert index.lookup(37.47, 126.6) == {}
+
+
+def test_point_in_polygon_with_holes(index):
+    # 역삼동의 구멍 밖
+    assert names(index.lookup(37.485, 127.025))[LEVEL_DONG] == "역삼동"
+    # 비어 있는 구멍: 동은 없고 상위 구역만 찾습니다.
+    found = names(index.lookup(37.51, 127.05))
+    assert LEVEL_DONG not in found
+    assert found == {LEVEL_SIGUNGU: "강남구", LEVEL_SIDO: "서울특별시"}
+    # 다른 동이 채운 구멍
+    assert names(index.lookup(37.495, 127.035))[LEVEL_DONG] == "섬동"
+
+
+def test_parents_are_linked_by_code(index):
+    found = names(index.lookup(37.485, 127.025))
+
+    assert found == {
+        LEVEL_DONG: "역삼동",
+        LEVEL_SIGUNGU: "강남구",
+        LEVEL_SIDO: "서울특별시",
+    }
+
+
+def test_reverse_geocode_formats_address_by_granularity(index):
+    result = index.reverse_geocode(37.485, 127.025, None)
+    assert result["formatted_address"] == "서울특별시 강남구 역삼동"
+    assert result["location_type"] == LEVEL_DONG
+    assert result["administrative_codes"] == {
+        LEVEL_SIDO: "11",
+        LEVEL_SIGUNGU: "11680",
+        LEVEL_DONG: "1168064000",
+    }
+
+    sigungu = index.reverse_geocode(37.485, 127.025, LEVEL_SIGUNGU, "en")
+    assert sigungu["formatted_address"] == "Gangnam-gu, Seoul"
+
+
+def test_reverse_geocode_returns_none_when_level_is_unknown(index):
+    # 빈 구멍 안에서는 동 수준으로 답할 수 없습니다.
+    assert index.reverse_geocode(37.51, 127.05, LEVEL_DONG) is None
+    assert index.reverse_geocode(37.8, 127.0, None) is None
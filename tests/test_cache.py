@@ -0,0 +1,193 @@
+"""결과 캐시(ResultCache)의 stale-while-revalidate 갱신과 장애 대체 테스트입니다."""
+
+import asyncio
+import itertools
+from functools import partial
+from typing import Any, Dict, List
+
+import pytest
+
+from google_maps_agents import cache, shared_state
+from google_maps_agents.cache import ResultCache
+from google_maps_agents.shared_state import SHARED_STATE_ADDRESS_ENV
+
+_namespaces = itertools.count()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """프로세스 내부 저장소와 가짜 시계를 사용합니다."""
+    monkeypatch.setattr(shared_state, "_store", None)
+    monkeypatch.delenv(SHARED_STATE_ADDRESS_ENV, raising=False)
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "time", fake)
+    return fake
+
+
+class Upstream:
+    """호출할 때마다 버전이 올라가는 결과를 돌려주는 업스트림 대역입니다."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+        self.error_result = False
+
+    async def fetch(self) -> Dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        if self.error_result:
+            return {"error": "quota"}
+        return {"version": self.calls}
+
+
+def make_cache(**kwargs: float) -> ResultCache:
+    options = {"ttl": 60.0, "hard_ttl": 300.0, "stale_ttl": 600.0}
+    options.update(kwargs)
+    return ResultCache(f"test-{next(_namespaces)}", **options)
+
+
+def run(*steps) -> List[Any]:
+    """단계를 같은 이벤트 루프에서 차례로 실행하고, 백그라운드 갱신이 끝날 때까지 기다립니다."""
+
+    async def scenario():
+        results = []
+        for step in steps:
+            results.append(await step())
+            pending = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            await asyncio.gather(*pending)
+        return results
+
+    return asyncio.run(scenario())
+
+
+def test_fresh_entry_is_served_without_upstream_call(clock):
+    store, upstream = make_cache(), Upstream()
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    assert run(get, get) == [{"version": 1}, {"version": 1}]
+    assert upstream.calls == 1
+
+
+def test_soft_expired_entry_is_returned_and_refreshed_in_background(clock):
+    store, upstream = make_cache(), Upstream()
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    async def after_soft_ttl():
+        clock.now += 120
+        return await get()
+
+    first, stale, refreshed = run(get, after_soft_ttl, get)
+
+    assert first == {"version": 1}
+    # 소프트 TTL이 지난 값은 기다리지 않고 그대로 반환합니다.
+    assert stale == {"version": 1}
+    assert refreshed == {"version": 2}
+    assert upstream.calls == 2
+
+
+def test_hard_expired_entry_is_fetched_synchronously(clock):
+    store, upstream = make_cache(), Upstream()
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    async def after_hard_ttl():
+        clock.now += 301
+        return await get()
+
+    assert run(get, after_hard_ttl) == [{"version": 1}, {"version": 2}]
+
+
+def test_failed_refresh_keeps_previous_value(clock):
+    store, upstream = make_cache(), Upstream()
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    async def refresh_with_error_result():
+        clock.now += 120
+        upstream.error_result = True
+        return await get()
+
+    async def refresh_with_exception():
+        upstream.error_result = False
+        upstream.fail = True
+        return await get()
+
+    results = run(get, refresh_with_error_result, refresh_with_exception)
+
+    assert results == [{"version": 1}] * 3
+    assert upstream.calls == 3
+
+
+def test_refresh_is_skipped_when_concurrency_limit_is_reached(clock, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_REFRESH_CONCURRENCY", 0)
+    store, upstream = make_cache(), Upstream()
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    async def after_soft_ttl():
+        clock.now += 120
+        return await get()
+
+    assert run(get, after_soft_ttl) == [{"version": 1}, {"version": 1}]
+    assert upstream.calls == 1
+
+
+def test_without_hard_ttl_soft_expiry_fetches_synchronously(clock):
+    store, upstream = make_cache(hard_ttl=0.0), Upstream()
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    async def after_soft_ttl():
+        clock.now += 61
+        return await get()
+
+    assert run(get, after_soft_ttl) == [{"version": 1}, {"version": 2}]
+
+
+def test_concurrent_misses_share_one_upstream_call(clock):
+    store, upstream = make_cache(), Upstream()
+
+    async def concurrent():
+        return await asyncio.gather(
+            *(store.get_or_fetch("k", upstream.fetch) for _ in range(5))
+        )
+
+    assert run(concurrent) == [[{"version": 1}] * 5]
+    assert upstream.calls == 1
+
+
+def test_stale_or_serves_retained_entries_until_stale_ttl(clock):
+    store = make_cache()
+    fallback = {"error": "down"}
+
+    async def scenario():
+        await store.set("k", {"version": 1})
+        clock.now += 400
+        during_outage = await store.stale_or("k", fallback)
+        clock.now += 600
+        after_retention = await store.stale_or("k", fallback)
+        return during_outage, after_retention
+
+    during_outage, after_retention = asyncio.run(scenario())
+
+    assert during_outage == {"version": 1, "stale": True, "stale_age_seconds": 400.0}
+    assert after_retention == fallback
+
+
+def test_error_results_are_not_cached(clock):
+    store, upstream = make_cache(), Upstream()
+    upstream.error_result = True
+    get = partial(store.get_or_fetch, "k", upstream.fetch)
+
+    assert run(get, get) == [{"error": "quota"}, {"error": "quota"}]
+    assert upstream.calls == 2
@@ -0,0 +1,196 @@
+"""쿼리/주소 정규화와 근사 중복 병합(NearDuplicateIndex) 테스트입니다."""
+
+import pytest
+
+from google_maps_agents import canonical
+from google_maps_agents.canonical import (
+    NearDuplicateIndex,
+    canonicalize_address,
+    canonicalize_query,
+    extract_result_count,
+    is_order_sensitive,
+    query_cache_key,
+)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "강남역 카페",
+        "카페 강남역에서 찾아줘",
+        "강남역  카페!!",
+        "강남역 카페 5개 보여줘",
+        "강남역 카페 추천해주세요",
+    ],
+)
+def test_canonical_forms_match(query):
+    assert canonicalize_query(query) == "강남역 카페"
+
+
+def test_canonicalize_is_case_and_width_insensitive():
+    assert canonicalize_query("Coffee Shops GANGNAM") == canonicalize_query(
+        "ｃｏｆｆｅｅ shops gangnam"
+    )
+
+
+def test_canonicalize_keeps_distinguishing_tokens():
+    assert canonicalize_query("강남역 1번 출구 카페") != canonicalize_query(
+        "강남역 2번 출구 카페"
+    )
+    assert canonicalize_query("강남역 카페") != canonicalize_query("홍대 카페")
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("강남역 말고 홍대 카페", "홍대 말고 강남역 카페"),
+        ("스타벅스 빼고 강남역 카페", "강남역 빼고 스타벅스 카페"),
+        ("강남역말고 홍대 카페", "홍대말고 강남역 카페"),
+        ("신촌에서 홍대까지 맛집", "홍대에서 신촌까지 맛집"),
+        ("cafes near gangnam not hongdae", "cafes near hongdae not gangnam"),
+    ],
+)
+def test_negation_and_direction_keep_token_order(a, b):
+    assert canonicalize_query(a) != canonicalize_query(b)
+    assert is_order_sensitive(canonicalize_query(a))
+
+
+def test_order_sensitive_queries_still_drop_fillers():
+    assert canonicalize_query("강남역 말고 홍대 근처 카페 찾아줘") == (
+        "강남역 말고 홍대 카페"
+    )
+    assert not is_order_sensitive(canonicalize_query("강남역 카페"))
+
+
+def test_canonicalize_falls_back_to_text_when_every_token_is_filler():
+    assert canonicalize_query("  찾아줘  ") == "찾아줘"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("강남역 카페 5개", 5),
+        ("카페 세 곳 추천", 3),
+        ("강남역 카페 5개 정도 보여줘", 5),
+        ("top 10 cafes", 10),
+        ("강남역 카페", None),
+        ("서울 3개 구 맛집", None),
+        ("서울 3개 구", None),
+        ("홍대 맛집 3곳", 3),
+    ],
+)
+def test_extract_result_count(text, expected):
+    assert extract_result_count(text) == expected
+
+
+def test_near_duplicates_merge_typos_to_first_seen_form():
+    index = NearDuplicateIndex(0.6)
+    first = canonicalize_query("서울역 근처 스타벅스 리저브")
+    typo = canonicalize_query("서울역 근처 스타벅스 리저부")
+
+    assert first != typo
+    assert index.resolve(first) == first
+    assert index.resolve(typo) == first
+
+
+def test_near_duplicates_never_merge_different_numbers():
+    index = NearDuplicateIndex(0.5)
+    exit_1 = canonicalize_query("서울역 1번 출구 카페")
+    exit_2 = canonicalize_query("서울역 2번 출구 카페")
+
+    assert index.resolve(exit_1) == exit_1
+    assert index.resolve(exit_2) == exit_2
+
+
+def test_counted_nouns_stay_in_the_canonical_form():
+    assert canonicalize_query("서울 3개 구 맛집") != canonicalize_query("서울 맛집")
+
+
+def test_near_duplicates_never_merge_order_sensitive_queries():
+    index = NearDuplicateIndex(0.5)
+    first = canonicalize_query("강남역 말고 홍대 카페")
+    swapped = canonicalize_query("홍대 말고 강남역 카페")
+
+    assert index.resolve(first) == first
+    assert index.resolve(swapped) == swapped
+    assert not index._signatures
+
+
+def test_near_duplicates_keep_unrelated_queries_apart():
+    index = NearDuplicateIndex(0.6)
+
+    assert index.resolve("강남역 카페") == "강남역 카페"
+    assert index.resolve("맛집 홍대") == "맛집 홍대"
+
+
+def test_near_duplicate_index_evicts_least_recently_used():
+    index = NearDuplicateIndex(0.6, max_entries=2)
+    for query in ("강남역 카페", "맛집 홍대", "약국 잠실"):
+        index.resolve(query)
+
+    assert list(index._signatures) == ["맛집 홍대", "약국 잠실"]
+    assert not any("강남역 카페" in bucket for bucket in index._buckets.values())
+
+
+def test_near_duplicate_index_rejects_uneven_bands():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(0.6, num_perm=64, bands=10)
+
+
+def test_query_cache_key_uses_near_duplicate_index(monkeypatch):
+    monkeypatch.setattr(canonical, "_near_duplicates", NearDuplicateIndex(0.6))
+
+    first = query_cache_key("서울역 근처 스타벅스 리저브")
+    assert query_cache_key("스타벅스 리저부 서울역 근처에서 찾아줘") == first
+
+
+def test_query_cache_key_is_exact_without_index(monkeypatch):
+    monkeypatch.setattr(canonical, "_near_duplicates", None)
+
+    assert query_cache_key("서울역 근처 스타벅스 리저부") == "리저부 서울역 스타벅스"
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "서울특별시 강남구 테헤란로 152",
+        "서울시 강남구 테헤란로152",
+        "대한민국 서울 강남구 테헤란로 152",
+        "South Korea, 서울특별시 강남구 테헤란로 152",
+        "Republic of Korea 서울 강남구, 테헤란로 152",
+    ],
+)
+def test_address_variants_share_one_canonical_form(address):
+    assert canonicalize_address(address) == "서울강남구테헤란로152"
+
+
+def test_address_lot_suffix_is_dropped():
+    assert canonicalize_address("서울 강남구 역삼동 737번지") == canonicalize_address(
+        "서울특별시 강남구 역삼동 737"
+    )
+
+
+@pytest.mark.parametrize(
+    "address, expected",
+    [
+        ("한국은행", "한국은행"),
+        ("Korea University", "koreauniversity"),
+        ("대한민국역사박물관", "대한민국역사박물관"),
+        ("한국외국어대학교", "한국외국어대학교"),
+        ("서울시립대학교", "서울시립대학교"),
+        # 국가명 뒤에 광역 행정구역이 없으면 이름의 일부로 봅니다.
+        ("한국 은행", "한국은행"),
+    ],
+)
+def test_address_prefixes_inside_names_are_kept(address, expected):
+    assert canonicalize_address(address) == expected
+
+
+def test_address_names_do_not_merge_with_their_suffix():
+    assert canonicalize_address("한국은행") != canonicalize_address("은행")
+    assert canonicalize_address("Korea University") != canonicalize_address(
+        "University"
+    )
+    assert canonicalize_address("서울시립대학교") != canonicalize_address(
+        "서울립대학교"
+    )
@@ -0,0 +1,213 @@
+"""모델 계층(CascadeLlm) 승급과 선택자 출력 검증 함수 테스트입니다."""
+
+import asyncio
+import itertools
+from typing import AsyncGenerator, List
+
+import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from google_maps_agents.models import cascade
+from google_maps_agents.models.cascade import (
+    CascadeLlm,
+    get_cascade_stats,
+    get_model,
+    text_validator,
+)
+from google_maps_agents.models.validators import (
+    is_valid_rating_pricing_output,
+    response_text,
+    tool_call_validator,
+)
+from google_maps_agents.telemetry.tracing import (
+    MODEL_METADATA_KEY,
+    REJECTED_USAGE_METADATA_KEY,
+)
+
+_agent_ids = itertools.count()
+
+
+def text_response(text: str, tokens: int = 0, partial: bool = False) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=tokens, candidates_token_count=tokens
+        ),
+        partial=partial,
+    )
+
+
+def call_response(name: str, args: dict) -> LlmResponse:
+    part = types.Part(function_call=types.FunctionCall(name=name, args=args))
+    return LlmResponse(content=types.Content(role="model", parts=[part]))
+
+
+class ScriptedLlm(BaseLlm):
+    """미리 정한 응답을 돌려주고 호출 횟수를 기록하는 모델입니다."""
+
+    responses: List[LlmResponse] = []
+    fail: bool = False
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("upstream unavailable")
+        for response in self.responses:
+            yield response.model_copy(deep=True)
+
+
+def metadata(response: LlmResponse) -> dict:
+    return response.custom_metadata or {}
+
+
+def make_cascade(*tiers: ScriptedLlm, check=lambda text: text == "ok") -> CascadeLlm:
+    return CascadeLlm(
+        model=tiers[0].model,
+        agent_name=f"test_agent_{next(_agent_ids)}",
+        tiers=list(tiers),
+        validator=text_validator(check),
+    )
+
+
+def run(llm: CascadeLlm, stream: bool = False) -> List[LlmResponse]:
+    async def collect() -> List[LlmResponse]:
+        request = LlmRequest(
+            contents=[types.Content(role="user", parts=[types.Part(text="질문")])]
+        )
+        return [r async for r in llm.generate_content_async(request, stream)]
+
+    return asyncio.run(collect())
+
+
+def test_valid_first_tier_is_served_without_escalation():
+    fast = ScriptedLlm(model="fast", responses=[text_response("ok", tokens=3)])
+    strong = ScriptedLlm(model="strong", responses=[text_response("ok")])
+    llm = make_cascade(fast, strong)
+
+    responses = run(llm)
+
+    assert response_text(responses) == "ok"
+    assert strong.calls == 0
+    assert metadata(responses[0]) == {MODEL_METADATA_KEY: "fast"}
+    stats = get_cascade_stats()[llm.agent_name]
+    assert stats["escalations"] == 0
+    assert stats["served"] == {"fast": 1}
+
+
+def test_invalid_output_escalates_and_attributes_rejected_usage():
+    fast = ScriptedLlm(model="fast", responses=[text_response("bad", tokens=4)])
+    strong = ScriptedLlm(model="strong", responses=[text_response("ok", tokens=9)])
+    llm = make_cascade(fast, strong)
+
+    responses = run(llm)
+
+    assert len(responses) == 1
+    assert metadata(responses[0])[MODEL_METADATA_KEY] == "strong"
+    assert metadata(responses[0])[REJECTED_USAGE_METADATA_KEY] == [
+        {"model": "fast", "prompt_tokens": 4, "completion_tokens": 4}
+    ]
+    stats = get_cascade_stats()[llm.agent_name]
+    assert stats["escalations"] == 1
+    assert stats["escalation_rate"] == 1.0
+    assert stats["served"] == {"strong": 1}
+
+
+def test_exception_and_error_code_escalate():
+    broken = ScriptedLlm(model="broken", fail=True)
+    errored = ScriptedLlm(
+        model="errored",
+        responses=[LlmResponse(error_code="SAFETY", error_message="blocked")],
+    )
+    last = ScriptedLlm(model="last", responses=[text_response("ok")])
+    llm = make_cascade(broken, errored, last)
+
+    responses = run(llm)
+
+    assert metadata(responses[0])[MODEL_METADATA_KEY] == "last"
+    rejected = metadata(responses[0])[REJECTED_USAGE_METADATA_KEY]
+    assert [r["model"] for r in rejected] == [
+        "broken",
+        "errored",
+    ]
+    assert get_cascade_stats()[llm.agent_name]["escalations"] == 2
+
+
+def test_last_tier_is_returned_without_validation():
+    fast = ScriptedLlm(model="fast", responses=[text_response("bad")])
+    strong = ScriptedLlm(model="strong", responses=[text_response("still bad")])
+
+    responses = run(make_cascade(fast, strong))
+
+    assert response_text(responses) == "still bad"
+    assert metadata(responses[0])[MODEL_METADATA_KEY] == "strong"
+
+
+def test_rejected_usage_is_attached_once_to_the_final_streamed_response():
+    fast = ScriptedLlm(model="fast", responses=[text_response("bad", tokens=2)])
+    strong = ScriptedLlm(
+        model="strong",
+        responses=[
+            text_response("o", partial=True),
+            text_response("k", partial=True),
+            text_response("ok", tokens=5),
+        ],
+    )
+
+    responses = run(make_cascade(fast, strong), stream=True)
+
+    assert [r.partial for r in responses] == [True, True, False]
+    carrying = [r for r in responses if REJECTED_USAGE_METADATA_KEY in metadata(r)]
+    assert carrying == [responses[-1]]
+    assert all(metadata(r)[MODEL_METADATA_KEY] == "strong" for r in responses)
+
+
+def test_get_model_returns_plain_gemini_when_disabled(monkeypatch):
+    monkeypatch.setattr(cascade, "MODEL_CASCADE_ENABLED", False)
+    model = get_model("agent", "gemini-2.5-flash", text_validator(bool))
+    assert isinstance(model, Gemini)
+    assert model.model == "gemini-2.5-flash"
+
+
+def test_get_model_builds_deduplicated_tiers(monkeypatch):
+    monkeypatch.setattr(cascade, "MODEL_CASCADE_ENABLED", True)
+    monkeypatch.setattr(cascade, "CASCADE_FAST_MODEL_NAME", "lite")
+    monkeypatch.setattr(cascade, "CASCADE_ESCALATION_MODEL_NAME", "pro")
+
+    model = get_model("agent", "lite", text_validator(bool))
+
+    assert isinstance(model, CascadeLlm)
+    assert [tier.model for tier in model.tiers] == ["lite", "pro"]
+    assert isinstance(get_model("agent", "lite"), Gemini)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", True),
+        ('{"minRating": 4.0}', True),
+        ('```json\n{"priceLevels": ["PRICE_LEVEL_MODERATE"]}\n```', True),
+        ('{"minRating": 6}', False),
+        ('{"priceLevels": ["CHEAP"]}', False),
+        ("[1, 2]", False),
+        ("평점 4점 이상", False),
+    ],
+)
+def test_is_valid_rating_pricing_output(text, expected):
+    assert is_valid_rating_pricing_output(text) is expected
+
+
+def test_tool_call_validator():
+    validate = tool_call_validator(frozenset({"text_search_tool"}))
+
+    assert validate([call_response("text_search_tool", {"query": "카페"})])
+    assert not validate([call_response("unknown_tool", {"query": "카페"})])
+    assert not validate([call_response("text_search_tool", {})])
+    assert validate([text_response("결과를 찾았습니다.")])
+    assert not validate([text_response("  ")])
@@ -0,0 +1,231 @@
+"""서킷 브레이커 상태 전이(closed -> open -> half_open -> closed/open) 테스트입니다."""
+
+import asyncio
+from typing import Callable
+
+import pytest
+
+from google_maps_agents import circuit_breaker
+from google_maps_agents.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    get_circuit_breaker,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def make_breaker(
+    is_failure: Callable[[BaseException], bool] = lambda e: True,
+) -> CircuitBreaker:
+    return CircuitBreaker(
+        "test.endpoint",
+        slow_call_seconds=1.0,
+        failure_rate=0.5,
+        min_calls=4,
+        window_size=10,
+        open_seconds=30.0,
+        is_failure=is_failure,
+    )
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        assert breaker.allow()
+        breaker.record(failed=True)
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record(failed=True)
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow()
+
+
+def test_stays_closed_below_failure_rate(clock):
+    breaker = make_breaker()
+    for failed in (True, False, False, False, True):
+        breaker.record(failed=failed)
+
+    assert breaker.state == STATE_CLOSED
+
+
+def test_opens_at_failure_rate_and_rejects(clock):
+    breaker = make_breaker()
+    trip(breaker)
+
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow()
+    clock.now += 29.0
+    assert not breaker.allow()
+
+
+def test_half_open_allows_limited_trials_after_open_seconds(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 30.0
+
+    assert breaker.allow()
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_successful_trial_closes_and_clears_window(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record(failed=False)
+
+    assert breaker.state == STATE_CLOSED
+    # 이전 실패 기록은 지워졌으므로 한 번의 실패로 다시 열리지 않습니다.
+    breaker.record(failed=True)
+    assert breaker.state == STATE_CLOSED
+
+
+def test_failed_trial_reopens_for_another_open_period(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record(failed=True)
+
+    assert breaker.state == STATE_OPEN
+    clock.now += 29.0
+    assert not breaker.allow()
+    clock.now += 1.0
+    assert breaker.allow()
+
+
+def test_track_counts_slow_calls_as_failures(clock):
+    breaker = make_breaker()
+    for _ in range(breaker.min_calls):
+        with breaker.track():
+            clock.now += 1.5
+
+    assert breaker.state == STATE_OPEN
+
+
+def test_track_ignores_caller_errors(clock):
+    breaker = make_breaker(is_failure=lambda e: not isinstance(e, ValueError))
+    for _ in range(breaker.min_calls):
+        with pytest.raises(ValueError):
+            with breaker.track():
+                raise ValueError("bad request")
+
+    assert breaker.state == STATE_CLOSED
+
+    for _ in range(breaker.min_calls):
+        with pytest.raises(RuntimeError):
+            with breaker.track():
+                raise RuntimeError("upstream down")
+
+    assert breaker.state == STATE_OPEN
+
+
+def test_cancelled_trial_releases_half_open_slot(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+
+    with pytest.raises(asyncio.CancelledError):
+        with breaker.track():
+            raise asyncio.CancelledError()
+
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow()
+
+
+def half_open(clock: FakeClock) -> CircuitBreaker:
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 30.0
+    return breaker
+
+
+def test_attempt_releases_slot_when_request_building_fails(clock):
+    breaker = half_open(clock)
+
+    with pytest.raises(ValueError):
+        with breaker.attempt() as call:
+            assert call.allowed
+            raise ValueError("invalid request parameters")
+
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow()
+
+
+def test_attempt_releases_slot_when_cancelled_before_tracking(clock):
+    breaker = half_open(clock)
+
+    async def wait_for_key_token():
+        with breaker.attempt() as call:
+            assert call.allowed
+            await asyncio.sleep(10)
+            with call.track():
+                pass
+
+    async def cancel_while_waiting():
+        task = asyncio.create_task(wait_for_key_token())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_while_waiting())
+
+    assert breaker.allow()
+
+
+def test_attempt_releases_slot_on_early_return(clock):
+    breaker = half_open(clock)
+
+    def search() -> str:
+        with breaker.attempt() as call:
+            if call.allowed:
+                return "cached"
+        return "rejected"
+
+    assert search() == "cached"
+    assert search() == "cached"
+    assert breaker.state == STATE_HALF_OPEN
+
+
+def test_attempt_records_tracked_result_once(clock):
+    breaker = half_open(clock)
+
+    with breaker.attempt() as call:
+        with call.track():
+            pass
+
+    assert breaker.state == STATE_CLOSED
+
+    trip(breaker)
+    with breaker.attempt() as call:
+        assert not call.allowed
+    assert breaker.state == STATE_OPEN
+
+
+def test_get_circuit_breaker_is_shared_per_endpoint():
+    first = get_circuit_breaker("test.shared", 1.0, is_failure=lambda e: False)
+    assert get_circuit_breaker("test.shared", 5.0) is first
+    assert not first.is_failure(RuntimeError())
+    assert get_circuit_breaker("test.default", 1.0).is_failure(RuntimeError())
@@ -0,0 +1,148 @@
+"""턴 단위 비용 집계(begin_turn/end_turn)와 비용 기록 요약 테스트입니다."""
+
+from collections import OrderedDict
+from typing import Optional
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import types
+
+from google_maps_agents.telemetry import cost
+from google_maps_agents.telemetry.cost import (
+    COST_HISTORY_KEY,
+    COST_TOTALS_KEY,
+    begin_turn,
+    end_turn,
+    record_llm_usage,
+    record_upstream_call,
+    summarize_cost_history,
+)
+
+ROOT = LlmAgent(name="coordinator")
+CHILD = LlmAgent(name="places_agent")
+
+
+@pytest.fixture(autouse=True)
+def clear_open_turns(monkeypatch):
+    """다른 테스트의 끝나지 않은 턴이 남지 않도록 턴 목록을 비웁니다."""
+    monkeypatch.setattr(cost, "_turns", OrderedDict())
+
+
+def context(
+    session: Session, invocation_id: str, agent: LlmAgent, utterance: Optional[str]
+) -> CallbackContext:
+    content = (
+        types.Content(role="user", parts=[types.Part(text=utterance)])
+        if utterance is not None
+        else None
+    )
+    invocation = InvocationContext(
+        session_service=InMemorySessionService(),
+        invocation_id=invocation_id,
+        agent=agent,
+        user_content=content,
+        session=session,
+    )
+    return CallbackContext(invocation)
+
+
+def run_turn(session: Session, invocation_id: str, utterance: str = "강남역 카페"):
+    """코디네이터가 시작하고 하위 에이전트가 LLM과 업스트림을 호출하는 턴 하나를 실행합니다."""
+    begin_turn(context(session, invocation_id, ROOT, utterance))
+    child = context(session, invocation_id, CHILD, utterance)
+    begin_turn(child)
+    record_llm_usage(invocation_id, "places_agent", "gemini", 100, 20)
+    record_llm_usage(invocation_id, "places_agent", "gemini", 50, 10)
+    record_upstream_call("places", "Text Search Pro")
+    end_turn(child)
+    end_turn(context(session, invocation_id, ROOT, utterance))
+
+
+def new_session() -> Session:
+    return Session(id="s1", app_name="app", user_id="u1")
+
+
+def test_turn_cost_is_written_when_the_owner_agent_ends():
+    session = new_session()
+    run_turn(session, "inv-1")
+
+    (record,) = session.state[COST_HISTORY_KEY]
+    assert record["utterance"] == "강남역 카페"
+    assert record["llm"] == [
+        {
+            "agent": "places_agent",
+            "model": "gemini",
+            "calls": 2,
+            "prompt_tokens": 150,
+            "completion_tokens": 30,
+        }
+    ]
+    assert record["upstream"] == [
+        {"api": "places", "sku": "Text Search Pro", "calls": 1}
+    ]
+    assert session.state[COST_TOTALS_KEY] == {
+        "llm_calls": 2,
+        "prompt_tokens": 150,
+        "completion_tokens": 30,
+        "upstream_calls": 1,
+        "turns": 1,
+        "upstream_by_sku": {"places:Text Search Pro": 1},
+    }
+
+
+def test_upstream_calls_outside_a_turn_are_not_attributed():
+    session = new_session()
+    run_turn(session, "inv-1")
+    record_upstream_call("places", "Text Search Pro")
+    run_turn(session, "inv-2")
+
+    assert session.state[COST_TOTALS_KEY]["upstream_calls"] == 2
+
+
+def test_history_keeps_only_recent_turns_but_totals_cover_all(monkeypatch):
+    monkeypatch.setattr(cost, "COST_HISTORY_MAX_TURNS", 2)
+    session = new_session()
+    for turn in range(3):
+        run_turn(session, f"inv-{turn}", utterance=f"발화 {turn}")
+
+    history = session.state[COST_HISTORY_KEY]
+    assert [record["utterance"] for record in history] == ["발화 1", "발화 2"]
+    assert session.state[COST_TOTALS_KEY]["turns"] == 3
+    assert session.state[COST_TOTALS_KEY]["prompt_tokens"] == 450
+
+
+def test_zero_history_limit_keeps_only_totals(monkeypatch):
+    monkeypatch.setattr(cost, "COST_HISTORY_MAX_TURNS", 0)
+    session = new_session()
+    run_turn(session, "inv-1")
+
+    assert COST_HISTORY_KEY not in session.state
+    assert session.state[COST_TOTALS_KEY]["turns"] == 1
+
+
+def test_summary_groups_equivalent_utterances_by_token_cost():
+    def record(utterance, prompt_tokens, upstream_calls):
+        return {
+            "utterance": utterance,
+            "totals": {"prompt_tokens": prompt_tokens, "llm_calls": 1},
+            "upstream": [
+                {"api": "places", "sku": "Text Search Pro", "calls": upstream_calls}
+            ],
+        }
+
+    records = [
+        record("강남역 카페 찾아줘", 100, 1),
+        record("홍대 맛집", 500, 2),
+        record("카페 강남역", 100, 1),
+    ]
+
+    summaries = summarize_cost_history(records)
+
+    assert [s["example"] for s in summaries] == ["홍대 맛집", "강남역 카페 찾아줘"]
+    assert summaries[1]["turns"] == 2
+    assert summaries[1]["prompt_tokens"] == 200
+    assert summaries[1]["upstream"] == {"places:Text Search Pro": 2}
+    assert summarize_cost_history(records, top=1) == summaries[:1]
@@ -0,0 +1,129 @@
+"""필드 마스크 정규화/보정(validate_field_mask, resolve_field)과 SKU 등급 계산 테스트입니다."""
+
+import pytest
+
+from google_maps_agents.tools.field_mask import (
+    SkuTier,
+    compute_sku_tier,
+    resolve_field,
+    validate_field_mask,
+)
+
+FALLBACK = "places.id,places.displayName"
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("rating", "places.rating"),
+        ("places.Rating", "places.rating"),
+        ("regular_opening_hours", "places.regularOpeningHours"),
+        ("places.raiting", "places.rating"),
+        ("`places.rating`", "places.rating"),
+        ("**places.rating**", "places.rating"),
+        ("places.displayName.text", "places.displayName.text"),
+        ("*", "*"),
+        ("places.*", "places.*"),
+        ("`*`", "*"),
+        ("'places.*'", "places.*"),
+        ("unknownField", None),
+        ("**", None),
+    ],
+)
+def test_resolve_field(token, expected):
+    assert resolve_field(token) == expected
+
+
+def test_validate_repairs_and_deduplicates():
+    result = validate_field_mask(" places.id, rating,\nplaces.id ", FALLBACK)
+
+    assert result.mask == "places.id,places.rating"
+    assert result.repaired == {"rating": "places.rating"}
+    assert result.dropped == []
+    assert result.tier is SkuTier.ENTERPRISE
+    assert result.changed
+
+
+def test_validate_keeps_canonical_mask_unchanged():
+    result = validate_field_mask("places.id,places.formattedAddress", FALLBACK)
+
+    assert result.mask == "places.id,places.formattedAddress"
+    assert not result.changed
+
+
+@pytest.mark.parametrize("mask", ["*", "places.*", "`*`"])
+def test_validate_keeps_wildcards(mask):
+    result = validate_field_mask(mask, FALLBACK)
+
+    assert result.fields == [mask.strip("`")]
+    assert result.tier is SkuTier.ENTERPRISE_ATMOSPHERE
+    assert result.dropped == []
+
+
+def test_validate_skips_markdown_noise_tokens():
+    result = validate_field_mask("- places.id\n** \n`places.rating`", FALLBACK)
+
+    assert result.fields == ["places.id", "places.rating"]
+    assert result.dropped == ["-"]
+
+
+def test_validate_falls_back_when_nothing_is_recognised():
+    result = validate_field_mask("foo, bar", FALLBACK)
+
+    assert result.mask == FALLBACK
+    assert result.dropped == ["foo", "bar"]
+
+
+def test_validate_downgrades_fields_above_max_tier():
+    result = validate_field_mask(
+        "places.id,places.displayName,places.reviews", FALLBACK, max_tier="pro"
+    )
+
+    assert result.mask == "places.id,places.displayName"
+    assert result.downgraded == ["places.reviews"]
+    assert result.tier is SkuTier.PRO
+
+
+def test_validate_uses_fallback_within_tier_when_all_fields_downgraded():
+    result = validate_field_mask(
+        "places.reviews", FALLBACK, max_tier=SkuTier.ESSENTIALS
+    )
+
+    assert result.downgraded == ["places.reviews"]
+    assert result.tier is SkuTier.ESSENTIALS
+    assert all(field in FALLBACK.split(",") for field in result.fields)
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ([], SkuTier.ESSENTIALS),
+        (["places.id"], SkuTier.ESSENTIALS),
+        (["places.id", "places.displayName"], SkuTier.PRO),
+        (["places.displayName.text"], SkuTier.PRO),
+        (["places.id", "places.rating"], SkuTier.ENTERPRISE),
+        (["places.rating", "places.reviews"], SkuTier.ENTERPRISE_ATMOSPHERE),
+        (["*"], SkuTier.ENTERPRISE_ATMOSPHERE),
+    ],
+)
+def test_compute_sku_tier_takes_highest_field_tier(fields, expected):
+    assert compute_sku_tier(fields) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Enterprise + Atmosphere", SkuTier.ENTERPRISE_ATMOSPHERE),
+        ("enterprise_atmosphere", SkuTier.ENTERPRISE_ATMOSPHERE),
+        ("pro", SkuTier.PRO),
+        (2, SkuTier.ENTERPRISE),
+        (SkuTier.ESSENTIALS, SkuTier.ESSENTIALS),
+    ],
+)
+def test_sku_tier_parse(value, expected):
+    assert SkuTier.parse(value) == expected
+
+
+def test_sku_tier_parse_rejects_unknown_label():
+    with pytest.raises(ValueError):
+        SkuTier.parse("Premium")
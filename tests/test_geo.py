@@ -0,0 +1,264 @@
+"""기준 위치 주변 검색, 경로 단순화(Douglas–Peucker)와 GPS 경로 일괄 역지오코딩 테스트입니다."""
+
+import asyncio
+import math
+
+import numpy as np
+import pytest
+
+from google_maps_agents.tools.geo import (
+    MAX_BIAS_RADIUS_M,
+    SearchArea,
+    _project_m,
+    cumulative_distance_m,
+    grid_cells,
+    haversine_m,
+    rank_by_distance,
+    simplify_polyline,
+    split_anchor,
+)
+from google_maps_agents.tools.geocode import GeocodingService
+
+# 위도 1도의 거리 (미터, 근사값)
+M_PER_DEG_LAT = 111_195.0
+LAT0, LNG0 = 37.5, 127.0
+
+
+def place(place_id, north_m=None):
+    """기준점에서 북쪽으로 north_m 떨어진 장소입니다. north_m이 None이면 좌표가 없습니다."""
+    if north_m is None:
+        return {"id": place_id}
+    location = {"latitude": LAT0 + north_m / M_PER_DEG_LAT, "longitude": LNG0}
+    return {"id": place_id, "location": location}
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("서울역 근처 약국", ("서울역", "약국")),
+        ("강남역 주변에 있는 카페", ("강남역", "카페")),
+        ("홍대입구역에서 가까운 술집", ("홍대입구역", "술집")),
+        ("pharmacy near Seoul Station", ("Seoul Station", "pharmacy")),
+        ("강남역 카페", None),
+    ],
+)
+def test_split_anchor(query, expected):
+    assert split_anchor(query) == expected
+
+
+def test_rank_by_distance_sorts_filters_and_annotates():
+    places = [
+        place("far", 900),
+        place("outside", 1500),
+        place("near", 100),
+        place("no-location"),
+    ]
+    area = SearchArea(lat=LAT0, lng=LNG0, radius_m=1000)
+
+    ranked = rank_by_distance(places, area)
+
+    assert [p["id"] for p in ranked] == ["near", "far"]
+    assert [p["distance_m"] for p in ranked] == pytest.approx([100, 900], abs=1)
+    # 원본 장소 목록은 바꾸지 않습니다.
+    assert "distance_m" not in places[0]
+
+
+def test_rank_by_distance_keeps_relevance_order_for_ties():
+    places = [place("first", 200), place("second", 200)]
+    area = SearchArea(lat=LAT0, lng=LNG0, radius_m=1000)
+
+    assert [p["id"] for p in rank_by_distance(places, area)] == ["first", "second"]
+    assert rank_by_distance([], area) == []
+
+
+def test_search_area_bounds_cover_the_radius():
+    area = SearchArea(lat=LAT0, lng=LNG0, radius_m=1000, restrict=True)
+    (south, west), (north, east) = area.bounds()
+
+    assert (north - LAT0) * M_PER_DEG_LAT == pytest.approx(1000, rel=1e-3)
+    east_m = (east - LNG0) * M_PER_DEG_LAT * math.cos(math.radians(LAT0))
+    assert east_m == pytest.approx(1000, rel=1e-3)
+    assert (south, west) == pytest.approx((2 * LAT0 - north, 2 * LNG0 - east))
+
+
+def test_search_area_request_params():
+    bias = SearchArea(lat=LAT0, lng=LNG0, radius_m=100_000).to_request_params()
+    restrict = SearchArea(lat=LAT0, lng=LNG0, radius_m=500, restrict=True)
+
+    assert bias["location_bias"].circle.radius == MAX_BIAS_RADIUS_M
+    rectangle = restrict.to_request_params()["location_restriction"].rectangle
+    assert rectangle.low.latitude < LAT0 < rectangle.high.latitude
+    assert SearchArea(LAT0, LNG0, 500).cache_key() != restrict.cache_key()
+
+
+def offsets_to_coords(east_m, north_m):
+    """기준점에서 동/북쪽으로 떨어진 거리(미터)를 위도/경도 배열로 변환합니다."""
+    east_m, north_m = np.asarray(east_m, dtype=float), np.asarray(north_m, dtype=float)
+    lats = LAT0 + north_m / M_PER_DEG_LAT
+    lngs = LNG0 + east_m / (M_PER_DEG_LAT * math.cos(math.radians(LAT0)))
+    return lats, lngs
+
+
+def segment_distances(x, y, kept):
+    """각 점에서 단순화된 경로(남은 점을 잇는 선분)까지의 최소 거리를 반환합니다."""
+    distances = np.full(len(x), np.inf)
+    for start, end in zip(kept[:-1], kept[1:]):
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x - x[start], y - y[start]
+        length2 = dx * dx + dy * dy
+        t = np.clip((px * dx + py * dy) / length2, 0.0, 1.0) if length2 else 0.0
+        distances = np.minimum(distances, np.hypot(px - t * dx, py - t * dy))
+    return distances
+
+
+def test_straight_line_keeps_only_endpoints():
+    lats, lngs = offsets_to_coords(np.linspace(0, 1000, 101), np.zeros(101))
+
+    assert simplify_polyline(lats, lngs, 5.0).tolist() == [0, 100]
+
+
+def test_keeps_corner_beyond_tolerance_and_drops_wobble_within_it():
+    east = [0, 100, 200, 200, 200]
+    north = [0, 3, 0, 100, 200]
+    lats, lngs = offsets_to_coords(east, north)
+
+    assert simplify_polyline(lats, lngs, 10.0).tolist() == [0, 2, 4]
+    assert simplify_polyline(lats, lngs, 1.0).tolist() == [0, 1, 2, 4]
+
+
+def test_keeps_turnaround_of_out_and_back_path():
+    # 선분이 아닌 직선까지의 거리를 쓰면 되돌아온 점이 사라집니다.
+    lats, lngs = offsets_to_coords([0, 500, 1000, 500, 0], [0, 0, 0, 0, 1])
+
+    assert 2 in simplify_polyline(lats, lngs, 10.0).tolist()
+
+
+def test_removed_points_stay_within_tolerance():
+    rng = np.random.default_rng(7)
+    steps = rng.normal(0, 8, size=(500, 2)) + [5, 0]
+    east, north = np.cumsum(steps, axis=0).T
+    lats, lngs = offsets_to_coords(east, north)
+    tolerance = 15.0
+
+    kept = simplify_polyline(lats, lngs, tolerance)
+    x, y = _project_m(lats, lngs)
+
+    assert kept[0] == 0 and kept[-1] == len(lats) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert len(kept) < len(lats) / 2
+    assert segment_distances(x, y, kept).max() <= tolerance + 1e-6
+
+
+@pytest.mark.parametrize("n, tolerance", [(1, 10.0), (2, 10.0), (50, 0.0)])
+def test_short_paths_and_zero_tolerance_keep_every_point(n, tolerance):
+    lats, lngs = offsets_to_coords(np.arange(n) * 10.0, np.zeros(n))
+
+    assert simplify_polyline(lats, lngs, tolerance).tolist() == list(range(n))
+
+
+def test_cumulative_distance_matches_haversine_steps():
+    lats, lngs = offsets_to_coords([0, 300, 300], [0, 0, 400])
+
+    distances = cumulative_distance_m(lats, lngs)
+    assert distances[0] == 0.0
+    assert distances[-1] == pytest.approx(700.0, rel=1e-3)
+
+
+def test_grid_cells_are_path_independent():
+    lats, lngs = offsets_to_coords([0, 10, 60, 10], [0, 10, 0, 10])
+    cells = grid_cells(lats, lngs, 50.0)
+
+    assert tuple(cells[1]) == tuple(cells[3])
+    assert tuple(cells[0]) != tuple(cells[2])
+
+
+class RecordingGeocoder:
+    """요청 좌표를 기록하고, 요청 순번을 주소로 돌려주는 reverse_geocode 대역입니다."""
+
+    def __init__(self, fail: bool = False):
+        self.requests = []
+        self.fail = fail
+
+    async def __call__(self, lat, lng, language_code="ko"):
+        self.requests.append((lat, lng))
+        if self.fail:
+            return {"error": "down", "lat": lat, "lng": lng}
+        return {
+            "formatted_address": f"addr-{len(self.requests) - 1}",
+            "lat": lat,
+            "lng": lng,
+        }
+
+
+def run_trace(monkeypatch, points, geocoder=None, **kwargs):
+    monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
+    geocoder = geocoder or RecordingGeocoder()
+
+    async def run():
+        service = GeocodingService(cache_ttl=0)
+        monkeypatch.setattr(service, "reverse_geocode", geocoder)
+        try:
+            return await service.reverse_geocode_trace(points, **kwargs)
+        finally:
+            await service.aclose()
+
+    return asyncio.run(run()), geocoder
+
+
+def test_trace_geocodes_one_point_per_cell(monkeypatch):
+    lats, lngs = offsets_to_coords(np.linspace(0, 1000, 201), np.zeros(201))
+    points = list(zip(lats, lngs))
+
+    result, geocoder = run_trace(monkeypatch, points, tolerance_m=15.0, cell_m=50.0)
+
+    stats = result["stats"]
+    assert stats["points"] == 201
+    assert stats["requests"] == len(geocoder.requests) == len(result["addresses"])
+    assert stats["requests"] <= 1000 / 50 + 2
+    assert stats["call_reduction"] > 0.85
+    # 대표 점은 모두 서로 다른 격자 칸에 속합니다.
+    requested = np.asarray(geocoder.requests)
+    requested_cells = grid_cells(requested[:, 0], requested[:, 1], 50.0)
+    assert len({tuple(cell) for cell in requested_cells}) == stats["requests"]
+
+
+def test_trace_assigns_every_point_to_a_nearby_address(monkeypatch):
+    rng = np.random.default_rng(3)
+    east, north = np.cumsum(rng.normal(0, 6, size=(300, 2)) + [4, 0], axis=0).T
+    lats, lngs = offsets_to_coords(east, north)
+    cell_m = 50.0
+
+    result, geocoder = run_trace(
+        monkeypatch, list(zip(lats, lngs)), tolerance_m=15.0, cell_m=cell_m
+    )
+
+    assignments = result["point_addresses"]
+    assert len(assignments) == len(lats)
+    assert set(assignments) <= set(range(len(result["addresses"])))
+    requested = np.asarray(geocoder.requests)
+    assigned = requested[assignments]
+    distances = haversine_m(lats, lngs, assigned[:, 0], assigned[:, 1])
+    # 자기 칸의 대표 점 또는 경로상 가장 가까운 남은 점의 칸이므로 칸 두 개 거리 안에 있습니다.
+    assert distances.max() <= 2 * math.sqrt(2) * cell_m + 15.0
+    # 대표 점 자신은 자기 주소를 받습니다.
+    for index, (lat, lng) in enumerate(geocoder.requests):
+        point = int(np.flatnonzero((lats == lat) & (lngs == lng))[0])
+        assert assignments[point] == index
+
+
+def test_trace_counts_failed_lookups(monkeypatch):
+    lats, lngs = offsets_to_coords(np.linspace(0, 200, 21), np.zeros(21))
+
+    result, geocoder = run_trace(
+        monkeypatch, list(zip(lats, lngs)), RecordingGeocoder(fail=True), cell_m=50.0
+    )
+
+    assert result["stats"]["failed"] == len(geocoder.requests) > 0
+
+
+@pytest.mark.parametrize("points", [[], [(37.5, float("nan"))], [(37.5,)]])
+def test_trace_rejects_invalid_points(monkeypatch, points):
+    result, geocoder = run_trace(monkeypatch, points)
+
+    assert "error" in result
+    assert geocoder.requests == []
@@ -0,0 +1,224 @@
+"""API 키 풀의 제외(cooldown), 재시도(failover), 키 선택 테스트입니다."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from google_maps_agents import key_pool
+from google_maps_agents.key_pool import (
+    REASON_DENIED,
+    REASON_EXHAUSTED,
+    KeyPool,
+    keys_from_env,
+)
+
+_pool_names = itertools.count()
+
+
+class QuotaError(Exception):
+    pass
+
+
+class DeniedError(Exception):
+    pass
+
+
+def classify(error: BaseException):
+    if isinstance(error, QuotaError):
+        return REASON_EXHAUSTED
+    if isinstance(error, DeniedError):
+        return REASON_DENIED
+    return None
+
+
+def make_pool(keys, name=None) -> KeyPool:
+    # 제외 상태는 프로세스 상태 저장소에 API 이름별로 남으므로 테스트마다 새 이름을 사용합니다.
+    return KeyPool(name or f"test-{next(_pool_names)}", keys, classify=classify)
+
+
+def key_of(pool: KeyPool, key: str):
+    return next(pooled for pooled in pool.keys if pooled.key == key)
+
+
+def test_fails_over_to_next_key_and_cools_down_failed_keys():
+    pool = make_pool(["a", "b", "c"])
+    calls = []
+
+    async def request(pooled):
+        calls.append(pooled.key)
+        if pooled.key == "a":
+            raise QuotaError()
+        if pooled.key == "b":
+            raise DeniedError()
+        return pooled.key
+
+    assert asyncio.run(pool.call(request)) == "c"
+    assert calls == ["a", "b", "c"]
+    assert [entry["cooling_down"] for entry in pool.snapshot()] == [True, True, False]
+
+    # 제외된 키는 다음 요청에서 고르지 않습니다.
+    calls.clear()
+    assert asyncio.run(pool.call(request)) == "c"
+    assert calls == ["c"]
+
+
+def test_raises_last_error_when_every_key_fails():
+    pool = make_pool(["a", "b"])
+
+    async def request(pooled):
+        raise QuotaError(pooled.key)
+
+    with pytest.raises(QuotaError, match="b"):
+        asyncio.run(pool.call(request))
+
+
+def test_first_attempt_proceeds_when_every_key_is_cooling_down():
+    pool = make_pool(["a"])
+    asyncio.run(pool.cooldown(key_of(pool, "a"), REASON_EXHAUSTED))
+
+    async def request(pooled):
+        return pooled.key
+
+    assert asyncio.run(pool.call(request)) == "a"
+
+
+def test_non_key_errors_propagate_without_cooldown():
+    pool = make_pool(["a", "b"])
+
+    async def request(pooled):
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(pool.call(request))
+    assert not any(entry["cooling_down"] for entry in pool.snapshot())
+
+
+def test_cooldown_expires(monkeypatch):
+    pool = make_pool(["a", "b"])
+    now = 1_000_000.0
+    monkeypatch.setattr(key_pool.time, "time", lambda: now)
+    asyncio.run(pool.cooldown(key_of(pool, "a"), REASON_EXHAUSTED))
+
+    assert pool.cooling_down(key_of(pool, "a"))
+    now += key_pool.API_KEY_EXHAUSTED_COOLDOWN_SECONDS + 1
+    assert not pool.cooling_down(key_of(pool, "a"))
+
+
+def test_denied_keys_cool_down_longer_than_exhausted_keys(monkeypatch):
+    pool = make_pool(["a", "b"])
+    now = 1_000_000.0
+    monkeypatch.setattr(key_pool.time, "time", lambda: now)
+    asyncio.run(pool.cooldown(key_of(pool, "a"), REASON_EXHAUSTED))
+    asyncio.run(pool.cooldown(key_of(pool, "b"), REASON_DENIED))
+
+    now += key_pool.API_KEY_EXHAUSTED_COOLDOWN_SECONDS + 1
+    assert not pool.cooling_down(key_of(pool, "a"))
+    assert pool.cooling_down(key_of(pool, "b"))
+
+
+def test_cooldown_is_shared_through_state_store():
+    pool = make_pool(["a", "b"])
+    asyncio.run(pool.cooldown(key_of(pool, "a"), REASON_EXHAUSTED))
+
+    other = make_pool(["a", "b"], name=pool.api)
+    assert not other.cooling_down(key_of(other, "a"))
+    asyncio.run(other.sync_cooldowns())
+    assert other.cooling_down(key_of(other, "a"))
+    selected = other.select()
+    assert selected is not None and selected.key == "b"
+
+
+def test_sync_reads_state_store_at_most_once_per_interval(monkeypatch):
+    pool = make_pool(["a", "b"])
+    reads = []
+
+    async def fake_call_state_store(method, *args):
+        reads.append(method)
+        return None
+
+    monkeypatch.setattr(key_pool, "call_state_store", fake_call_state_store)
+    monkeypatch.setattr(key_pool, "API_KEY_COOLDOWN_SYNC_SECONDS", 60.0)
+
+    async def requests():
+        for _ in range(5):
+            await pool.call(lambda pooled: asyncio.sleep(0, pooled.key))
+
+    asyncio.run(requests())
+    assert reads == ["cache_get", "cache_get"]
+
+
+def test_selects_least_loaded_key():
+    pool = make_pool(["a", "b"])
+    seen = []
+
+    async def request(pooled):
+        seen.append(pooled.key)
+        await asyncio.sleep(0.01)
+        return pooled.key
+
+    async def run():
+        return await asyncio.gather(*(pool.call(request) for _ in range(4)))
+
+    assert sorted(asyncio.run(run())) == ["a", "a", "b", "b"]
+    assert seen[:2] == ["a", "b"]
+
+
+def test_each_attempt_leases_its_key_and_waits_for_its_token(monkeypatch):
+    pool = make_pool(["a", "b"])
+    events = []
+
+    async def acquire(self):
+        events.append(("token", self.name.rsplit(":", 1)[1]))
+
+    monkeypatch.setattr(key_pool.RateLimiter, "acquire", acquire)
+
+    async def request(pooled):
+        events.append(("request", pooled.key, pooled.in_flight))
+        if pooled.key == "a":
+            raise QuotaError()
+        return pooled.key
+
+    assert asyncio.run(pool.call(request)) == "b"
+    # 재시도하는 키의 토큰은 요청(추적 구간) 밖에서, 해당 시도 직전에 얻습니다.
+    assert events == [
+        ("token", key_of(pool, "a").key_id),
+        ("request", "a", 1),
+        ("token", key_of(pool, "b").key_id),
+        ("request", "b", 1),
+    ]
+    assert [pooled.in_flight for pooled in pool.keys] == [0, 0]
+
+
+def test_lease_without_key_selects_one():
+    pool = make_pool(["a", "b"])
+    key_of(pool, "a").in_flight = 1
+
+    async def run():
+        async with pool.lease() as leased:
+            return leased.key, leased.in_flight
+
+    assert asyncio.run(run()) == ("b", 1)
+
+
+def test_first_selection_never_returns_none():
+    pool = make_pool(["a"])
+    asyncio.run(pool.cooldown(key_of(pool, "a"), REASON_DENIED))
+
+    assert pool.select(exclude=pool.keys) is None
+    selected = pool.select()
+    assert selected is not None and selected.key == "a"
+
+
+def test_keys_from_env(monkeypatch):
+    monkeypatch.setenv("TEST_KEYS", "k1, k2,k1,,")
+    assert keys_from_env("TEST_KEYS", "TEST_KEY") == ["k1", "k2"]
+
+    monkeypatch.delenv("TEST_KEYS")
+    monkeypatch.setenv("TEST_KEY", "single")
+    assert keys_from_env("TEST_KEYS", "TEST_KEY") == ["single"]
+
+
+def test_empty_pool_is_rejected():
+    with pytest.raises(ValueError):
+        KeyPool("empty", [])
@@ -0,0 +1,123 @@
+"""선택자 출력 메모(selector_memo_callbacks) 테스트입니다."""
+
+import asyncio
+import itertools
+from typing import List, Optional
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import types
+
+from google_maps_agents.cache import ResultCache
+from google_maps_agents.models import memo
+from google_maps_agents.models.memo import selector_memo_callbacks
+from google_maps_agents.models.validators import response_text
+
+AGENT = LlmAgent(name="types_selector_agent")
+
+_namespaces = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def memo_cache(monkeypatch):
+    """테스트마다 비어 있는 메모 네임스페이스를 사용합니다."""
+    namespace = f"selector-test-{next(_namespaces)}"
+    monkeypatch.setattr(memo, "_memo", ResultCache(namespace, 60.0))
+
+
+def user_content(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def context(
+    utterance: str, invocation_id: str = "inv-1", history: Optional[List[str]] = None
+) -> CallbackContext:
+    """history의 각 발화를 이전 호출의 사용자 메시지로 가진 세션의 콜백 컨텍스트를 만듭니다."""
+    events = [
+        Event(author="user", invocation_id=f"prior-{i}", content=user_content(text))
+        for i, text in enumerate(history or [])
+    ]
+    events.append(
+        Event(
+            author="user", invocation_id=invocation_id, content=user_content(utterance)
+        )
+    )
+    invocation = InvocationContext(
+        session_service=InMemorySessionService(),
+        invocation_id=invocation_id,
+        agent=AGENT,
+        user_content=user_content(utterance),
+        session=Session(id="s1", app_name="app", user_id="u1", events=events),
+    )
+    return CallbackContext(invocation)
+
+
+def model_output(text: str) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+def remember_then_lookup(stored: CallbackContext, looked_up: CallbackContext):
+    callbacks = selector_memo_callbacks(lambda text: text != "invalid")
+
+    async def scenario():
+        await callbacks.store(stored, model_output("cafe"))
+        return await callbacks.lookup(looked_up, LlmRequest())
+
+    return asyncio.run(scenario())
+
+
+def test_equivalent_utterance_reuses_validated_output():
+    response = remember_then_lookup(
+        context("강남역 카페 찾아줘"), context("카페 강남역 근처", "inv-2")
+    )
+
+    assert response is not None
+    assert response_text([response]) == "cafe"
+
+
+def test_negated_utterance_with_swapped_places_is_not_reused():
+    response = remember_then_lookup(
+        context("강남역 말고 홍대 카페"), context("홍대 말고 강남역 카페", "inv-2")
+    )
+
+    assert response is None
+
+
+def test_multi_turn_sessions_are_not_memoized():
+    first_turn = context("거기 말고 다른 카페")
+    follow_up = context("거기 말고 다른 카페", "inv-2", history=["강남역 카페"])
+    # 이전 턴이 있는 세션의 출력은 저장하지 않습니다.
+    assert remember_then_lookup(follow_up, first_turn) is None
+    # 첫 턴에서 저장한 출력도 이전 턴이 있는 세션에서는 사용하지 않습니다.
+    assert remember_then_lookup(first_turn, follow_up) is None
+
+
+def test_invalid_or_partial_outputs_are_not_stored():
+    callbacks = selector_memo_callbacks(lambda text: text != "invalid")
+
+    async def scenario():
+        await callbacks.store(context("강남역 카페"), model_output("invalid"))
+        partial = model_output("cafe")
+        partial.partial = True
+        await callbacks.store(context("강남역 카페"), partial)
+        return await callbacks.lookup(context("강남역 카페", "inv-2"), LlmRequest())
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_disabled_memo_does_nothing(monkeypatch):
+    monkeypatch.setattr(memo, "_memo", ResultCache("selector-test-disabled", 0.0))
+
+    response = remember_then_lookup(
+        context("강남역 카페"), context("강남역 카페", "inv-2")
+    )
+
+    assert response is None
@@ -0,0 +1,166 @@
+"""장소 사진 디스크 캐시(PhotoCache)와 사진 서비스(PhotoService) 테스트입니다."""
+
+import asyncio
+import os
+from typing import Any, List, cast
+
+import httpx
+import pytest
+from google.maps import places_v1
+
+from google_maps_agents.tools import photos
+from google_maps_agents.tools.photos import (
+    PhotoCache,
+    PhotoService,
+    attach_card_photos,
+)
+from google_maps_agents.tools.places import PlacesService
+
+JPEG = b"\xff\xd8jpeg-bytes"
+PNG = b"\x89PNGpng-bytes"
+
+
+def test_store_and_lookup_share_blobs_by_content(tmp_path):
+    cache = PhotoCache(str(tmp_path), max_bytes=0)
+
+    first = cache.store("places/A/photos/1|400x400", JPEG, "image/jpeg; charset=x")
+    second = cache.store("places/B/photos/9|400x400", JPEG, "image/jpeg")
+
+    assert first == second
+    assert first.filename.endswith(".jpg")
+    assert first.url == f"/photos/{first.filename}"
+    assert cache.lookup("places/A/photos/1|400x400") == first
+    assert cache.lookup("places/A/photos/1|800x800") is None
+    blobs = [name for _, _, files in os.walk(tmp_path / "blobs") for name in files]
+    assert blobs == [first.filename]
+
+
+def test_path_rejects_unknown_and_malformed_names(tmp_path):
+    cache = PhotoCache(str(tmp_path), max_bytes=0)
+    photo = cache.store("k", PNG, "image/png")
+
+    assert cache.path(photo.filename) is not None
+    assert PhotoCache.content_type(photo.filename) == "image/png"
+    assert cache.path("../" + photo.filename) is None
+    assert cache.path("0" * 64 + ".jpg") is None
+    assert cache.store("other", b"data", None).filename.endswith(".bin")
+
+
+def test_size_limit_evicts_least_recently_used_blobs(tmp_path):
+    cache = PhotoCache(str(tmp_path), max_bytes=25)
+    old = cache.store("old", b"a" * 10, "image/jpeg")
+    recent = cache.store("recent", b"b" * 10, "image/jpeg")
+    old_path = cache.path(old.filename)
+    assert old_path is not None
+    os.utime(old_path, (1, 1))
+
+    cache.store("new", b"c" * 10, "image/jpeg")
+
+    # 본문이 삭제된 참조는 캐시 미스입니다.
+    assert cache.lookup("old") is None
+    assert cache.lookup("recent") == recent
+    assert cache.lookup("new") is not None
+    assert not os.path.exists(os.path.join(str(tmp_path), "refs", "old"))
+
+
+class FakePhotoClient:
+    """GetPhotoMedia 요청을 기록하고 사진 이름으로 photo_uri를 돌려주는 클라이언트 대역입니다."""
+
+    def __init__(self) -> None:
+        self.requests: List[places_v1.GetPhotoMediaRequest] = []
+
+    async def get_photo_media(self, request: Any, timeout: Any):
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        return places_v1.PhotoMedia(photo_uri=f"https://photos.test/{request.name}")
+
+
+def download(request: httpx.Request) -> httpx.Response:
+    if "missing" in request.url.path:
+        return httpx.Response(404)
+    body = request.url.path.encode()
+    return httpx.Response(200, content=body, headers={"content-type": "image/jpeg"})
+
+
+def make_service(monkeypatch, tmp_path):
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test-key")
+    grpc = FakePhotoClient()
+    places = PlacesService(
+        client=cast(places_v1.PlacesAsyncClient, grpc), cache_ttl=0, rate_limit=None
+    )
+    service = PhotoService(places, PhotoCache(str(tmp_path), max_bytes=0))
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(download))
+    return service, grpc
+
+
+def test_fetch_caches_on_disk_and_coalesces_concurrent_requests(monkeypatch, tmp_path):
+    service, grpc = make_service(monkeypatch, tmp_path)
+    name = "places/A/photos/1"
+
+    async def scenario():
+        concurrent = await asyncio.gather(*(service.fetch(name) for _ in range(3)))
+        cached = await service.fetch(name)
+        await service.aclose()
+        return concurrent, cached
+
+    concurrent, cached = asyncio.run(scenario())
+
+    assert len(grpc.requests) == 1
+    request = grpc.requests[0]
+    assert request.name == f"{name}/media"
+    assert request.skip_http_redirect
+    assert all(result == cached for result in concurrent)
+    assert cached["name"] == name
+    assert cached["content_type"] == "image/jpeg"
+    assert cached["url"].startswith("/photos/")
+
+
+def test_fetch_validates_size_and_reports_download_errors(monkeypatch, tmp_path):
+    service, grpc = make_service(monkeypatch, tmp_path)
+
+    async def scenario():
+        no_size = await service.fetch("places/A/photos/1", None, None)
+        clamped = await service.fetch("places/A/photos/2", 10_000, None)
+        failed = await service.fetch("places/A/photos/missing")
+        await service.aclose()
+        return no_size, clamped, failed
+
+    no_size, clamped, failed = asyncio.run(scenario())
+
+    assert "error" in no_size
+    assert "url" in clamped
+    assert grpc.requests[0].max_width_px == photos.MAX_PHOTO_PX
+    assert "error" in failed and failed["name"] == "places/A/photos/missing"
+
+
+def test_attach_card_photos_sets_urls_for_places_with_photos(monkeypatch, tmp_path):
+    service, _ = make_service(monkeypatch, tmp_path)
+
+    async def get_service():
+        return service
+
+    monkeypatch.setattr(photos, "get_photo_service", get_service)
+    cards: List[dict] = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+    places = [
+        {"photos": [{"name": "places/a/photos/1"}]},
+        {"photos": []},
+        {"photos": [{"name": "places/c/photos/missing"}]},
+    ]
+
+    asyncio.run(attach_card_photos(cards, places))
+
+    assert cards[0]["photo_url"].startswith("/photos/")
+    assert "photo_url" not in cards[1]
+    assert "photo_url" not in cards[2]
+
+
+@pytest.mark.parametrize(
+    "status, counted", [(404, False), (403, False), (429, True), (503, True)]
+)
+def test_only_throttling_and_server_errors_trip_the_breaker(status, counted):
+    request = httpx.Request("GET", "https://photos.test/x")
+    error = httpx.HTTPStatusError(
+        "status", request=request, response=httpx.Response(status, request=request)
+    )
+
+    assert photos._is_upstream_failure(error) is counted
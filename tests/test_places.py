@@ -0,0 +1,121 @@
+"""장소 검색 결과 수 제한(result_limit)과 장소별 리뷰/사진 축소(_trim_place) 테스트입니다."""
+
+import asyncio
+from typing import Any, List, cast
+
+import pytest
+from google.maps import places_v1
+
+from google_maps_agents.tools import places
+from google_maps_agents.tools.places import (
+    MAX_RESULT_COUNT,
+    PlacesService,
+    _trim_place,
+    result_limit,
+)
+
+
+@pytest.mark.parametrize(
+    "query, utterance, default, expected",
+    [
+        ("강남역 카페 3곳만", None, None, 3),
+        # 쿼리의 개수 표현이 발화보다 우선합니다.
+        ("강남역 카페 3곳만", "다섯 곳 알려줘", None, 3),
+        ("강남역 카페", "강남역 카페 5개 알려줘", None, 5),
+        ("강남역 카페", None, 7, 7),
+        ("강남역 카페", None, None, None),
+        ("top 30 cafes", None, None, MAX_RESULT_COUNT),
+        ("강남역 카페 0곳", None, None, 1),
+    ],
+)
+def test_result_limit(monkeypatch, query, utterance, default, expected):
+    monkeypatch.setattr(places, "PLACES_DEFAULT_RESULT_COUNT", default)
+
+    assert result_limit(query, utterance) == expected
+
+
+def make_place(reviews: int = 5, photos: int = 5, chars: int = 20) -> places_v1.Place:
+    text = "가" * chars
+    return places_v1.Place(
+        id="p1",
+        reviews=[
+            places_v1.Review(text={"text": text}, original_text={"text": text})
+            for _ in range(reviews)
+        ],
+        photos=[places_v1.Photo(name=f"photo-{i}") for i in range(photos)],
+    )
+
+
+def test_trim_place_limits_reviews_photos_and_review_text(monkeypatch):
+    monkeypatch.setattr(places, "PLACES_MAX_REVIEWS_PER_PLACE", 2)
+    monkeypatch.setattr(places, "PLACES_MAX_PHOTOS_PER_PLACE", 1)
+    monkeypatch.setattr(places, "PLACES_MAX_REVIEW_CHARS", 10)
+    place = make_place()
+
+    _trim_place(place)
+
+    assert len(place.reviews) == 2
+    assert [photo.name for photo in place.photos] == ["photo-0"]
+    for review in place.reviews:
+        assert review.text.text == "가" * 10 + "…"
+        assert review.original_text.text == "가" * 10 + "…"
+
+
+def test_trim_place_negative_and_zero_limits_disable_trimming(monkeypatch):
+    monkeypatch.setattr(places, "PLACES_MAX_REVIEWS_PER_PLACE", -1)
+    monkeypatch.setattr(places, "PLACES_MAX_PHOTOS_PER_PLACE", 0)
+    monkeypatch.setattr(places, "PLACES_MAX_REVIEW_CHARS", 0)
+    place = make_place()
+
+    _trim_place(place)
+
+    assert len(place.reviews) == 5
+    assert len(place.photos) == 0
+    assert place.reviews[0].text.text == "가" * 20
+
+
+def test_count_expressions_share_the_query_but_not_the_cache_key():
+    fields = "places.id,places.displayName"
+
+    limited = PlacesService.cache_key("강남역 카페 3곳만", fields, "", "ko", None, 3)
+    unlimited = PlacesService.cache_key("강남역 카페", fields, "", "ko", None, None)
+    same_limit = PlacesService.cache_key("강남역 카페", fields, "", "ko", None, 3)
+
+    assert limited != unlimited
+    assert limited == same_limit
+
+
+class RecordingClient:
+    """SearchText 요청을 기록하고 리뷰/사진이 많은 장소를 돌려주는 클라이언트 대역입니다."""
+
+    def __init__(self) -> None:
+        self.requests: List[places_v1.SearchTextRequest] = []
+
+    async def search_text(self, request: Any, metadata: Any, timeout: Any):
+        self.requests.append(request)
+        return places_v1.SearchTextResponse(places=[make_place(chars=600)])
+
+
+def test_text_search_sends_max_result_count_and_trims_places(monkeypatch):
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test-key")
+    client = RecordingClient()
+    service = PlacesService(
+        client=cast(places_v1.PlacesAsyncClient, client), cache_ttl=0, rate_limit=None
+    )
+
+    result = asyncio.run(
+        service.text_search(
+            "강남역 카페 3곳만",
+            "places.id,places.reviews",
+            "",
+            "ko",
+            max_result_count=3,
+        )
+    )
+
+    assert client.requests[0].max_result_count == 3
+    (place,) = result["places"]
+    assert len(place["reviews"]) == places.PLACES_MAX_REVIEWS_PER_PLACE
+    assert len(place["photos"]) == places.PLACES_MAX_PHOTOS_PER_PLACE
+    review_text = place["reviews"][0]["text"]["text"]
+    assert len(review_text) == places.PLACES_MAX_REVIEW_CHARS + 1
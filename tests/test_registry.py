@@ -0,0 +1,102 @@
+"""이벤트 루프별 서비스 레지스트리(ServiceRegistry) 테스트입니다."""
+
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from google_maps_agents.tools.registry import ServiceRegistry
+
+
+class FakeService:
+    """생성 순서와 정리 여부를 기록하는 서비스입니다."""
+
+    created = 0
+
+    def __init__(self):
+        FakeService.created += 1
+        self.number = FakeService.created
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+async def slow_factory() -> FakeService:
+    await asyncio.sleep(0.01)
+    return FakeService()
+
+
+def test_concurrent_first_requests_create_one_instance_per_loop():
+    registry = ServiceRegistry()
+    registry.register("places", slow_factory)
+
+    async def get_many():
+        return await asyncio.gather(*(registry.get("places") for _ in range(5)))
+
+    first = asyncio.run(get_many())
+    second = asyncio.run(get_many())
+
+    assert len({id(s) for s in first}) == 1
+    assert len({id(s) for s in second}) == 1
+    # 다른 이벤트 루프에서는 새 인스턴스를 생성합니다.
+    assert first[0] is not second[0]
+
+
+def test_unknown_service_raises_key_error():
+    with pytest.raises(KeyError):
+        asyncio.run(ServiceRegistry().get("missing"))
+
+
+def test_lifecycle_hooks_and_aclose():
+    registry = ServiceRegistry()
+    registry.register("places", FakeService)
+    registry.register("geocoding", FakeService)
+    events: List[Tuple[str, str]] = []
+
+    async def on_create(name, instance):
+        events.append(("create", name))
+
+    registry.add_lifecycle_hooks(
+        on_create=on_create, on_close=lambda name, _: events.append(("close", name))
+    )
+
+    async def scenario():
+        places = await registry.get("places")
+        geocoding = await registry.get("geocoding")
+        await registry.aclose("places")
+        assert places.closed and not geocoding.closed
+        # 정리한 서비스는 다음 요청 때 다시 생성됩니다.
+        assert await registry.get("places") is not places
+        await registry.aclose()
+        assert geocoding.closed
+
+    asyncio.run(scenario())
+
+    assert events == [
+        ("create", "places"),
+        ("create", "geocoding"),
+        ("close", "places"),
+        ("create", "places"),
+        ("close", "geocoding"),
+        ("close", "places"),
+    ]
+
+
+def test_set_overrides_instance_and_close_errors_are_logged():
+    registry = ServiceRegistry()
+    registry.register("places", FakeService)
+
+    class BrokenService:
+        async def aclose(self):
+            raise RuntimeError("close failed")
+
+    async def scenario():
+        stub = BrokenService()
+        registry.set("places", stub)
+        assert await registry.get("places") is stub
+        await registry.aclose()
+        # 현재 루프의 서비스가 없으면 아무 일도 하지 않습니다.
+        await registry.aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,104 @@
+"""선택자 출력 스키마(FieldsSelection/TypeSelection/LanguageSelection) 테스트입니다."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from google_maps_agents.models import (
+    FieldsSelection,
+    LanguageSelection,
+    TypeSelection,
+    get_known_language_codes,
+    get_known_place_types,
+    is_valid_fields_output,
+    is_valid_language_output,
+    is_valid_types_output,
+    selected_fields,
+    selected_language,
+    selected_type,
+    selector_output_json,
+)
+
+CORPUS = Path(__file__).parents[1] / "benchmarks" / "data" / "eval_corpus.jsonl"
+
+
+def corpus_entries() -> List[Dict[str, Any]]:
+    """평가 코퍼스에서 장소 검색 경로의 실제 선택자 출력을 읽습니다."""
+    with CORPUS.open(encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    return [entry for entry in entries if entry.get("fields")]
+
+
+@pytest.mark.parametrize("entry", corpus_entries(), ids=lambda entry: entry["text"])
+def test_schemas_accept_selector_outputs_from_the_eval_corpus(entry):
+    fields = selector_output_json(FieldsSelection, entry["fields"])
+    types = selector_output_json(TypeSelection, entry.get("types") or "")
+    language = selector_output_json(LanguageSelection, entry["language"])
+
+    assert fields is not None and is_valid_fields_output(fields)
+    assert types is not None and is_valid_types_output(types)
+    assert language is not None and is_valid_language_output(language)
+    # 상태에 저장된 JSON 값에서 원래 출력을 다시 읽을 수 있습니다.
+    assert selected_fields(json.loads(fields)) == entry["fields"]
+    assert selected_type(json.loads(types)) == (entry.get("types") or None)
+    assert selected_language(json.loads(language)) == entry["language"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"fields": ["places.id", "places.displayName"]}',
+        '```json\n{"fields": ["places.id"]}\n```',
+    ],
+)
+def test_valid_fields_output(text):
+    assert is_valid_fields_output(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"fields": []}',
+        '{"fields": ["places.unknownField"]}',
+        '{"fields": ["displayName"]}',
+        '{"fields": ["places.id"], "reason": "기본 필드"}',
+        "places.id,places.displayName",
+        "",
+    ],
+)
+def test_invalid_fields_output(text):
+    assert not is_valid_fields_output(text)
+
+
+def test_type_and_language_outputs():
+    assert is_valid_types_output('{"included_type": "cafe"}')
+    assert is_valid_types_output("{}")
+    assert not is_valid_types_output('{"included_type": "coffee shop"}')
+    assert not is_valid_types_output('{"included_type": ["cafe"]}')
+    assert is_valid_language_output('{"language_code": "ko"}')
+    assert not is_valid_language_output('{"language_code": "korean"}')
+    assert not is_valid_language_output("{}")
+
+
+def test_free_text_values_are_converted_or_rejected():
+    assert selector_output_json(TypeSelection, "cafe") == '{"included_type":"cafe"}'
+    assert selector_output_json(TypeSelection, "") == "{}"
+    assert selector_output_json(TypeSelection, "커피숍") is None
+    assert selector_output_json(LanguageSelection, "xx") is None
+    assert selector_output_json(FieldsSelection, "places.id, places.bogus") is None
+
+
+def test_response_schema_enums_match_the_prompt_lists():
+    types_schema = TypeSelection.model_json_schema()["properties"]["included_type"]
+    type_enum = next(option for option in types_schema["anyOf"] if "enum" in option)
+    language_schema = LanguageSelection.model_json_schema()["properties"]
+    fields_schema = FieldsSelection.model_json_schema()["properties"]["fields"]
+
+    assert type_enum["enum"] == sorted(get_known_place_types())
+    assert language_schema["language_code"]["enum"] == sorted(
+        get_known_language_codes()
+    )
+    assert "places.id" in fields_schema["items"]["enum"]
+    assert all(name.startswith("places.") for name in fields_schema["items"]["enum"])
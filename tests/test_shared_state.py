@@ -0,0 +1,156 @@
+"""상태 저장소(StateStore), 공유 매니저 연결과 속도 제한기(RateLimiter) 테스트입니다."""
+
+import asyncio
+
+import pytest
+
+from google_maps_agents import ratelimit, shared_state
+from google_maps_agents.ratelimit import RateLimiter
+from google_maps_agents.shared_state import (
+    SHARED_STATE_ADDRESS_ENV,
+    SHARED_STATE_AUTHKEY_ENV,
+    StateStore,
+    _format_address,
+    _parse_address,
+    call_state_store,
+    get_state_store,
+    is_shared_state,
+    start_shared_state,
+)
+
+
+@pytest.fixture
+def fresh_store(monkeypatch):
+    """테스트마다 프로세스 전역 저장소를 새로 만들도록 초기화합니다."""
+    monkeypatch.setattr(shared_state, "_store", None)
+    # start_shared_state()가 기록한 환경변수도 테스트 후 원래대로 되돌립니다.
+    for name in (SHARED_STATE_ADDRESS_ENV, SHARED_STATE_AUTHKEY_ENV):
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+
+
+def test_cache_get_returns_stored_at_and_value():
+    store = StateStore()
+    store.cache_set("places", "k", {"places": []}, retain_seconds=60)
+
+    stored_at, value = store.cache_get("places", "k") or (None, None)
+
+    assert value == {"places": []}
+    assert stored_at is not None
+    assert store.cache_get("places", "missing") is None
+    assert store.cache_get("geocode", "k") is None
+
+
+def test_cache_entries_expire_after_retain_seconds(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(shared_state.time, "time", lambda: now[0])
+    store = StateStore()
+    store.cache_set("places", "k", "v", retain_seconds=10)
+
+    now[0] += 9
+    assert store.cache_get("places", "k") == (1000.0, "v")
+    now[0] += 2
+    assert store.cache_get("places", "k") is None
+    assert store.cache_size("places") == 0
+
+
+def test_cache_evicts_least_recently_used_entries():
+    store = StateStore(max_entries=2)
+    store.cache_set("places", "a", 1, retain_seconds=60)
+    store.cache_set("places", "b", 2, retain_seconds=60)
+    store.cache_get("places", "a")
+    store.cache_set("places", "c", 3, retain_seconds=60)
+
+    assert store.cache_get("places", "b") is None
+    assert store.cache_get("places", "a") is not None
+    assert store.cache_size("places") == 2
+
+    store.cache_delete("places", "a")
+    store.cache_delete("unknown", "a")
+    assert store.cache_size("places") == 1
+
+
+def test_take_token_reserves_and_refills(monkeypatch):
+    now = [50.0]
+    monkeypatch.setattr(shared_state.time, "monotonic", lambda: now[0])
+    store = StateStore()
+
+    assert [store.take_token("places", 2.0, 2.0) for _ in range(2)] == [0.0, 0.0]
+    # 토큰이 없으면 음수 잔량으로 예약하고 대기 시간을 돌려줍니다.
+    assert store.take_token("places", 2.0, 2.0) == pytest.approx(0.5)
+    assert store.take_token("places", 2.0, 2.0) == pytest.approx(1.0)
+    now[0] += 1.0
+    assert store.take_token("places", 2.0, 2.0) == pytest.approx(0.5)
+    # 버킷은 이름별로 독립적입니다.
+    assert store.take_token("geocode", 2.0, 2.0) == 0.0
+
+
+@pytest.mark.parametrize(
+    "address, value",
+    [
+        (("127.0.0.1", 50000), "127.0.0.1:50000"),
+        ("/tmp/state.sock", "/tmp/state.sock"),
+    ],
+)
+def test_address_round_trip(address, value):
+    assert _format_address(address) == value
+    assert _parse_address(value) == address
+
+
+def test_local_store_without_shared_address(fresh_store):
+    store = get_state_store()
+
+    assert isinstance(store, StateStore)
+    assert get_state_store() is store
+    assert not is_shared_state()
+    asyncio.run(call_state_store("cache_set", "places", "k", "v", 60))
+    assert store.cache_get("places", "k") is not None
+
+
+def test_workers_share_the_manager_store(fresh_store):
+    manager = start_shared_state()
+    try:
+        assert is_shared_state()
+        store = get_state_store()
+        assert not isinstance(store, StateStore)
+
+        async def roundtrip():
+            await call_state_store("cache_set", "places", "k", {"n": 1}, 60)
+            return await call_state_store("cache_get", "places", "k")
+
+        stored_at, value = asyncio.run(roundtrip())
+        assert value == {"n": 1}
+        # 다른 워커처럼 새로 연결한 프록시도 같은 항목을 봅니다.
+        shared_state._store = None
+        assert get_state_store().cache_size("places") == 1
+    finally:
+        manager.shutdown()
+
+
+def test_rate_limiter_waits_for_reserved_token(fresh_store, monkeypatch):
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+    limiter = RateLimiter("test-ratelimit", rate=1.0)
+
+    async def acquire_three():
+        for _ in range(3):
+            await limiter.acquire()
+
+    asyncio.run(acquire_three())
+
+    assert len(waits) == 2
+    assert waits[0] == pytest.approx(1.0, abs=0.05)
+    assert waits[1] == pytest.approx(2.0, abs=0.05)
+
+
+def test_rate_limiter_without_rate_or_store_does_not_block(fresh_store, monkeypatch):
+    async def failing_call(*args):
+        raise ConnectionError("manager down")
+
+    asyncio.run(RateLimiter("unlimited", rate=None).acquire())
+    monkeypatch.setattr(ratelimit, "call_state_store", failing_call)
+    asyncio.run(RateLimiter("broken", rate=1.0).acquire())
@@ -0,0 +1,150 @@
+"""투기적 검색(resolve_speculation) 재사용 조건 테스트입니다."""
+
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from google_maps_agents.tools.geo import SearchArea
+from google_maps_agents.tools.speculative import (
+    OUTCOME_HIT,
+    OUTCOME_MISS,
+    OUTCOME_NONE,
+    discard_speculation,
+    get_speculation_stats,
+    resolve_speculation,
+    start_speculation,
+)
+
+FIELDS = "places.id,places.displayName,places.formattedAddress,places.types"
+PLACES = [
+    {"id": "p1", "display_name": "카페 하나"},
+    {"id": "p2", "display_name": "카페 둘"},
+]
+
+_keys = itertools.count()
+
+
+class RecordingSearch:
+    """호출 인자를 기록하고 정해진 결과를 돌려주는 검색 함수입니다."""
+
+    def __init__(self, result: Optional[Dict[str, Any]] = None, delay: float = 0.0):
+        self.result = {"places": PLACES} if result is None else result
+        self.delay = delay
+        self.calls: List[Tuple[Any, ...]] = []
+
+    async def __call__(self, query, fields, types, language_code, max_result_count):
+        self.calls.append((query, fields, types, language_code, max_result_count))
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+def speculate_and_resolve(
+    search: RecordingSearch,
+    query: str = "강남역 근처 카페",
+    fields: str = "places.id,places.displayName",
+    types: Optional[str] = "",
+    language_code: Optional[str] = "ko",
+    max_result_count: Optional[int] = 10,
+    area: Optional[SearchArea] = None,
+):
+    """발화로 투기적 검색을 시작한 뒤 최종 파라미터로 결과 재사용을 시도합니다."""
+    key = f"invocation-{next(_keys)}"
+
+    async def scenario():
+        start_speculation(key, "강남역 근처 카페 찾아줘", FIELDS, "ko", 10, search)
+        # 선택자 에이전트가 실행되는 동안 투기적 검색이 시작됩니다.
+        await asyncio.sleep(0)
+        resolved = await resolve_speculation(
+            key,
+            query,
+            fields,
+            types,
+            language_code,
+            max_result_count=max_result_count,
+            area=area,
+        )
+        pending = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        await asyncio.gather(*pending, return_exceptions=True)
+        return resolved
+
+    return asyncio.run(scenario())
+
+
+def test_identical_request_reuses_speculative_result():
+    search = RecordingSearch()
+    before = get_speculation_stats()
+
+    result, outcome = speculate_and_resolve(search)
+
+    assert outcome == OUTCOME_HIT
+    assert result == {"places": PLACES}
+    assert search.calls == [("강남역 근처 카페 찾아줘", FIELDS, "", "ko", 10)]
+    after = get_speculation_stats()
+    assert after["hits"] == before["hits"] + 1
+    assert after["started"] == before["started"] + 1
+
+
+def test_sub_field_of_speculative_mask_is_covered():
+    result, outcome = speculate_and_resolve(
+        RecordingSearch(), fields="places.displayName.text,places.types"
+    )
+    assert outcome == OUTCOME_HIT
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"types": "cafe"},
+        {"language_code": "en"},
+        {"language_code": ""},
+        {"max_result_count": 3},
+        {"max_result_count": None},
+        {"fields": "places.id,places.rating"},
+        {"query": "홍대 카페"},
+        {"area": SearchArea(lat=37.498, lng=127.028, radius_m=1000, restrict=False)},
+    ],
+)
+def test_any_parameter_mismatch_is_a_miss_without_extra_calls(override):
+    search = RecordingSearch(delay=0.05)
+    before = get_speculation_stats()
+
+    result, outcome = speculate_and_resolve(search, **override)
+
+    assert (result, outcome) == (None, OUTCOME_MISS)
+    assert len(search.calls) == 1
+    after = get_speculation_stats()
+    assert after["misses"] == before["misses"] + 1
+    assert after["wasted_calls"] == before["wasted_calls"] + 1
+
+
+def test_failed_speculative_search_is_a_miss():
+    search = RecordingSearch(result={"error": "quota", "query": "강남역 근처 카페"})
+    assert speculate_and_resolve(search) == (None, OUTCOME_MISS)
+
+
+def test_resolve_without_pending_speculation():
+    result = asyncio.run(
+        resolve_speculation(
+            "unknown", "카페", "places.id", "", "ko", max_result_count=10
+        )
+    )
+    assert result == (None, OUTCOME_NONE)
+
+
+def test_discard_cancels_and_counts_wasted_call():
+    search = RecordingSearch(delay=1.0)
+    before = get_speculation_stats()
+
+    async def scenario():
+        start_speculation("discard-me", "카페", FIELDS, "ko", None, search)
+        await asyncio.sleep(0)
+        discard_speculation("discard-me")
+        discard_speculation("discard-me")
+        return await resolve_speculation("discard-me", "카페", "places.id", "", "ko")
+
+    assert asyncio.run(scenario()) == (None, OUTCOME_NONE)
+    assert get_speculation_stats()["wasted_calls"] == before["wasted_calls"] + 1
@@ -0,0 +1,176 @@
+"""장소 카드 스트리밍(to_stream_events, stream_turn)과 POST /stream 경로 테스트입니다."""
+
+import asyncio
+import json
+from typing import Any, Dict, List, cast
+
+import pytest
+from google.adk.agents.run_config import StreamingMode
+from google.adk.events import Event, EventActions
+from google.adk.runners import Runner
+from google.genai import types
+
+from google_maps_agents import streaming
+from google_maps_agents.streaming import format_sse, stream_turn, to_stream_events
+from google_maps_agents.tools.places import PLACE_CARDS_STATE_KEY
+
+CARDS = {"query": "강남역 카페", "places": [{"id": "p1", "name": "카페 하나"}]}
+
+
+def text_event(author: str, text: str, partial: bool = False) -> Event:
+    return Event(
+        author=author,
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        partial=partial,
+    )
+
+
+def cards_event() -> Event:
+    return Event(
+        author="places_agent",
+        actions=EventActions(state_delta={PLACE_CARDS_STATE_KEY: CARDS}),
+    )
+
+
+def parse_sse(body: str) -> List[Dict[str, Any]]:
+    messages = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        data = json.loads(lines["data"])
+        assert lines["event"] == data["type"]
+        messages.append(data)
+    return messages
+
+
+def test_place_cards_become_results_available():
+    assert to_stream_events(cards_event()) == [
+        {
+            "type": "results_available",
+            "author": "places_agent",
+            "query": "강남역 카페",
+            "places": CARDS["places"],
+        }
+    ]
+
+
+def test_narrative_text_is_streamed_as_delta_then_done():
+    assert to_stream_events(text_event("places_agent", "강남역", partial=True)) == [
+        {"type": "text_delta", "author": "places_agent", "text": "강남역"}
+    ]
+    assert to_stream_events(text_event("places_agent", "강남역 카페입니다.")) == [
+        {"type": "text_done", "author": "places_agent", "text": "강남역 카페입니다."}
+    ]
+
+
+def test_selector_output_is_not_streamed():
+    assert to_stream_events(text_event("fields_selector_agent", "places.rating")) == []
+    assert to_stream_events(Event(author="places_agent")) == []
+
+
+def test_format_sse():
+    message = format_sse({"type": "text_done", "text": "카페"})
+    assert (
+        message == 'event: text_done\ndata: {"type": "text_done", "text": "카페"}\n\n'
+    )
+
+
+class FakeRunner:
+    """미리 정한 이벤트를 돌려주고 실행 인자를 기록하는 Runner 대역입니다."""
+
+    def __init__(self, events: List[Event]):
+        self.events = events
+        self.calls: List[Dict[str, Any]] = []
+
+    async def run_async(self, **kwargs):
+        self.calls.append(kwargs)
+        for event in self.events:
+            yield event
+
+
+def test_stream_turn_sends_cards_before_narrative_in_sse_mode():
+    runner = FakeRunner(
+        [
+            text_event("types_selector_agent", "cafe"),
+            cards_event(),
+            text_event("places_agent", "강남역", partial=True),
+            text_event("places_agent", "강남역 카페입니다."),
+        ]
+    )
+
+    async def collect():
+        turn = stream_turn(cast(Runner, runner), "u1", "s1", "강남역 카페")
+        return [item async for item in turn]
+
+    items = asyncio.run(collect())
+
+    assert [item["type"] for item in items] == [
+        "results_available",
+        "text_delta",
+        "text_done",
+    ]
+    call = runner.calls[0]
+    assert call["run_config"].streaming_mode == StreamingMode.SSE
+    assert call["new_message"].parts[0].text == "강남역 카페"
+
+
+@pytest.fixture
+def stream_client(monkeypatch):
+    """stream_turn을 대역으로 바꾼 POST /stream 테스트 클라이언트입니다."""
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test-key")
+    monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
+    monkeypatch.delenv("SERVE_SESSION_SERVICE_URI", raising=False)
+
+    async def fake_stream_turn(runner, user_id, session_id, message):
+        if message == "fail":
+            raise RuntimeError("upstream down")
+        yield {"type": "results_available", "author": "places_agent", "places": []}
+        yield {"type": "text_done", "author": "places_agent", "text": message}
+
+    monkeypatch.setattr(streaming, "stream_turn", fake_stream_turn)
+    from google_maps_agents.serve import create_app
+
+    with TestClient(create_app()) as client:
+        yield client
+
+
+def test_stream_endpoint_sends_session_then_events(stream_client):
+    response = stream_client.post("/stream", json={"user_id": "u1", "message": "카페"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = parse_sse(response.text)
+    assert [m["type"] for m in messages] == [
+        "session",
+        "results_available",
+        "text_done",
+    ]
+    assert messages[-1]["text"] == "카페"
+
+
+def test_stream_endpoint_continues_or_creates_requested_session(stream_client):
+    first = parse_sse(
+        stream_client.post("/stream", json={"user_id": "u1", "message": "a"}).text
+    )
+    session_id = first[0]["session_id"]
+
+    again = stream_client.post(
+        "/stream", json={"user_id": "u1", "message": "b", "session_id": session_id}
+    )
+    assert parse_sse(again.text)[0]["session_id"] == session_id
+
+    fresh = stream_client.post(
+        "/stream", json={"user_id": "u1", "message": "c", "session_id": "client-chosen"}
+    )
+    assert parse_sse(fresh.text)[0]["session_id"] == "client-chosen"
+
+
+def test_stream_endpoint_reports_errors_as_events(stream_client):
+    messages = parse_sse(
+        stream_client.post("/stream", json={"user_id": "u1", "message": "fail"}).text
+    )
+    assert messages == [
+        {"type": "session", "session_id": messages[0]["session_id"]},
+        {"type": "error", "message": "upstream down"},
+    ]